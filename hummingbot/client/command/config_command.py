@@ -80,6 +80,10 @@ client_configs_to_display = ["autofill_import",
                              "global_token_name",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "rate_limits_shared",
+                             "order_book_max_depth",
+                             "order_book_coalesce_diffs",
+                             "order_book_warm_restart",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
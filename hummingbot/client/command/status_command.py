@@ -16,6 +16,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.application_warning import ApplicationWarning
@@ -76,11 +77,28 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self._format_connection_pools()
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
 
+    def _format_connection_pools(self,  # type: HummingbotApplication
+                                 ) -> str:
+        rows = []
+        for market in self.markets.values():
+            if isinstance(market, ExchangePyBase):
+                for host, metrics in market.connection_pool_metrics.hosts.items():
+                    rows.append([market.display_name, host, metrics.in_flight, metrics.waiting,
+                                 metrics.connections_created, metrics.connections_reused,
+                                 round(metrics.mean_handshake_time * 1e3, 1), round(metrics.max_handshake_time * 1e3, 1)])
+        if len(rows) == 0:
+            return ""
+
+        connections_df = pd.DataFrame(data=rows, columns=["Exchange", "Host", "In flight", "Waiting", "Created",
+                                                          "Reused", "Mean handshake (ms)", "Max handshake (ms)"])
+        return "\n\n  Connection pools:\n" + "\n".join(
+            ["    " + line for line in connections_df.to_string(index=False).split("\n")])
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
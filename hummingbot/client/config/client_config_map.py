@@ -1125,6 +1125,48 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_shared: bool = Field(
+        default=False,
+        description=("Share the API rate limits of each exchange with the other bot instances of this host that enable"
+                     "\nthis setting, instead of counting them for this bot instance only. The limits are then the ones"
+                     "\nof the whole account or IP address, still scaled by rate_limits_share_pct."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to share the API rate limits with the other bot instances of this host? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_max_depth: int = Field(
+        default=0,
+        description=("Number of levels kept on each side of the order books of the connectors, the levels beyond are"
+                     "\ndropped. Enter 0 to keep every level."),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many levels do you want to keep on each side of the order books? (Enter 0 to keep all of them)"
+            ),
+        ),
+    )
+    order_book_coalesce_diffs: bool = Field(
+        default=False,
+        description=("Merge the diffs the connectors receive for each order book and apply them once per clock tick, or"
+                     "\nwhen the order book is read, instead of applying every diff as it arrives."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to merge the order book diffs and apply them once per tick? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_warm_restart: bool = Field(
+        default=False,
+        description=("Save the order books of the connectors to the data folder while the bot runs, and start from them"
+                     "\nwhen it restarts, instead of waiting for new snapshots."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to save the order books and start from them when the bot restarts? (Yes/No)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1189,7 +1231,14 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator(
+        "send_error_logs",
+        "fetch_pairs_from_all_exchanges",
+        "rate_limits_shared",
+        "order_book_coalesce_diffs",
+        "order_book_warm_restart",
+        pre=True,
+    )
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -55,10 +55,9 @@ class OrderBookTab(TabBase):
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book_text(no_lines: int):
-            bids = order_book.snapshot[0][['price', 'amount']].head(no_lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(no_lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            bids_array, asks_array = order_book.snapshot_arrays(depth=no_lines)
+            bids = pd.DataFrame({'bid_price': bids_array['price'], 'bid_volume': bids_array['amount']})
+            asks = pd.DataFrame({'ask_price': asks_array['price'], 'ask_volume': asks_array['amount']})
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["" + line for line in joined_df.to_string(index=False).split("\n")]
             header = f"market: {market_connector.name} {trading_pair}\n"
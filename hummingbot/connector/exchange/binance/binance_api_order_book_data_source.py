@@ -20,6 +20,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    SEQUENCED_ORDER_BOOK_DIFFS = True
 
     _logger: Optional[HummingbotLogger] = None
 
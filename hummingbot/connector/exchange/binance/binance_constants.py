@@ -1,5 +1,6 @@
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
 from hummingbot.core.data_type.in_flight_order import OrderState
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitHeaders
 
 DEFAULT_DOMAIN = "com"
 
@@ -97,10 +98,12 @@ RATE_LIMITS = [
                              LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
     RateLimit(limit_id=ACCOUNTS_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 20),
-                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)],
+              priority=RequestPriority.PRIVATE_STATUS),
     RateLimit(limit_id=MY_TRADES_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 20),
-                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)],
+              priority=RequestPriority.PRIVATE_STATUS),
     RateLimit(limit_id=ORDER_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 4),
                              LinkedLimitWeightPair(ORDERS, 1),
@@ -108,6 +111,19 @@ RATE_LIMITS = [
                              LinkedLimitWeightPair(RAW_REQUESTS, 1)])
 ]
 
+# Share of every limit polls and public data requests leave to the orders: a tenth for the creations and a tenth more
+# for the cancels, which can then go through while the account's REQUEST_WEIGHT and ORDERS budgets are busy
+RATE_LIMITS_PRIORITY_RESERVES = {
+    RequestPriority.CREATE: 0.1,
+    RequestPriority.CANCEL: 0.1,
+}
+
+# Usage of the account limits reported in the responses, counted in fixed windows
+RATE_LIMIT_HEADERS = [
+    RateLimitHeaders(limit_id=REQUEST_WEIGHT, used_header="X-MBX-USED-WEIGHT-1M", fixed_window=ONE_MINUTE),
+    RateLimitHeaders(limit_id=ORDERS, used_header="X-MBX-ORDER-COUNT-10S", fixed_window=10 * ONE_SECOND),
+]
+
 ORDER_NOT_EXIST_ERROR_CODE = -2013
 ORDER_NOT_EXIST_MESSAGE = "Order does not exist"
 UNKNOWN_ORDER_ERROR_CODE = -2011
@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -77,6 +78,10 @@ class BinanceExchange(ExchangePyBase):
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
 
+    @property
+    def rate_limits_priority_reserves(self):
+        return CONSTANTS.RATE_LIMITS_PRIORITY_RESERVES
+
     @property
     def domain(self):
         return self._domain
@@ -198,7 +203,8 @@ class BinanceExchange(ExchangePyBase):
             order_result = await self._api_post(
                 path_url=CONSTANTS.ORDER_PATH_URL,
                 data=api_params,
-                is_auth_required=True)
+                is_auth_required=True,
+                priority=RequestPriority.CREATE)
             o_id = str(order_result["orderId"])
             transact_time = order_result["transactTime"] * 1e-3
         except IOError as e:
@@ -221,7 +227,8 @@ class BinanceExchange(ExchangePyBase):
         cancel_result = await self._api_delete(
             path_url=CONSTANTS.ORDER_PATH_URL,
             params=api_params,
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.CANCEL)
         if cancel_result.get("status") == "CANCELED":
             return True
         return False
@@ -496,7 +503,8 @@ class BinanceExchange(ExchangePyBase):
             params={
                 "symbol": trading_pair,
                 "origClientOrderId": tracked_order.client_order_id},
-            is_auth_required=True)
+            is_auth_required=True,
+            priority=RequestPriority.PRIVATE_STATUS)
 
         new_state = CONSTANTS.ORDER_STATE[updated_order_data["status"]]
 
@@ -6,6 +6,7 @@ from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitHeadersPostProcessor
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
@@ -46,6 +47,9 @@ def build_api_factory(
         auth=auth,
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
+        ],
+        rest_post_processors=[
+            RateLimitHeadersPostProcessor(throttler=throttler, rate_limit_headers=CONSTANTS.RATE_LIMIT_HEADERS),
         ])
     return api_factory
 
@@ -30,6 +30,9 @@ TRACKER_TYPE = Dict[str, BitfinexOrderBookTrackerEntry]
 
 class BitfinexOrderBookTracker(OrderBookTracker):
     _logger: Optional[HummingbotLogger] = None
+    # the snapshot requests of this data source are not throttled
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS = 1
+    SNAPSHOT_REQUEST_INTERVAL = 1.0
 
     EXCEPTION_TIME_SLEEP = 5.0
 
@@ -22,6 +22,9 @@ from hummingbot.logger import HummingbotLogger
 
 class CoinbaseProOrderBookTracker(OrderBookTracker):
     _cbpobt_logger: Optional[HummingbotLogger] = None
+    # the snapshot requests of this data source are not throttled
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS = 1
+    SNAPSHOT_REQUEST_INTERVAL = 1.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
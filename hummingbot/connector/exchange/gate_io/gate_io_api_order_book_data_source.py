@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 
 class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SEQUENCED_ORDER_BOOK_DIFFS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -18,6 +18,9 @@ from hummingbot.connector.exchange.hitbtc.hitbtc_order_book import HitbtcOrderBo
 
 class HitbtcOrderBookTracker(OrderBookTracker):
     _logger: Optional[HummingbotLogger] = None
+    # the snapshot requests of this data source are not throttled
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS = 1
+    SNAPSHOT_REQUEST_INTERVAL = 1.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SEQUENCED_ORDER_BOOK_DIFFS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -1,44 +1,51 @@
 import asyncio
-import json
 import logging
 import time
 
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from bidict import bidict
-from gql.transport.appsync_auth import AppSyncJWTAuthentication
-from scalecodec.base import RuntimeConfiguration
-from scalecodec.type_registry import load_type_registry_preset
-from substrateinterface import Keypair, KeypairType
 
 from hummingbot.connector.exchange.suidex import suidex_constants as CONSTANTS, suidex_utils
+from hummingbot.connector.exchange.suidex.libsui import deepbook
+from hummingbot.connector.exchange.suidex.libsui.async_deepbook import AsyncDeepbookConnector
 from hummingbot.connector.exchange.suidex.libsui.deepbook import DeepbookConnector
+from hummingbot.connector.exchange.suidex.libsui.event_stream import DeepbookEventStream
+from hummingbot.connector.exchange.suidex.libsui.level2_book import Level2Book
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import DeepbookPool
+from hummingbot.connector.exchange.suidex.libsui.simulator import DeepbookSimulator
+from hummingbot.connector.exchange.suidex.suidex_order_batcher import SuidexOrderBatcher
 
 # from hummingbot.connector.exchange.suidex.suidex_query_executor import GrapQLQueryExecutor
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_listener import EventListener
-from hummingbot.core.event.events import AccountEvent, BalanceUpdateEvent, MarketEvent, OrderBookEvent
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.pubsub import Enum, PubSub
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.suidex.suidex_exchange import SuidexExchange
 
-CLASSES = [DeepbookConnector]
+# the first class is the default; `DeepbookSimulator` runs the connector against an in-process Deep Book
+CLASSES = [DeepbookConnector, DeepbookSimulator]
 
 
 def _connector(net=None, connector_cls=None, *args, **kwargs):
@@ -68,6 +75,7 @@ class SuidexDataSource:
         account_cap: Optional[str] = None,
         net: Optional[str] = CONSTANTS.NETS[0],
         trading_required: bool = True,
+        connector_cls: Optional[type] = None,
     ):
         self._connector = connector
         self._net = net
@@ -76,15 +84,27 @@ class SuidexDataSource:
         self._user_main_address = wallet_address
         self._account_cap = account_cap
 
-        # Load Suidex Runtime Config
-        self._runtime_config = RuntimeConfiguration()
-        # Register core types
-        self._runtime_config.update_type_registry(load_type_registry_preset("core"))
-        # Register Orderbook specific types
-        # self._runtime_config.update_type_registry(CONSTANTS.CUSTOM_TYPES)
+        self._chain_executor = AsyncDeepbookConnector(connector=_connector(connector_cls=connector_cls))
+        self._order_batcher = SuidexOrderBatcher(chain_executor=self._chain_executor)
+        self._event_stream = DeepbookEventStream(
+            chain_executor=self._chain_executor, poll_interval=CONSTANTS.EVENTS_POLL_INTERVAL
+        )
 
-        self._query_executor = None  # GrapQLQueryExecutor(auth=self._auth, domain=self._domain)
-        self._chain_executor = _connector()
+        self._trading_pair = combine_to_hb_trading_pair(base=CONSTANTS.BASE_ASSET_NAME, quote=CONSTANTS.QUOTE_ASSET_NAME)
+        # the configured pool, the only one traded for now, and the decimals of its coins; loaded by `_market_pool`
+        self._pool: Optional[DeepbookPool] = None
+        self._base_decimals = CONSTANTS.BASE_ASSET_DECIMALS
+        self._quote_decimals = CONSTANTS.QUOTE_ASSET_DECIMALS
+        # local copy of the pool levels, kept up to date from the pool events to build absolute diffs
+        self._level2_book = Level2Book()
+        self._order_book_resync_task: Optional[asyncio.Task] = None
+        # chain client order id (u64, as str) -> hummingbot client order id, for the orders placed by this connector
+        self._client_order_ids: Dict[str, str] = {}
+        # what the pool events told of the orders placed by this connector, for the order status and fills polling:
+        # the last state per exchange order id, and the trade updates per client order id
+        self._order_states: Dict[str, OrderState] = {}
+        self._trade_updates: Dict[str, List[TradeUpdate]] = defaultdict(list)
+        self._last_trade_price: Optional[Decimal] = None
 
         self._publisher = PubSub()
         self._last_received_message_time = 0
@@ -99,6 +119,11 @@ class SuidexDataSource:
             OrderType.LIMIT: "LIMIT",
             OrderType.LIMIT_MAKER: "LIMIT",
         }
+        self._suidex_order_restriction = {
+            OrderType.MARKET: deepbook.IMMEDIATE_OR_CANCEL,
+            OrderType.LIMIT: deepbook.NO_RESTRICTION,
+            OrderType.LIMIT_MAKER: deepbook.POST_OR_ABORT,
+        }
         self._hummingbot_order_type = {
             "LIMIT": OrderType.LIMIT,
             "MARKET": OrderType.MARKET,
@@ -118,40 +143,14 @@ class SuidexDataSource:
     async def start(self, market_symbols: List[str]):
         if len(self._events_listening_tasks) > 0:
             raise AssertionError("Suidex datasource is already listening to events and can't be started again")
-        await self._query_executor.create_ws_session()
 
+        # the events are converted with the decimals of the pool, which must be known before the first one arrives
         for market_symbol in market_symbols:
-            self._events_listening_tasks.append(
-                asyncio.create_task(
-                    self._query_executor.listen_to_orderbook_updates(
-                        events_handler=self._process_order_book_event, market_symbol=market_symbol
-                    )
-                )
-            )
-            self._events_listening_tasks.append(
-                asyncio.create_task(
-                    self._query_executor.listen_to_public_trades(
-                        events_handler=self._process_recent_trades_event, market_symbol=market_symbol
-                    )
-                )
-            )
-
-        if self._trading_required:
-            self._events_listening_tasks.append(
-                asyncio.create_task(
-                    self._query_executor.listen_to_private_events(
-                        events_handler=self._process_private_event, address=self._user_proxy_address
-                    )
-                )
-            )
-            main_address = await self.user_main_address()
-            self._events_listening_tasks.append(
-                asyncio.create_task(
-                    self._query_executor.listen_to_private_events(
-                        events_handler=self._process_private_event, address=main_address
-                    )
-                )
-            )
+            await self._market_pool(market_symbol)
+        # a single stream of pool events feeds the order book diffs, the public trades and the private updates
+        self._events_listening_tasks.append(
+            asyncio.create_task(self._event_stream.listen(events_handler=self._process_chain_event))
+        )
 
     async def stop(self):
         for task in self._events_listening_tasks:
@@ -171,9 +170,9 @@ class SuidexDataSource:
         self._publisher.remove_listener(event_tag=event_tag, listener=listener)
 
     async def exchange_status(self):
-        all_assets = await self.assets_map()
+        pools = await self._pools()
 
-        if len(all_assets) > 0:
+        if len(pools) > 0:
             result = NetworkStatus.CONNECTED
         else:
             result = NetworkStatus.NOT_CONNECTED
@@ -181,99 +180,110 @@ class SuidexDataSource:
         return result
 
     async def assets_map(self) -> Dict[str, str]:
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_ASSETS_LIMIT_ID):
-            all_assets = await self._query_executor.all_assets()
-        self._assets_map = {
-            asset["asset_id"]: suidex_utils.normalized_asset_name(asset_id=asset["asset_id"], asset_name=asset["name"])
-            for asset in all_assets["getAllAssets"]["items"]
-        }
-
-        if len(self._assets_map) > 0:
-            self._assets_map["suidex"] = "PDEX"  # required due to inconsistent token name in private balance event
-
+        """coin type -> asset name, for the coins of the pools that can be traded"""
+        self._assets_map = {}
+        for pool in self._tradable_pools(await self._pools()).values():
+            self._assets_map[pool.base_type] = pool.base_symbol
+            self._assets_map[pool.quote_type] = pool.quote_symbol
         return self._assets_map
 
     async def symbols_map(self) -> Mapping[str, str]:
         symbols_map = bidict()
-        assets_map = await self.assets_map()
-
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_MARKETS_LIMIT_ID):
-            markets = await self._query_executor.all_markets()
-
-        for market_info in markets["getAllMarkets"]["items"]:
-            try:
-                base_asset, quote_asset = market_info["market"].split("-")
-                base = assets_map[base_asset]
-                quote = assets_map[quote_asset]
-                symbols_map[market_info["market"]] = combine_to_hb_trading_pair(base=base, quote=quote)
-            except KeyError:
-                continue
+        for market_symbol in self._tradable_pools(await self._pools()):
+            base, quote = market_symbol.split("-")
+            symbols_map[market_symbol] = combine_to_hb_trading_pair(base=base, quote=quote)
         return symbols_map
 
     async def all_trading_rules(self) -> List[TradingRule]:
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_MARKETS_LIMIT_ID):
-            markets = await self._query_executor.all_markets()
-
         trading_rules = []
-        for market_info in markets["getAllMarkets"]["items"]:
+        for market_symbol, pool in self._tradable_pools(await self._pools()).items():
             try:
-                exchange_trading_pair = market_info["market"]
-                trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-                    symbol=exchange_trading_pair
+                trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=market_symbol)
+                base_decimals = await self._chain_executor.coin_decimals(pool.base_type)
+                quote_decimals = await self._chain_executor.coin_decimals(pool.quote_type)
+                price_increment = suidex_utils.from_chain_price(
+                    pool.tick_size, base_decimals=base_decimals, quote_decimals=quote_decimals
                 )
-                min_order_size = Decimal(market_info["min_order_qty"])
-                max_order_size = Decimal(market_info["max_order_qty"])
-                min_order_price = Decimal(market_info["min_order_price"])
-                amount_increment = Decimal(market_info["qty_step_size"])
-                price_increment = Decimal(market_info["price_tick_size"])
+                amount_increment = suidex_utils.from_chain_quantity(pool.lot_size, decimals=base_decimals)
                 trading_rules.append(
                     TradingRule(
                         trading_pair=trading_pair,
-                        min_order_size=min_order_size,
-                        max_order_size=max_order_size,
+                        min_order_size=amount_increment,
                         min_price_increment=price_increment,
                         min_base_amount_increment=amount_increment,
                         min_quote_amount_increment=price_increment,
-                        min_notional_size=min_order_size * min_order_price,
-                        min_order_value=min_order_size * min_order_price,
+                        min_notional_size=amount_increment * price_increment,
                     )
                 )
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().exception(f"Error parsing the trading pair rule: {market_info}. Skipping...")
+                self.logger().exception(f"Error parsing the trading pair rule: {pool}. Skipping...")
 
         return trading_rules
 
-    async def order_book_snapshot(self, market_symbol: str, trading_pair: str) -> OrderBookMessage:
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ORDERBOOK_LIMIT_ID):
-            snapshot_data = await self._query_executor.get_orderbook(market_symbol=market_symbol)
-
-        orderbook_entries = snapshot_data["getOrderbook"]["items"]
+    async def _pools(self) -> List[DeepbookPool]:
+        # served from the pool registry; only reaches the chain when the registry is due for a refresh
+        async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_MARKETS_LIMIT_ID):
+            return await self._chain_executor.list_pools()
 
-        timestamp = self._time()
-        update_id = -1
-        bids = []
-        asks = []
+    @staticmethod
+    def _pools_by_symbol(pools: List[DeepbookPool]) -> Dict[str, DeepbookPool]:
+        """market symbol (`BASE-QUOTE`) -> pool; when several pools trade the same pair the first one created is used"""
+        pools_by_symbol = {}
+        for pool in pools:
+            pools_by_symbol.setdefault(f"{pool.base_symbol}-{pool.quote_symbol}", pool)
+        return pools_by_symbol
+
+    def _tradable_pools(self, pools: List[DeepbookPool]) -> Dict[str, DeepbookPool]:
+        """
+        market symbol -> pool, for the pools that can be traded. The orders, the cancels, the book reads, the balances
+        and the events all go to the configured pool, so it is the only one until they are routed per market.
+        """
+        return self._pools_by_symbol([pool for pool in pools if pool.pool_id == self._chain_executor.pool_object_id])
+
+    async def _market_pool(self, market_symbol: str) -> DeepbookPool:
+        """the pool of `market_symbol`, loading the decimals of its coins the first time"""
+        if self._pool is None:
+            pool = self._tradable_pools(await self._pools()).get(market_symbol)
+            if pool is None:
+                raise ValueError(f"{market_symbol} is not traded in the Suidex pool {self._chain_executor.pool_object_id}")
+            self._base_decimals = await self._chain_executor.coin_decimals(pool.base_type)
+            self._quote_decimals = await self._chain_executor.coin_decimals(pool.quote_type)
+            self._pool = pool
+        elif market_symbol != f"{self._pool.base_symbol}-{self._pool.quote_symbol}":
+            raise ValueError(f"{market_symbol} is not traded in the Suidex pool {self._pool.pool_id}")
+        return self._pool
 
-        for orderbook_entry in orderbook_entries:
-            price = Decimal(str(orderbook_entry["p"]))
-            amount = Decimal(str(orderbook_entry["q"]))
+    async def order_book_snapshot(self, market_symbol: str, trading_pair: str) -> OrderBookMessage:
+        """
+        Reads the whole book only on the first call and after a gap. Otherwise the local book (kept up to date by the
+        pool events) is reconciled with a read of the levels around the touch, and returned.
+        """
+        await self._market_pool(market_symbol)
+        window = None
+        if not self._level2_book.needs_snapshot:
+            window = self._level2_book.touch_window(width=CONSTANTS.ORDER_BOOK_REFRESH_WINDOW)
+        price_range = {} if window is None else {"price_low": window[0], "price_high": window[1]}
 
-            if orderbook_entry["s"] == "Bid":
-                bids.append((price, amount))
-            else:
-                asks.append((price, amount))
+        async with self._throttler.execute_task(limit_id=CONSTANTS.ORDERBOOK_LIMIT_ID):
+            bids = await self._chain_executor.get_level2_book_status("bid", **price_range)
+            asks = await self._chain_executor.get_level2_book_status("ask", **price_range)
 
-            update_id = max(update_id, int(orderbook_entry["stid"]))
+        timestamp = self._time()
+        if window is None:
+            self._level2_book.apply_snapshot(bids=bids, asks=asks, update_id=int(timestamp * 1e3))
+        else:
+            self._level2_book.apply_window(True, *window, window=bids)
+            self._level2_book.apply_window(False, *window, window=asks)
 
         order_book_message_content = {
             "trading_pair": trading_pair,
-            "update_id": update_id,
-            "bids": bids,
-            "asks": asks,
+            "update_id": self._level2_book.update_id,
+            "bids": self._order_book_rows(is_bid=True),
+            "asks": self._order_book_rows(is_bid=False),
         }
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = CompactOrderBookMessage(
             message_type=OrderBookMessageType.SNAPSHOT,
             content=order_book_message_content,
             timestamp=timestamp,
@@ -283,37 +293,42 @@ class SuidexDataSource:
 
     async def user_main_address(self):
         if self._user_main_address is None:
-            async with self._throttler.execute_task(limit_id=CONSTANTS.FIND_USER_LIMIT_ID):
-                self._user_main_address = await self._query_executor.main_account_from_proxy(
-                    proxy_account=self._user_proxy_address,
-                )
+            self._user_main_address = self._chain_executor.connector.active_address
         return self._user_main_address
 
     async def last_price(self, market_symbol: str) -> float:
-        async with self._throttler.execute_task(limit_id=CONSTANTS.PUBLIC_TRADES_LIMIT_ID):
-            response = await self._query_executor.recent_trades(market_symbol=market_symbol, limit=1)
-        last_price = response["getRecentTrades"]["items"][0]["p"]
-
-        return float(last_price)
+        """the price of the last trade in the pool events, or the mid price of the book before any trade"""
+        if self._last_trade_price is not None:
+            return float(self._last_trade_price)
+        if self._level2_book.needs_snapshot:
+            await self.order_book_snapshot(market_symbol=market_symbol, trading_pair=self._trading_pair)
+        best_bid, best_ask = self._level2_book.best_price(is_bid=True), self._level2_book.best_price(is_bid=False)
+        if best_bid is None or best_ask is None:
+            raise IOError(f"No trade and no two-sided book in the {market_symbol} pool to take a price from.")
+        return float((self._from_chain_price(best_bid) + self._from_chain_price(best_ask)) / 2)
 
     async def all_balances(self) -> List[Dict[str, Any]]:
-        result = []
-        assets_map = await self.assets_map()
-        main_account = await self.user_main_address()
+        """the balances of the account in the configured pool"""
+        pool = await self._market_pool(self._trading_pair)
         async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_BALANCES_LIMIT_ID):
-            balances = await self._query_executor.get_all_balances_by_main_account(main_account=main_account)
+            base_avail, base_locked, quote_avail, quote_locked = await self._chain_executor.account_balance(
+                pool_object_id=pool.pool_id
+            )
 
-        for token_balance in balances["getAllBalancesByMainAccount"]["items"]:
-            try:
-                balance_info = {}
-                available_balance = Decimal(token_balance["f"])
-                locked_balance = Decimal(token_balance["r"])
-                balance_info["token_name"] = assets_map[token_balance["a"]]
-                balance_info["total_balance"] = available_balance + locked_balance
-                balance_info["available_balance"] = available_balance
-                result.append(balance_info)
-            except KeyError:
-                continue
+        result = []
+        for token_name, available, locked, decimals in (
+            (pool.base_symbol, base_avail, base_locked, self._base_decimals),
+            (pool.quote_symbol, quote_avail, quote_locked, self._quote_decimals),
+        ):
+            available_balance = suidex_utils.from_chain_quantity(available, decimals=decimals)
+            locked_balance = suidex_utils.from_chain_quantity(locked, decimals=decimals)
+            result.append(
+                {
+                    "token_name": token_name,
+                    "total_balance": available_balance + locked_balance,
+                    "available_balance": available_balance,
+                }
+            )
         return result
 
     async def place_order(
@@ -325,75 +340,139 @@ class SuidexDataSource:
         trade_type: TradeType,
         order_type: OrderType,
     ) -> Tuple[str, float]:
-        main_account = await self.user_main_address()
-        price = self.normalize_fraction(price)
-        amount = self.normalize_fraction(amount)
         timestamp = self._time()
-        order_parameters = {
-            "user": self._user_proxy_address,
-            "main_account": main_account,
-            "pair": market_symbol,
-            "qty": f"{amount}",
-            "price": f"{price}",
-            "quote_order_quantity": "0",  # No need to be 8 decimal points
-            "timestamp": int(timestamp * 1e3),
-            "client_order_id": client_order_id,
-            "order_type": self._suidex_order_type[order_type],
-            "side": self._suidex_trade_type[trade_type],
-        }
-
-        place_order_request = self._runtime_config.create_scale_object("OrderPayload").encode(order_parameters)
-        signature = self._keypair.sign(place_order_request)
+        await self._market_pool(market_symbol)
+        chain_client_order_id = self._register_client_order_id(client_order_id=client_order_id)
 
         async with self._throttler.execute_task(limit_id=CONSTANTS.PLACE_ORDER_LIMIT_ID):
-            response = await self._query_executor.place_order(
-                suidex_order=order_parameters,
-                signature={"Sr25519": signature.hex()},
+            success, exchange_order_id, _ = await self._order_batcher.place_order(
+                price=self._to_chain_price(price),
+                quantity=suidex_utils.to_chain_quantity(amount, decimals=self._base_decimals),
+                is_bid=trade_type == TradeType.BUY,
+                client_order_id=chain_client_order_id,
+                restriction=self._suidex_order_restriction[order_type],
             )
-            place_order_data = json.loads(response["place_order"])
-
-        exchange_order_id = None
-        if place_order_data["is_success"] is True:
-            exchange_order_id = place_order_data["body"]
 
-        if exchange_order_id is None:
+        if not success or exchange_order_id is None:
             raise ValueError(f"Error in Suidex creating order {client_order_id}")
 
         return exchange_order_id, timestamp
 
     async def cancel_order(self, order: InFlightOrder, market_symbol: str, timestamp: float) -> OrderState:
-        try:
-            cancel_result = await self._place_order_cancel(order=order, market_symbol=market_symbol)
-        except Exception as e:
-            if "Order is not active" in str(e):
-                new_order_state = OrderState.CANCELED
-            else:
-                raise
+        cancel_result = await self._place_order_cancel(order=order, market_symbol=market_symbol)
+
+        if cancel_result["cancel_order"]:
+            new_order_state = OrderState.PENDING_CANCEL
+        elif deepbook.move_abort_code(cancel_result["tx_result"]) == deepbook.EInvalidOrderId:
+            # the order is no longer resting in the pool
+            new_order_state = OrderState.CANCELED
         else:
-            new_order_state = OrderState.PENDING_CANCEL if cancel_result["cancel_order"] else order.current_state
+            new_order_state = order.current_state
 
         return new_order_state
 
-    async def order_update(self, order: InFlightOrder, market_symbol: str) -> OrderUpdate:
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ORDER_UPDATE_LIMIT_ID):
-            response = await self._query_executor.find_order_by_main_account(
-                main_account=self._user_proxy_address,
-                market_symbol=market_symbol,
-                order_id=order.exchange_order_id,
+    async def batch_order_create(self, orders_to_create: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """places all the orders in as few programmable transactions as possible, reporting the result of each one"""
+        timestamp = self._time()
+
+        async with self._throttler.execute_task(limit_id=CONSTANTS.BATCH_ORDER_UPDATES_LIMIT_ID):
+            place_results = await asyncio.gather(
+                *[self._place_batched_order(order=order) for order in orders_to_create],
+                return_exceptions=True,
             )
 
-        order_info = response["findOrderByMainAccount"]
+        results = []
+        for order, place_result in zip(orders_to_create, place_results):
+            exchange_order_id = None
+            misc_updates = {}
+            exception = None
+            if isinstance(place_result, Exception):
+                exception = place_result
+            else:
+                success, exchange_order_id, tx_result_json = place_result
+                misc_updates = {"creation_transaction_hash": (tx_result_json or {}).get("digest")}
+                if not success or exchange_order_id is None:
+                    exception = ValueError(f"Error in Suidex creating order {order.client_order_id}")
+            results.append(
+                PlaceOrderResult(
+                    update_timestamp=timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=exchange_order_id,
+                    trading_pair=order.trading_pair,
+                    misc_updates=misc_updates,
+                    exception=exception,
+                )
+            )
+        return results
+
+    async def batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """cancels all the orders in as few programmable transactions as possible, reporting the result of each one"""
+        async with self._throttler.execute_task(limit_id=CONSTANTS.BATCH_ORDER_UPDATES_LIMIT_ID):
+            cancel_results = await asyncio.gather(
+                *[self._order_batcher.cancel_order(order_id=int(order.exchange_order_id)) for order in orders_to_cancel],
+                return_exceptions=True,
+            )
+
+        results = []
+        for order, cancel_result in zip(orders_to_cancel, cancel_results):
+            misc_updates = {}
+            not_found = False
+            exception = None
+            if isinstance(cancel_result, Exception):
+                exception = cancel_result
+            else:
+                success, tx_result_json = cancel_result
+                misc_updates = {"cancelation_transaction_hash": (tx_result_json or {}).get("digest")}
+                if not success:
+                    if deepbook.move_abort_code(tx_result_json) == deepbook.EInvalidOrderId:
+                        not_found = True
+                    else:
+                        exception = ValueError(f"Error in Suidex canceling order {order.client_order_id}")
+            results.append(
+                CancelOrderResult(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    misc_updates=misc_updates,
+                    not_found=not_found,
+                    exception=exception,
+                )
+            )
+        return results
+
+    async def cancel_all_orders(self) -> Set[str]:
+        """cancels every order of the account in the pool with a single on-chain call
+
+        :return: the exchange order ids of the canceled orders
+        """
+        async with self._throttler.execute_task(limit_id=CONSTANTS.BATCH_ORDER_UPDATES_LIMIT_ID):
+            success, canceled, tx_result_json = await self._chain_executor.cancel_all_orders()
 
-        if order_info is None:
-            raise IOError(f"Order not found {order.client_order_id} ({order.exchange_order_id})")
+        if not success:
+            raise IOError(f"Error in Suidex canceling all orders ({tx_result_json})")
 
-        new_state = CONSTANTS.ORDER_STATE[order_info["st"]]
-        filled_amount = Decimal(order_info["fq"])
-        if new_state == OrderState.OPEN and filled_amount > 0:
-            new_state = OrderState.PARTIALLY_FILLED
+        return canceled
+
+    async def order_update(self, order: InFlightOrder, market_symbol: str) -> OrderUpdate:
+        """
+        The state of an order: open or partially filled while it rests in the pool, otherwise the state its last pool
+        event gave it.
+        """
+        pool = await self._market_pool(market_symbol)
+        async with self._throttler.execute_task(limit_id=CONSTANTS.ORDER_UPDATE_LIMIT_ID):
+            open_order = await self._chain_executor.get_order_status(
+                int(order.exchange_order_id), pool_object_id=pool.pool_id
+            )
+
+        if open_order is not None:
+            new_state = OrderState.PARTIALLY_FILLED if open_order.quantity < open_order.original_quantity else OrderState.OPEN
+        else:
+            new_state = self._order_states.get(order.exchange_order_id)
+            if new_state not in (OrderState.FILLED, OrderState.CANCELED):
+                # out of the pool, but its last event is not in yet
+                raise IOError(f"Order not found {order.client_order_id} ({order.exchange_order_id})")
         order_update = OrderUpdate(
             client_order_id=order.client_order_id,
-            exchange_order_id=order_info["id"],
+            exchange_order_id=order.exchange_order_id,
             trading_pair=order.trading_pair,
             update_timestamp=self._time(),
             new_state=new_state,
@@ -403,189 +482,239 @@ class SuidexDataSource:
     async def get_all_fills(
         self, from_timestamp: float, to_timestamp: float, orders: List[InFlightOrder]
     ) -> List[TradeUpdate]:
-        trade_updates = []
-
-        async with self._throttler.execute_task(limit_id=CONSTANTS.ALL_FILLS_LIMIT_ID):
-            fills = await self._query_executor.get_order_fills_by_main_account(
-                from_timestamp=from_timestamp, to_timestamp=to_timestamp, main_account=self._user_proxy_address
-            )
-
-        exchange_order_id_to_order = {order.exchange_order_id: order for order in orders}
-        for fill in fills["listTradesByMainAccount"]["items"]:
-            exchange_trading_pair = fill["m"]
-            trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-                symbol=exchange_trading_pair
-            )
-
-            price = Decimal(fill["p"])
-            size = Decimal(fill["q"])
-            order = exchange_order_id_to_order.get(fill["m_id"], None)
-            if order is None:
-                order = exchange_order_id_to_order.get(fill["t_id"], None)
-            if order is not None:
-                exchange_order_id = order.exchange_order_id
-                client_order_id = order.client_order_id
-
-                fee = await self._build_fee_for_event(event=fill, trade_type=order.trade_type)
-                trade_updates.append(
-                    TradeUpdate(
-                        trade_id=fill["trade_id"],
-                        client_order_id=client_order_id,
-                        exchange_order_id=exchange_order_id,
-                        trading_pair=trading_pair,
-                        fill_timestamp=int(fill["t"]) * 1e-3,
-                        fill_price=price,
-                        fill_base_amount=size,
-                        fill_quote_amount=price * size,
-                        fee=fee,
-                    )
-                )
-
-        return trade_updates
+        """the fills of `orders` between the two timestamps, from the pool events"""
+        client_order_ids = {order.client_order_id for order in orders}
+        # the fills of the orders no longer tracked are not needed any more
+        for client_order_id in list(self._trade_updates):
+            if client_order_id not in client_order_ids:
+                del self._trade_updates[client_order_id]
+
+        return [
+            trade_update
+            for client_order_id in client_order_ids
+            for trade_update in self._trade_updates.get(client_order_id, [])
+            if from_timestamp <= trade_update.fill_timestamp <= to_timestamp
+        ]
+
+    async def _place_batched_order(self, order: InFlightOrder) -> Tuple[bool, Optional[str], Any]:
+        await self._market_pool(await self._connector.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair))
+        return await self._order_batcher.place_order(
+            price=self._to_chain_price(order.price),
+            quantity=suidex_utils.to_chain_quantity(order.amount, decimals=self._base_decimals),
+            is_bid=order.trade_type == TradeType.BUY,
+            client_order_id=self._register_client_order_id(client_order_id=order.client_order_id),
+            restriction=self._suidex_order_restriction[order.order_type],
+        )
 
     async def _place_order_cancel(self, order: InFlightOrder, market_symbol: str) -> Dict[str, Any]:
-        cancel_request = self._runtime_config.create_scale_object("H256").encode(order.exchange_order_id)
-        signature = self._keypair.sign(cancel_request)
-
+        await self._market_pool(market_symbol)
         async with self._throttler.execute_task(limit_id=CONSTANTS.CANCEL_ORDER_LIMIT_ID):
-            cancel_result = await self._query_executor.cancel_order(
-                order_id=order.exchange_order_id,
-                market_symbol=market_symbol,
-                main_address=self._user_main_address,
-                proxy_address=self._user_proxy_address,
-                signature={"Sr25519": signature.hex()},
-            )
+            success, tx_result_json = await self._order_batcher.cancel_order(order_id=int(order.exchange_order_id))
 
-        return cancel_result
+        return {"cancel_order": success, "tx_result": tx_result_json}
 
-    def _process_order_book_event(self, event: Dict[str, Any], market_symbol: str):
-        safe_ensure_future(self._process_order_book_event_async(event=event, market_symbol=market_symbol))
-
-    async def _process_order_book_event_async(self, event: Dict[str, Any], market_symbol: str):
-        diff_data = json.loads(event["websocket_streams"]["data"])
-        timestamp = self._time()
-        update_id = diff_data["i"]
-        asks = [(Decimal(price), Decimal(amount)) for price, amount in diff_data["a"].items()]
-        bids = [(Decimal(price), Decimal(amount)) for price, amount in diff_data["b"].items()]
+    def _register_client_order_id(self, client_order_id: str) -> int:
+        chain_client_order_id = suidex_utils.chain_client_order_id(client_order_id)
+        self._client_order_ids[str(chain_client_order_id)] = client_order_id
+        return chain_client_order_id
 
-        order_book_message_content = {
-            "trading_pair": await self._connector.trading_pair_associated_to_exchange_symbol(symbol=market_symbol),
-            "update_id": update_id,
-            "bids": bids,
-            "asks": asks,
-        }
-        diff_message = OrderBookMessage(
-            message_type=OrderBookMessageType.DIFF,
-            content=order_book_message_content,
-            timestamp=timestamp,
-        )
-        self._publisher.trigger_event(event_tag=OrderBookEvent.OrderBookDataSourceUpdateEvent, message=diff_message)
+    def _process_chain_event(self, event: Dict[str, Any]):
+        self._last_received_message_time = self._time()
 
-    def _process_recent_trades_event(self, event: Dict[str, Any]):
-        safe_ensure_future(self._process_recent_trades_event_async(event=event))
+        name = deepbook.event_name(event)
+        data = event["parsedJson"]
+        update_id = int(event["timestampMs"]) if event.get("timestampMs") else int(self._time() * 1e3)
 
-    async def _process_recent_trades_event_async(self, event: Dict[str, Any]):
-        trade_data = json.loads(event["websocket_streams"]["data"])
+        if name == "OrderPlaced":
+            self._process_order_placed_event(data=data, update_id=update_id)
+        elif name == "OrderCanceled":
+            self._process_order_canceled_event(
+                data=data, quantity=int(data["base_asset_quantity_canceled"]), update_id=update_id
+            )
+        elif name == "AllOrdersCanceled":
+            for order in data["orders_canceled"]:
+                self._process_order_canceled_event(
+                    data=order, quantity=int(order["base_asset_quantity_canceled"]), update_id=update_id
+                )
+        elif name == "OrderFilled":
+            self._process_order_filled_event(data=data, event_id=event["id"], update_id=update_id)
+
+    def _process_order_placed_event(self, data: Dict[str, Any], update_id: int):
+        self._apply_book_change(
+            is_bid=data["is_bid"],
+            price=int(data["price"]),
+            quantity_change=int(data["base_asset_quantity_placed"]),
+            update_id=update_id,
+        )
+        if data["owner"] == self._chain_executor.account_cap:
+            self._publish_order_update(data=data, new_state=OrderState.OPEN, update_id=update_id)
 
-        exchange_trading_pair = trade_data["m"]
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=exchange_trading_pair)
-        timestamp = int(trade_data["t"]) * 1e-3
-        trade_type = float(self._hummingbot_trade_type[trade_data["m_side"]].value)
-        message_content = {
-            "trade_id": trade_data["trade_id"],
-            "trading_pair": trading_pair,
-            "trade_type": trade_type,
-            "amount": Decimal(str(trade_data["q"])),
-            "price": Decimal(str(trade_data["p"])),
-        }
+    def _process_order_canceled_event(self, data: Dict[str, Any], quantity: int, update_id: int):
+        self._apply_book_change(
+            is_bid=data["is_bid"], price=int(data["price"]), quantity_change=-quantity, update_id=update_id
+        )
+        if data["owner"] == self._chain_executor.account_cap:
+            self._publish_order_update(data=data, new_state=OrderState.CANCELED, update_id=update_id)
+
+    def _process_order_filled_event(self, data: Dict[str, Any], event_id: Dict[str, str], update_id: int):
+        trade_id = f"{event_id['txDigest']}-{event_id['eventSeq']}"
+        maker_is_bid = data["is_bid"]
+        price = self._from_chain_price(int(data["price"]))
+        amount = suidex_utils.from_chain_quantity(int(data["base_asset_quantity_filled"]), decimals=self._base_decimals)
+        timestamp = update_id * 1e-3
+        self._last_trade_price = price
+
+        self._apply_book_change(
+            is_bid=maker_is_bid,
+            price=int(data["price"]),
+            quantity_change=-int(data["base_asset_quantity_filled"]),
+            update_id=update_id,
+        )
         trade_message = OrderBookMessage(
             message_type=OrderBookMessageType.TRADE,
-            content=message_content,
+            content={
+                "trade_id": trade_id,
+                "trading_pair": self._trading_pair,
+                "trade_type": float(TradeType.SELL.value if maker_is_bid else TradeType.BUY.value),
+                "amount": amount,
+                "price": price,
+            },
             timestamp=timestamp,
         )
         self._publisher.trigger_event(event_tag=OrderBookEvent.TradeEvent, message=trade_message)
 
-    def _process_private_event(self, event: Dict[str, Any]):
-        event_data = json.loads(event["websocket_streams"]["data"])
+        account_cap = self._chain_executor.account_cap
+        if data["maker_address"] == account_cap:
+            self._publish_trade_update(
+                trade_id=f"{trade_id}-maker",
+                client_order_id=self._client_order_ids.get(str(data["maker_client_order_id"])),
+                exchange_order_id=str(data["order_id"]),
+                trade_type=TradeType.BUY if maker_is_bid else TradeType.SELL,
+                price=price,
+                amount=amount,
+                fee_amount=-suidex_utils.from_chain_quantity(
+                    int(data["maker_rebates"]), decimals=self._quote_decimals
+                ),
+                is_taker=False,
+                timestamp=timestamp,
+            )
+            new_state = OrderState.FILLED if int(data["base_asset_quantity_remaining"]) == 0 else OrderState.PARTIALLY_FILLED
+            self._publish_order_update(
+                data={"client_order_id": data["maker_client_order_id"], "order_id": data["order_id"]},
+                new_state=new_state,
+                update_id=update_id,
+            )
+        if data["taker_address"] == account_cap:
+            self._publish_trade_update(
+                trade_id=f"{trade_id}-taker",
+                client_order_id=self._client_order_ids.get(str(data["taker_client_order_id"])),
+                exchange_order_id=None,
+                trade_type=TradeType.SELL if maker_is_bid else TradeType.BUY,
+                price=price,
+                amount=amount,
+                fee_amount=suidex_utils.from_chain_quantity(
+                    int(data["taker_commission"]), decimals=self._quote_decimals
+                ),
+                is_taker=True,
+                timestamp=timestamp,
+            )
 
-        if event_data["type"] == "SetBalance":
-            safe_ensure_future(self._process_balance_event(event=event_data))
-        elif event_data["type"] == "Order":
-            safe_ensure_future(self._process_private_order_update_event(event=event_data))
-        elif event_data["type"] == "TradeFormat":
-            safe_ensure_future(self._process_private_trade_event(event=event_data))
+    def _apply_book_change(self, is_bid: bool, price: int, quantity_change: int, update_id: int):
+        gaps = self._level2_book.gaps
+        depth = self._level2_book.apply_change(
+            is_bid=is_bid, price=price, quantity_change=quantity_change, update_id=update_id
+        )
+        if depth is None:
+            # either already reflected in the last snapshot, or a change was missed and the book must be read again
+            if self._level2_book.gaps > gaps:
+                self._schedule_order_book_resync()
+            return
+
+        level = (self._from_chain_price(price), suidex_utils.from_chain_quantity(depth, decimals=self._base_decimals))
+        diff_message = CompactOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": self._trading_pair,
+                "update_id": update_id,
+                "bids": [level] if is_bid else [],
+                "asks": [] if is_bid else [level],
+            },
+            timestamp=update_id * 1e-3,
+        )
+        self._publisher.trigger_event(event_tag=OrderBookEvent.OrderBookDataSourceUpdateEvent, message=diff_message)
 
-    async def _process_balance_event(self, event: Dict[str, Any]):
-        self._last_received_message_time = self._time()
+    def _schedule_order_book_resync(self):
+        if self._order_book_resync_task is None or self._order_book_resync_task.done():
+            self.logger().warning(f"Gap detected in the {self._trading_pair} order book events. Reading the full book.")
+            self._order_book_resync_task = safe_ensure_future(self._resync_order_book())
 
-        assets_map = await self.assets_map()
+    async def _resync_order_book(self):
+        snapshot = await self.order_book_snapshot(market_symbol=self._trading_pair, trading_pair=self._trading_pair)
+        self._publisher.trigger_event(event_tag=OrderBookEvent.OrderBookDataSourceUpdateEvent, message=snapshot)
 
-        asset_name = assets_map[event["asset"]["asset"]]
-        available_balance = Decimal(event["free"])
-        reserved_balance = Decimal(event["reserved"])
-        balance_msg = BalanceUpdateEvent(
-            timestamp=self._time(),
-            asset_name=asset_name,
-            total_balance=available_balance + reserved_balance,
-            available_balance=available_balance,
-        )
-        self._publisher.trigger_event(event_tag=AccountEvent.BalanceEvent, message=balance_msg)
+    def _order_book_rows(self, is_bid: bool) -> List[Tuple[Decimal, Decimal]]:
+        return [
+            (self._from_chain_price(price), suidex_utils.from_chain_quantity(depth, decimals=self._base_decimals))
+            for price, depth in self._level2_book.levels(is_bid=is_bid)
+        ]
 
-    async def _process_private_order_update_event(self, event: Dict[str, Any]):
-        self._last_received_message_time = self._time()
+    def _to_chain_price(self, price: Decimal) -> int:
+        return suidex_utils.to_chain_price(price, base_decimals=self._base_decimals, quote_decimals=self._quote_decimals)
 
-        exchange_order_id = event["id"]
-        base = event["pair"]["base"]["asset"]
-        quote = event["pair"]["quote"]["asset"]
-        trading_pair = combine_to_hb_trading_pair(base=self._assets_map[base], quote=self._assets_map[quote])
-        fill_amount = Decimal(event["filled_quantity"])
-        order_state = CONSTANTS.ORDER_STATE[event["status"]]
+    def _from_chain_price(self, price: int) -> Decimal:
+        return suidex_utils.from_chain_price(price, base_decimals=self._base_decimals, quote_decimals=self._quote_decimals)
 
-        if order_state == OrderState.OPEN and fill_amount > 0:
-            order_state = OrderState.PARTIALLY_FILLED
+    def _publish_order_update(self, data: Dict[str, Any], new_state: OrderState, update_id: int):
+        client_order_id = self._client_order_ids.get(str(data["client_order_id"]))
+        if client_order_id is None:
+            # not placed by this connector
+            return
         order_update = OrderUpdate(
-            trading_pair=trading_pair,
-            update_timestamp=event["stid"],
-            new_state=order_state,
-            client_order_id=event["client_order_id"],
-            exchange_order_id=exchange_order_id,
+            trading_pair=self._trading_pair,
+            update_timestamp=update_id * 1e-3,
+            new_state=new_state,
+            client_order_id=client_order_id,
+            exchange_order_id=str(data["order_id"]),
         )
+        self._order_states[order_update.exchange_order_id] = new_state
         self._publisher.trigger_event(event_tag=MarketEvent.OrderUpdate, message=order_update)
 
-    async def _process_private_trade_event(self, event: Dict[str, Any]):
-        exchange_trading_pair = event["m"]
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=exchange_trading_pair)
-        price = Decimal(event["p"])
-        size = Decimal(event["q"])
-        trade_type = self._hummingbot_trade_type[event["s"]]
-        fee = await self._build_fee_for_event(event=event, trade_type=trade_type)
+    def _publish_trade_update(
+        self,
+        trade_id: str,
+        client_order_id: Optional[str],
+        exchange_order_id: Optional[str],
+        trade_type: TradeType,
+        price: Decimal,
+        amount: Decimal,
+        fee_amount: Decimal,
+        is_taker: bool,
+        timestamp: float,
+    ):
+        if client_order_id is None:
+            # not placed by this connector
+            return
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self._connector.trade_fee_schema(),
+            trade_type=trade_type,
+            percent_token=CONSTANTS.QUOTE_ASSET_NAME,
+            flat_fees=[TokenAmount(token=CONSTANTS.QUOTE_ASSET_NAME, amount=fee_amount)],
+        )
         trade_update = TradeUpdate(
-            trade_id=event["trade_id"],
-            client_order_id=event["cid"],
-            exchange_order_id=event["order_id"],
-            trading_pair=trading_pair,
-            fill_timestamp=self._time(),
+            trade_id=trade_id,
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self._trading_pair,
+            fill_timestamp=timestamp,
             fill_price=price,
-            fill_base_amount=size,
-            fill_quote_amount=price * size,
+            fill_base_amount=amount,
+            fill_quote_amount=price * amount,
             fee=fee,
+            is_taker=is_taker,
         )
-
+        self._trade_updates[client_order_id].append(trade_update)
         self._publisher.trigger_event(event_tag=MarketEvent.TradeUpdate, message=trade_update)
 
-    async def _build_fee_for_event(self, event: Dict[str, Any], trade_type: TradeType) -> TradeFeeBase:
-        """Builds a TradeFee object from the given event data."""
-        exchange_trading_pair = event["m"]
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=exchange_trading_pair)
-        _, quote = split_hb_trading_pair(trading_pair=trading_pair)
-        fee = TradeFeeBase.new_spot_fee(
-            fee_schema=self._connector.trade_fee_schema(),
-            trade_type=trade_type,
-            percent_token=quote,
-            flat_fees=[TokenAmount(token=quote, amount=Decimal("0"))],  # feels will be zero for the foreseeable future
-        )
-        return fee
-
     def _time(self):
         return time.time()
 
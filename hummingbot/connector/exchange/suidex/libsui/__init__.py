@@ -4,15 +4,24 @@ import collections.abc
 import json
 import logging
 import os
+import threading
 
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pysui
 import pysui.sui.sui_txn
 
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from pysui.sui.sui_builders.get_builders import GetObjectsOwnedByAddress
+from pysui.sui.sui_types.scalars import ObjectID, SuiInteger
 
 ONE_SUI = 10**9
+DEFAULT_GAS_BUDGET = 10_000_000  # for transactions whose shape has no estimate, see `gas_estimator`
+
+OBJECTS_PAGE_SIZE = 50
+OBJECTS_CACHE_TTL = 60
+OBJECTS_CACHE_SIZE = 1024
 
 """'accounting' currency for calculations; outside of Sui, this is often called the "base currency".
 
@@ -35,14 +44,19 @@ __all__ = [
     "ASSET_QUOTE",
     "ASSET_BASE",
     "ASSET_SUI",
+    "DEFAULT_GAS_BUDGET",
     "NETS",
     "RPC_PORT",
     "RPC_URL",
     "ONE_SUI",
+    "decode_u64_vector",
     "ensure_init",
     "execute_and_handle_result",
+    "find_objects",
     "init",
+    "invalidate_objects",
     "logger",
+    "query_objects",
 ]
 
 
@@ -66,6 +80,10 @@ _USER_CONFIG = None
 _CFG = None
 _CLIENT = None
 
+# (owner, struct type) -> objects found by `find_objects`
+_objects_cache: TTLCache = TTLCache(maxsize=OBJECTS_CACHE_SIZE, ttl=OBJECTS_CACHE_TTL)
+_objects_cache_lock = threading.Lock()
+
 
 def logger():
     global _logger
@@ -186,10 +204,12 @@ def execute_and_handle_result(
     debug: Optional[bool] = None,
     strict: Optional[bool] = None,
     logger: Optional[logging.Logger] = None,
+    use_gas_object: Optional[str] = None,
+    gas_budget: int = DEFAULT_GAS_BUDGET,
 ) -> Tuple[bool, str, Any]:
     logger = logging.getLogger() if logger is None else logger
     handler = lambda result, debug=debug: libsui_rpc_handler(result, debug=debug)
-    result = pysui.handle_result(txn.execute(gas_budget="10000000"), handler=handler)
+    result = pysui.handle_result(txn.execute(gas_budget=str(gas_budget), use_gas_object=use_gas_object), handler=handler)
     if debug:
         tx_result, tx_result_data = result
     else:
@@ -209,32 +229,96 @@ def execute_and_handle_result(
     return success, tx_result_json, tx_result
 
 
-def find_objects(client, sui_type, address_owner=None, ordered_by_type_version=True):
-    find_results = client.get_objects(address=address_owner)
-    try:
-        active_address = str(client._config._active_address)
-    except Exception as ex:
-        active_address = f"<unable to access in {client=}: {ex=}"
-    if not find_results:
-        logger().warning(f"find_objects(..): no results from client.get_objects({address_owner=}) ({active_address=}")
-        return None
-
-    objects_all = find_results.result_data.to_dict()["data"]
-    if not objects_all:
-        logger().warning(f"find_objects(..): empty list from client.get_objects({address_owner=})?! ({active_address=}")
-        return []
-    if ordered_by_type_version:
-        objects_all = list(sorted(objects_all, key=lambda el: (el["type"], el["version"])))
+def query_objects(
+    client, struct_type: str, address_owner=None, cursor: Optional[str] = None, limit: int = OBJECTS_PAGE_SIZE
+) -> Tuple[List[dict], Optional[str], bool]:
+    """one page of the objects of `struct_type` owned by `address_owner` (by default the active address)
+
+    The full node filters by type (`suix_getOwnedObjects` with a `StructType` filter), so the cost of a lookup does not
+    depend on how many other objects the address holds. Omitting the type parameters of a generic struct matches all
+    of its instantiations, e.g. `0x2::coin::Coin` matches every coin.
 
-    objects = [o for o in objects_all if sui_type in o["type"]]
+    :return: (object dicts with `objectId`, `version` and `type`, next_cursor, has_next_page)
+    """
+    address_owner = client.config.active_address if address_owner is None else address_owner
+    builder = GetObjectsOwnedByAddress(
+        address=address_owner,
+        query={"filter": {"StructType": struct_type}, "options": {"showType": True, "showOwner": True}},
+        cursor=None if cursor is None else ObjectID(cursor),
+        limit=SuiInteger(limit),
+    )
+    page = libsui_rpc_handler(client.execute(builder), debug=False).to_dict()
+    return page["data"], page["nextCursor"], page["hasNextPage"]
+
+
+def find_objects(client, struct_type, address_owner=None, ordered_by_type_version=True, use_cache=True):
+    """every object of `struct_type` owned by `address_owner`, paging through `query_objects`
+
+    Results are cached for OBJECTS_CACHE_TTL seconds per (owner, struct type); call `invalidate_objects` after a
+    transaction that creates or deletes objects of that type.
+    """
+    address_owner = client.config.active_address if address_owner is None else address_owner
+    key = (str(address_owner), struct_type)
+    if use_cache:
+        with _objects_cache_lock:
+            objects = _objects_cache.get(key)
+        if objects is not None:
+            return list(objects)
+
+    objects, cursor, has_next_page = [], None, True
+    while has_next_page:
+        page, cursor, has_next_page = query_objects(client, struct_type, address_owner=address_owner, cursor=cursor)
+        objects.extend(page)
+    if ordered_by_type_version:
+        objects.sort(key=lambda el: (el["type"], int(el["version"])))
 
     if not objects:
-        logger().warning(
-            f"find_objects(..): found no objects of type {sui_type=} from {len(objects_all)} objects returned by client.get_objects({address_owner=}) ({active_address=}"
-        )
+        logger().warning(f"find_objects(..): found no objects of {struct_type=} owned by {address_owner}")
     else:
-        logger().debug(
-            f"find_objects(..): found {len(objects)} objects of type {sui_type=} from {len(objects_all)} objects returned by client.get_objects({address_owner=}) ({active_address=}"
-        )
+        logger().debug(f"find_objects(..): found {len(objects)} objects of {struct_type=} owned by {address_owner}")
+
+    with _objects_cache_lock:
+        _objects_cache[key] = objects
+    return list(objects)
+
+
+def invalidate_objects(address_owner, struct_type):
+    with _objects_cache_lock:
+        _objects_cache.pop((str(address_owner), struct_type), None)
 
-    return objects
+
+def decode_u64_vector(raw) -> List[int]:
+    """decode a BCS-encoded `vector<u64>` as returned in dev-inspect `returnValues`
+
+    >>> decode_u64_vector([2, 1, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0])
+    [1, 2]
+    """
+    data = bytes(raw)
+    length, shift, offset = 0, 0, 0
+    while True:  # ULEB128 length prefix
+        byte = data[offset]
+        offset += 1
+        length |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+        shift += 7
+    return [int.from_bytes(data[offset + 8 * i:offset + 8 * (i + 1)], "little") for i in range(length)]
+
+
+def decode_order(raw) -> Dict[str, Any]:
+    """decode a BCS-encoded `clob_v2::Order` as returned in dev-inspect `returnValues`, keyed by the Move field names"""
+    data = bytes(raw)
+    order_id, client_order_id, price, original_quantity, quantity = (
+        int.from_bytes(data[8 * i:8 * (i + 1)], "little") for i in range(5)
+    )
+    return {
+        "order_id": order_id,
+        "client_order_id": client_order_id,
+        "price": price,
+        "original_quantity": original_quantity,
+        "quantity": quantity,
+        "is_bid": data[40] == 1,
+        "owner": "0x" + data[41:73].hex(),
+        "expire_timestamp": int.from_bytes(data[73:81], "little"),
+        "self_matching_prevention": data[81],
+    }
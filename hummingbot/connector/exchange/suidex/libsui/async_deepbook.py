@@ -0,0 +1,103 @@
+"""Non-blocking access to the Deep Book for code running on the asyncio event loop
+
+`DeepbookConnector` builds a pysui `SyncTransaction` per call and blocks until
+the RPC round trip(s) complete.  `AsyncDeepbookConnector` runs those calls on a
+dedicated thread pool (sharing the connector's pysui client and its HTTP
+connection pool) so that awaiting a chain call never stalls the event loop.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.exchange.suidex.libsui.deepbook import DeepbookOrder
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import DeepbookPool
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class AsyncDeepbookConnector:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self, connector, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        :param connector: the blocking connector (a `DeepbookConnector` or anything implementing its interface)
+        :param max_workers: number of chain calls that can be in flight at the same time
+        """
+        self._connector = connector
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deepbook")
+
+    @property
+    def connector(self):
+        return self._connector
+
+    @property
+    def account_cap(self) -> Optional[str]:
+        return self._connector.account_cap
+
+    @property
+    def pool_object_id(self) -> Optional[str]:
+        return self._connector.pool_object_id
+
+    async def place_limit_order(self, price: int, quantity: int, **kwargs) -> Tuple[bool, int, Optional[str], Any]:
+        return await self._run(self._connector.place_limit_order, price, quantity, **kwargs)
+
+    async def cancel_order(self, order_id: int, **kwargs) -> Tuple[bool, Any]:
+        return await self._run(self._connector.cancel_order, order_id, **kwargs)
+
+    async def batch_cancel_order(self, order_ids: List[int], **kwargs) -> Tuple[bool, Set[str], Any]:
+        return await self._run(self._connector.batch_cancel_order, order_ids, **kwargs)
+
+    async def cancel_all_orders(self, **kwargs) -> Tuple[bool, Set[str], Any]:
+        return await self._run(self._connector.cancel_all_orders, **kwargs)
+
+    async def execute_batch(
+        self, place_orders: List[Dict[str, Any]], cancel_order_ids: List[int], **kwargs
+    ) -> Tuple[bool, Dict[str, str], Set[str], Any]:
+        return await self._run(self._connector.execute_batch, place_orders, cancel_order_ids, **kwargs)
+
+    async def account_balance(self, **kwargs) -> Tuple[int, int, int, int]:
+        return await self._run(self._connector.account_balance, **kwargs)
+
+    async def get_level2_book_status(self, side: str, **kwargs) -> Tuple[List[int], List[int]]:
+        return await self._run(self._connector.get_level2_book_status, side, **kwargs)
+
+    async def query_events(
+        self, cursor: Optional[Dict[str, str]] = None, **kwargs
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]], bool]:
+        return await self._run(self._connector.query_events, cursor, **kwargs)
+
+    async def latest_event_cursor(self) -> Optional[Dict[str, str]]:
+        return await self._run(self._connector.latest_event_cursor)
+
+    async def list_pools(self, **kwargs) -> List[DeepbookPool]:
+        return await self._run(self._connector.list_pools, **kwargs)
+
+    async def coin_decimals(self, coin_type: str) -> int:
+        return await self._run(self._connector.coin_decimals, coin_type)
+
+    async def get_order_status(self, pool_order_id: int, **kwargs) -> Optional[DeepbookOrder]:
+        return await self._run(self._connector.get_order_status, pool_order_id, **kwargs)
+
+    async def deposit_base(self, amount_base: int, **kwargs) -> Any:
+        return await self._run(self._connector.deposit_base, amount_base, **kwargs)
+
+    async def deposit_quote(self, amount_quote: int, **kwargs) -> Any:
+        return await self._run(self._connector.deposit_quote, amount_quote, **kwargs)
+
+    def close(self):
+        """stops accepting new calls; calls already in flight are allowed to finish"""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, function: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
@@ -3,24 +3,35 @@
 import datetime
 import json
 import logging
-import numpy as np
 import os
 import random
+import re
+import time
 
+from dataclasses import dataclass
 from decimal import Decimal as D
-from pprint import pprint
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
 # from numpy.random import PCG64, Generator
-from pysui.sui.sui_builders.get_builders import GetObjectsOwnedByAddress
+from pysui.sui.sui_builders.get_builders import GetObjectsOwnedByAddress, QueryEvents
 from pysui.sui.sui_txn import SyncTransaction
+from pysui.sui.sui_txresults.complex_tx import TxInspectionResult
 
 # from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_types.scalars import ObjectID, SuiBoolean, SuiU8, SuiU64
+from pysui.sui.sui_types.collections import EventID
+from pysui.sui.sui_types.event_filter import MoveEventModuleQuery
+from pysui.sui.sui_types.scalars import SuiBoolean, SuiInteger, SuiU8, SuiU64
 
 import hummingbot.connector.exchange.suidex.libsui as libsui
+from hummingbot.connector.exchange.suidex.libsui.gas_estimator import GasEstimator
+from hummingbot.connector.exchange.suidex.libsui.object_cache import (
+    DEFAULT_GAS_COIN_POOL_SIZE,
+    GasCoinPool,
+    ObjectRefCache,
+)
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import DeepbookPool, PoolRegistry
 
 from hummingbot.logger import HummingbotLogger
 
@@ -54,6 +65,17 @@ EInvalidExpireTimestamp = 19
 EInvalidTickSizeMinSize = 20
 EInvalidSelfMatchingPreventionArg = 21
 
+CANCEL_OLDEST = 0  # self-matching prevention
+
+NO_RESTRICTION = 0
+IMMEDIATE_OR_CANCEL = 1
+FILL_OR_KILL = 2
+POST_OR_ABORT = 3
+
+CLOCK_OBJECT_ID = "0x6"
+ORDER_TTL_MS = 24 * 60 * 60 * 1000
+EVENTS_PAGE_SIZE = 50
+
 
 _DEEPBOOK = None
 
@@ -79,6 +101,64 @@ def _client_trade_id(msg=None, epoch=10**17):
     return epoch + int(datetime.datetime.now().timestamp())
 
 
+def order_side(quantity, is_bid=None):
+    """`(is_bid, quantity)` of an order given as a signed quantity: positive for a bid, negative for an ask"""
+    if quantity == 0:
+        raise ValueError(f"quantity was 0; why are you placing an order?! ({quantity=}")
+    if quantity < 0:
+        if is_bid is not None and is_bid is True:
+            raise ValueError(f"contradictory inputs: {is_bid=} but {quantity=} < 0")
+        return False, abs(quantity)
+    if (quantity > 0) and (is_bid is not None) and (is_bid is False):
+        raise ValueError(f"contradictory inputs: {is_bid=} but {quantity=} > 0")
+    return True, quantity
+
+
+def _default_expire_timestamp(ttl_ms=ORDER_TTL_MS):
+    return int(time.time() * 1000) + ttl_ms
+
+
+def _events_of_type(tx_result_json, event_name):
+    """parsedJson of the `clob_v2::<event_name><..>` events emitted by a transaction"""
+    events = (tx_result_json or {}).get("events", None) or []
+    return [e["parsedJson"] for e in events if f"::clob_v2::{event_name}<" in e.get("type", "")]
+
+
+def _canceled_order_ids(tx_result_json):
+    """pool order ids (as str) reported canceled by `OrderCanceled` and `AllOrdersCanceled` events"""
+    canceled = {e["order_id"] for e in _events_of_type(tx_result_json, "OrderCanceled")}
+    for e in _events_of_type(tx_result_json, "AllOrdersCanceled"):
+        canceled.update(component["order_id"] for component in e["orders_canceled"])
+    return canceled
+
+
+def event_name(event):
+    """`OrderPlaced` for an event of type `0x..::clob_v2::OrderPlaced<..>`"""
+    return event["type"].split("::")[2].split("<")[0]
+
+
+def move_abort_code(tx_result_json):
+    """the abort code of a failed Move call, e.g. `EInvalidOrderId`, or None"""
+    error = (tx_result_json or {}).get("effects", {}).get("status", {}).get("error", "") or ""
+    match = re.search(r"MoveAbort\(.*, (\d+)\) in command", error)
+    return int(match.group(1)) if match else None
+
+
+@dataclass
+class DeepbookOrder:
+    """a `clob_v2::Order` resting in a pool"""
+
+    order_id: int
+    client_order_id: int
+    price: int
+    original_quantity: int
+    quantity: int
+    is_bid: bool
+    owner: str
+    expire_timestamp: int
+    self_matching_prevention: int
+
+
 class DeepbookConnector:
     _logger: Optional[HummingbotLogger] = None
 
@@ -88,7 +168,16 @@ class DeepbookConnector:
             cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
         return cls._logger
 
-    def __init__(self, client=None, cfg=None, package_id=None, pool_object_id=None, net=None, account_cap=None):
+    def __init__(
+        self,
+        client=None,
+        cfg=None,
+        package_id=None,
+        pool_object_id=None,
+        net=None,
+        account_cap=None,
+        gas_coin_pool_size=DEFAULT_GAS_COIN_POOL_SIZE,
+    ):
         load_dotenv()
 
         if not all((client, cfg, net)):
@@ -105,9 +194,13 @@ class DeepbookConnector:
 
         self.client = client
         self.cfg = cfg
+        self.objects = ObjectRefCache(client)
+        self.gas_coins = GasCoinPool(client, size=gas_coin_pool_size)
+        self.gas = GasEstimator(client)
         self.account_cap = account_cap
         self.package_id = package_id
         self.pool_object_id = pool_object_id
+        self.pools = PoolRegistry(client, package_id)
 
         if self.account_cap is None:
             self.account_cap = self.get_account_cap(create_if_needed=True)
@@ -135,32 +228,76 @@ class DeepbookConnector:
         else:
             return self.cfg.active_address
 
-    def account_balance(self, asset_base=None, asset_quote=None, pool=None, account_cap=None):
+    def list_pools(self, refresh=False) -> List[DeepbookPool]:
+        """every Deepbook pool of the package, from the in-memory registry"""
+        return self.pools.pools(refresh=refresh)
+
+    def coin_decimals(self, coin_type) -> int:
+        return self.pools.coin_decimals(coin_type)
+
+    def _asset_type(self, asset):
+        return libsui.TYPE_SUI if asset == libsui.ASSET_SUI else f"{self.package_id}::{asset}"
+
+    def _type_arguments(self, pool_object_id=None):
+        """`[BaseAsset, QuoteAsset]` of a pool; the SUI/REALUSDC pair of the package if the registry does not know it"""
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        pool = self.pools.pool_by_id(pool_object_id)
+        if pool is None:
+            return [libsui.TYPE_SUI, f"{self.package_id}::{libsui.ASSET_ACCOUNTING}"]
+        return pool.type_arguments
+
+    def _object(self, object_id):
+        """move call argument for a shared or owned object, without a lookup once the object is cached"""
+        return self.objects.get(object_id)
+
+    def _execute(self, txn, pooled_gas=True, shape=None):
+        """executes `txn` and moves the cached owned objects to the versions it produced
+
+        :param pooled_gas: pay with a coin of `self.gas_coins` that no other in-flight transaction uses; transactions
+            splitting an amount off `txn.gas` (deposits, pool creation fees) let pysui pick a large enough coin instead
+        :param shape: key of the transactions `txn` costs as much gas as, e.g. `("cancel_order",)`; its budget comes
+            from `self.gas`, otherwise `txn` gets `libsui.DEFAULT_GAS_BUDGET`
+        """
+        gas_budget = libsui.DEFAULT_GAS_BUDGET if shape is None else self.gas.budget(shape, txn)
+        try:
+            if pooled_gas:
+                with self.gas_coins.coin() as gas_coin:
+                    success, tx_result_json, tx_result = libsui.execute_and_handle_result(
+                        txn, use_gas_object=gas_coin, gas_budget=gas_budget
+                    )
+            else:
+                success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn, gas_budget=gas_budget)
+        except Exception:
+            # the transaction may or may not have executed: owned versions must be looked up again
+            self.objects.invalidate_owned()
+            raise
+        self.objects.update_from_effects(tx_result_json)
+        if shape is not None:
+            self.gas.observe(shape, tx_result_json)
+        return success, tx_result_json, tx_result
+
+    def account_balance(self, pool_object_id=None, account_cap=None):
         """public fun account_balance<BaseAsset, QuoteAsset>(
         pool: &Pool<BaseAsset, QuoteAsset>,
         account_cap: &AccountCap)
         """
         self.logger().debug(f"account_balance(..): calling...")
 
-        asset_quote = libsui.ASSET_ACCOUNTING if asset_quote is None else asset_quote
-        asset_base = libsui.ASSET_SUI if asset_base is None else asset_base
-        pool_object_id = self.pool_object_id if pool is None else pool
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
         account_cap = self.account_cap if account_cap is None else account_cap
 
-        type_base = libsui.TYPE_SUI
-        type_quote = f"{self.package_id}::{asset_quote}"
-
-        txn = SyncTransaction(client=self.client)
-        result = txn.move_call(
-            target=f"{self.package_id}::clob_v2::account_balance",
-            arguments=[
-                ObjectID(pool_object_id),
-                ObjectID(account_cap),
-            ],
-            type_arguments=[type_base, type_quote],
-        )
+        with self.objects.lease(account_cap):
+            txn = SyncTransaction(client=self.client)
+            result = txn.move_call(
+                target=f"{self.package_id}::clob_v2::account_balance",
+                arguments=[
+                    self._object(pool_object_id),
+                    self._object(account_cap),
+                ],
+                type_arguments=self._type_arguments(pool_object_id),
+            )
 
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
+            success, tx_result_json, tx_result = self._execute(txn, shape=("account_balance",))
         self.logger().debug(tx_result_json)
 
         if success:
@@ -177,9 +314,20 @@ class DeepbookConnector:
         """public fun asks<BaseAsset, QuoteAsset>(pool: &Pool<BaseAsset, QuoteAsset>): &CritbitTree<TickLevel> {"""
         raise NotImplementedError()
 
-    def batch_cancel_order(self, *args, **kwargs):
-        """public fun batch_cancel_order<BaseAsset, QuoteAsset>("""
-        raise NotImplementedError()
+    def batch_cancel_order(self, order_ids, account_cap=None, pool_object_id=None):
+        """public fun batch_cancel_order<BaseAsset, QuoteAsset>(
+
+        :return: (success, {canceled pool order ids}, tx_result_json)
+        """
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+
+        with self.objects.lease(account_cap):
+            txn = SyncTransaction(client=self.client)
+            self._move_call_cancel_orders(txn, order_ids, account_cap, pool_object_id)
+            success, tx_result_json, tx_result = self._execute(txn, shape=("batch_cancel_order", len(order_ids)))
+        self.logger().debug(tx_result_json)
+        return success, _canceled_order_ids(tx_result_json), tx_result_json
 
     def bids(self, *args, **kwargs):
         """public fun bids<BaseAsset, QuoteAsset>(pool: &Pool<BaseAsset, QuoteAsset>): &CritbitTree<TickLevel> {"""
@@ -197,13 +345,47 @@ class DeepbookConnector:
         """public fun borrow_mut_pool<BaseAsset, QuoteAsset>("""
         raise NotImplementedError()
 
-    def cancel_all_orders(self, *args, **kwargs):
-        """public fun cancel_all_orders<BaseAsset, QuoteAsset>("""
-        raise NotImplementedError()
+    def cancel_all_orders(self, account_cap=None, pool_object_id=None):
+        """public fun cancel_all_orders<BaseAsset, QuoteAsset>(
+
+        :return: (success, {canceled pool order ids}, tx_result_json)
+        """
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+
+        with self.objects.lease(account_cap):
+            txn = SyncTransaction(client=self.client)
+            txn.move_call(
+                target=f"{self.package_id}::clob_v2::cancel_all_orders",
+                arguments=[
+                    self._object(pool_object_id),
+                    self._object(account_cap),
+                ],
+                type_arguments=self._type_arguments(pool_object_id),
+            )
+            success, tx_result_json, tx_result = self._execute(txn, shape=("cancel_all_orders",))
+        self.logger().debug(tx_result_json)
+        return success, _canceled_order_ids(tx_result_json), tx_result_json
 
-    def cancel_order(self, *args, **kwargs):
+    def cancel_order(self, order_id, account_cap=None, pool_object_id=None):
         """public fun cancel_order<BaseAsset, QuoteAsset>("""
-        raise NotImplementedError()
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+
+        with self.objects.lease(account_cap):
+            txn = SyncTransaction(client=self.client)
+            txn.move_call(
+                target=f"{self.package_id}::clob_v2::cancel_order",
+                arguments=[
+                    self._object(pool_object_id),
+                    SuiU64(order_id),
+                    self._object(account_cap),
+                ],
+                type_arguments=self._type_arguments(pool_object_id),
+            )
+            success, tx_result_json, tx_result = self._execute(txn, shape=("cancel_order",))
+        self.logger().debug(tx_result_json)
+        return success, tx_result_json
 
     def check_balance_invariants_for_account(self, *args, **kwargs):
         """public fun check_balance_invariants_for_account<BaseAsset, QuoteAsset>("""
@@ -239,16 +421,19 @@ class DeepbookConnector:
             transfers=[account_cap],
             recipient=self.active_address,
         )
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
+        success, tx_result_json, tx_result = self._execute(txn, pooled_gas=False)
         self.logger().debug(tx_result_json)
 
         account_cap = tx_result_json.get("effects").get("created")[0]["reference"]["objectId"]
+        libsui.invalidate_objects(self.active_address, f"{self.package_id}::clob_v2::AccountCap")
         self.account_cap = account_cap
         self.logger().info(f"created account cap: {account_cap}")
         return account_cap
 
     def get_account_cap(self, create_if_needed=False):
-        account_cap_dicts = libsui.find_objects(self.client, "AccountCap", address_owner=self.active_address)
+        account_cap_dicts = libsui.find_objects(
+            self.client, f"{self.package_id}::clob_v2::AccountCap", address_owner=self.active_address
+        )
         account_cap_dict = account_cap_dicts[-1] if account_cap_dicts else {}
         if (account_cap := account_cap_dict.get("objectId", None)) is None:
             if create_if_needed:
@@ -289,8 +474,8 @@ class DeepbookConnector:
         tick_size = TICK_SIZE if tick_size is None else tick_size
         min_size = TICK_SIZE if min_size is None else min_size
 
-        type_base = libsui.TYPE_SUI if asset_base == libsui.ASSET_SUI else f"{self.package_id}::{asset_base}"
-        type_quote = f"{self.package_id}::{asset_quote}"
+        type_base = self._asset_type(asset_base)
+        type_quote = self._asset_type(asset_quote)
 
         txn = SyncTransaction(client=self.client)
         creation_fee = txn.split_coin(coin=txn.gas, amounts=[libsui.ONE_SUI])
@@ -307,7 +492,7 @@ class DeepbookConnector:
             type_arguments=[type_base, type_quote],
         )
 
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
+        success, tx_result_json, tx_result = self._execute(txn, pooled_gas=False)
         self.logger().debug(tx_result_json)
 
         changed_objects = tx_result.to_dict()["objectChanges"]
@@ -326,31 +511,20 @@ class DeepbookConnector:
             raise RuntimeError(msg)
 
         self.logger().info(f"created Pool<{asset_base}, {asset_quote}>: {pool_object_id}")
+        self.pools.refresh()
         return pool_object_id
 
     def get_pool(self, asset_base=None, asset_quote=None, create_if_needed=False):
-        pool_object_dicts = libsui.find_objects(self.client, "::Pool<", address_owner=self.active_address)
-        breakpoint()
-        pool_object_id = None
-        if pool_object_dicts:
-            asset_quote_desired = libsui.ASSET_ACCOUNTING if asset_quote is None else asset_quote
-            asset_base_desired = libsui.ASSET_SUI if asset_base is None else asset_base
-
-            def is_desired_pool(o):
-                return (asset_base_desired in o["type"]) and (asset_quote_desired in o["type"])
-
-            pool_object_dicts_matching = [o for o in pool_object_dicts if is_desired_pool(o)]
-            breakpoint()
-            if pool_object_dicts_matching:
-                pool_object_id = pool_object_dicts_matching[-1]["objectId"]
-        if not pool_object_id:
-            if create_if_needed:
-                pool_object_id = self.create_pool(asset_base=asset_base, asset_quote=asset_quote)
-            else:
-                raise RuntimeError(
-                    "No Pool object could be found?! (net={self._network}, active_address={self.active_address})"
-                )
-        return pool_object_id
+        """id of the (first) pool trading `asset_base` against `asset_quote`, looked up in the pool registry"""
+        asset_quote = libsui.ASSET_ACCOUNTING if asset_quote is None else asset_quote
+        asset_base = libsui.ASSET_SUI if asset_base is None else asset_base
+
+        pool = self.pools.pool_for(self._asset_type(asset_base), self._asset_type(asset_quote))
+        if pool is not None:
+            return pool.pool_id
+        if create_if_needed:
+            return self.create_pool(asset_base=asset_base, asset_quote=asset_quote)
+        raise RuntimeError(f"No Pool<{asset_base}, {asset_quote}> could be found in package {self.package_id}")
 
     def create_pool_with_return(self, *args, **kwargs):
         """public fun create_pool_with_return<BaseAsset, QuoteAsset>("""
@@ -366,7 +540,7 @@ class DeepbookConnector:
 
     def deposit_quote(self, amount_quote, asset_quote=None, asset_base=None):  # noqa: mock
         """public fun deposit_quote<BaseAsset, QuoteAsset>("""
-        return self._deposit("quote", amount_base, asset_quote=asset_quote, asset_base=asset_base)
+        return self._deposit("quote", amount_quote, asset_quote=asset_quote, asset_base=asset_base)
 
     def _deposit(self, base_or_quote, amount, asset_quote=None, asset_base=None):
         assert base_or_quote in [
@@ -388,25 +562,21 @@ class DeepbookConnector:
         self.logger().info(f"deposit_{base_or_quote}(..): depositing {amount_sui} SUI ({amount=}) [{base_or_quote=}]")
 
         # TODO: add case for sponsoredTransaction
-        txn = SyncTransaction(client=self.client)
-        ret = txn.move_call(
-            target=f"{self.package_id}::clob_v2::deposit_{base_or_quote}",
-            arguments=[
-                ObjectID(pool_object_id),
-                txn.split_coin(coin=txn.gas, amounts=[amount]),
-                ObjectID(account_cap),
-            ],
-            type_arguments=[type_base, type_quote],
-        )
-        breakpoint()
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
+        with self.objects.lease(account_cap):
+            txn = SyncTransaction(client=self.client)
+            ret = txn.move_call(
+                target=f"{self.package_id}::clob_v2::deposit_{base_or_quote}",
+                arguments=[
+                    self._object(pool_object_id),
+                    txn.split_coin(coin=txn.gas, amounts=[amount]),
+                    self._object(account_cap),
+                ],
+                type_arguments=[type_base, type_quote],
+            )
+            success, tx_result_json, tx_result = self._execute(txn, pooled_gas=False)
         self.logger().debug(tx_result_json)
         return tx_result
 
-    def deposit_quote(self, *args, **kwargs):
-        """public fun deposit_quote<BaseAsset, QuoteAsset>("""
-        raise NotImplementedError()
-
     def expire_timestamp(self, *args, **kwargs):
         """public fun expire_timestamp(order: &Order): u64 {"""
         raise NotImplementedError()
@@ -425,64 +595,93 @@ class DeepbookConnector:
     def get_level2_book_status_ask_side(self, *args, **kwargs):
         return self.get_level2_book_status("ask", *args, **kwargs)
 
-    def get_level2_book_status(self, side):
+    def get_level2_book_status(self, side, price_low=0, price_high=10**12, pool_object_id=None):
+        """returns `(price_vec, depth_vec)` for one side of the book, decoded from the dev-inspect result"""
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
         txn = SyncTransaction(client=self.client)
-        return_value = txn.move_call(
+        txn.move_call(
             target=f"{self.package_id}::clob_v2::get_level2_book_status_{side}_side",
             arguments=[
-                ObjectID(self.pool_object_id),
-                SuiU64(0),
-                SuiU64(10**12),
-                ObjectID("0x6"),
-            ],
-            type_arguments=[
-                "0x2::sui::SUI",
-                f"{self.package_id}::realusdc::REALUSDC",
+                self._object(pool_object_id),
+                SuiU64(price_low),
+                SuiU64(price_high),
+                self._object(CLOCK_OBJECT_ID),
             ],
+            type_arguments=self._type_arguments(pool_object_id),
         )
-        # print(return_value)
-        temp = txn.inspect_all()
-        # pprint(temp)
-        results = temp.results
-        # result = handle_result(temp)
-        # print(results)
-
-        # Extract raw values (lists containing 0)
-        price_vec = results[0]["returnValues"][0][0]
-        depth_vec = results[0]["returnValues"][1][0]
+        results = txn.inspect_all().results
+
+        price_vec = libsui.decode_u64_vector(results[0]["returnValues"][0][0])
+        depth_vec = libsui.decode_u64_vector(results[0]["returnValues"][1][0])
         self.logger().debug(f"price_vec: {price_vec}")
         self.logger().debug(f"depth_vec: {depth_vec}")
 
-        return results
+        return price_vec, depth_vec
+
+    def query_events(self, cursor=None, limit=EVENTS_PAGE_SIZE, pool_object_id=None):
+        """pages through the `clob_v2` events emitted for a pool (by default `self.pool_object_id`), oldest first
+
+        :param cursor: `{"txDigest": .., "eventSeq": ..}` of the last event already seen, or None to start from the first
+        :return: (events, next_cursor, has_next_page); `next_cursor` is None when there are no events after `cursor`
+        """
+        builder = QueryEvents(
+            query=MoveEventModuleQuery(module="clob_v2", package_id=self.package_id),
+            cursor=None if cursor is None else EventID(event_seq=cursor["eventSeq"], tx_seq=cursor["txDigest"]),
+            limit=SuiInteger(limit),
+            descending_order=SuiBoolean(False),
+        )
+        page, _ = libsui.libsui_rpc_handler(self.client.execute(builder))
+        page = page.to_dict()
+
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        events = [e for e in page["data"] if e["parsedJson"].get("pool_id") == pool_object_id]
+        next_cursor = page["nextCursor"] if page["data"] else None
+        return events, next_cursor, page["hasNextPage"]
+
+    def latest_event_cursor(self):
+        """cursor of the most recent `clob_v2` event, to follow new events without replaying the package history"""
+        builder = QueryEvents(
+            query=MoveEventModuleQuery(module="clob_v2", package_id=self.package_id),
+            limit=SuiInteger(1),
+            descending_order=SuiBoolean(True),
+        )
+        page, _ = libsui.libsui_rpc_handler(self.client.execute(builder))
+        data = page.to_dict()["data"]
+        return data[0]["id"] if data else None
 
     def get_market_price(self, *args, **kwargs):
         """public fun get_market_price<BaseAsset, QuoteAsset>("""
         raise NotImplementedError()
 
-    def get_order_status(self, pool_order_id, account_cap=None):
-        """public fun get_order_status<BaseAsset, QuoteAsset>("""
+    def get_order_status(self, pool_order_id, account_cap=None, pool_object_id=None) -> Optional[DeepbookOrder]:
+        """the open order `pool_order_id` of `account_cap`, decoded from the dev-inspect result; None if it is not open
+
+        public fun get_order_status<BaseAsset, QuoteAsset>(
+        pool: &Pool<BaseAsset, QuoteAsset>,
+        order_id: u64,
+        account_cap: &AccountCap): &Order
+        """
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        account_cap = self.account_cap if account_cap is None else account_cap
         txn = SyncTransaction(client=self.client)
-        return_value = txn.move_call(
+        txn.move_call(
             target=f"{self.package_id}::clob_v2::get_order_status",
             arguments=[
-                ObjectID(self.pool_object_id),
+                self._object(pool_object_id),
                 SuiU64(pool_order_id),
-                ObjectID(self.account_cap),
-            ],
-            type_arguments=[
-                "0x2::sui::SUI",
-                f"{self.package_id}::realusdc::REALUSDC",
+                self._object(account_cap),
             ],
+            type_arguments=self._type_arguments(pool_object_id),
         )
+        inspection = txn.inspect_all()
+        if not isinstance(inspection, TxInspectionResult):
+            raise RuntimeError(f"get_order_status(..): inspection failed: {inspection.result_string}")
+        if inspection.error:
+            if move_abort_code({"effects": {"status": {"error": inspection.error}}}) in (EInvalidOrderId, EInvalidUser):
+                return None
+            raise RuntimeError(f"get_order_status(..): {inspection.error}")
 
-        print("=== GET ORDER STATUS ===")
-        pprint(txn.inspect_all())
-
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
-        self.logger().debug(tx_result_json)
-        order_status = None
-        breakpoint()
-        return order_status
+        return DeepbookOrder(**libsui.decode_order(inspection.results[0]["returnValues"][0][0]))
 
     def get_pool_stat(self, *args, **kwargs):
         """public fun get_pool_stat<BaseAsset, QuoteAsset>("""
@@ -532,55 +731,125 @@ class DeepbookConnector:
         """public fun owner(order: &Order): address {"""
         raise NotImplementedError()
 
-    def place_limit_order(self, price, quantity, is_bid=None, client_order_id=None):  # noqa: mock
+    def place_limit_order(
+        self,
+        price,
+        quantity,
+        is_bid=None,
+        client_order_id=None,
+        restriction=IMMEDIATE_OR_CANCEL,
+        expire_timestamp=None,
+        self_matching_prevention=CANCEL_OLDEST,
+        pool_object_id=None,
+    ):  # noqa: mock
         """public fun place_limit_order<BaseAsset, QuoteAsset>("""
-        client_order_id = _client_trade_id() if client_order_id is None else client_order_id
-        if quantity == 0:
-            raise ValueError(f"quantity was 0; why are you placing an order?! ({quantity=}")
-        if quantity < 0:
-            if is_bid is not None and is_bid is True:
-                raise ValueError(f"contradictory inputs: {is_bid=} but {quantity=} < 0")
-            is_bid = False
-            quantity = abs(quantity)
-        else:
-            if (quantity > 0) and (is_bid is not None) and (is_bid is False):
-                raise ValueError(f"contradictory inputs: {is_bid=} but {quantity=} > 0")
-            is_bid = True
-
         # TODO: add case for sponsoredTransaction
-        txn = SyncTransaction(client=self.client)
+        with self.objects.lease(self.account_cap):
+            txn = SyncTransaction(client=self.client)
+            client_order_id = self._move_call_place_limit_order(
+                txn,
+                price,
+                quantity,
+                is_bid=is_bid,
+                client_order_id=client_order_id,
+                restriction=restriction,
+                expire_timestamp=expire_timestamp,
+                self_matching_prevention=self_matching_prevention,
+                pool_object_id=pool_object_id,
+            )
+            success, tx_result_json, tx_result = self._execute(txn, shape=("place_limit_order",))
+        placed = {e["client_order_id"]: e["order_id"] for e in _events_of_type(tx_result_json, "OrderPlaced")}
+        pool_order_id = placed.get(str(client_order_id), None)
+        return success, client_order_id, pool_order_id, tx_result
 
-        # defining range for mock order id
-        # Define the lower and upper bounds for the random u64 integers (inclusive)
-        low = 0
-        high = np.iinfo(np.uint64).max  # Maximum value for uint64
+    def _move_call_place_limit_order(
+        self,
+        txn,
+        price,
+        quantity,
+        is_bid=None,
+        client_order_id=None,
+        restriction=IMMEDIATE_OR_CANCEL,
+        expire_timestamp=None,
+        self_matching_prevention=CANCEL_OLDEST,
+        pool_object_id=None,
+    ):
+        """adds a `clob_v2::place_limit_order` command to `txn`; returns the client order id used"""
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        client_order_id = _client_trade_id() if client_order_id is None else client_order_id
+        is_bid, quantity = order_side(quantity, is_bid=is_bid)
+        expire_timestamp = _default_expire_timestamp() if expire_timestamp is None else expire_timestamp
 
-        # sett ask price to
-        print(f"Placing {'bid' if is_bid else 'ask'} order with price {price} and quantity {quantity}")
+        self.logger().debug(f"Placing {'bid' if is_bid else 'ask'} order with price {price} and quantity {quantity}")
 
         txn.move_call(
             target=f"{self.package_id}::clob_v2::place_limit_order",
             arguments=[
-                ObjectID(self.pool_object_id),
+                self._object(pool_object_id),
                 SuiU64(client_order_id),
                 SuiU64(price),
                 SuiU64(quantity),
-                SuiU8(0),
+                SuiU8(self_matching_prevention),
                 SuiBoolean(is_bid),
-                SuiU64(round(int(datetime.datetime.utcnow().timestamp()) * 1000 + 24 * 60 * 60 * 100000000000000)),
-                SuiU8(1),
-                ObjectID("0x6"),
-                ObjectID(self.account_cap),
+                SuiU64(expire_timestamp),
+                SuiU8(restriction),
+                self._object(CLOCK_OBJECT_ID),
+                self._object(self.account_cap),
             ],
-            type_arguments=[
-                "0x2::sui::SUI",
-                f"{self.package_id}::realusdc::REALUSDC",
+            type_arguments=self._type_arguments(pool_object_id),
+        )
+        return client_order_id
+
+    def execute_batch(self, place_orders=(), cancel_order_ids=(), account_cap=None, pool_object_id=None):
+        """places and cancels orders in a single programmable transaction block
+
+        Cancels go first so that the balance they unlock is available to the placements.
+        A PTB is atomic: if any command aborts, none of them take effect.
+
+        :param place_orders: dicts of `place_limit_order` keyword arguments, each with a `client_order_id`
+        :param cancel_order_ids: pool order ids to cancel
+        :return: (success, {client_order_id: pool_order_id}, {canceled pool order ids}, tx_result_json)
+        """
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        cancel_order_ids = list(cancel_order_ids)
+        place_orders = list(place_orders)
+
+        with self.objects.lease(account_cap, self.account_cap):
+            txn = SyncTransaction(client=self.client)
+            if len(cancel_order_ids) == 1:
+                txn.move_call(
+                    target=f"{self.package_id}::clob_v2::cancel_order",
+                    arguments=[
+                        self._object(pool_object_id),
+                        SuiU64(cancel_order_ids[0]),
+                        self._object(account_cap),
+                    ],
+                    type_arguments=self._type_arguments(pool_object_id),
+                )
+            elif cancel_order_ids:
+                self._move_call_cancel_orders(txn, cancel_order_ids, account_cap, pool_object_id)
+            for place_order in place_orders:
+                self._move_call_place_limit_order(txn, pool_object_id=pool_object_id, **place_order)
+
+            shape = ("execute_batch", len(cancel_order_ids), len(place_orders))
+            success, tx_result_json, tx_result = self._execute(txn, shape=shape)
+        self.logger().debug(tx_result_json)
+
+        placed = {e["client_order_id"]: e["order_id"] for e in _events_of_type(tx_result_json, "OrderPlaced")}
+        return success, placed, _canceled_order_ids(tx_result_json), tx_result_json
+
+    def _move_call_cancel_orders(self, txn, order_ids, account_cap, pool_object_id):
+        """adds a `clob_v2::batch_cancel_order` command to `txn`"""
+        txn.move_call(
+            target=f"{self.package_id}::clob_v2::batch_cancel_order",
+            arguments=[
+                self._object(pool_object_id),
+                [SuiU64(order_id) for order_id in order_ids],
+                self._object(account_cap),
             ],
+            type_arguments=self._type_arguments(pool_object_id),
         )
-        success, tx_result_json, tx_result = libsui.execute_and_handle_result(txn)
-        breakpoint()
-        pool_order_id = tx_result_json[4]
-        return success, client_order_id, pool_order_id, tx_result
 
     def place_limit_order_with_metadata(self, *args, **kwargs):
         """public fun place_limit_order_with_metadata<BaseAsset, QuoteAsset>("""
@@ -0,0 +1,82 @@
+"""Follow the Deep Book `clob_v2` Move events of a pool as a stream
+
+Sui full nodes no longer offer event websocket subscriptions, so the stream
+pages `suix_queryEvents` forward from a cursor.  Polling at a fraction of the
+checkpoint interval delivers every `OrderPlaced` / `OrderCanceled` /
+`OrderFilled` event shortly after the checkpoint that includes it, in order and
+without gaps, and a new page is requested immediately while the node reports
+more events behind the cursor.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_POLL_INTERVAL = 0.2
+
+
+class DeepbookEventStream:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self, chain_executor, poll_interval: float = DEFAULT_POLL_INTERVAL, cursor: Optional[Dict] = None):
+        """
+        :param chain_executor: an `AsyncDeepbookConnector` (or anything implementing `query_events`)
+        :param poll_interval: seconds to wait before asking again once the stream has caught up
+        :param cursor: id of the last event already processed; by default only events emitted after the stream
+            starts listening are delivered
+        """
+        self._chain_executor = chain_executor
+        self._poll_interval = poll_interval
+        self._cursor = cursor
+        self._started = cursor is not None
+        self._last_event_timestamp = 0
+
+    @property
+    def cursor(self) -> Optional[Dict]:
+        return self._cursor
+
+    @property
+    def last_event_timestamp(self) -> float:
+        """timestamp (in seconds) of the checkpoint that included the last delivered event"""
+        return self._last_event_timestamp
+
+    async def listen(self, events_handler: Callable[[Dict[str, Any]], Any]):
+        """delivers every new event of the pool to `events_handler`, in the order they were emitted; runs until cancelled"""
+        while True:
+            try:
+                if not self._started:
+                    await self._start()
+                has_next_page = await self._deliver_next_page(events_handler=events_handler)
+                if not has_next_page:
+                    await asyncio.sleep(self._poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error reading Deepbook events. Retrying...")
+                await asyncio.sleep(self._poll_interval)
+
+    async def _start(self):
+        """
+        Positions the stream after the latest event. With no event yet, "now" is the start of the history: the stream
+        pages from it, and never asks for the latest event again, which would skip the events emitted meanwhile.
+        """
+        self._cursor = await self._chain_executor.latest_event_cursor()
+        self._started = True
+
+    async def _deliver_next_page(self, events_handler: Callable[[Dict[str, Any]], Any]) -> bool:
+        events, next_cursor, has_next_page = await self._chain_executor.query_events(self._cursor)
+        for event in events:
+            events_handler(event)
+            if event.get("timestampMs"):
+                self._last_event_timestamp = int(event["timestampMs"]) * 1e-3
+        if next_cursor is not None:
+            self._cursor = next_cursor
+        return has_next_page
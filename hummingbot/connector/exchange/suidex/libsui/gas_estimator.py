@@ -0,0 +1,147 @@
+"""Gas budgets for Deep Book transactions, estimated once per transaction shape
+
+Leaving the gas budget to pysui makes it dry-run every transaction before
+executing it -- one extra round trip per order -- while a fixed budget is
+either wasteful (the budget must be covered by the gas coin) or too small for
+a large batch.  The gas a transaction uses depends on its shape (which move
+calls it makes, on how many orders), much less on its arguments, so
+`GasEstimator` dev-inspects the first transaction of each shape, keeps the gas
+it used plus a safety margin, and hands that budget to every later
+transaction of the same shape.
+
+Computation is paid at the reference gas price, which can change at every
+epoch boundary; the price is polled at most every `price_refresh_interval`
+and a new price drops every cached budget.  The budget of a shape only grows:
+a transaction that used more than its estimate raises it for the next ones,
+and one that ran out of gas forgets it.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from pysui.sui.sui_builders.get_builders import GetReferenceGasPrice
+
+import hummingbot.connector.exchange.suidex.libsui as libsui
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_SAFETY_MARGIN = 0.2
+DEFAULT_PRICE_REFRESH_INTERVAL = 60.0
+MIN_BUDGET_GAS_UNITS = 2_000  # the network rejects budgets below ~1000 units at the reference gas price
+
+_INSUFFICIENT_GAS = "InsufficientGas"
+
+
+class GasEstimator:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(
+        self,
+        client,
+        safety_margin: float = DEFAULT_SAFETY_MARGIN,
+        price_refresh_interval: float = DEFAULT_PRICE_REFRESH_INTERVAL,
+        default_budget: int = libsui.DEFAULT_GAS_BUDGET,
+    ):
+        """
+        :param client: the pysui client the transactions are inspected and executed with
+        :param safety_margin: fraction added on top of the gas a shape used, e.g. 0.2 for a 20% larger budget
+        :param price_refresh_interval: seconds between two reads of the reference gas price
+        :param default_budget: budget (in MIST) of a transaction whose inspection failed
+        """
+        self._client = client
+        self._safety_margin = safety_margin
+        self._price_refresh_interval = price_refresh_interval
+        self._default_budget = default_budget
+        self._budgets: Dict[Hashable, int] = {}
+        self._gas_price: Optional[int] = None
+        self._last_price_refresh: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def gas_price(self) -> int:
+        self._refresh_gas_price_if_due()
+        return self._gas_price
+
+    def budget(self, shape: Hashable, txn) -> int:
+        """
+        The gas budget (in MIST) for `txn`, whose shape is `shape`, e.g. `("place_limit_order", 1)`; only the first
+        transaction of a shape (after a change of the reference gas price) is inspected. Sets the gas price of `txn`.
+        """
+        gas_price = self.gas_price
+        txn.gas_price = gas_price
+        with self._lock:
+            budget = self._budgets.get(shape)
+        if budget is None:
+            gas_used = self._inspect(txn)
+            if gas_used is None:
+                return self._default_budget
+            budget = self._with_margin(gas_used, gas_price)
+            with self._lock:
+                budget = self._budgets.setdefault(shape, budget)
+            self.logger().debug(f"Gas budget of {shape} transactions: {budget} MIST at {gas_price} MIST per unit.")
+        return budget
+
+    def observe(self, shape: Hashable, tx_result_json: Optional[Dict[str, Any]]):
+        """adjusts the budget of `shape` to the gas an executed transaction of that shape used"""
+        effects = (tx_result_json or {}).get("effects") or {}
+        error = (effects.get("status") or {}).get("error") or ""
+        with self._lock:
+            if _INSUFFICIENT_GAS in error:
+                self.logger().warning(f"A {shape} transaction ran out of gas; its budget will be estimated again.")
+                self._budgets.pop(shape, None)
+            elif shape in self._budgets and "gasUsed" in effects and self._gas_price is not None:
+                budget = self._with_margin(self._gas_used(effects["gasUsed"]), self._gas_price)
+                self._budgets[shape] = max(self._budgets[shape], budget)
+
+    def invalidate(self):
+        with self._lock:
+            self._budgets.clear()
+
+    def _refresh_gas_price_if_due(self):
+        now = self._time()
+        if self._last_price_refresh is not None and now - self._last_price_refresh < self._price_refresh_interval:
+            return
+        gas_price = int(libsui.libsui_rpc_handler(self._client.execute(GetReferenceGasPrice()), debug=False))
+        with self._lock:
+            self._last_price_refresh = now
+            if gas_price != self._gas_price:
+                if self._gas_price is not None:
+                    self.logger().info(f"Reference gas price changed from {self._gas_price} to {gas_price} MIST.")
+                self._gas_price = gas_price
+                self._budgets.clear()
+
+    def _inspect(self, txn) -> Optional[int]:
+        """the gas (in MIST) `txn` uses according to `sui_devInspectTransactionBlock`, None if it could not tell"""
+        try:
+            result = txn.inspect_all()
+        except Exception as ex:
+            self.logger().warning(f"Inspecting the transaction failed: {ex}")
+            return None
+        effects = getattr(result, "effects", None)
+        if effects is None or not effects.status.succeeded:
+            # an aborted transaction stops short of the gas a successful one uses
+            self.logger().warning(f"Inspected transaction did not succeed: {getattr(result, 'result_string', result)}")
+            return None
+        return int(effects.gas_used.total)
+
+    def _with_margin(self, gas_used: int, gas_price: int) -> int:
+        return max(math.ceil(gas_used * (1 + self._safety_margin)), MIN_BUDGET_GAS_UNITS * gas_price)
+
+    @staticmethod
+    def _gas_used(gas_used_json: Dict[str, Any]) -> int:
+        return sum(
+            int(gas_used_json[key]) for key in ("computationCost", "storageCost", "nonRefundableStorageFee")
+            if key in gas_used_json
+        )
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -0,0 +1,110 @@
+"""Local level 2 copy of a Deep Book pool, maintained incrementally
+
+A full `get_level2_book_status_{bid,ask}_side` dev-inspect over the whole
+price range walks every tick level of the pool and returns it in one payload.
+`Level2Book` keeps the depth of every level locally (keyed by the tick-aligned
+chain price) so that the full fetch is only needed on start and after a gap.
+In between, the book moves by the deltas carried by the pool events, and a
+refresh only has to re-read a narrow price window around the touch.
+
+All prices and depths are chain units (u64).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+Levels = Tuple[List[int], List[int]]
+
+
+class Level2Book:
+    def __init__(self):
+        self._levels: Dict[bool, Dict[int, int]] = {True: {}, False: {}}
+        self._snapshot_update_id = 0
+        self._update_id = 0
+        self._needs_snapshot = True
+        self._gaps = 0
+
+    @property
+    def update_id(self) -> int:
+        """update id of the last snapshot, window refresh or delta applied"""
+        return self._update_id
+
+    @property
+    def needs_snapshot(self) -> bool:
+        """True until the first snapshot, and again after a gap is detected"""
+        return self._needs_snapshot
+
+    @property
+    def gaps(self) -> int:
+        """number of gaps detected since the book was created"""
+        return self._gaps
+
+    def mark_gap(self):
+        self._needs_snapshot = True
+        self._gaps += 1
+
+    def apply_snapshot(self, bids: Levels, asks: Levels, update_id: int):
+        self._levels = {True: dict(zip(*bids)), False: dict(zip(*asks))}
+        self._snapshot_update_id = update_id
+        self._update_id = update_id
+        self._needs_snapshot = False
+
+    def apply_change(self, is_bid: bool, price: int, quantity_change: int, update_id: int) -> Optional[int]:
+        """
+        Adds `quantity_change` (negative for cancels and fills) to a level.
+
+        :return: the new depth of the level, or None if the change is already reflected in the book (its update id is
+            not newer than the last snapshot) or the book is waiting for a snapshot
+        """
+        if self._needs_snapshot or update_id <= self._snapshot_update_id:
+            return None
+        levels = self._levels[is_bid]
+        depth = levels.get(price, 0) + quantity_change
+        if depth < 0:
+            # more was removed than the level holds: a change was missed
+            self.mark_gap()
+            return None
+        if depth > 0:
+            levels[price] = depth
+        else:
+            levels.pop(price, None)
+        self._update_id = max(self._update_id, update_id)
+        return depth
+
+    def apply_window(self, is_bid: bool, price_low: int, price_high: int, window: Levels) -> List[Tuple[int, int]]:
+        """
+        Replaces the levels of one side between `price_low` and `price_high` (inclusive) with a fresh read of that window.
+
+        :return: the (price, depth) of every level that changed; a depth of 0 means the level is gone
+        """
+        levels = self._levels[is_bid]
+        fresh = dict(zip(*window))
+        changes = [(price, 0) for price in levels if price_low <= price <= price_high and price not in fresh]
+        changes.extend((price, depth) for price, depth in fresh.items() if levels.get(price) != depth)
+        for price, depth in changes:
+            if depth > 0:
+                levels[price] = depth
+            else:
+                levels.pop(price, None)
+        return changes
+
+    def levels(self, is_bid: bool) -> List[Tuple[int, int]]:
+        """(price, depth) of one side, best price first"""
+        return sorted(self._levels[is_bid].items(), reverse=is_bid)
+
+    def best_price(self, is_bid: bool) -> Optional[int]:
+        levels = self._levels[is_bid]
+        if not levels:
+            return None
+        return max(levels) if is_bid else min(levels)
+
+    def touch_window(self, width: float) -> Optional[Tuple[int, int]]:
+        """
+        Price range from `width` (a fraction of the price) below the best bid to `width` above the best ask, or None if
+        the book is empty. The spread is always inside the window, so levels placed at the touch are picked up too.
+        """
+        best_bid, best_ask = self.best_price(True), self.best_price(False)
+        if best_bid is None and best_ask is None:
+            return None
+        low = best_bid if best_bid is not None else best_ask
+        high = best_ask if best_ask is not None else best_bid
+        return max(0, int(low * (1 - width))), int(high * (1 + width))
@@ -0,0 +1,213 @@
+"""Object references and gas coins for Deep Book transactions, kept locally
+
+Passing `ObjectID(..)` to a pysui move call makes it look the object up
+(`sui_multiGetObjects`) to learn its version, digest and owner, and leaving
+the gas payment to pysui makes it list the address' coins and pick one --
+on every command of every transaction.  Both are avoidable:
+
+* shared objects (the pool, the clock) are referenced by their initial shared
+  version, which never changes, so one lookup is enough for the lifetime of
+  the connector;
+* owned objects (the `AccountCap`) get a new version and digest with every
+  transaction that uses them, and the effects of that transaction report both,
+  so the local reference can be moved forward without asking the node again.
+
+An owned object can only be used by one transaction at a time (two signed
+transactions holding the same version equivocate and lock it until the end of
+the epoch), so the cache hands owned objects out under a lease.  Gas coins are
+owned objects too: `GasCoinPool` splits a set of coins off the main gas coin
+once and gives each in-flight transaction its own.
+"""
+
+import copy
+import logging
+import threading
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from pysui.sui.sui_txn import SyncTransaction
+from pysui.sui.sui_txresults.single_tx import ObjectRead, SharedOwner
+from pysui.sui.sui_types.scalars import ObjectID
+
+import hummingbot.connector.exchange.suidex.libsui as libsui
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_GAS_COIN_POOL_SIZE = 4  # one coin per AsyncDeepbookConnector worker
+DEFAULT_GAS_COIN_BALANCE = libsui.ONE_SUI // 2  # 50 transactions at the current gas budget
+
+_NEW_VERSION_KEYS = ("mutated", "created", "unwrapped")
+_GONE_KEYS = ("deleted", "wrapped", "unwrappedThenDeleted")
+
+
+class ObjectRefCache:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self, client):
+        self._client = client
+        self._objects: Dict[str, ObjectRead] = {}
+        self._lock = threading.Lock()
+        self._leases: Dict[str, threading.Lock] = {}
+
+    def get(self, object_id: str) -> ObjectRead:
+        """the reference to pass to a move call in place of `ObjectID(object_id)`; looked up on first use only"""
+        with self._lock:
+            object_read = self._objects.get(object_id)
+        if object_read is None:
+            object_read = libsui.libsui_rpc_handler(self._client.get_object(ObjectID(object_id)), debug=False)
+            with self._lock:
+                object_read = self._objects.setdefault(object_id, object_read)
+        return object_read
+
+    @contextmanager
+    def lease(self, *object_ids: str) -> Iterator[None]:
+        """
+        Holds the given owned objects for one transaction: from building it (which fixes the versions it references)
+        until `update_from_effects` has moved them to the versions it produced.
+        """
+        with self._lock:
+            locks = [self._leases.setdefault(object_id, threading.Lock()) for object_id in sorted(set(object_ids))]
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            yield
+
+    def update_from_effects(self, tx_result_json: Optional[Dict[str, Any]]):
+        """
+        Moves cached owned objects to the version and digest reported by a transaction's effects, and forgets objects
+        it deleted or wrapped. Effects are reported for failed transactions too: their owned inputs are still bumped.
+        """
+        effects = (tx_result_json or {}).get("effects") or {}
+        with self._lock:
+            for key in _NEW_VERSION_KEYS:
+                for owner_ref in effects.get(key) or []:
+                    reference = owner_ref["reference"]
+                    cached = self._objects.get(reference["objectId"])
+                    if cached is not None and not self._is_shared(cached):
+                        # not dataclasses.replace: ObjectRead.__post_init__ cannot parse its own parsed fields again
+                        updated = copy.copy(cached)
+                        updated.version = str(reference["version"])
+                        updated.digest = reference["digest"]
+                        self._objects[reference["objectId"]] = updated
+            for key in _GONE_KEYS:
+                for reference in effects.get(key) or []:
+                    self._objects.pop(reference["objectId"], None)
+
+    def invalidate(self, object_id: str):
+        with self._lock:
+            self._objects.pop(object_id, None)
+
+    def invalidate_owned(self):
+        """forgets every owned object, e.g. after a transaction whose effects are unknown"""
+        with self._lock:
+            self._objects = {
+                object_id: object_read for object_id, object_read in self._objects.items() if self._is_shared(object_read)
+            }
+
+    @staticmethod
+    def _is_shared(object_read: ObjectRead) -> bool:
+        return isinstance(object_read.owner, SharedOwner)
+
+
+class GasCoinPool:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(
+        self,
+        client,
+        size: int = DEFAULT_GAS_COIN_POOL_SIZE,
+        coin_balance: int = DEFAULT_GAS_COIN_BALANCE,
+        address: Optional[str] = None,
+    ):
+        """
+        :param client: the pysui client the transactions are executed with
+        :param size: number of transactions that can hold a gas coin at the same time
+        :param coin_balance: balance (in MIST) each pooled coin is split off with; coins holding less are not pooled
+        :param address: owner of the coins, by default the active address of the client
+        """
+        self._client = client
+        self._size = size
+        self._coin_balance = coin_balance
+        self._address = address
+        self._available: Deque[str] = deque()
+        self._in_use: Set[str] = set()
+        self._condition = threading.Condition()
+        self._ensure_lock = threading.Lock()
+        self._ready = False
+
+    @property
+    def coin_ids(self) -> List[str]:
+        with self._condition:
+            return list(self._available) + sorted(self._in_use)
+
+    def ensure(self):
+        """pools the address' coins holding at least `coin_balance`, splitting the missing ones off the gas coin"""
+        coins = self._funded_coins()
+        missing = self._size - len(coins)
+        if missing > 0:
+            self.logger().info(f"Splitting {missing} gas coins of {self._coin_balance} MIST each.")
+            self._split_gas_coins(missing)
+            coins = self._funded_coins()
+        with self._condition:
+            self._available = deque(coin_id for coin_id in coins[:self._size] if coin_id not in self._in_use)
+            self._ready = True
+            self._condition.notify_all()
+
+    @contextmanager
+    def coin(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """a coin no other transaction is using, for the duration of one transaction"""
+        coin_id = self.acquire(timeout=timeout)
+        try:
+            yield coin_id
+        finally:
+            self.release(coin_id)
+
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        if not self._ready:
+            with self._ensure_lock:
+                if not self._ready:
+                    self.ensure()
+        with self._condition:
+            if not self._condition.wait_for(lambda: len(self._available) > 0, timeout=timeout):
+                raise TimeoutError(f"No gas coin became available within {timeout} seconds.")
+            coin_id = self._available.popleft()
+            self._in_use.add(coin_id)
+            return coin_id
+
+    def release(self, coin_id: str):
+        with self._condition:
+            self._in_use.discard(coin_id)
+            self._available.append(coin_id)
+            self._condition.notify()
+
+    def _funded_coins(self) -> List[str]:
+        """ids of the address' SUI coins holding at least `coin_balance`, largest first"""
+        address = self._address or self._client.config.active_address
+        coins = libsui.libsui_rpc_handler(self._client.get_gas(address=address), debug=False).data
+        funded: List[Tuple[int, str]] = [
+            (int(coin.balance), coin.coin_object_id) for coin in coins if int(coin.balance) >= self._coin_balance
+        ]
+        return [coin_id for _, coin_id in sorted(funded, reverse=True)]
+
+    def _split_gas_coins(self, count: int):
+        txn = SyncTransaction(client=self._client)
+        coins = txn.split_coin(coin=txn.gas, amounts=[self._coin_balance] * count)
+        txn.transfer_objects(
+            transfers=coins if isinstance(coins, list) else [coins],
+            recipient=self._address or self._client.config.active_address,
+        )
+        success, tx_result_json, _ = libsui.execute_and_handle_result(txn)
+        if not success:
+            raise RuntimeError(f"Splitting gas coins failed: {tx_result_json}")
@@ -0,0 +1,166 @@
+"""Index of the Deep Book pools of a package, discovered from `PoolCreated` events
+
+Every `clob_v2::create_pool*` call emits a `PoolCreated` event carrying the
+pool id, the base and quote coin types, the tick size, the lot size and the
+fee rates -- everything needed to trade a pool, and none of it ever changes.
+`PoolRegistry` pages through those events once, keeps the pools indexed by id
+and by (base type, quote type), and afterwards only reads the events emitted
+since its last cursor, and only when a lookup misses or the index is older
+than `refresh_interval`.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from pysui.sui.sui_builders.get_builders import GetCoinMetaData, QueryEvents
+from pysui.sui.sui_types.collections import EventID
+from pysui.sui.sui_types.event_filter import MoveEventTypeQuery
+from pysui.sui.sui_types.scalars import SuiBoolean, SuiInteger, SuiString
+
+import hummingbot.connector.exchange.suidex.libsui as libsui
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_REFRESH_INTERVAL = 60.0
+MIN_REFRESH_INTERVAL = 5.0
+POOL_CREATED_PAGE_SIZE = 50
+
+
+def normalize_type(type_name: str) -> str:
+    """`0x2::sui::SUI` for both `0x0000..0002::sui::SUI` and the `0000..0002::sui::SUI` of a Move `TypeName`"""
+    address, rest = type_name.split("::", 1)
+    address = address[2:] if address.startswith("0x") else address
+    return f"0x{address.lstrip('0') or '0'}::{rest}"
+
+
+@dataclass(frozen=True)
+class DeepbookPool:
+    pool_id: str
+    base_type: str
+    quote_type: str
+    tick_size: int
+    lot_size: int
+    taker_fee_rate: int
+    maker_rebate_rate: int
+
+    @classmethod
+    def from_pool_created(cls, parsed_json: Dict[str, Any]) -> "DeepbookPool":
+        return cls(
+            pool_id=parsed_json["pool_id"],
+            base_type=normalize_type(parsed_json["base_asset"]["name"]),
+            quote_type=normalize_type(parsed_json["quote_asset"]["name"]),
+            tick_size=int(parsed_json["tick_size"]),
+            lot_size=int(parsed_json["lot_size"]),
+            taker_fee_rate=int(parsed_json["taker_fee_rate"]),
+            maker_rebate_rate=int(parsed_json["maker_rebate_rate"]),
+        )
+
+    @property
+    def base_symbol(self) -> str:
+        return self.base_type.split("::")[-1]
+
+    @property
+    def quote_symbol(self) -> str:
+        return self.quote_type.split("::")[-1]
+
+    @property
+    def type_arguments(self) -> List[str]:
+        return [self.base_type, self.quote_type]
+
+
+class PoolRegistry:
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self, client, package_id: str, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        :param client: the pysui client used to read the events
+        :param package_id: the package whose `clob_v2::PoolCreated` events are indexed
+        :param refresh_interval: seconds after which `pools()` reads the events emitted since the last refresh
+        """
+        self._client = client
+        self._package_id = package_id
+        self._refresh_interval = refresh_interval
+        self._pools_by_id: Dict[str, DeepbookPool] = {}
+        self._pools_by_types: Dict[Tuple[str, str], DeepbookPool] = {}
+        self._coin_decimals: Dict[str, int] = {}
+        self._cursor: Optional[Dict[str, str]] = None
+        self._last_refresh: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def pools(self, refresh: bool = False) -> List[DeepbookPool]:
+        """every pool of the package, in creation order"""
+        with self._lock:
+            if refresh or self._is_stale(self._refresh_interval):
+                self.refresh()
+            return list(self._pools_by_id.values())
+
+    def pool_by_id(self, pool_id: str) -> Optional[DeepbookPool]:
+        with self._lock:
+            if pool_id not in self._pools_by_id:
+                self._refresh_after_miss()
+            return self._pools_by_id.get(pool_id)
+
+    def pool_for(self, base_type: str, quote_type: str) -> Optional[DeepbookPool]:
+        """the first pool created for the pair; later pools of the same pair are only reachable by id"""
+        key = (normalize_type(base_type), normalize_type(quote_type))
+        with self._lock:
+            if key not in self._pools_by_types:
+                self._refresh_after_miss()
+            return self._pools_by_types.get(key)
+
+    def coin_decimals(self, coin_type: str) -> int:
+        coin_type = normalize_type(coin_type)
+        with self._lock:
+            if coin_type not in self._coin_decimals:
+                builder = GetCoinMetaData(coin_type=SuiString(coin_type))
+                metadata = libsui.libsui_rpc_handler(self._client.execute(builder), debug=False)
+                self._coin_decimals[coin_type] = int(metadata.decimals)
+            return self._coin_decimals[coin_type]
+
+    def refresh(self):
+        """indexes the pools created since the last refresh"""
+        with self._lock:
+            has_next_page = True
+            while has_next_page:
+                events, next_cursor, has_next_page = self._query_pool_created_events(self._cursor)
+                for event in events:
+                    self._add(DeepbookPool.from_pool_created(event["parsedJson"]))
+                if next_cursor is not None:
+                    self._cursor = next_cursor
+            self._last_refresh = self._time()
+            self.logger().debug(f"Indexed {len(self._pools_by_id)} Deepbook pools of {self._package_id}.")
+
+    def _add(self, pool: DeepbookPool):
+        self._pools_by_id[pool.pool_id] = pool
+        self._pools_by_types.setdefault((pool.base_type, pool.quote_type), pool)
+
+    def _refresh_after_miss(self):
+        # an unknown pool is looked for at most once every MIN_REFRESH_INTERVAL
+        if self._is_stale(MIN_REFRESH_INTERVAL):
+            self.refresh()
+
+    def _is_stale(self, max_age: float) -> bool:
+        return self._last_refresh is None or self._time() - self._last_refresh > max_age
+
+    def _query_pool_created_events(self, cursor: Optional[Dict[str, str]]):
+        builder = QueryEvents(
+            query=MoveEventTypeQuery(f"{self._package_id}::clob_v2::PoolCreated"),
+            cursor=None if cursor is None else EventID(event_seq=cursor["eventSeq"], tx_seq=cursor["txDigest"]),
+            limit=SuiInteger(POOL_CREATED_PAGE_SIZE),
+            descending_order=SuiBoolean(False),
+        )
+        page = libsui.libsui_rpc_handler(self._client.execute(builder), debug=False).to_dict()
+        next_cursor = page["nextCursor"] if page["data"] else None
+        return page["data"], next_cursor, page["hasNextPage"]
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -0,0 +1,837 @@
+"""An in-process Deep Book: the `clob_v2` matching engine, without a chain
+
+`DeepbookSimulator` implements the `DeepbookConnector` interface on top of a
+Python port of the `clob_v2` pool logic (see `contracts/deepbook/sources`):
+
+* orders rest in price-time priority, bids and asks get ids from separate
+  ranges (`MIN_BID_ORDER_ID`, `MIN_ASK_ORDER_ID`);
+* a limit order must be on a tick, at least `lot_size` and a multiple of
+  `LOT_SIZE`, and expire in the future -- otherwise it aborts with the same
+  code as on chain;
+* a taker pays `taker_fee_rate` on the quote quantity it fills (rounded up),
+  of which `maker_rebate_rate` goes to the maker and the rest to the pool;
+* an expired maker order, or one of the taker's own, is canceled instead of
+  matched;
+* the custodian keeps an available and a locked balance per account and asset.
+
+Each call is one transaction: it either applies all of its commands or, if one
+of them aborts, none of them, and it returns a `tx_result_json` carrying the
+same `effects.status` and `events` a full node reports.  Events are kept in
+order and paged through `query_events`, so `DeepbookEventStream`, the order
+batcher and the data source run unchanged against the simulator; that makes
+the connector stack testable and benchmarkable without a localnet.
+
+Not simulated: gas, coins outside the custodian, and market orders / swaps.
+"""
+
+import bisect
+import copy
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import hummingbot.connector.exchange.suidex.libsui as libsui
+from hummingbot.connector.exchange.suidex.libsui.deepbook import (
+    CANCEL_OLDEST,
+    EInvalidExpireTimestamp,
+    EInvalidFeeRateRebateRate,
+    EInvalidOrderId,
+    EInvalidPair,
+    EInvalidPrice,
+    EInvalidQuantity,
+    EInvalidRestriction,
+    EInvalidSelfMatchingPreventionArg,
+    EInvalidTickSizeMinSize,
+    EInvalidUser,
+    EOrderCannotBeFullyFilled,
+    EOrderCannotBeFullyPassive,
+    EVENTS_PAGE_SIZE,
+    FILL_OR_KILL,
+    IMMEDIATE_OR_CANCEL,
+    NO_RESTRICTION,
+    ORDER_TTL_MS,
+    POST_OR_ABORT,
+    REFERENCE_MAKER_REBATE_RATE,
+    REFERENCE_TAKER_FEE_RATE,
+    _canceled_order_ids,
+    _client_trade_id,
+    _events_of_type,
+    order_side,
+)
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import DeepbookPool
+from hummingbot.logger import HummingbotLogger
+
+SIMULATOR_PACKAGE_ID = "0xdee9"
+FLOAT_SCALING = 10**9
+LOT_SIZE = 1000  # every quantity is a multiple of it; the lot size of a pool is its minimum order size
+MIN_BID_ORDER_ID = 1
+MIN_ASK_ORDER_ID = 1 << 63
+DEFAULT_TICK_SIZE = libsui.ONE_SUI // 10**4  # as `DeepbookConnector.create_pool`
+DEFAULT_COIN_DECIMALS = {libsui.TYPE_SUI: 9}
+
+EUnderflow = 1  # deepbook::math
+ENotEnough = 2  # sui::balance
+
+
+class MoveAbort(Exception):
+    def __init__(self, code: int, function: str, module: str = "clob_v2", address: str = SIMULATOR_PACKAGE_ID):
+        super().__init__(f"{address}::{module}::{function} aborted with {code}")
+        self.code = code
+        self.function = function
+        self.module = module
+        self.address = address
+
+    def error(self, command: int) -> str:
+        """the `effects.status.error` a full node reports for the abort"""
+        return (
+            f'MoveAbort(MoveLocation {{ module: ModuleId {{ address: {self.address}, name: Identifier("{self.module}") }}, '
+            f'function: 0, instruction: 0, function_name: Some("{self.function}") }}, {self.code}) in command {command}'
+        )
+
+
+def _unsafe_mul_round(x: int, y: int) -> Tuple[bool, int]:
+    result, remainder = divmod(x * y, FLOAT_SCALING)
+    return remainder != 0, result
+
+
+def _unsafe_mul(x: int, y: int) -> int:
+    return _unsafe_mul_round(x, y)[1]
+
+
+def _mul(x: int, y: int) -> int:
+    result = _unsafe_mul(x, y)
+    if result == 0:
+        raise MoveAbort(EUnderflow, "mul", module="math")
+    return result
+
+
+def _split(value: int, amount: int) -> int:
+    """what is left of a balance of `value` after splitting `amount` off it"""
+    if amount > value:
+        raise MoveAbort(ENotEnough, "split", module="balance", address="0x2")
+    return value - amount
+
+
+@dataclass
+class SimulatedOrder:
+    order_id: int
+    client_order_id: int
+    price: int
+    original_quantity: int
+    quantity: int
+    is_bid: bool
+    owner: str
+    expire_timestamp: int
+    self_matching_prevention: int = CANCEL_OLDEST
+
+
+class _Journal:
+    """undoes the changes of an aborted transaction"""
+
+    def __init__(self):
+        self._undo: List[Callable[[], None]] = []
+        self._saved: Set[Tuple[int, Any]] = set()
+
+    def save(self, mapping: Dict, key: Any):
+        """remembers `mapping[key]` (a shallow copy of it) as it was before its first change in the transaction"""
+        token = (id(mapping), key)
+        if token in self._saved:
+            return
+        self._saved.add(token)
+        if key in mapping:
+            saved = copy.copy(mapping[key])
+            self._undo.append(lambda: mapping.__setitem__(key, saved))
+        else:
+            self._undo.append(lambda: mapping.pop(key, None))
+
+    def on_rollback(self, undo: Callable[[], None]):
+        self._undo.append(undo)
+
+    def rollback(self):
+        for undo in reversed(self._undo):
+            undo()
+
+
+class SimulatedPool:
+    """the state and the order entry functions of one `clob_v2::Pool`"""
+
+    def __init__(self, pool: DeepbookPool, package_id: str = SIMULATOR_PACKAGE_ID):
+        self.pool = pool
+        self.package_id = package_id
+        # price -> {order_id: order}, in time priority (order ids of a side only grow)
+        self._levels: Dict[bool, Dict[int, Dict[int, SimulatedOrder]]] = {True: {}, False: {}}
+        self._prices: Dict[bool, List[int]] = {True: [], False: []}  # ascending
+        self._usr_open_orders: Dict[str, Dict[int, int]] = {}  # owner -> {order_id: price}, oldest first
+        # custodian: (asset, owner) -> (available, locked), asset being "base" or "quote"
+        self._balances: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._state = {
+            "next_bid_order_id": MIN_BID_ORDER_ID,
+            "next_ask_order_id": MIN_ASK_ORDER_ID,
+            "quote_asset_trading_fees": 0,
+        }
+        self._journal = _Journal()
+        self._events: List[Tuple[str, Dict[str, Any]]] = []
+
+    @property
+    def quote_asset_trading_fees(self) -> int:
+        return self._state["quote_asset_trading_fees"]
+
+    def begin(self, journal: _Journal, events: List[Tuple[str, Dict[str, Any]]]):
+        """routes the changes and events of the following calls to a transaction"""
+        self._journal = journal
+        self._events = events
+
+    # ---- queries
+
+    def account_balance(self, owner: str) -> Tuple[int, int, int, int]:
+        base_available, base_locked = self._balance("base", owner)
+        quote_available, quote_locked = self._balance("quote", owner)
+        return base_available, base_locked, quote_available, quote_locked
+
+    def level2_book_status(self, is_bid: bool, price_low: int, price_high: int, now_ms: int) -> Tuple[List[int], List[int]]:
+        price_vec, depth_vec = [], []
+        for price in self._prices[is_bid]:
+            if price_low <= price <= price_high:
+                depth = sum(o.quantity for o in self._levels[is_bid][price].values() if o.expire_timestamp > now_ms)
+                if depth != 0:
+                    price_vec.append(price)
+                    depth_vec.append(depth)
+        return price_vec, depth_vec
+
+    def order(self, owner: str, order_id: int) -> Optional[SimulatedOrder]:
+        price = self._usr_open_orders.get(owner, {}).get(order_id)
+        if price is None:
+            return None
+        return replace(self._levels[order_id < MIN_ASK_ORDER_ID][price][order_id])
+
+    def open_orders(self, is_bid: bool) -> Iterator[SimulatedOrder]:
+        """resting orders of a side, best price first and in time priority within a price"""
+        prices = reversed(self._prices[is_bid]) if is_bid else iter(self._prices[is_bid])
+        for price in prices:
+            yield from self._levels[is_bid][price].values()
+
+    # ---- entry functions
+
+    def deposit(self, asset: str, owner: str, quantity: int):
+        if quantity == 0:
+            raise MoveAbort(EInvalidQuantity, f"deposit_{asset}")
+        self._increase_available(asset, owner, quantity)
+        asset_type = self.pool.base_type if asset == "base" else self.pool.quote_type
+        self._emit(f"DepositAsset<{asset_type}>", {"quantity": quantity, "owner": owner})
+
+    def place_limit_order(
+        self,
+        owner: str,
+        client_order_id: int,
+        price: int,
+        quantity: int,
+        self_matching_prevention: int,
+        is_bid: bool,
+        expire_timestamp: int,
+        restriction: int,
+        now_ms: int,
+    ) -> Tuple[int, int, bool, int]:
+        """`(base quantity filled, quote quantity filled, is placed, order id)`, as `clob_v2::place_limit_order`"""
+        function = "place_limit_order_int"
+        if self_matching_prevention != CANCEL_OLDEST:
+            raise MoveAbort(EInvalidSelfMatchingPreventionArg, function)
+        if quantity <= 0:
+            raise MoveAbort(EInvalidQuantity, function)
+        if price <= 0 or price % self.pool.tick_size != 0:
+            raise MoveAbort(EInvalidPrice, function)
+        if quantity < self.pool.lot_size or quantity % LOT_SIZE != 0:
+            raise MoveAbort(EInvalidQuantity, function)
+        if expire_timestamp <= now_ms:
+            raise MoveAbort(EInvalidExpireTimestamp, function)
+
+        if is_bid:
+            quote_quantity_original, _ = self._balance("quote", owner)
+            self._decrease_available("quote", owner, quote_quantity_original)
+            base_quantity_filled, quote_left = self._match_bid(owner, client_order_id, quantity, price, now_ms,
+                                                               quote_quantity_original)
+            quote_quantity_filled = quote_quantity_original - quote_left
+            self._increase_available("base", owner, base_quantity_filled)
+            self._increase_available("quote", owner, quote_left)
+        else:
+            self._decrease_available("base", owner, quantity)
+            base_left, quote_quantity_filled = self._match_ask(owner, client_order_id, price, now_ms, quantity)
+            base_quantity_filled = quantity - base_left
+            self._increase_available("base", owner, base_left)
+            self._increase_available("quote", owner, quote_quantity_filled)
+
+        if restriction == IMMEDIATE_OR_CANCEL:
+            return base_quantity_filled, quote_quantity_filled, False, 0
+        if restriction == FILL_OR_KILL:
+            if base_quantity_filled != quantity:
+                raise MoveAbort(EOrderCannotBeFullyFilled, function)
+            return base_quantity_filled, quote_quantity_filled, False, 0
+        if restriction == POST_OR_ABORT:
+            if base_quantity_filled != 0:
+                raise MoveAbort(EOrderCannotBeFullyPassive, function)
+            order_id = self._inject_limit_order(owner, client_order_id, price, quantity, quantity, is_bid,
+                                                expire_timestamp)
+            return base_quantity_filled, quote_quantity_filled, True, order_id
+        if restriction != NO_RESTRICTION:
+            raise MoveAbort(EInvalidRestriction, function)
+        if quantity > base_quantity_filled:
+            order_id = self._inject_limit_order(owner, client_order_id, price, quantity,
+                                                quantity - base_quantity_filled, is_bid, expire_timestamp)
+            return base_quantity_filled, quote_quantity_filled, True, order_id
+        return base_quantity_filled, quote_quantity_filled, False, 0
+
+    def cancel_order(self, owner: str, order_id: int):
+        if owner not in self._usr_open_orders:
+            raise MoveAbort(EInvalidUser, "cancel_order")
+        if order_id not in self._usr_open_orders[owner]:
+            raise MoveAbort(EInvalidOrderId, "cancel_order")
+        order = self._cancel(owner, order_id)
+        self._emit("OrderCanceled", self._canceled_component(order))
+
+    def batch_cancel_order(self, owner: str, order_ids: List[int]):
+        if owner not in self._usr_open_orders:
+            raise MoveAbort(0, "batch_cancel_order")
+        canceled = []
+        for order_id in order_ids:
+            if order_id not in self._usr_open_orders[owner]:
+                raise MoveAbort(EInvalidOrderId, "batch_cancel_order")
+            canceled.append(self._canceled_component(self._cancel(owner, order_id)))
+        self._emit_all_orders_canceled(canceled)
+
+    def cancel_all_orders(self, owner: str):
+        if owner not in self._usr_open_orders:
+            raise MoveAbort(EInvalidUser, "cancel_all_orders")
+        # newest first, as `linked_table::back`
+        order_ids = list(reversed(self._usr_open_orders[owner]))
+        self._emit_all_orders_canceled([self._canceled_component(self._cancel(owner, order_id)) for order_id in order_ids])
+
+    # ---- matching
+
+    def _match_bid(
+        self, owner: str, client_order_id: int, quantity: int, price_limit: int, now_ms: int, quote_balance: int
+    ) -> Tuple[int, int]:
+        """`(base filled, quote left)` of a taker bid matched against the asks"""
+        taker_base_quantity_remaining = quantity
+        base_filled = 0
+        canceled = []
+        prices = self._prices[False]
+        while prices and prices[0] <= price_limit and taker_base_quantity_remaining > 0:
+            tick_price = prices[0]
+            for maker_order in list(self._levels[False][tick_price].values()):
+                if maker_order.expire_timestamp <= now_ms or maker_order.owner == owner:
+                    self._unlock("base", maker_order.owner, maker_order.quantity)
+                    canceled.append(self._canceled_component(maker_order))
+                    self._remove_order(maker_order)
+                else:
+                    filled_base_quantity = min(taker_base_quantity_remaining, maker_order.quantity)
+                    filled_quote_quantity = _mul(filled_base_quantity, maker_order.price)
+                    maker_rebate = _unsafe_mul(filled_quote_quantity, self.pool.maker_rebate_rate)
+                    is_round_down, taker_commission = _unsafe_mul_round(filled_quote_quantity, self.pool.taker_fee_rate)
+                    taker_commission += 1 if is_round_down else 0
+
+                    taker_base_quantity_remaining -= filled_base_quantity
+                    self._decrease_locked("base", maker_order.owner, filled_base_quantity)
+                    base_filled += filled_base_quantity
+                    quote_balance = _split(quote_balance, taker_commission)
+                    self._increase_available("quote", maker_order.owner, maker_rebate)
+                    self._collect_fees(taker_commission - maker_rebate)
+                    quote_balance = _split(quote_balance, filled_quote_quantity)
+                    self._increase_available("quote", maker_order.owner, filled_quote_quantity)
+                    self._fill(maker_order, client_order_id, owner, filled_base_quantity, taker_commission, maker_rebate)
+                if taker_base_quantity_remaining == 0:
+                    break
+        self._emit_all_orders_canceled(canceled)
+        return base_filled, quote_balance
+
+    def _match_ask(
+        self, owner: str, client_order_id: int, price_limit: int, now_ms: int, base_balance: int
+    ) -> Tuple[int, int]:
+        """`(base left, quote filled)` of a taker ask matched against the bids"""
+        quote_filled = 0
+        canceled = []
+        prices = self._prices[True]
+        while prices and prices[-1] >= price_limit and base_balance > 0:
+            tick_price = prices[-1]
+            for maker_order in list(self._levels[True][tick_price].values()):
+                if maker_order.expire_timestamp <= now_ms or maker_order.owner == owner:
+                    self._unlock("quote", maker_order.owner, _mul(maker_order.quantity, maker_order.price))
+                    canceled.append(self._canceled_component(maker_order))
+                    self._remove_order(maker_order)
+                else:
+                    filled_base_quantity = min(base_balance, maker_order.quantity)
+                    # a rounded down quote quantity leaves a unit locked; the pool takes it as a fee
+                    is_round_down, filled_quote_quantity = _unsafe_mul_round(filled_base_quantity, maker_order.price)
+                    if is_round_down:
+                        self._decrease_locked("quote", maker_order.owner, 1)
+                        self._collect_fees(1)
+                    maker_rebate = _unsafe_mul(filled_quote_quantity, self.pool.maker_rebate_rate)
+                    is_round_down, taker_commission = _unsafe_mul_round(filled_quote_quantity, self.pool.taker_fee_rate)
+                    taker_commission += 1 if is_round_down else 0
+
+                    self._decrease_locked("quote", maker_order.owner, filled_quote_quantity)
+                    _split(filled_quote_quantity, taker_commission)
+                    self._increase_available("quote", maker_order.owner, maker_rebate)
+                    self._collect_fees(taker_commission - maker_rebate)
+                    quote_filled += filled_quote_quantity - taker_commission
+                    base_balance = _split(base_balance, filled_base_quantity)
+                    self._increase_available("base", maker_order.owner, filled_base_quantity)
+                    self._fill(maker_order, client_order_id, owner, filled_base_quantity, taker_commission, maker_rebate)
+                if base_balance == 0:
+                    break
+        self._emit_all_orders_canceled(canceled)
+        return base_balance, quote_filled
+
+    def _fill(
+        self,
+        maker_order: SimulatedOrder,
+        taker_client_order_id: int,
+        taker_address: str,
+        filled_base_quantity: int,
+        taker_commission: int,
+        maker_rebate: int,
+    ):
+        self._emit("OrderFilled", {
+            "order_id": maker_order.order_id,
+            "taker_client_order_id": taker_client_order_id,
+            "maker_client_order_id": maker_order.client_order_id,
+            "is_bid": maker_order.is_bid,
+            "taker_address": taker_address,
+            "maker_address": maker_order.owner,
+            "original_quantity": maker_order.original_quantity,
+            "base_asset_quantity_filled": filled_base_quantity,
+            "base_asset_quantity_remaining": maker_order.quantity - filled_base_quantity,
+            "price": maker_order.price,
+            "taker_commission": taker_commission,
+            "maker_rebates": maker_rebate,
+        })
+        if maker_order.quantity == filled_base_quantity:
+            self._remove_order(maker_order)
+        else:
+            self._set_quantity(maker_order, maker_order.quantity - filled_base_quantity)
+
+    def _inject_limit_order(
+        self,
+        owner: str,
+        client_order_id: int,
+        price: int,
+        original_quantity: int,
+        quantity: int,
+        is_bid: bool,
+        expire_timestamp: int,
+    ) -> int:
+        if is_bid:
+            self._lock("quote", owner, _mul(quantity, price))
+        else:
+            self._lock("base", owner, quantity)
+        key = "next_bid_order_id" if is_bid else "next_ask_order_id"
+        order_id = self._state[key]
+        self._set_state(key, order_id + 1)
+        order = SimulatedOrder(
+            order_id=order_id,
+            client_order_id=client_order_id,
+            price=price,
+            original_quantity=original_quantity,
+            quantity=quantity,
+            is_bid=is_bid,
+            owner=owner,
+            expire_timestamp=expire_timestamp,
+        )
+        self._insert_order(order)
+        self._emit("OrderPlaced", {
+            "order_id": order_id,
+            "client_order_id": client_order_id,
+            "is_bid": is_bid,
+            "owner": owner,
+            "original_quantity": original_quantity,
+            "base_asset_quantity_placed": quantity,
+            "price": price,
+            "expire_timestamp": expire_timestamp,
+        })
+        return order_id
+
+    def _cancel(self, owner: str, order_id: int) -> SimulatedOrder:
+        """removes an order of `owner` from the book and unlocks what it held"""
+        is_bid = order_id < MIN_ASK_ORDER_ID
+        order = self._levels[is_bid][self._usr_open_orders[owner][order_id]][order_id]
+        self._remove_order(order)
+        if is_bid:
+            self._unlock("quote", owner, _unsafe_mul(order.quantity, order.price))
+        else:
+            self._unlock("base", owner, order.quantity)
+        return order
+
+    @staticmethod
+    def _canceled_component(order: SimulatedOrder) -> Dict[str, Any]:
+        return {
+            "order_id": order.order_id,
+            "client_order_id": order.client_order_id,
+            "is_bid": order.is_bid,
+            "owner": order.owner,
+            "original_quantity": order.original_quantity,
+            "base_asset_quantity_canceled": order.quantity,
+            "price": order.price,
+        }
+
+    # ---- journaled state changes
+
+    # Appending an order is undone by removing it again. A removal cannot be undone that way (the order has to go
+    # back to its place in the queue), so the tick level and the owner's orders are saved before the first removal.
+
+    def _insert_order(self, order: SimulatedOrder):
+        levels = self._levels[order.is_bid]
+        if order.price not in levels:
+            levels[order.price] = {}
+            self._add_price(order.is_bid, order.price)
+        levels[order.price][order.order_id] = order
+        self._usr_open_orders.setdefault(order.owner, {})[order.order_id] = order.price
+        self._journal.on_rollback(lambda: self._discard_order(order))
+
+    def _discard_order(self, order: SimulatedOrder):
+        levels = self._levels[order.is_bid]
+        level = levels[order.price]
+        del level[order.order_id]
+        if not level:
+            del levels[order.price]
+            self._prices[order.is_bid].remove(order.price)
+        del self._usr_open_orders[order.owner][order.order_id]
+
+    def _remove_order(self, order: SimulatedOrder):
+        levels = self._levels[order.is_bid]
+        self._journal.save(levels, order.price)
+        self._journal.save(self._usr_open_orders, order.owner)
+        level = levels[order.price]
+        del level[order.order_id]
+        if not level:
+            del levels[order.price]
+            self._prices[order.is_bid].remove(order.price)
+            self._journal.on_rollback(lambda: self._add_price(order.is_bid, order.price))
+        del self._usr_open_orders[order.owner][order.order_id]
+
+    def _add_price(self, is_bid: bool, price: int):
+        bisect.insort(self._prices[is_bid], price)
+
+    def _set_quantity(self, order: SimulatedOrder, quantity: int):
+        previous = order.quantity
+        self._journal.on_rollback(lambda: setattr(order, "quantity", previous))
+        order.quantity = quantity
+
+    def _set_state(self, key: str, value: int):
+        self._journal.save(self._state, key)
+        self._state[key] = value
+
+    def _collect_fees(self, quantity: int):
+        self._set_state("quote_asset_trading_fees", self._state["quote_asset_trading_fees"] + quantity)
+
+    def _balance(self, asset: str, owner: str) -> Tuple[int, int]:
+        return self._balances.get((asset, owner), (0, 0))
+
+    def _set_balance(self, asset: str, owner: str, available: int, locked: int):
+        self._journal.save(self._balances, (asset, owner))
+        self._balances[(asset, owner)] = (available, locked)
+
+    def _increase_available(self, asset: str, owner: str, quantity: int):
+        available, locked = self._balance(asset, owner)
+        self._set_balance(asset, owner, available + quantity, locked)
+
+    def _decrease_available(self, asset: str, owner: str, quantity: int):
+        available, locked = self._balance(asset, owner)
+        self._set_balance(asset, owner, _split(available, quantity), locked)
+
+    def _decrease_locked(self, asset: str, owner: str, quantity: int):
+        available, locked = self._balance(asset, owner)
+        self._set_balance(asset, owner, available, _split(locked, quantity))
+
+    def _lock(self, asset: str, owner: str, quantity: int):
+        available, locked = self._balance(asset, owner)
+        self._set_balance(asset, owner, _split(available, quantity), locked + quantity)
+
+    def _unlock(self, asset: str, owner: str, quantity: int):
+        available, locked = self._balance(asset, owner)
+        self._set_balance(asset, owner, available + quantity, _split(locked, quantity))
+
+    def _emit(self, name: str, parsed_json: Dict[str, Any]):
+        self._events.append((name, dict(pool_id=self.pool.pool_id, **parsed_json)))
+
+    def _emit_all_orders_canceled(self, canceled: List[Dict[str, Any]]):
+        if canceled:
+            self._emit("AllOrdersCanceled", {"orders_canceled": canceled})
+
+
+class DeepbookSimulator:
+    """
+    Stands in for `DeepbookConnector`: same methods, same return values, but the pools live in memory and every call
+    executes instantly. Accounts are `AccountCap` ids handed out by `create_account`; methods acting for an account
+    take an `account_cap` (by default the simulator's own, `self.account_cap`).
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(
+        self,
+        package_id: str = SIMULATOR_PACKAGE_ID,
+        coin_decimals: Optional[Dict[str, int]] = None,
+        clock: Optional[Callable[[], int]] = None,
+        create_pool: bool = True,
+    ):
+        """
+        :param package_id: package the event types and the default pool's REALUSDC type are prefixed with
+        :param coin_decimals: decimals of the coin types, by default 9 for SUI and 6 for the package's REALUSDC
+        :param clock: current time in milliseconds, by default the wall clock; drives order expiration
+        :param create_pool: creates a SUI/REALUSDC pool with the parameters of `DeepbookConnector.create_pool` and sets
+            it as `pool_object_id`
+        """
+        self.package_id = package_id
+        self._coin_decimals = {**DEFAULT_COIN_DECIMALS, f"{package_id}::{libsui.ASSET_ACCOUNTING}": 6}
+        self._coin_decimals.update(coin_decimals or {})
+        self._clock = clock or (lambda: int(time.time() * 1e3))
+        self._pools: Dict[str, SimulatedPool] = {}
+        self._events: List[Dict[str, Any]] = []
+        self._event_index: Dict[Tuple[str, str], int] = {}
+        self._object_ids = itertools.count(1)
+        self._transactions = itertools.count(1)
+        self._lock = threading.Lock()
+
+        self.account_cap = self.create_account()
+        self.pool_object_id = self.create_pool() if create_pool else None
+
+    # ---- accounts and pools
+
+    def create_account(self) -> str:
+        return self._new_object_id()
+
+    def create_pool(
+        self,
+        asset_base=None,
+        asset_quote=None,
+        taker_fee_rate=None,
+        maker_rebate_rate=None,
+        tick_size=None,
+        min_size=None,
+    ) -> str:
+        """creates a pool and returns its id; defaults as `DeepbookConnector.create_pool`"""
+        asset_base = libsui.ASSET_SUI if asset_base is None else asset_base
+        asset_quote = libsui.ASSET_ACCOUNTING if asset_quote is None else asset_quote
+        pool = DeepbookPool(
+            pool_id=self._new_object_id(),
+            base_type=self._asset_type(asset_base),
+            quote_type=self._asset_type(asset_quote),
+            tick_size=DEFAULT_TICK_SIZE if tick_size is None else tick_size,
+            lot_size=DEFAULT_TICK_SIZE if min_size is None else min_size,
+            taker_fee_rate=REFERENCE_TAKER_FEE_RATE if taker_fee_rate is None else taker_fee_rate,
+            maker_rebate_rate=REFERENCE_MAKER_REBATE_RATE if maker_rebate_rate is None else maker_rebate_rate,
+        )
+        if pool.taker_fee_rate < pool.maker_rebate_rate:
+            raise MoveAbort(EInvalidFeeRateRebateRate, "create_pool_")
+        if pool.base_type == pool.quote_type:
+            raise MoveAbort(EInvalidPair, "create_pool_")
+        if pool.tick_size == 0 or pool.lot_size == 0 or pool.lot_size % LOT_SIZE != 0:
+            raise MoveAbort(EInvalidTickSizeMinSize, "create_pool_")
+        self._pools[pool.pool_id] = SimulatedPool(pool, package_id=self.package_id)
+        self.logger().info(f"created simulated Pool<{asset_base}, {asset_quote}>: {pool.pool_id}")
+        return pool.pool_id
+
+    def list_pools(self, refresh=False) -> List[DeepbookPool]:
+        return [simulated.pool for simulated in self._pools.values()]
+
+    def coin_decimals(self, coin_type) -> int:
+        return self._coin_decimals[coin_type]
+
+    def pool(self, pool_object_id=None) -> SimulatedPool:
+        return self._pools[self.pool_object_id if pool_object_id is None else pool_object_id]
+
+    # ---- transactions
+
+    def deposit_base(self, amount_base, pool_object_id=None, account_cap=None):  # noqa: mock
+        return self._deposit("base", amount_base, pool_object_id=pool_object_id, account_cap=account_cap)
+
+    def deposit_quote(self, amount_quote, pool_object_id=None, account_cap=None):  # noqa: mock
+        return self._deposit("quote", amount_quote, pool_object_id=pool_object_id, account_cap=account_cap)
+
+    def _deposit(self, base_or_quote, amount, pool_object_id=None, account_cap=None):
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool = self.pool(pool_object_id)
+        _, tx_result_json = self._execute(pool, [lambda now_ms: pool.deposit(base_or_quote, account_cap, amount)])
+        return tx_result_json
+
+    def place_limit_order(
+        self,
+        price,
+        quantity,
+        is_bid=None,
+        client_order_id=None,
+        restriction=IMMEDIATE_OR_CANCEL,
+        expire_timestamp=None,
+        self_matching_prevention=CANCEL_OLDEST,
+        pool_object_id=None,
+        account_cap=None,
+    ):
+        """:return: (success, client_order_id, pool_order_id, tx_result_json)"""
+        pool = self.pool(pool_object_id)
+        command, client_order_id = self._place_limit_order_command(
+            pool, price, quantity, is_bid=is_bid, client_order_id=client_order_id, restriction=restriction,
+            expire_timestamp=expire_timestamp, self_matching_prevention=self_matching_prevention,
+            account_cap=account_cap,
+        )
+        success, tx_result_json = self._execute(pool, [command])
+        placed = {e["client_order_id"]: e["order_id"] for e in _events_of_type(tx_result_json, "OrderPlaced")}
+        return success, client_order_id, placed.get(str(client_order_id), None), tx_result_json
+
+    def cancel_order(self, order_id, account_cap=None, pool_object_id=None):
+        """:return: (success, tx_result_json)"""
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool = self.pool(pool_object_id)
+        return self._execute(pool, [lambda now_ms: pool.cancel_order(account_cap, int(order_id))])
+
+    def batch_cancel_order(self, order_ids, account_cap=None, pool_object_id=None):
+        """:return: (success, {canceled pool order ids}, tx_result_json)"""
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool = self.pool(pool_object_id)
+        order_ids = [int(order_id) for order_id in order_ids]
+        success, tx_result_json = self._execute(pool, [lambda now_ms: pool.batch_cancel_order(account_cap, order_ids)])
+        return success, _canceled_order_ids(tx_result_json), tx_result_json
+
+    def cancel_all_orders(self, account_cap=None, pool_object_id=None):
+        """:return: (success, {canceled pool order ids}, tx_result_json)"""
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool = self.pool(pool_object_id)
+        success, tx_result_json = self._execute(pool, [lambda now_ms: pool.cancel_all_orders(account_cap)])
+        return success, _canceled_order_ids(tx_result_json), tx_result_json
+
+    def execute_batch(self, place_orders=(), cancel_order_ids=(), account_cap=None, pool_object_id=None):
+        """cancels, then places, atomically -- as `DeepbookConnector.execute_batch`
+
+        :return: (success, {client_order_id: pool_order_id}, {canceled pool order ids}, tx_result_json)
+        """
+        account_cap = self.account_cap if account_cap is None else account_cap
+        pool = self.pool(pool_object_id)
+        cancel_order_ids = [int(order_id) for order_id in cancel_order_ids]
+        commands = []
+        if len(cancel_order_ids) == 1:
+            commands.append(lambda now_ms: pool.cancel_order(account_cap, cancel_order_ids[0]))
+        elif cancel_order_ids:
+            commands.append(lambda now_ms: pool.batch_cancel_order(account_cap, cancel_order_ids))
+        for place_order in place_orders:
+            command, _ = self._place_limit_order_command(pool, account_cap=account_cap, **place_order)
+            commands.append(command)
+
+        success, tx_result_json = self._execute(pool, commands)
+        placed = {e["client_order_id"]: e["order_id"] for e in _events_of_type(tx_result_json, "OrderPlaced")}
+        return success, placed, _canceled_order_ids(tx_result_json), tx_result_json
+
+    def _place_limit_order_command(
+        self,
+        pool: SimulatedPool,
+        price,
+        quantity,
+        is_bid=None,
+        client_order_id=None,
+        restriction=IMMEDIATE_OR_CANCEL,
+        expire_timestamp=None,
+        self_matching_prevention=CANCEL_OLDEST,
+        account_cap=None,
+    ) -> Tuple[Callable[[int], Any], int]:
+        account_cap = self.account_cap if account_cap is None else account_cap
+        client_order_id = _client_trade_id() if client_order_id is None else client_order_id
+        is_bid, quantity = order_side(quantity, is_bid=is_bid)
+
+        def command(now_ms: int):
+            expires = now_ms + ORDER_TTL_MS if expire_timestamp is None else expire_timestamp
+            return pool.place_limit_order(
+                account_cap, int(client_order_id), int(price), int(quantity), self_matching_prevention, is_bid,
+                expires, restriction, now_ms,
+            )
+
+        return command, client_order_id
+
+    def _execute(self, pool: SimulatedPool, commands: List[Callable[[int], Any]]) -> Tuple[bool, Dict[str, Any]]:
+        """runs the commands of one transaction: all of them, or none if one aborts"""
+        with self._lock:
+            now_ms = self._clock()
+            digest = f"sim{next(self._transactions)}"
+            journal, events = _Journal(), []
+            pool.begin(journal, events)
+            status = {"status": "success"}
+            for index, command in enumerate(commands):
+                try:
+                    command(now_ms)
+                except MoveAbort as abort:
+                    journal.rollback()
+                    events.clear()
+                    status = {"status": "failure", "error": abort.error(index)}
+                    break
+            pool.begin(_Journal(), [])
+            tx_events = [self._record(digest, seq, now_ms, pool, name, data) for seq, (name, data) in enumerate(events)]
+        return status["status"] == "success", {"digest": digest, "effects": {"status": status}, "events": tx_events}
+
+    def _record(self, digest, seq, now_ms, pool: SimulatedPool, name, parsed_json) -> Dict[str, Any]:
+        # u64 values are reported as strings, as by the JSON-RPC API
+        parsed_json = {key: self._json_value(value) for key, value in parsed_json.items()}
+        event_type = (
+            f"{self.package_id}::clob_v2::{name}" if "<" in name
+            else f"{self.package_id}::clob_v2::{name}<{pool.pool.base_type}, {pool.pool.quote_type}>"
+        )
+        event = {
+            "id": {"txDigest": digest, "eventSeq": str(seq)},
+            "type": event_type,
+            "parsedJson": parsed_json,
+            "timestampMs": str(now_ms),
+        }
+        self._event_index[(digest, str(seq))] = len(self._events)
+        self._events.append(event)
+        return event
+
+    @classmethod
+    def _json_value(cls, value):
+        if isinstance(value, bool) or isinstance(value, str):
+            return value
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, list):
+            return [{key: cls._json_value(v) for key, v in item.items()} for item in value]
+        return value
+
+    # ---- reads
+
+    def account_balance(self, pool_object_id=None, account_cap=None):
+        """:return: (base_avail, base_locked, quote_avail, quote_locked)"""
+        account_cap = self.account_cap if account_cap is None else account_cap
+        with self._lock:
+            return self.pool(pool_object_id).account_balance(account_cap)
+
+    def get_level2_book_status(self, side, price_low=0, price_high=10**12, pool_object_id=None):
+        """:return: (price_vec, depth_vec) of the non-expired orders of one side, ascending prices"""
+        with self._lock:
+            return self.pool(pool_object_id).level2_book_status(side == "bid", price_low, price_high, self._clock())
+
+    def get_order_status(self, pool_order_id, account_cap=None, pool_object_id=None) -> Optional[SimulatedOrder]:
+        account_cap = self.account_cap if account_cap is None else account_cap
+        with self._lock:
+            return self.pool(pool_object_id).order(account_cap, int(pool_order_id))
+
+    def query_events(self, cursor=None, limit=EVENTS_PAGE_SIZE, pool_object_id=None):
+        """pages through the events of a pool, oldest first -- as `DeepbookConnector.query_events`"""
+        pool_object_id = self.pool_object_id if pool_object_id is None else pool_object_id
+        with self._lock:
+            start = 0 if cursor is None else self._event_index[(cursor["txDigest"], cursor["eventSeq"])] + 1
+            page = self._events[start:start + limit]
+            has_next_page = start + limit < len(self._events)
+        events = [e for e in page if e["parsedJson"].get("pool_id") == pool_object_id]
+        next_cursor = page[-1]["id"] if page else None
+        return events, next_cursor, has_next_page
+
+    def latest_event_cursor(self):
+        with self._lock:
+            return self._events[-1]["id"] if self._events else None
+
+    def _asset_type(self, asset):
+        return libsui.TYPE_SUI if asset == libsui.ASSET_SUI else f"{self.package_id}::{asset}"
+
+    def _new_object_id(self) -> str:
+        return f"0x{next(self._object_ids):064x}"
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.suidex import suidex_constants as CONSTANTS
 from hummingbot.connector.exchange.suidex.chain_data_source import SuidexDataSource
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import OrderBookEvent
@@ -35,6 +35,7 @@ class SuidexOrderBookDataSource(OrderBookTrackerDataSource):
         # would break in that case because an async Queue can't be created in a thread that is not running
         # the async loop
         self._message_queue[self._diff_messages_queue_key] = asyncio.Queue()
+        self._message_queue[self._snapshot_messages_queue_key] = asyncio.Queue()
         self._message_queue[self._trade_messages_queue_key] = asyncio.Queue()
 
     async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
@@ -44,9 +45,9 @@ class SuidexOrderBookDataSource(OrderBookTrackerDataSource):
         # The chain reconnection is managed by the data_source. This method should do nothing
         pass
 
-    async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        # Polkadex only sends diff order book messages
-        raise NotImplementedError
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        # Suidex only sends snapshots to resynchronize the book after a gap, already as OrderBookMessage
+        message_queue.put_nowait(raw_message)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         # Polkadex uses GrapQL websockets to consume stream events
@@ -86,8 +87,11 @@ class SuidexOrderBookDataSource(OrderBookTrackerDataSource):
         self._forwarders.append(event_forwarder)
         self._data_source.add_listener(event_tag=OrderBookEvent.TradeEvent, listener=event_forwarder)
 
-    def _process_order_book_event(self, order_book_diff: OrderBookMessage):
-        self._message_queue[self._diff_messages_queue_key].put_nowait(order_book_diff)
+    def _process_order_book_event(self, order_book_message: OrderBookMessage):
+        if order_book_message.type == OrderBookMessageType.SNAPSHOT:
+            self._message_queue[self._snapshot_messages_queue_key].put_nowait(order_book_message)
+        else:
+            self._message_queue[self._diff_messages_queue_key].put_nowait(order_book_message)
 
     def _process_public_trade_event(self, trade_update: OrderBookMessage):
         self._message_queue[self._trade_messages_queue_key].put_nowait(trade_update)
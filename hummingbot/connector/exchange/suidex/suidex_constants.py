@@ -29,6 +29,13 @@ GRAPHQL_ENDPOINTS = {net: f"https://sui-{net}.mystenlabs.com/graphql" for net in
 
 SUIDEX_SS58_PREFIX = 88
 
+# Deepbook prices are u64 fixed point: quote atomic units per base atomic unit, times FLOAT_SCALING
+FLOAT_SCALING = 10**9
+BASE_ASSET_NAME = "SUI"
+QUOTE_ASSET_NAME = "REALUSDC"
+BASE_ASSET_DECIMALS = 9
+QUOTE_ASSET_DECIMALS = 6
+
 ORDERBOOK_UPDATES_STREAM_NAME = "ob-inc"
 RECENT_TRADES_STREAM_NAME = "recent-trades"
 
@@ -48,6 +55,17 @@ LIST_OPEN_ORDERS_LIMIT_ID = "ListOpenOrders"
 
 NO_LIMIT = sys.maxsize
 
+# Order placements and cancels issued within this window go out as one programmable transaction block
+ORDER_BATCH_WINDOW = 0.05
+MAX_ORDERS_PER_BATCH = 50
+
+# Deepbook events are followed by paging suix_queryEvents; Sui produces a checkpoint every ~250ms
+EVENTS_POLL_INTERVAL = 0.2
+EVENTS_PAGE_SIZE = 50
+
+# Once the order book is in sync, snapshots only re-read the levels within this fraction of the mid price
+ORDER_BOOK_REFRESH_WINDOW = 0.02
+
 RATE_LIMITS = [
     RateLimit(
         limit_id=ALL_ASSETS_LIMIT_ID,
@@ -1,11 +1,12 @@
 import asyncio
 import math
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from _decimal import Decimal
+from async_timeout import timeout
 
-from hummingbot.connector.constants import s_decimal_NaN
+from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange.suidex import suidex_constants as CONSTANTS
 from hummingbot.connector.exchange.suidex.chain_data_source import SuidexDataSource
 from hummingbot.connector.exchange.suidex.order_book_data_source import SuidexOrderBookDataSource
@@ -13,8 +14,11 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -210,6 +214,72 @@ class SuidexExchange(ExchangePyBase):
         )
         return hex_order_id
 
+    def batch_order_create(self, orders_to_create: List[Union[MarketOrder, LimitOrder]]) -> List[LimitOrder]:
+        """
+        Issues a batch order creation. All the orders are placed in as few programmable transactions as possible
+        (usually one), and the result of each order is reported individually.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The order
+            IDs can be blank.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            hex_order_id = f"0x{client_order_id.encode('utf-8').hex()}"
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=hex_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation. All the cancels are sent in as few programmable transactions as possible
+        (usually one), and the result of each cancel is reported individually.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+    async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
+        """
+        Cancels all currently active orders with a single on-chain `cancel_all_orders` call.
+
+        :param timeout_seconds: the maximum time (in seconds) the cancel logic should run
+
+        :return: a list of CancellationResult instances, one for each of the orders to be cancelled
+        """
+        incomplete_orders = {
+            order.client_order_id: order for order in self.in_flight_orders.values() if not order.is_done
+        }
+        successful_cancellations = []
+
+        if len(incomplete_orders) > 0:
+            try:
+                async with timeout(timeout_seconds):
+                    canceled_exchange_order_ids = await self._data_source.cancel_all_orders()
+                for client_order_id, order in list(incomplete_orders.items()):
+                    if order.exchange_order_id is not None and order.exchange_order_id in canceled_exchange_order_ids:
+                        self._update_order_after_cancelation_success(order=order)
+                        del incomplete_orders[client_order_id]
+                        successful_cancellations.append(CancellationResult(client_order_id, True))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error cancelling orders.",
+                    exc_info=True,
+                    app_warning_msg="Failed to cancel order. Check API key and network connection.",
+                )
+        failed_cancellations = [CancellationResult(oid, False) for oid in incomplete_orders.keys()]
+        return successful_cancellations + failed_cancellations
+
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
         # Suidex does not use a time synchronizer
         return False
@@ -236,6 +306,180 @@ class SuidexExchange(ExchangePyBase):
             self._order_tracker.process_order_update(order_update)
         return cancelled
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[MarketOrder, LimitOrder]]):
+        inflight_orders_to_create = []
+        for order in orders_to_create:
+            valid_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=order.price,
+            )
+            if valid_order is not None:
+                inflight_orders_to_create.append(valid_order)
+        if len(inflight_orders_to_create) > 0:
+            await self._execute_batch_inflight_order_create(inflight_orders_to_create=inflight_orders_to_create)
+
+    async def _execute_batch_inflight_order_create(self, inflight_orders_to_create: List[InFlightOrder]):
+        try:
+            place_order_results = await self._data_source.batch_order_create(orders_to_create=inflight_orders_to_create)
+            for place_order_result, in_flight_order in zip(place_order_results, inflight_orders_to_create):
+                if place_order_result.exception is not None:
+                    self._on_order_failure(
+                        order_id=in_flight_order.client_order_id,
+                        trading_pair=in_flight_order.trading_pair,
+                        amount=in_flight_order.amount,
+                        trade_type=in_flight_order.trade_type,
+                        order_type=in_flight_order.order_type,
+                        price=in_flight_order.price,
+                        exception=place_order_result.exception,
+                    )
+                else:
+                    order_update: OrderUpdate = OrderUpdate(
+                        client_order_id=in_flight_order.client_order_id,
+                        exchange_order_id=str(place_order_result.exchange_order_id),
+                        trading_pair=in_flight_order.trading_pair,
+                        update_timestamp=place_order_result.update_timestamp,
+                        new_state=OrderState.OPEN,
+                        misc_updates=place_order_result.misc_updates,
+                    )
+                    self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network("Batch order create failed.")
+            for order in inflight_orders_to_create:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=ex,
+                )
+
+    def _start_tracking_and_validate_order(
+        self,
+        trade_type: TradeType,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        order_type: OrderType,
+        price: Optional[Decimal] = None,
+    ) -> Optional[InFlightOrder]:
+        """applies the same checks as `_create_order`; returns the tracked order, or None if it was rejected"""
+        trading_rule = self._trading_rules[trading_pair]
+
+        if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
+            price = self.quantize_order_price(trading_pair, price)
+        quantized_amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount)
+
+        self.start_tracking_order(
+            order_id=order_id,
+            exchange_order_id=None,
+            trading_pair=trading_pair,
+            order_type=order_type,
+            trade_type=trade_type,
+            price=price,
+            amount=quantized_amount,
+        )
+        order = self._order_tracker.active_orders[order_id]
+        if not price or price.is_nan() or price == s_decimal_0:
+            notional_size = self.get_price(trading_pair, False) * quantized_amount
+        else:
+            notional_size = price * quantized_amount
+
+        if order_type not in self.supported_order_types():
+            self.logger().error(f"{order_type} is not in the list of supported order types")
+            order = None
+        elif quantized_amount < trading_rule.min_order_size:
+            self.logger().warning(
+                f"{trade_type.name.title()} order amount {amount} is lower than the minimum order size "
+                f"{trading_rule.min_order_size}. The order will not be created."
+            )
+            order = None
+        elif notional_size < trading_rule.min_notional_size:
+            self.logger().warning(
+                f"{trade_type.name.title()} order notional {notional_size} is lower than the minimum notional size "
+                f"{trading_rule.min_notional_size}. The order will not be created."
+            )
+            order = None
+
+        if order is None:
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        return order
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        results = []
+        tracked_orders_to_cancel = []
+
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            if tracked_order is not None and tracked_order.exchange_order_id is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        if len(tracked_orders_to_cancel) > 0:
+            results.extend(await self._execute_batch_order_cancel(orders_to_cancel=tracked_orders_to_cancel))
+
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            cancel_order_results = await self._data_source.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+            cancelation_results = []
+            for cancel_order_result in cancel_order_results:
+                success = True
+                if cancel_order_result.not_found:
+                    self.logger().warning(
+                        f"Failed to cancel the order {cancel_order_result.client_order_id} due to the order"
+                        f" not being found."
+                    )
+                    await self._order_tracker.process_order_not_found(
+                        client_order_id=cancel_order_result.client_order_id
+                    )
+                    success = False
+                elif cancel_order_result.exception is not None:
+                    self.logger().error(
+                        f"Failed to cancel order {cancel_order_result.client_order_id}",
+                        exc_info=cancel_order_result.exception,
+                    )
+                    success = False
+                else:
+                    tracked_order = self._order_tracker.all_updatable_orders.get(cancel_order_result.client_order_id)
+                    if tracked_order is not None:
+                        self._update_order_after_cancelation_success(order=tracked_order)
+                cancelation_results.append(
+                    CancellationResult(order_id=cancel_order_result.client_order_id, success=success)
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join([o.client_order_id for o in orders_to_cancel])}",
+                exc_info=True,
+            )
+            cancelation_results = [
+                CancellationResult(order_id=order.client_order_id, success=False) for order in orders_to_cancel
+            ]
+
+        return cancelation_results
+
+    def _update_order_after_cancelation_success(self, order: InFlightOrder):
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=(
+                OrderState.CANCELED if self.is_cancel_request_in_exchange_synchronous else OrderState.PENDING_CANCEL
+            ),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder) -> OrderState:
         await tracked_order.get_exchange_order_id()
         market_symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
@@ -430,7 +674,11 @@ class SuidexExchange(ExchangePyBase):
             self._order_tracker.process_order_update(order_update=order_update_to_process)
 
     def _process_user_trade_update(self, trade_update: TradeUpdate):
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(trade_update.exchange_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders.get(trade_update.client_order_id)
+        if tracked_order is None:
+            tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(
+                trade_update.exchange_order_id
+            )
 
         if tracked_order is not None:
             self.logger().debug(f"Processing trade update {trade_update}\nFillable order {tracked_order.to_json()}")
@@ -444,16 +692,18 @@ class SuidexExchange(ExchangePyBase):
                 percent_token=tracked_order.quote_asset,
                 flat_fees=flat_fees,
             )
-            fill_amount = trade_update.fill_base_amount - tracked_order.executed_amount_base
+            # OrderFilled events report the amount matched by each fill, not the accumulated amount
+            fill_amount = trade_update.fill_base_amount
             trade_update: TradeUpdate = TradeUpdate(
                 trade_id=trade_update.trade_id,
                 client_order_id=tracked_order.client_order_id,
-                exchange_order_id=trade_update.exchange_order_id,
+                exchange_order_id=trade_update.exchange_order_id or tracked_order.exchange_order_id,
                 trading_pair=tracked_order.trading_pair,
                 fill_timestamp=trade_update.fill_timestamp,
                 fill_price=trade_update.fill_price,
                 fill_base_amount=fill_amount,
                 fill_quote_amount=fill_amount * trade_update.fill_price,
                 fee=fee,
+                is_taker=trade_update.is_taker,
             )
             self._order_tracker.process_trade_update(trade_update)
@@ -0,0 +1,129 @@
+"""Coalesce the order placements and cancels issued within one clock tick into one programmable transaction"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.connector.exchange.suidex import suidex_constants as CONSTANTS
+from hummingbot.connector.exchange.suidex.libsui.async_deepbook import AsyncDeepbookConnector
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class _PendingBatch:
+    place_orders: List[Dict[str, Any]] = field(default_factory=list)
+    place_futures: List[asyncio.Future] = field(default_factory=list)
+    cancel_order_ids: List[int] = field(default_factory=list)
+    cancel_futures: List[asyncio.Future] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.place_orders) + len(self.cancel_order_ids)
+
+
+class SuidexOrderBatcher:
+    """
+    Collects the requests issued within `batch_window` seconds (well inside one clock tick) and submits them as a
+    single `execute_batch` programmable transaction block. Each caller gets back its own result:
+
+    - placements resolve to `(success, pool_order_id, tx_result_json)`
+    - cancels resolve to `(success, tx_result_json)`
+
+    A PTB is atomic, so when a multi-request batch fails, its requests are resubmitted one by one to find out which
+    of them failed instead of failing all of them.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(
+        self,
+        chain_executor: AsyncDeepbookConnector,
+        batch_window: float = CONSTANTS.ORDER_BATCH_WINDOW,
+        max_batch_size: int = CONSTANTS.MAX_ORDERS_PER_BATCH,
+    ):
+        self._chain_executor = chain_executor
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._pending = _PendingBatch()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def place_order(self, **place_order_kwargs) -> Tuple[bool, Optional[str], Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.place_orders.append(place_order_kwargs)
+        self._pending.place_futures.append(future)
+        self._schedule_flush()
+        return await future
+
+    async def cancel_order(self, order_id: int) -> Tuple[bool, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.cancel_order_ids.append(order_id)
+        self._pending.cancel_futures.append(future)
+        self._schedule_flush()
+        return await future
+
+    def flush(self):
+        """submits whatever has been collected so far without waiting for the batch window to close"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if len(self._pending) > 0:
+            batch, self._pending = self._pending, _PendingBatch()
+            safe_ensure_future(self._execute_batch(batch))
+
+    def _schedule_flush(self):
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._batch_window, self.flush)
+
+    async def _execute_batch(self, batch: _PendingBatch):
+        try:
+            success, placed, canceled, tx_result_json = await self._chain_executor.execute_batch(
+                place_orders=batch.place_orders, cancel_order_ids=batch.cancel_order_ids
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            self.logger().exception(f"Error submitting a batch of {len(batch)} Suidex order requests")
+            self._set_exceptions(batch, exception)
+            return
+
+        if not success and len(batch) > 1:
+            self.logger().warning(f"Suidex batch of {len(batch)} order requests failed, resubmitting them one by one")
+            await asyncio.gather(*[self._execute_batch(single) for single in self._split(batch)])
+            return
+
+        for place_order, future in zip(batch.place_orders, batch.place_futures):
+            pool_order_id = placed.get(str(place_order["client_order_id"]), None)
+            self._set_result(future, (success and pool_order_id is not None, pool_order_id, tx_result_json))
+        for order_id, future in zip(batch.cancel_order_ids, batch.cancel_futures):
+            self._set_result(future, (success and str(order_id) in canceled, tx_result_json))
+
+    @staticmethod
+    def _split(batch: _PendingBatch) -> List[_PendingBatch]:
+        singles = [
+            _PendingBatch(place_orders=[place_order], place_futures=[future])
+            for place_order, future in zip(batch.place_orders, batch.place_futures)
+        ]
+        singles.extend(
+            _PendingBatch(cancel_order_ids=[order_id], cancel_futures=[future])
+            for order_id, future in zip(batch.cancel_order_ids, batch.cancel_futures)
+        )
+        return singles
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, result: Any):
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exceptions(batch: _PendingBatch, exception: Exception):
+        for future in batch.place_futures + batch.cancel_futures:
+            if not future.done():
+                future.set_exception(exception)
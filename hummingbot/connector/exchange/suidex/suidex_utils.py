@@ -1,4 +1,5 @@
-from decimal import Decimal
+import hashlib
+from decimal import ROUND_DOWN, Decimal
 
 from pydantic import Field, SecretStr
 
@@ -23,6 +24,37 @@ def normalized_asset_name(asset_id: str, asset_name: str) -> str:
     return name
 
 
+def to_chain_price(
+    price: Decimal,
+    base_decimals: int = CONSTANTS.BASE_ASSET_DECIMALS,
+    quote_decimals: int = CONSTANTS.QUOTE_ASSET_DECIMALS,
+) -> int:
+    """converts a human price (quote per base) to the Deepbook u64 price"""
+    scaled = price * CONSTANTS.FLOAT_SCALING * Decimal(10) ** (quote_decimals - base_decimals)
+    return int(scaled.to_integral_value(rounding=ROUND_DOWN))
+
+
+def from_chain_price(
+    price: int,
+    base_decimals: int = CONSTANTS.BASE_ASSET_DECIMALS,
+    quote_decimals: int = CONSTANTS.QUOTE_ASSET_DECIMALS,
+) -> Decimal:
+    return Decimal(price) / CONSTANTS.FLOAT_SCALING / Decimal(10) ** (quote_decimals - base_decimals)
+
+
+def to_chain_quantity(amount: Decimal, decimals: int = CONSTANTS.BASE_ASSET_DECIMALS) -> int:
+    return int((amount * Decimal(10) ** decimals).to_integral_value(rounding=ROUND_DOWN))
+
+
+def from_chain_quantity(quantity: int, decimals: int = CONSTANTS.BASE_ASSET_DECIMALS) -> Decimal:
+    return Decimal(quantity) / Decimal(10) ** decimals
+
+
+def chain_client_order_id(client_order_id: str) -> int:
+    """Deepbook client order ids are u64; derive a stable one from the hummingbot client order id"""
+    return int.from_bytes(hashlib.blake2b(client_order_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+
 def _configmap(net):
     class SuidexConfigMap(BaseConnectorConfigMap):
         connector: str = Field(default=f"suidex_{net}", const=True, client_data=None)
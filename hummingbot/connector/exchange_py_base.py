@@ -2,26 +2,32 @@ import asyncio
 import copy
 import logging
 import math
+import os
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
+from hummingbot import data_path
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.api_throttler.async_shared_throttler import AsyncSharedThrottler
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.shared_rate_limit_budget import SharedRateLimitBudget
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_store import OrderBookStore
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
@@ -29,6 +35,7 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool_metrics import ConnectionPoolMetrics
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
@@ -62,9 +69,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler = self._create_throttler(client_config_map)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -76,7 +81,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            coalesce_diffs=client_config_map.order_book_coalesce_diffs,
+            order_book_store=self._create_order_book_store(client_config_map),
+            max_depth=client_config_map.order_book_max_depth))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -104,6 +112,22 @@ class ExchangePyBase(ExchangeBase, ABC):
     def rate_limits_rules(self) -> List[RateLimit]:
         raise NotImplementedError
 
+    @property
+    def rate_limits_priority_reserves(self) -> Optional[Dict[RequestPriority, float]]:
+        """
+        Share of the rate limits kept for the requests of a priority and the more urgent ones, see AsyncThrottlerBase.
+        Nothing is reserved by default.
+        """
+        return None
+
+    @property
+    def rate_limits_budget_name(self) -> str:
+        """
+        Name of the rate limit budget shared by the bots of the host when `rate_limits_shared` is enabled, see
+        SharedRateLimitBudget. The bots of an exchange share it by default, as they share the limits of their IP address.
+        """
+        return self.name
+
     @property
     @abstractmethod
     def domain(self) -> str:
@@ -165,6 +189,10 @@ class ExchangePyBase(ExchangeBase, ABC):
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
 
+    @property
+    def connection_pool_metrics(self) -> ConnectionPoolMetrics:
+        return self._web_assistants_factory.connection_pool_metrics
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -249,6 +277,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         Includes the logic that has to be processed every time a new tick happens in the bot. Particularly it enables
         the execution of the status update polling loop using an event.
         """
+        self.order_book_tracker.flush_coalesced_diffs()
         poll_interval = self._get_poll_interval(timestamp=timestamp)
         last_tick = int(self._last_timestamp / poll_interval)
         current_tick = int(timestamp / poll_interval)
@@ -893,6 +922,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -912,6 +942,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
                     headers=headers,
+                    priority=priority,
                 )
 
                 return request_result
@@ -1066,6 +1097,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         raise NotImplementedError
 
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottlerBase:
+        if client_config_map.rate_limits_shared:
+            return AsyncSharedThrottler(
+                rate_limits=self.rate_limits_rules,
+                budget=SharedRateLimitBudget(self.rate_limits_budget_name),
+                limits_share_percentage=client_config_map.rate_limits_share_pct,
+                priority_reserves=self.rate_limits_priority_reserves)
+        return AsyncThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct,
+            priority_reserves=self.rate_limits_priority_reserves)
+
+    def _create_order_book_store(self, client_config_map: "ClientConfigAdapter") -> Optional[OrderBookStore]:
+        if client_config_map.order_book_warm_restart:
+            return OrderBookStore(path=os.path.join(data_path(), "order_books", self.name))
+        return None
+
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
@@ -34,6 +35,7 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 reserved_share: float = 0.0,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +44,7 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param reserved_share: Share of each limit this API request must leave to more urgent ones
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +52,7 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._reserved_share: float = reserved_share
 
     def flush(self):
         """
@@ -62,6 +66,10 @@ class AsyncRequestContextBase(ABC):
             if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
                 self._task_logs.remove(task)
 
+    def available_capacity(self, rate_limit: RateLimit) -> int:
+        """the capacity of `rate_limit` this API request can use"""
+        return rate_limit.limit - math.floor(float(rate_limit.limit) * self._reserved_share)
+
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
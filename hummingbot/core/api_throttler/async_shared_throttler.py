@@ -0,0 +1,134 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.shared_rate_limit_budget import LimitRequest, SharedRateLimitBudget
+
+
+class AsyncSharedRequestContext(AsyncRequestContextBase):
+    """
+    The async context of a task of AsyncSharedThrottler, drawing the weights of the task from the shared budget once
+    every limit of the task has capacity in it.
+    """
+
+    def __init__(self,
+                 throttler: "AsyncSharedThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 priority: RequestPriority):
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=throttler._lock,
+            safety_margin_pct=throttler._safety_margin_pct,
+            retry_interval=throttler._retry_interval,
+            reserved_share=throttler.reserved_share(priority),
+        )
+        self._throttler = throttler
+        self._limits: List[LimitRequest] = [] if rate_limit is None else [
+            (limit.limit_id, self.available_capacity(limit), limit.time_interval * (1 + self._safety_margin_pct), weight)
+            for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits
+        ]
+
+    def flush(self):
+        # the shared budget drops the weights out of the time window itself
+        pass
+
+    def within_capacity(self) -> bool:
+        return len(self._limits) == 0 or self._throttler.budget.try_acquire(self._limits, consume=False)[0]
+
+    async def acquire(self):
+        if len(self._limits) == 0:
+            return
+        while True:
+            acquired, wait = await self._throttler.budget.async_try_acquire(self._limits)
+            if acquired:
+                return
+            self._throttler._warn_max_capacity_reached(self._rate_limit)
+            await asyncio.sleep(min(wait, self._retry_interval))
+
+
+class AsyncSharedThrottler(AsyncThrottlerBase):
+    """
+    Throttler drawing from a SharedRateLimitBudget, so that the processes of a host using the same API key, with the
+    same budget name, keep within the limits of the exchange together instead of each one on its own. The budget gives
+    every process a fair share of the limits while others wait for them.
+    The limits should be the limits of the whole account: `limits_share_percentage` still scales them down, for all
+    the processes.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 budget: SharedRateLimitBudget,
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_reserves: Optional[Dict[RequestPriority, float]] = None,
+                 ):
+        """
+        :param budget: the budget shared with the other processes
+        """
+        self.budget: SharedRateLimitBudget = budget
+        self._last_max_cap_warning_ts: float = 0.0
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage,
+                         priority_reserves=priority_reserves)
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncSharedRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task in the shared budget.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the task, by default the priority of its rate limit
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return AsyncSharedRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            priority=self.task_priority(rate_limit, priority),
+        )
+
+    async def async_update_usage(self,
+                                 limit_id: str,
+                                 used: Optional[int] = None,
+                                 remaining: Optional[int] = None,
+                                 limit: Optional[int] = None,
+                                 expires_in: Optional[float] = None):
+        reported_usage = self._reported_usage(limit_id=limit_id, used=used, remaining=remaining, limit=limit,
+                                              expires_in=expires_in)
+        if reported_usage is None:
+            return
+        rate_limit, used, expires_in = reported_usage
+        await self.budget.async_align_usage(rate_limit.limit_id,
+                                            span=rate_limit.time_interval * (1 + self._safety_margin_pct),
+                                            used=used,
+                                            expires_in=expires_in)
+
+    def _used_capacity(self, rate_limit: RateLimit, now: float) -> int:
+        return self.budget.usage(rate_limit.limit_id, now=now)
+
+    def _add_usage(self, rate_limit: RateLimit, weight: int, timestamp: float):
+        self.budget.add_usage(rate_limit.limit_id,
+                              span=rate_limit.time_interval * (1 + self._safety_margin_pct),
+                              weight=weight,
+                              timestamp=timestamp)
+
+    def _warn_max_capacity_reached(self, rate_limit: RateLimit):
+        now = time.time()
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                 f"{rate_limit.time_interval}s), shared with the other bots using "
+                                 f"{self.budget.path}, has almost reached.")
+            self._last_max_cap_warning_ts = now
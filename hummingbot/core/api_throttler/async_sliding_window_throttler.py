@@ -0,0 +1,261 @@
+import asyncio
+import bisect
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+
+class RateLimitWindow:
+    """
+    The weights of the tasks run within the time window of a RateLimit, oldest first, and their total.
+    """
+
+    __slots__ = ("rate_limit", "span", "used", "_tasks")
+
+    def __init__(self, rate_limit: RateLimit, span: float):
+        """
+        :param rate_limit: the RateLimit
+        :param span: the time window, the time interval of the limit extended by the safety margin of the throttler
+        """
+        self.rate_limit: RateLimit = rate_limit
+        self.span: float = span
+        self.used: int = 0
+        self._tasks: Deque[Tuple[float, int]] = deque()
+
+    def expire(self, now: float):
+        tasks = self._tasks
+        horizon = now - self.span
+        while len(tasks) > 0 and tasks[0][0] < horizon:
+            self.used -= tasks.popleft()[1]
+
+    def capacity(self, reserved_share: float = 0.0) -> int:
+        limit = self.rate_limit.limit
+        return limit - math.floor(float(limit) * reserved_share)
+
+    def has_capacity(self, weight: int, reserved_share: float = 0.0) -> bool:
+        return self.used + weight <= self.capacity(reserved_share)
+
+    def add(self, timestamp: float, weight: int):
+        tasks = self._tasks
+        if len(tasks) == 0 or tasks[-1][0] <= timestamp:
+            tasks.append((timestamp, weight))
+        else:
+            # usage reported by the server may expire before the tasks already in the window
+            tasks.insert(bisect.bisect_right([task_timestamp for task_timestamp, _ in tasks], timestamp),
+                         (timestamp, weight))
+        self.used += weight
+
+    def free_at(self, weight: int, reserved_share: float = 0.0) -> float:
+        """the time at which enough of the tasks expire for a task of `weight`, inf if it exceeds the limit itself"""
+        capacity = self.capacity(reserved_share)
+        excess = self.used + weight - capacity
+        if weight > capacity:
+            return math.inf
+        freed = 0
+        for timestamp, task_weight in self._tasks:
+            freed += task_weight
+            if freed >= excess:
+                return timestamp + self.span
+        return -math.inf
+
+
+WeightedWindows = List[Tuple[RateLimitWindow, int]]
+Waiter = Tuple[WeightedWindows, float, asyncio.Future]
+
+
+class AsyncSlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    The async context of a task of AsyncSlidingWindowThrottler, waiting until every limit of the task has capacity.
+    """
+
+    def __init__(self,
+                 throttler: "AsyncSlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 windows: WeightedWindows,
+                 priority: RequestPriority):
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=throttler._lock,
+            safety_margin_pct=throttler._safety_margin_pct,
+            retry_interval=throttler._retry_interval,
+            reserved_share=throttler.reserved_share(priority),
+        )
+        self._throttler = throttler
+        self._windows: WeightedWindows = windows
+        self._priority: RequestPriority = priority
+
+    def flush(self):
+        now = self._throttler._time()
+        for window, _ in self._windows:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        self.flush()
+        return all(window.has_capacity(weight, self._reserved_share) for window, weight in self._windows)
+
+    async def acquire(self):
+        if len(self._windows) > 0:
+            await self._throttler._acquire(self._windows, self._priority, self._reserved_share)
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    AsyncThrottler with the same limits, checked in constant time. Each RateLimit keeps the weights of the tasks within
+    its time window in a queue with their running total, instead of a list of TaskLog scanned on every check. The tasks
+    waiting for capacity are queued, in order, and woken by a single timer when the oldest tasks blocking them leave
+    the window, instead of polling every `retry_interval`.
+    A waiting task holds back the tasks of its priority queued after it, and the tasks of lower priorities, that share
+    one of its limits, not the others. Tasks leave the share of the limits reserved by `priority_reserves` to the
+    tasks of more urgent priorities.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_reserves: Optional[Dict[RequestPriority, float]] = None,
+                 ):
+        self._safety_margin_pct: float = safety_margin_pct
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._task_windows: Dict[str, WeightedWindows] = {}
+        # the waiting tasks of each priority, in order
+        self._waiters: List[Deque[Waiter]] = [deque() for _ in RequestPriority]
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0.0
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage,
+                         priority_reserves=priority_reserves)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        previous_windows = self._windows
+        self._windows = {}
+        for rate_limit in self._rate_limits:
+            window = RateLimitWindow(rate_limit, span=rate_limit.time_interval * (1 + self._safety_margin_pct))
+            if rate_limit.limit_id in previous_windows:
+                # the tasks already run keep counting against the new limit
+                for timestamp, weight in previous_windows[rate_limit.limit_id]._tasks:
+                    window.add(timestamp, weight)
+            self._windows[rate_limit.limit_id] = window
+        self._task_windows = {}
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None
+                     ) -> AsyncSlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the task, by default the priority of its rate limit
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        windows = self._task_windows.get(limit_id)
+        if windows is None:
+            windows = self._task_windows[limit_id] = [] if rate_limit is None else [
+                (self._windows[limit.limit_id], weight)
+                for limit, weight in [(rate_limit, rate_limit.weight)] + related_rate_limits
+            ]
+        return AsyncSlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            windows=windows,
+            priority=self.task_priority(rate_limit, priority),
+        )
+
+    async def _acquire(self, windows: WeightedWindows, priority: RequestPriority, reserved_share: float):
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append((windows, reserved_share, future))
+        self._grant_waiters()
+        if future.done():
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                # the tasks held back by this one may run now
+                self._grant_waiters()
+            raise
+
+    def _grant_waiters(self):
+        """
+        Runs the waiting tasks that have capacity, most urgent first and in order, and sets the timer for when the next
+        one will have it.
+        """
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        now = self._time()
+        blocked_windows = set()
+        wakeup_at = math.inf
+        for waiters in reversed(self._waiters):
+            for _ in range(len(waiters)):
+                waiter = waiters.popleft()
+                windows, reserved_share, future = waiter
+                if future.done():
+                    continue
+                if any(window in blocked_windows for window, _ in windows):
+                    waiters.append(waiter)
+                    continue
+                full_windows = []
+                for window, weight in windows:
+                    window.expire(now)
+                    if not window.has_capacity(weight, reserved_share):
+                        full_windows.append((window, weight))
+                if len(full_windows) == 0:
+                    for window, weight in windows:
+                        window.add(now, weight)
+                    future.set_result(None)
+                else:
+                    waiters.append(waiter)
+                    blocked_windows.update(window for window, _ in windows)
+                    wakeup_at = min(wakeup_at, max(window.free_at(weight, reserved_share)
+                                                   for window, weight in full_windows))
+                    self._warn_max_capacity_reached(full_windows[0][0], now)
+        if wakeup_at < math.inf:
+            self._wakeup_handle = asyncio.get_running_loop().call_later(max(wakeup_at - now, 0), self._grant_waiters)
+
+    def update_usage(self,
+                     limit_id: str,
+                     used: Optional[int] = None,
+                     remaining: Optional[int] = None,
+                     limit: Optional[int] = None,
+                     expires_in: Optional[float] = None):
+        super().update_usage(limit_id=limit_id, used=used, remaining=remaining, limit=limit, expires_in=expires_in)
+        if limit is not None and any(len(waiters) > 0 for waiters in self._waiters):
+            # a higher limit may let waiting tasks run now
+            self._grant_waiters()
+
+    def _used_capacity(self, rate_limit: RateLimit, now: float) -> int:
+        window = self._windows[rate_limit.limit_id]
+        window.expire(now)
+        return window.used
+
+    def _add_usage(self, rate_limit: RateLimit, weight: int, timestamp: float):
+        self._windows[rate_limit.limit_id].add(timestamp, weight)
+
+    def _warn_max_capacity_reached(self, window: RateLimitWindow, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = window.rate_limit
+            self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                 f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                                 f"is {window.used} in the last {rate_limit.time_interval} seconds")
+            self._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
@@ -2,12 +2,13 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -30,7 +31,8 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_reserves: Optional[Dict[RequestPriority, float]] = None,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -39,11 +41,21 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_reserves: Share (from 0 to 1) of every limit reserved for the tasks of a priority and the more
+            urgent ones, e.g. {RequestPriority.CANCEL: 0.1} keeps a tenth of each limit for cancels
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
         self.limits_pct: Decimal = share_percentage / 100
 
+        # Share of the limits the tasks of each priority leave to the more urgent ones.
+        priority_reserves = priority_reserves or {}
+        self._reserved_shares: Dict[RequestPriority, float] = {
+            priority: sum(reserve for reserved_priority, reserve in priority_reserves.items()
+                          if reserved_priority > priority)
+            for priority in RequestPriority
+        }
+
         self.set_rate_limits(rate_limits)
 
         # List of TaskLog used to determine the API requests within a set time window.
@@ -85,6 +97,89 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def task_priority(self, rate_limit: Optional[RateLimit], priority: Optional[RequestPriority] = None
+                      ) -> RequestPriority:
+        if priority is not None:
+            return priority
+        if rate_limit is not None and rate_limit.priority is not None:
+            return rate_limit.priority
+        return RequestPriority.PUBLIC_DATA
+
+    def reserved_share(self, priority: RequestPriority) -> float:
+        """share of every limit the tasks of `priority` can't use, kept for more urgent ones"""
+        return self._reserved_shares[priority]
+
+    def update_usage(self,
+                     limit_id: str,
+                     used: Optional[int] = None,
+                     remaining: Optional[int] = None,
+                     limit: Optional[int] = None,
+                     expires_in: Optional[float] = None):
+        """
+        Aligns `limit_id` with the usage the server reports, e.g. in the headers of its responses, so that the tasks
+        wait for the capacity the server has left, not only for the one counted here.
+        A reported usage below the one counted here is ignored: the requests in flight may not be in it yet.
+        :param used: the weight used within the time window of the limit, by all the clients of the account
+        :param remaining: the weight left within the time window of the limit, if the server reports it instead
+        :param limit: the limit reported by the server, replacing the configured one
+        :param expires_in: seconds until the server resets the usage, the time interval of the limit by default
+        """
+        reported_usage = self._reported_usage(limit_id=limit_id, used=used, remaining=remaining, limit=limit,
+                                              expires_in=expires_in)
+        if reported_usage is None:
+            return
+        rate_limit, used, expires_in = reported_usage
+        span = rate_limit.time_interval * (1 + self._safety_margin_pct)
+        now = time.time()
+        missing = used - self._used_capacity(rate_limit, now)
+        if missing > 0:
+            self._add_usage(rate_limit, missing, now - span + expires_in)
+
+    async def async_update_usage(self,
+                                 limit_id: str,
+                                 used: Optional[int] = None,
+                                 remaining: Optional[int] = None,
+                                 limit: Optional[int] = None,
+                                 expires_in: Optional[float] = None):
+        """
+        As update_usage(), to be awaited from the event loop: a throttler whose usage is locked across processes yields
+        to the event loop while the lock is held.
+        """
+        self.update_usage(limit_id=limit_id, used=used, remaining=remaining, limit=limit, expires_in=expires_in)
+
+    def _reported_usage(self,
+                        limit_id: str,
+                        used: Optional[int],
+                        remaining: Optional[int],
+                        limit: Optional[int],
+                        expires_in: Optional[float]) -> Optional[Tuple[RateLimit, int, float]]:
+        """
+        Applies the limit reported by the server, and returns the rate limit, the weight the server reports used, scaled
+        to the share of this throttler, and the seconds until it expires; None if there is nothing to align.
+        """
+        rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id)
+        if rate_limit is None:
+            return None
+        if limit is not None:
+            rate_limit.limit = max(1, math.floor(Decimal(str(limit)) * self.limits_pct))
+        if used is None:
+            if remaining is None:
+                return None
+            used = (limit if limit is not None else float(rate_limit.limit / self.limits_pct)) - remaining
+        span = rate_limit.time_interval * (1 + self._safety_margin_pct)
+        expires_in = span if expires_in is None else min(max(expires_in, 0.0), span)
+        return rate_limit, math.floor(Decimal(str(used)) * self.limits_pct), expires_in
+
+    def _used_capacity(self, rate_limit: RateLimit, now: float) -> int:
+        """the weight of the tasks of `rate_limit` within its time window"""
+        span = rate_limit.time_interval * (1 + self._safety_margin_pct)
+        return sum(task.weight for task in self._task_logs
+                   if task.rate_limit.limit_id == rate_limit.limit_id and now - task.timestamp <= span)
+
+    def _add_usage(self, rate_limit: RateLimit, weight: int, timestamp: float):
+        """counts `weight` against `rate_limit` as if a task had run at `timestamp`"""
+        self._task_logs.append(TaskLog(timestamp=timestamp, rate_limit=rate_limit, weight=weight))
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,17 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority of an API request when several wait for the capacity of the same rate limits, the most urgent last.
+    Requests of limits without a priority are public data requests.
+    """
+    PUBLIC_DATA = 0
+    PRIVATE_STATUS = 1
+    CREATE = 2
+    CANCEL = 3
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -30,6 +42,7 @@ class RateLimit:
                  time_interval: float,
                  weight: int = DEFAULT_WEIGHT,
                  linked_limits: Optional[List[LinkedLimitWeightPair]] = None,
+                 priority: Optional[RequestPriority] = None,
                  ):
         """
         :param limit_id: A unique identifier for this RateLimit object, this is usually an API request path url
@@ -37,12 +50,14 @@ class RateLimit:
         :param time_interval: The time interval in seconds
         :param weight: The weight (in integer) of each call. Defaults to 1
         :param linked_limits: Optional list of LinkedLimitWeightPairs. Used to associate a weight to the linked rate limit.
+        :param priority: The priority of the calls, unless given per call. Defaults to RequestPriority.PUBLIC_DATA
         """
         self.limit_id = limit_id
         self.limit = limit
         self.time_interval = time_interval
         self.weight = weight
         self.linked_limits = linked_limits or []
+        self.priority = priority
 
     def __repr__(self):
         return f"limit_id: {self.limit_id}, limit: {self.limit}, time interval: {self.time_interval}, " \
@@ -0,0 +1,313 @@
+import asyncio
+import fcntl
+import hashlib
+import math
+import os
+import secrets
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"HBRLB001"
+# A client that did not draw from the budget for that long is not active any more: its share goes to the others, and
+# its slot can be taken over by a new client.
+CLIENT_TIMEOUT = 60.0
+# How long a client blocked on a limit keeps the others to their fair share of it, unless it tries again.
+WAITING_TIMEOUT = 1.0
+# Seconds between two attempts to lock the budget from the event loop while another process holds the lock.
+LOCK_RETRY_INTERVAL = 0.001
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("max_clients", np.int64),
+    ("max_limits", np.int64),
+    ("buckets", np.int64),
+])
+CLIENT_DTYPE = np.dtype([
+    ("pid", np.int64),
+    ("token", np.int64),
+    ("heartbeat", np.float64),
+])
+
+
+def _limit_dtype(max_clients: int, buckets: int) -> np.dtype:
+    return np.dtype([
+        ("name", "S64"),
+        ("bucket_width", np.float64),
+        ("epochs", np.int64, (buckets,)),
+        ("used", np.int64, (buckets,)),
+        ("client_used", np.int64, (max_clients, buckets)),
+        ("waiting_until", np.float64, (max_clients,)),
+    ])
+
+
+# The limit id, the capacity of the limit, its time window and the weight of the task
+LimitRequest = Tuple[str, int, float, int]
+
+
+class SharedRateLimitBudget:
+    """
+    Rate limit budget shared by the processes of one host that use the same API key, e.g. several bots on one account.
+
+    The budget is a file, memory-mapped by every process and locked with flock() for each change; async_try_acquire()
+    and async_align_usage() wait for the lock without blocking the event loop. The weights used per
+    limit id are counted in `buckets` time buckets, each 1 / (buckets - 1) of the time window of the limit, globally and
+    per client, a bucket being dropped once all of it is out of the window; the count can run over the true sliding
+    window by up to one bucket, never under it.
+
+    Fair share: a client may use any capacity left, unless another client is waiting for the same limit, in which case
+    it gets at most the capacity divided by the number of active clients.
+    """
+
+    def __init__(self,
+                 name: str,
+                 path: Optional[str] = None,
+                 max_clients: int = 16,
+                 max_limits: int = 256,
+                 buckets: int = 21):
+        """
+        :param name: the name of the budget, the same for every process sharing it, e.g. the exchange and the account
+        :param path: the directory of the budget file, the temporary directory by default
+        :param max_clients: the number of clients (throttlers) that can share the budget
+        :param max_limits: the number of limit ids the budget can count
+        :param buckets: the number of time buckets per limit
+        """
+        self._path = os.path.join(path or os.path.join(tempfile.gettempdir(), "hummingbot_rate_limits"),
+                                  f"{name}.budget")
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        limit_dtype = _limit_dtype(max_clients, buckets)
+        clients_offset = HEADER_DTYPE.itemsize
+        limits_offset = clients_offset + CLIENT_DTYPE.itemsize * max_clients
+        size = limits_offset + limit_dtype.itemsize * max_limits
+
+        self._file = open(self._path, "a+b")
+        with self._locked():
+            if os.fstat(self._file.fileno()).st_size == 0:
+                self._file.truncate(size)
+                header = np.memmap(self._file, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+                header[0] = (MAGIC, max_clients, max_limits, buckets)
+                header.flush()
+            header = np.memmap(self._file, dtype=HEADER_DTYPE, mode="r", shape=(1,))[0]
+            if (header["magic"], header["max_clients"], header["max_limits"], header["buckets"]) != (
+                    MAGIC, max_clients, max_limits, buckets):
+                raise ValueError(f"The rate limit budget {self._path} was created with another layout.")
+        self._clients = np.memmap(self._file, dtype=CLIENT_DTYPE, mode="r+", offset=clients_offset,
+                                  shape=(max_clients,))
+        self._limits = np.memmap(self._file, dtype=limit_dtype, mode="r+", offset=limits_offset, shape=(max_limits,))
+        self._buckets = buckets
+        self._token = secrets.randbits(62) + 1
+        self._client: Optional[int] = None
+        self._limit_indexes: Dict[str, int] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def try_acquire(self, limits: List[LimitRequest], now: Optional[float] = None, consume: bool = True
+                    ) -> Tuple[bool, float]:
+        """
+        Draws the weights of a task from the budget of each of its limits, if they all have capacity.
+
+        :param consume: False to only check the capacity, without drawing the weights or waiting for the capacity
+        :return: whether the limits have capacity, and if not, the seconds to wait before it frees up
+        """
+        with self._locked():
+            return self._try_acquire(limits, time.time() if now is None else now, consume)
+
+    async def async_try_acquire(self, limits: List[LimitRequest], now: Optional[float] = None
+                                ) -> Tuple[bool, float]:
+        """as try_acquire(), yielding to the event loop while another process holds the lock"""
+        async with self._locked():
+            return self._try_acquire(limits, time.time() if now is None else now, consume=True)
+
+    def _try_acquire(self, limits: List[LimitRequest], now: float, consume: bool) -> Tuple[bool, float]:
+        client = self._claim_client(now)
+        active_clients = max(1, int(np.count_nonzero(
+            (self._clients["token"] != 0) & (self._clients["heartbeat"] >= now - CLIENT_TIMEOUT)
+        )))
+        wait = 0.0
+        blocked = []
+        counted = []
+        for limit_id, capacity, span, weight in limits:
+            limit = self._limits[self._limit_index(limit_id, span)]
+            epoch = math.floor(now / limit["bucket_width"])
+            valid = limit["epochs"] > epoch - self._buckets
+            used = int(limit["used"][valid].sum())
+            counted.append((limit, epoch, weight))
+            if used + weight > capacity:
+                blocked.append(limit)
+                wait = max(wait, self._free_in(limit, valid, used + weight - capacity, now))
+                continue
+            others_waiting = np.delete(limit["waiting_until"], client) > now
+            fair_share = capacity / active_clients
+            client_used = int(limit["client_used"][client][valid].sum())
+            if others_waiting.any() and client_used > 0 and client_used + weight > fair_share:
+                blocked.append(limit)
+                wait = max(wait, limit["bucket_width"])
+
+        if len(blocked) > 0:
+            if consume:
+                for limit in blocked:
+                    limit["waiting_until"][client] = now + WAITING_TIMEOUT
+            return False, wait
+        if not consume:
+            return True, 0.0
+
+        for limit, epoch, weight in counted:
+            bucket = epoch % self._buckets
+            if limit["epochs"][bucket] != epoch:
+                limit["epochs"][bucket] = epoch
+                limit["used"][bucket] = 0
+                limit["client_used"][:, bucket] = 0
+            limit["used"][bucket] += weight
+            limit["client_used"][client, bucket] += weight
+            limit["waiting_until"][client] = 0
+        return True, 0.0
+
+    def usage(self, limit_id: str, now: Optional[float] = None) -> int:
+        """the weights drawn from the budget of `limit_id` within its time window, by all the clients"""
+        with self._locked():
+            return self._usage(limit_id, time.time() if now is None else now)
+
+    def add_usage(self, limit_id: str, span: float, weight: int, timestamp: float, now: Optional[float] = None):
+        """
+        Counts `weight` in the budget of `limit_id`, used at `timestamp` by no client in particular. A usage already out
+        of the time window is dropped, and one ahead of `now` is counted at `now`.
+        """
+        with self._locked():
+            self._add_usage(limit_id, span, weight, timestamp, time.time() if now is None else now)
+
+    async def async_align_usage(self, limit_id: str, span: float, used: int, expires_in: float,
+                                now: Optional[float] = None):
+        """
+        Counts the weight missing from the budget of `limit_id` for it to have `used` within its time window, expiring
+        in `expires_in` seconds, e.g. the usage reported by the server; yields to the event loop while another process
+        holds the lock.
+        """
+        now = time.time() if now is None else now
+        async with self._locked():
+            missing = used - self._usage(limit_id, now)
+            if missing > 0:
+                self._add_usage(limit_id, span, missing, now - span + expires_in, now)
+
+    def _usage(self, limit_id: str, now: float) -> int:
+        index = self._find_limit(limit_id)
+        if index is None:
+            return 0
+        limit = self._limits[index]
+        epoch = math.floor(now / limit["bucket_width"])
+        return int(limit["used"][limit["epochs"] > epoch - self._buckets].sum())
+
+    def _add_usage(self, limit_id: str, span: float, weight: int, timestamp: float, now: float):
+        limit = self._limits[self._limit_index(limit_id, span)]
+        current_epoch = math.floor(now / limit["bucket_width"])
+        epoch = min(math.floor(timestamp / limit["bucket_width"]), current_epoch)
+        bucket = epoch % self._buckets
+        if epoch <= current_epoch - self._buckets or limit["epochs"][bucket] > epoch:
+            # the bucket of the usage was dropped, or already reused for a later time
+            return
+        if limit["epochs"][bucket] < epoch:
+            limit["epochs"][bucket] = epoch
+            limit["used"][bucket] = 0
+            limit["client_used"][:, bucket] = 0
+        limit["used"][bucket] += weight
+
+    def close(self):
+        """leaves the budget, giving the slot of the client to others"""
+        with self._locked():
+            if self._client is not None and self._clients["token"][self._client] == self._token:
+                self._clients[self._client] = (0, 0, 0.0)
+            self._client = None
+        self._file.close()
+
+    def _locked(self):
+        return _FileLock(self._file)
+
+    def _claim_client(self, now: float) -> int:
+        clients = self._clients
+        if self._client is None or clients["token"][self._client] != self._token:
+            free = np.flatnonzero((clients["token"] == 0) | (clients["heartbeat"] < now - CLIENT_TIMEOUT))
+            free = [index for index in free.tolist()
+                    if clients["token"][index] == 0 or not _is_alive(int(clients["pid"][index]))] or free.tolist()
+            if len(free) == 0:
+                raise RuntimeError(f"All the {len(clients)} clients of the rate limit budget {self._path} are active.")
+            self._client = free[0]
+            self._limits["client_used"][:, self._client] = 0
+            self._limits["waiting_until"][:, self._client] = 0
+            clients[self._client] = (os.getpid(), self._token, now)
+        clients["heartbeat"][self._client] = now
+        return self._client
+
+    def _limit_index(self, limit_id: str, span: float) -> int:
+        index = self._limit_indexes.get(limit_id)
+        if index is None:
+            index = self._find_limit(limit_id)
+            if index is None:
+                free = np.flatnonzero(self._limits["name"] == b"")
+                if len(free) == 0:
+                    raise RuntimeError(f"The rate limit budget {self._path} is full, it counts {len(self._limits)} "
+                                       f"limits at most.")
+                index = int(free[0])
+                self._limits[index]["name"] = _limit_key(limit_id)
+                self._limits[index]["bucket_width"] = span / (self._buckets - 1)
+                self._limits[index]["epochs"] = -self._buckets
+            self._limit_indexes[limit_id] = index
+        return index
+
+    def _find_limit(self, limit_id: str) -> Optional[int]:
+        if limit_id in self._limit_indexes:
+            return self._limit_indexes[limit_id]
+        found = np.flatnonzero(self._limits["name"] == _limit_key(limit_id))
+        return int(found[0]) if len(found) > 0 else None
+
+    def _free_in(self, limit: np.void, valid: np.ndarray, excess: int, now: float) -> float:
+        """seconds until enough of the oldest buckets leave the window to free `excess`"""
+        freed = 0
+        for bucket in np.argsort(np.where(valid, limit["epochs"], np.iinfo(np.int64).max)).tolist():
+            if not valid[bucket]:
+                break
+            freed += int(limit["used"][bucket])
+            if freed >= excess:
+                return max((int(limit["epochs"][bucket]) + self._buckets) * limit["bucket_width"] - now, 0.0)
+        return limit["bucket_width"]
+
+
+class _FileLock:
+    """flock() on the budget file: `with` blocks the thread until the lock is free, `async with` the task only"""
+
+    def __init__(self, file):
+        self._file = file
+
+    def __enter__(self):
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+    def __exit__(self, exc_type, exc, tb):
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    async def __aenter__(self):
+        while True:
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                await asyncio.sleep(LOCK_RETRY_INTERVAL)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+
+def _limit_key(limit_id: str) -> bytes:
+    key = limit_id.encode()
+    return key if len(key) <= 64 else hashlib.sha1(key).hexdigest().encode()
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
@@ -0,0 +1,122 @@
+#include "OrderBookL3Side.h"
+#include <iterator>
+
+void OrderBookL3Side::append(const std::string &orderId, const double &price, const double &amount) {
+    Level &level = this->levels[price];
+    level.orders.push_back(Order{orderId, amount});
+    level.amount += amount;
+    level.count++;
+    this->index[orderId] = Position{price, std::prev(level.orders.end())};
+}
+
+void OrderBookL3Side::erase(const std::unordered_map<std::string, Position>::iterator &position) {
+    auto levelIterator = this->levels.find(position->second.price);
+    Level &level = levelIterator->second;
+    level.amount -= position->second.order->amount;
+    level.count--;
+    level.orders.erase(position->second.order);
+    if (level.count == 0) {
+        this->levels.erase(levelIterator);
+    }
+    this->index.erase(position);
+}
+
+// The aggregated entry of the level at `price`; a zero amount if no order rests there.
+OrderBookEntry OrderBookL3Side::levelEntry(const double &price, const int64_t &updateId) const {
+    auto levelIterator = this->levels.find(price);
+    if (levelIterator == this->levels.end()) {
+        return OrderBookEntry(price, 0, updateId);
+    }
+    return OrderBookEntry(price, levelIterator->second.amount, updateId);
+}
+
+size_t OrderBookL3Side::size() const {
+    return this->index.size();
+}
+
+size_t OrderBookL3Side::levelCount() const {
+    return this->levels.size();
+}
+
+bool OrderBookL3Side::contains(const std::string &orderId) const {
+    return this->index.find(orderId) != this->index.end();
+}
+
+size_t OrderBookL3Side::orderCount(const double &price) const {
+    auto levelIterator = this->levels.find(price);
+    return levelIterator == this->levels.end() ? 0 : levelIterator->second.count;
+}
+
+void OrderBookL3Side::clear() {
+    this->levels.clear();
+    this->index.clear();
+}
+
+// Sets the remaining amount of an order; a non-positive amount removes it. A new order, an order moved to another
+// price or an order whose amount grows goes to the back of its level, an order whose amount shrinks keeps its place.
+std::vector<OrderBookEntry> OrderBookL3Side::update(const std::string &orderId,
+                                                    const double &price,
+                                                    const double &amount,
+                                                    const int64_t &updateId) {
+    std::vector<OrderBookEntry> touched;
+    auto position = this->index.find(orderId);
+    const bool exists = position != this->index.end();
+    if (exists) {
+        const double previousPrice = position->second.price;
+        Order &order = *position->second.order;
+        if (previousPrice == price && amount > 0 && amount <= order.amount) {
+            this->levels[price].amount += amount - order.amount;
+            order.amount = amount;
+            touched.push_back(this->levelEntry(price, updateId));
+            return touched;
+        }
+        this->erase(position);
+        if (previousPrice != price) {
+            touched.push_back(this->levelEntry(previousPrice, updateId));
+        }
+    }
+    if (amount > 0) {
+        this->append(orderId, price, amount);
+    }
+    if (exists || amount > 0) {
+        touched.push_back(this->levelEntry(price, updateId));
+    }
+    return touched;
+}
+
+std::vector<OrderBookEntry> OrderBookL3Side::remove(const std::string &orderId, const int64_t &updateId) {
+    std::vector<OrderBookEntry> touched;
+    auto position = this->index.find(orderId);
+    if (position != this->index.end()) {
+        const double price = position->second.price;
+        this->erase(position);
+        touched.push_back(this->levelEntry(price, updateId));
+    }
+    return touched;
+}
+
+// The aggregated entries of every level.
+std::vector<OrderBookEntry> OrderBookL3Side::entries(const int64_t &updateId) const {
+    std::vector<OrderBookEntry> levelEntries;
+    levelEntries.reserve(this->levels.size());
+    for (const auto &level : this->levels) {
+        levelEntries.push_back(OrderBookEntry(level.first, level.second.amount, updateId));
+    }
+    return levelEntries;
+}
+
+// The amount and number of the orders ahead of `orderId` at its price level; false if the order is not resting.
+bool OrderBookL3Side::queuePosition(const std::string &orderId, double &amountAhead, size_t &ordersAhead) const {
+    auto position = this->index.find(orderId);
+    if (position == this->index.end()) {
+        return false;
+    }
+    const Level &level = this->levels.at(position->second.price);
+    amountAhead = 0;
+    ordersAhead = 0;
+    for (auto order = level.orders.begin(); order != position->second.order; order++) {
+        amountAhead += order->amount;
+        ordersAhead++;
+    }
+    return true;
+}
@@ -0,0 +1,52 @@
+#ifndef _ORDER_BOOK_L3_SIDE_H
+#define _ORDER_BOOK_L3_SIDE_H
+
+#include <list>
+#include <map>
+#include <stdint.h>
+#include <string>
+#include <unordered_map>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// The resting orders of one side of an order book, in time priority within each price level. The total amount and
+// the order count of every level are kept up to date as the orders change, and every change returns the entries of
+// the levels it touched, to be applied to the aggregated (L2) order book.
+class OrderBookL3Side {
+    struct Order {
+        std::string orderId;
+        double amount;
+    };
+    struct Level {
+        std::list<Order> orders;
+        double amount = 0;
+        size_t count = 0;
+    };
+    struct Position {
+        double price;
+        std::list<Order>::iterator order;
+    };
+    std::map<double, Level> levels;
+    std::unordered_map<std::string, Position> index;
+
+    void append(const std::string &orderId, const double &price, const double &amount);
+    void erase(const std::unordered_map<std::string, Position>::iterator &position);
+    OrderBookEntry levelEntry(const double &price, const int64_t &updateId) const;
+
+    public:
+        size_t size() const;
+        size_t levelCount() const;
+        bool contains(const std::string &orderId) const;
+        size_t orderCount(const double &price) const;
+        void clear();
+
+        std::vector<OrderBookEntry> update(const std::string &orderId,
+                                           const double &price,
+                                           const double &amount,
+                                           const int64_t &updateId);
+        std::vector<OrderBookEntry> remove(const std::string &orderId, const int64_t &updateId);
+        std::vector<OrderBookEntry> entries(const int64_t &updateId) const;
+        bool queuePosition(const std::string &orderId, double &amountAhead, size_t &ordersAhead) const;
+};
+
+#endif
@@ -0,0 +1,218 @@
+#include "OrderBookSide.h"
+#include <algorithm>
+#include <cmath>
+
+OrderBookSide::OrderBookSide() : OrderBookSide(false) {
+}
+
+OrderBookSide::OrderBookSide(bool descending) {
+    this->descending = descending;
+    this->cumAmounts.push_back(0);
+    this->cumQuoteAmounts.push_back(0);
+    this->cleanLevels = 0;
+}
+
+bool OrderBookSide::isBetter(const double &price, const double &other) const {
+    return this->descending ? price > other : price < other;
+}
+
+void OrderBookSide::touch(const size_t &level) {
+    if (level < this->cleanLevels) {
+        this->cleanLevels = level;
+    }
+}
+
+void OrderBookSide::refresh() {
+    const size_t levels = this->prices.size();
+    if (this->cleanLevels == levels && this->cumAmounts.size() == levels + 1) {
+        return;
+    }
+    this->cumAmounts.resize(levels + 1);
+    this->cumQuoteAmounts.resize(levels + 1);
+    for (size_t i = this->cleanLevels; i < levels; i++) {
+        this->cumAmounts[i + 1] = this->cumAmounts[i] + this->amounts[i];
+        this->cumQuoteAmounts[i + 1] = this->cumQuoteAmounts[i] + this->amounts[i] * this->prices[i];
+    }
+    this->cleanLevels = levels;
+}
+
+size_t OrderBookSide::size() const {
+    return this->prices.size();
+}
+
+double OrderBookSide::getPrice(const size_t &level) const {
+    return this->prices[level];
+}
+
+double OrderBookSide::getAmount(const size_t &level) const {
+    return this->amounts[level];
+}
+
+int64_t OrderBookSide::getUpdateId(const size_t &level) const {
+    return this->updateIds[level];
+}
+
+// The level of `price`, or where it would be inserted: the first level that is not better than `price`.
+size_t OrderBookSide::find(const double &price) const {
+    size_t low = 0, high = this->prices.size();
+    while (low < high) {
+        const size_t middle = low + (high - low) / 2;
+        if (this->isBetter(this->prices[middle], price)) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+void OrderBookSide::clear() {
+    this->prices.clear();
+    this->amounts.clear();
+    this->updateIds.clear();
+    this->cleanLevels = 0;
+}
+
+// Replaces the levels with `entries`, in any order. As with std::set::insert, the first entry of a price wins.
+void OrderBookSide::assign(const std::vector<OrderBookEntry> &entries) {
+    std::vector<OrderBookEntry> sorted(entries);
+    std::stable_sort(sorted.begin(), sorted.end(), [this](const OrderBookEntry &a, const OrderBookEntry &b) {
+        return this->isBetter(a.getPrice(), b.getPrice());
+    });
+    this->clear();
+    this->prices.reserve(sorted.size());
+    this->amounts.reserve(sorted.size());
+    this->updateIds.reserve(sorted.size());
+    for (const OrderBookEntry &entry : sorted) {
+        if (!this->prices.empty() && this->prices.back() == entry.getPrice()) {
+            continue;
+        }
+        this->prices.push_back(entry.getPrice());
+        this->amounts.push_back(entry.getAmount());
+        this->updateIds.push_back(entry.getUpdateId());
+    }
+}
+
+// Sets the level at the price of `entry`; a non-positive amount removes it.
+void OrderBookSide::update(const OrderBookEntry &entry) {
+    const size_t level = this->find(entry.getPrice());
+    const bool exists = level < this->prices.size() && this->prices[level] == entry.getPrice();
+    if (entry.getAmount() > 0) {
+        if (exists) {
+            this->amounts[level] = entry.getAmount();
+            this->updateIds[level] = entry.getUpdateId();
+        } else {
+            this->prices.insert(this->prices.begin() + level, entry.getPrice());
+            this->amounts.insert(this->amounts.begin() + level, entry.getAmount());
+            this->updateIds.insert(this->updateIds.begin() + level, entry.getUpdateId());
+        }
+    } else if (exists) {
+        this->prices.erase(this->prices.begin() + level);
+        this->amounts.erase(this->amounts.begin() + level);
+        this->updateIds.erase(this->updateIds.begin() + level);
+    } else {
+        return;
+    }
+    this->touch(level);
+}
+
+void OrderBookSide::eraseBest() {
+    this->prices.erase(this->prices.begin());
+    this->amounts.erase(this->amounts.begin());
+    this->updateIds.erase(this->updateIds.begin());
+    this->touch(0);
+}
+
+// Removes the levels beyond maxDepth, and the levels not better than prunePrice, the best level removed so far
+// (NaN if none): the levels the exchange holds beyond it are unknown. Lowers prunePrice to the levels removed.
+void OrderBookSide::limitDepth(const size_t &maxDepth, double &prunePrice) {
+    size_t levels = this->prices.size();
+    while (levels > 0) {
+        const double &price = this->prices[levels - 1];
+        const bool pruned = !std::isnan(prunePrice) && !this->isBetter(price, prunePrice);
+        if (levels <= maxDepth && !pruned) {
+            break;
+        }
+        if (!pruned) {
+            prunePrice = price;
+        }
+        levels--;
+    }
+    if (levels < this->prices.size()) {
+        this->prices.resize(levels);
+        this->amounts.resize(levels);
+        this->updateIds.resize(levels);
+        this->touch(levels);
+    }
+}
+
+double OrderBookSide::cumAmount(const size_t &levels) {
+    this->refresh();
+    return this->cumAmounts[levels];
+}
+
+double OrderBookSide::cumQuoteAmount(const size_t &levels) {
+    this->refresh();
+    return this->cumQuoteAmounts[levels];
+}
+
+// The first level at which the cumulative base amount reaches `amount`, size() if the side holds less.
+size_t OrderBookSide::levelForAmount(const double &amount) {
+    this->refresh();
+    size_t low = 0, high = this->prices.size();
+    while (low < high) {
+        const size_t middle = low + (high - low) / 2;
+        if (this->cumAmounts[middle + 1] >= amount) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
+    }
+    return low;
+}
+
+// The first level at which the cumulative quote amount reaches `quoteAmount`, size() if the side holds less.
+size_t OrderBookSide::levelForQuoteAmount(const double &quoteAmount) {
+    this->refresh();
+    size_t low = 0, high = this->prices.size();
+    while (low < high) {
+        const size_t middle = low + (high - low) / 2;
+        if (this->cumQuoteAmounts[middle + 1] >= quoteAmount) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
+    }
+    return low;
+}
+
+// The number of levels priced at or better than `price`.
+size_t OrderBookSide::levelsWithin(const double &price) const {
+    size_t low = 0, high = this->prices.size();
+    while (low < high) {
+        const size_t middle = low + (high - low) / 2;
+        if (this->isBetter(price, this->prices[middle])) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
+    }
+    return low;
+}
+
+// Same rules as truncateOverlapEntries(): centralised, the newer level wins; dex, the larger quote amount wins.
+void truncateOverlapLevels(OrderBookSide &bidSide, OrderBookSide &askSide, const bool &dex) {
+    while (bidSide.size() > 0 && askSide.size() > 0 && bidSide.prices[0] >= askSide.prices[0]) {
+        bool bidWins;
+        if (dex) {
+            bidWins = bidSide.amounts[0] * bidSide.prices[0] > askSide.amounts[0] * askSide.prices[0];
+        } else {
+            bidWins = bidSide.updateIds[0] > askSide.updateIds[0];
+        }
+        if (bidWins) {
+            askSide.eraseBest();
+        } else {
+            bidSide.eraseBest();
+        }
+    }
+}
@@ -0,0 +1,50 @@
+#ifndef _ORDER_BOOK_SIDE_H
+#define _ORDER_BOOK_SIDE_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// One side of an order book as contiguous arrays, best level first, with the
+// cumulative base and quote amounts of the levels for binary-searched depth queries.
+class OrderBookSide {
+    bool descending;
+    std::vector<double> prices;
+    std::vector<double> amounts;
+    std::vector<int64_t> updateIds;
+    // cumAmounts[i] / cumQuoteAmounts[i]: base / quote amount of the i best levels.
+    // Only the first cleanLevels + 1 entries are valid; the rest are refreshed on the next query.
+    std::vector<double> cumAmounts;
+    std::vector<double> cumQuoteAmounts;
+    size_t cleanLevels;
+
+    bool isBetter(const double &price, const double &other) const;
+    void touch(const size_t &level);
+    void refresh();
+
+    public:
+        OrderBookSide();
+        OrderBookSide(bool descending);
+
+        size_t size() const;
+        double getPrice(const size_t &level) const;
+        double getAmount(const size_t &level) const;
+        int64_t getUpdateId(const size_t &level) const;
+        size_t find(const double &price) const;
+
+        void clear();
+        void assign(const std::vector<OrderBookEntry> &entries);
+        void update(const OrderBookEntry &entry);
+        void eraseBest();
+        void limitDepth(const size_t &maxDepth, double &prunePrice);
+
+        double cumAmount(const size_t &levels);
+        double cumQuoteAmount(const size_t &levels);
+        size_t levelForAmount(const double &amount);
+        size_t levelForQuoteAmount(const double &quoteAmount);
+        size_t levelsWithin(const double &price) const;
+
+        friend void truncateOverlapLevels(OrderBookSide &bidSide, OrderBookSide &askSide, const bool &dex);
+};
+
+#endif
@@ -0,0 +1,23 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool as cppbool
+from libcpp.string cimport string
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookL3Side.h":
+    cdef cppclass OrderBookL3Side:
+        OrderBookL3Side()
+        size_t size()
+        size_t levelCount()
+        cppbool contains(const string &order_id)
+        size_t orderCount(const double &price)
+        void clear()
+        vector[OrderBookEntry] update(const string &order_id,
+                                      const double &price,
+                                      const double &amount,
+                                      const int64_t &update_id)
+        vector[OrderBookEntry] remove(const string &order_id, const int64_t &update_id)
+        vector[OrderBookEntry] entries(const int64_t &update_id)
+        cppbool queuePosition(const string &order_id, double &amount_ahead, size_t &orders_ahead)
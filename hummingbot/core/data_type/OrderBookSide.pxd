@@ -0,0 +1,28 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool as cppbool
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookSide.h":
+    cdef cppclass OrderBookSide:
+        OrderBookSide()
+        OrderBookSide(cppbool descending)
+        size_t size()
+        double getPrice(const size_t &level)
+        double getAmount(const size_t &level)
+        int64_t getUpdateId(const size_t &level)
+        size_t find(const double &price)
+        void clear()
+        void assign(const vector[OrderBookEntry] &entries)
+        void update(const OrderBookEntry &entry)
+        void eraseBest()
+        void limitDepth(const size_t &max_depth, double &prune_price)
+        double cumAmount(const size_t &levels)
+        double cumQuoteAmount(const size_t &levels)
+        size_t levelForAmount(const double &amount)
+        size_t levelForQuoteAmount(const double &quote_amount)
+        size_t levelsWithin(const double &price)
+
+    void truncateOverlapLevels(OrderBookSide &bid_side, OrderBookSide &ask_side, const cppbool &dex)
@@ -0,0 +1,14 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookSide cimport OrderBookSide
+cimport numpy as np
+
+cdef class ArrayOrderBook(OrderBook):
+    cdef:
+        OrderBookSide _bids
+        OrderBookSide _asks
+
+    cdef np.ndarray c_side_array(self, OrderBookSide *side, object depth)
+    cdef OrderBookSide *c_side(self, bint is_buy)
+    cdef double c_get_price(self, bint is_buy) except? -1
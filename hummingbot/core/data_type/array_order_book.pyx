@@ -0,0 +1,186 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookSide.cpp']
+
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from cython.operator cimport address as ref
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookSide cimport OrderBookSide, truncateOverlapLevels
+from hummingbot.core.data_type.order_book cimport c_as_snapshot_array, c_depth_limit
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+cimport numpy as np
+
+NaN = float("nan")
+
+
+cdef class ArrayOrderBook(OrderBook):
+    """
+    Order book kept in contiguous price / amount arrays, best level first, with the cumulative base and quote amounts
+    of the levels. Diffs update the arrays in place and the cumulative amounts are recomputed lazily from the best
+    level a diff touched, so the volume, VWAP and price queries are binary searches that create no Python objects
+    besides their result.
+
+    A drop-in replacement for OrderBook; select it with
+    `data_source.order_book_create_function = lambda: ArrayOrderBook()`.
+    The std::set based books of the base class stay empty.
+    """
+    def __cinit__(self, *args, **kwargs):
+        self._bids = OrderBookSide(True)
+        self._asks = OrderBookSide(False)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            OrderBookEntry entry
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for entry in bids:
+            self._bids.update(entry)
+        for entry in asks:
+            self._asks.update(entry)
+
+        # Same overlap rules as OrderBook: centralised, newer entries win; dex, see OrderBookEntry.cpp
+        truncateOverlapLevels(self._bids, self._asks, self._dex)
+
+        if self._bids.size() > 0:
+            self._best_bid = self._bids.getPrice(0)
+        if self._asks.size() > 0:
+            self._best_ask = self._asks.getPrice(0)
+
+        if self._max_depth > 0:
+            self.c_limit_depth()
+
+        self._last_diff_uid = update_id
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bids.assign(bids)
+        self._asks.assign(asks)
+        if self._dex:
+            truncateOverlapLevels(self._bids, self._asks, self._dex)
+
+        self._best_bid = self._bids.getPrice(0) if self._bids.size() > 0 else NaN
+        self._best_ask = self._asks.getPrice(0) if self._asks.size() > 0 else NaN
+
+        self._bid_prune_price = self._ask_prune_price = NaN
+        self._needs_resync = False
+        if self._max_depth > 0:
+            self.c_limit_depth()
+
+        self._snapshot_uid = update_id
+
+    cdef c_limit_depth(self):
+        self._bids.limitDepth(self._max_depth, self._bid_prune_price)
+        self._asks.limitDepth(self._max_depth, self._ask_prune_price)
+        if ((not isnan(self._bid_prune_price) and self._bids.size() < self._max_depth)
+                or (not isnan(self._ask_prune_price) and self._asks.size() < self._max_depth)):
+            self._needs_resync = True
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t level = 0
+        while level < self._bids.size():
+            yield OrderBookRow(self._bids.getPrice(level), self._bids.getAmount(level), self._bids.getUpdateId(level))
+            level += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t level = 0
+        while level < self._asks.size():
+            yield OrderBookRow(self._asks.getPrice(level), self._asks.getAmount(level), self._asks.getUpdateId(level))
+            level += 1
+
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        return self.c_side_array(ref(self._bids), depth), self.c_side_array(ref(self._asks), depth)
+
+    cdef np.ndarray c_side_array(self, OrderBookSide *side, object depth):
+        cdef:
+            size_t levels = c_depth_limit(depth, side.size())
+            np.ndarray[np.float64_t, ndim=2] array = np.empty((levels, 3))
+            size_t level
+
+        for level in range(levels):
+            array[level, 0] = side.getPrice(level)
+            array[level, 1] = side.getAmount(level)
+            array[level, 2] = side.getUpdateId(level)
+        return c_as_snapshot_array(array)
+
+    cdef OrderBookSide *c_side(self, bint is_buy):
+        # a buy is matched against the asks, a sell against the bids
+        return ref(self._asks) if is_buy else ref(self._bids)
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if self.c_side(is_buy).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t level = side.levelForAmount(volume)
+            double result_price = NaN
+
+        if level < side.size():
+            result_price = side.getPrice(level)
+            level += 1
+        return OrderBookQueryResult(NaN, volume, result_price, min(side.cumAmount(level), volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t level = side.levelForAmount(volume)
+            double total_cost
+            double total_volume = side.cumAmount(level)
+            double incremental_amount
+            double result_vwap = NaN
+
+        if level < side.size():
+            incremental_amount = volume - total_volume
+            total_cost = side.cumQuoteAmount(level) + incremental_amount * side.getPrice(level)
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t level = side.levelForQuoteAmount(quote_volume)
+            double result_price = NaN
+
+        if level < side.size():
+            result_price = side.getPrice(level)
+            level += 1
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(side.cumQuoteAmount(level), quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t level = side.levelForAmount(base_amount)
+            double cumulative_volume = side.cumQuoteAmount(level)
+
+        if level < side.size():
+            cumulative_volume += (base_amount - side.cumAmount(level)) * side.getPrice(level)
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t levels = side.levelsWithin(price)
+            double result_price = side.getPrice(levels - 1) if levels > 0 else NaN
+
+        return OrderBookQueryResult(price, NaN, result_price, side.cumAmount(levels))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            OrderBookSide *side = self.c_side(is_buy)
+            size_t levels = side.levelsWithin(price)
+            double result_price = side.getPrice(levels - 1) if levels > 0 else NaN
+
+        return OrderBookQueryResult(price, NaN, result_price, side.cumQuoteAmount(levels))
@@ -1,7 +1,9 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -9,6 +11,7 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import snapshot_array_from_rows
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 cdef class CompositeOrderBook(OrderBook):
@@ -175,6 +178,12 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        # the entries must be read to the end: that is where the traded order book drops the consumed entries
+        bids = list(self.bid_entries())[:depth]
+        asks = list(self.ask_entries())[:depth]
+        return snapshot_array_from_rows(bids), snapshot_array_from_rows(asks)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -0,0 +1,15 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookL3Side cimport OrderBookL3Side
+
+cdef class L3OrderBook(OrderBook):
+    cdef:
+        OrderBookL3Side _bid_orders
+        OrderBookL3Side _ask_orders
+
+    cdef OrderBookL3Side *c_orders(self, bint is_bid)
@@ -0,0 +1,115 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookL3Side.cpp']
+
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+from cython.operator cimport address as ref
+from libc.stdint cimport int64_t
+from libcpp.string cimport string
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookL3Side cimport OrderBookL3Side
+
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+
+class QueuePosition(NamedTuple):
+    amount_ahead: float
+    orders_ahead: int
+
+
+cdef class L3OrderBook(OrderBook):
+    """
+    Order book of the individual resting orders (L3), for the exchanges publishing them. The orders of each price level
+    are kept in time priority, and the amount of a level is updated incrementally with every order change and applied
+    to the price levels of OrderBook, so the aggregated (L2) view and its queries stay the usual ones.
+
+    Feed it with apply_l3_snapshot() and the order updates. A snapshot of price levels (apply_snapshot) drops the
+    orders, leaving a plain L2 order book until the next L3 snapshot.
+    """
+    def __init__(self, dex=False):
+        super().__init__(dex=dex)
+
+    cdef OrderBookL3Side *c_orders(self, bint is_bid):
+        return ref(self._bid_orders) if is_bid else ref(self._ask_orders)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bid_orders.clear()
+        self._ask_orders.clear()
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+
+    def apply_l3_snapshot(self,
+                          bids: Iterable[Tuple[str, float, float]],
+                          asks: Iterable[Tuple[str, float, float]],
+                          update_id: int):
+        """
+        :param bids: the (order ID, price, amount) of the resting buy orders, in time priority
+        :param asks: the (order ID, price, amount) of the resting sell orders, in time priority
+        """
+        self._bid_orders.clear()
+        self._ask_orders.clear()
+        for order_id, price, amount in bids:
+            self._bid_orders.update(order_id.encode("utf8"), float(price), float(amount), update_id)
+        for order_id, price, amount in asks:
+            self._ask_orders.update(order_id.encode("utf8"), float(price), float(amount), update_id)
+        OrderBook.c_apply_snapshot(self, self._bid_orders.entries(update_id), self._ask_orders.entries(update_id),
+                                   update_id)
+
+    def apply_order_update(self, order_id: str, is_bid: bool, price: float, amount: float, update_id: int):
+        """
+        Sets the remaining amount of an order; 0 removes it. A new order, an order moved to another price or an order
+        whose amount grows goes to the back of its price level, an order whose amount shrinks (a partial fill) keeps
+        its place.
+        """
+        self.apply_order_updates([(order_id, is_bid, price, amount)], update_id)
+
+    def apply_order_updates(self, updates: Iterable[Tuple[str, bool, float, float]], update_id: int):
+        """Applies (order ID, is bid, price, remaining amount) order updates, in order, as one price level diff"""
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+            vector[OrderBookEntry] touched
+
+        for order_id, is_bid, price, amount in updates:
+            touched = self.c_orders(is_bid).update(order_id.encode("utf8"), float(price), float(amount), update_id)
+            if is_bid:
+                bids.insert(bids.end(), touched.begin(), touched.end())
+            else:
+                asks.insert(asks.end(), touched.begin(), touched.end())
+        self.c_apply_diffs(bids, asks, update_id)
+
+    def remove_order(self, order_id: str, update_id: int):
+        cdef:
+            string c_order_id = order_id.encode("utf8")
+            vector[OrderBookEntry] bids = self._bid_orders.remove(c_order_id, update_id)
+            vector[OrderBookEntry] asks = self._ask_orders.remove(c_order_id, update_id)
+
+        if bids.size() > 0 or asks.size() > 0:
+            self.c_apply_diffs(bids, asks, update_id)
+
+    def has_order(self, order_id: str) -> bool:
+        cdef string c_order_id = order_id.encode("utf8")
+        return self._bid_orders.contains(c_order_id) or self._ask_orders.contains(c_order_id)
+
+    def order_count(self, is_bid: bool, price: float) -> int:
+        """The number of orders resting at `price`"""
+        return self.c_orders(is_bid).orderCount(price)
+
+    def queue_position(self, order_id: str) -> Optional[QueuePosition]:
+        """The amount and the number of orders ahead of the order at its price level, None if it is not resting"""
+        cdef:
+            string c_order_id = order_id.encode("utf8")
+            double amount_ahead = 0
+            size_t orders_ahead = 0
+
+        if (self._bid_orders.queuePosition(c_order_id, amount_ahead, orders_ahead)
+                or self._ask_orders.queuePosition(c_order_id, amount_ahead, orders_ahead)):
+            return QueuePosition(amount_ahead, orders_ahead)
+        return None
+
+    def in_flight_order_queue_position(self, order: InFlightOrder) -> Optional[QueuePosition]:
+        """The queue position of one of our orders, None if its exchange order ID is unknown or it is not resting"""
+        if order.exchange_order_id is None:
+            return None
+        return self.queue_position(order.exchange_order_id)
@@ -9,6 +9,11 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef size_t c_depth_limit(object depth, size_t levels)
+cdef vector[OrderBookEntry] c_entries_from_array(np.ndarray[np.float64_t, ndim=2] levels, int64_t update_id)
+cdef np.ndarray c_as_snapshot_array(np.ndarray levels)
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,10 +25,15 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef size_t _max_depth
+    cdef double _bid_prune_price
+    cdef double _ask_prune_price
+    cdef bint _needs_resync
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_limit_depth(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
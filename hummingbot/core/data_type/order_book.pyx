@@ -18,9 +18,11 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from libc.math cimport isnan
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -34,6 +36,38 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# One level per item, with the OrderBookRow fields; the dtype of OrderBook.snapshot_arrays()
+SNAPSHOT_DTYPE = np.dtype([("price", np.float64), ("amount", np.float64), ("update_id", np.float64)])
+
+
+def snapshot_array_from_rows(rows: List[OrderBookRow]) -> np.ndarray:
+    """converts order book rows to a read-only array of SNAPSHOT_DTYPE"""
+    return c_as_snapshot_array(np.array(rows, dtype=np.float64).reshape(len(rows), 3))
+
+
+cdef size_t c_depth_limit(object depth, size_t levels):
+    if depth is None:
+        return levels
+    return max(0, min(depth, levels))
+
+
+cdef vector[OrderBookEntry] c_entries_from_array(np.ndarray[np.float64_t, ndim=2] levels, int64_t update_id):
+    """the entries of a (n, 2) array of [price, amount] rows, all with update ID `update_id`"""
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t level
+
+    entries.reserve(levels.shape[0])
+    for level in range(levels.shape[0]):
+        entries.push_back(OrderBookEntry(levels[level, 0], levels[level, 1], update_id))
+    return entries
+
+
+cdef np.ndarray c_as_snapshot_array(np.ndarray levels):
+    """views a C-contiguous (n, 3) float64 array of [price, amount, update_id] rows as a read-only SNAPSHOT_DTYPE array"""
+    cdef np.ndarray array = levels.view(SNAPSHOT_DTYPE).reshape(levels.shape[0])
+    array.setflags(write=False)
+    return array
 
 
 cdef class OrderBook(PubSub):
@@ -46,7 +80,11 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, max_depth: int = 0):
+        """
+        :param dex: whether overlapping levels are resolved the decentralised exchange way, see OrderBookEntry.cpp
+        :param max_depth: if positive, the number of levels kept on each side; the levels beyond are dropped
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +93,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._max_depth = max(max_depth, 0)
+        self._bid_prune_price = self._ask_prune_price = float("NaN")
+        self._needs_resync = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -93,6 +134,9 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        if self._max_depth > 0:
+            self.c_limit_depth()
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
@@ -133,9 +177,50 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self._bid_prune_price = self._ask_prune_price = NaN
+        self._needs_resync = False
+        if self._max_depth > 0:
+            self.c_limit_depth()
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_limit_depth(self):
+        """
+        Drops the levels beyond max_depth on each side, and the levels at or beyond the best level dropped so far: the
+        levels the exchange holds there are unknown until the next snapshot. A side left with fewer than max_depth
+        levels after dropping some marks the order book as needing a resync.
+        """
+        cdef:
+            set[OrderBookEntry].iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            double price
+
+        # The bids are in ascending price order, the worst one first.
+        while self._bid_book.size() > 0:
+            bid_iterator = self._bid_book.begin()
+            price = deref(bid_iterator).getPrice()
+            if self._bid_book.size() <= self._max_depth and not (price <= self._bid_prune_price):
+                break
+            if not (price <= self._bid_prune_price):
+                self._bid_prune_price = price
+            self._bid_book.erase(bid_iterator)
+
+        # The asks are in ascending price order, the worst one last.
+        while self._ask_book.size() > 0:
+            ask_iterator = self._ask_book.end()
+            dec(ask_iterator)
+            price = deref(ask_iterator).getPrice()
+            if self._ask_book.size() <= self._max_depth and not (price >= self._ask_prune_price):
+                break
+            if not (price >= self._ask_prune_price):
+                self._ask_prune_price = price
+            self._ask_book.erase(ask_iterator)
+
+        if ((not isnan(self._bid_prune_price) and self._bid_book.size() < self._max_depth)
+                or (not isnan(self._ask_prune_price) and self._ask_book.size() < self._max_depth)):
+            self._needs_resync = True
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -161,6 +246,25 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: int):
+        """keeps `value` levels on each side from now on, dropping the levels beyond; 0 keeps every level"""
+        self._max_depth = max(value, 0)
+        if self._max_depth > 0:
+            self.c_limit_depth()
+
+    @property
+    def needs_resync(self) -> bool:
+        """
+        True if a depth-limited order book lost levels within max_depth to diffs, while the levels that would take
+        their place were dropped; cleared by the next snapshot
+        """
+        return self._needs_resync
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -171,11 +275,36 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        bids_array, asks_array = self.snapshot_arrays()
+        return pd.DataFrame(bids_array), pd.DataFrame(asks_array)
+
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The bid and ask levels, best first, as read-only NumPy structured arrays of SNAPSHOT_DTYPE (price, amount and
+        update_id, like OrderBookRow), at most `depth` levels per side. The arrays are filled straight from the books,
+        without an OrderBookRow or DataFrame per call.
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] bids = np.empty((c_depth_limit(depth, self._bid_book.size()), 3))
+            np.ndarray[np.float64_t, ndim=2] asks = np.empty((c_depth_limit(depth, self._ask_book.size()), 3))
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            Py_ssize_t level
+
+        for level in range(bids.shape[0]):
+            entry = deref(bid_it)
+            bids[level, 0] = entry.getPrice()
+            bids[level, 1] = entry.getAmount()
+            bids[level, 2] = entry.getUpdateId()
+            inc(bid_it)
+        for level in range(asks.shape[0]):
+            entry = deref(ask_it)
+            asks[level, 0] = entry.getPrice()
+            asks[level, 1] = entry.getAmount()
+            asks[level, 2] = entry.getUpdateId()
+            inc(ask_it)
+        return c_as_snapshot_array(bids), c_as_snapshot_array(asks)
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
@@ -197,6 +326,35 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_array_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int):
+        """
+        apply_diffs() for levels given as (n, 2) float64 arrays of [price, amount] rows, e.g.
+        CompactOrderBookMessage.bids_array, without converting them to OrderBookRow first.
+        """
+        self.c_apply_diffs(c_entries_from_array(bids_array, update_id),
+                           c_entries_from_array(asks_array, update_id),
+                           update_id)
+
+    def apply_array_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int):
+        """apply_snapshot() for levels given as (n, 2) float64 arrays of [price, amount] rows"""
+        self.c_apply_snapshot(c_entries_from_array(bids_array, update_id),
+                              c_entries_from_array(asks_array, update_id),
+                              update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """applies the levels of a diff message, from its cached arrays if it is a CompactOrderBookMessage"""
+        if isinstance(message, CompactOrderBookMessage):
+            self.apply_array_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """applies the levels of a snapshot message, from its cached arrays if it is a CompactOrderBookMessage"""
+        if isinstance(message, CompactOrderBookMessage):
+            self.apply_array_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -478,6 +636,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -95,3 +97,65 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class CompactOrderBookMessage(OrderBookMessage):
+    """
+    Order book message whose levels are parsed once, on first access, into read-only float64 arrays shared by `bids`,
+    `asks` and the array accessors. Worth it for diffs, which the order book tracker applies, keeps in its past diffs
+    window and replays on every snapshot. The levels in `content` must not change once the message is read.
+    """
+
+    @classmethod
+    def from_arrays(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, Any],
+        bids_array: np.ndarray,
+        asks_array: np.ndarray,
+        timestamp: Optional[float] = None,
+    ) -> "CompactOrderBookMessage":
+        """
+        A message whose levels are (n, 2) float64 arrays of [price, amount] rows, stored in the content as they are
+        (and made read-only) instead of as lists.
+        """
+        bids_array, asks_array = _read_only(bids_array), _read_only(asks_array)
+        message = cls(message_type, {**content, "bids": bids_array, "asks": asks_array}, timestamp)
+        message.__dict__.update(bids_array=bids_array, asks_array=asks_array)
+        return message
+
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """the asks as a read-only (n, 2) float64 array of [price, amount] rows, for OrderBook.apply_array_diffs()"""
+        return _read_only(levels_array(self.content["asks"]))
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """the bids as a read-only (n, 2) float64 array of [price, amount] rows, for OrderBook.apply_array_diffs()"""
+        return _read_only(levels_array(self.content["bids"]))
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in self.asks_array.tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in self.bids_array.tolist()]
+
+
+def levels_array(levels) -> np.ndarray:
+    """
+    The [price, amount] of `levels` as a (n, 2) float64 array; `levels` is an array or a sequence of rows starting with
+    a price and an amount, as numbers, strings or Decimals.
+    """
+    if isinstance(levels, np.ndarray) and levels.ndim == 2:
+        return np.ascontiguousarray(levels[:, :2], dtype=np.float64)
+    return np.array([(float(price), float(amount)) for price, amount, *trash in levels], dtype=np.float64).reshape(-1, 2)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array = np.ascontiguousarray(array, dtype=np.float64).reshape(-1, 2)
+    array.setflags(write=False)
+    return array
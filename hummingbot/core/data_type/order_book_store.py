@@ -0,0 +1,133 @@
+import os
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+
+# Every row of a stored order book is a record of STORE_DTYPE. A SNAPSHOT row (update_id, and the time it was saved as
+# the price) is followed by the BID and ASK rows of the order book levels, then every DIFF row (first_update_id,
+# update_id, and the message timestamp as the price) by the BID and ASK rows of its levels.
+STORE_DTYPE = np.dtype([
+    ("kind", np.uint8),
+    ("first_update_id", np.int64),
+    ("update_id", np.int64),
+    ("price", np.float64),
+    ("amount", np.float64),
+])
+SNAPSHOT, DIFF, BID, ASK = range(4)
+
+
+class StoredOrderBook(NamedTuple):
+    snapshot: CompactOrderBookMessage
+    diffs: List[CompactOrderBookMessage]
+    timestamp: float
+
+
+class OrderBookStore:
+    """
+    Keeps the latest state of the order books on disk, one NumPy file per trading pair in `path`: the levels of the
+    order book as of an update ID, and the diffs of the past diffs window of the order book tracker. Files are replaced
+    atomically on every save, and memory-mapped on load.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(self,
+             trading_pair: str,
+             order_book: OrderBook,
+             update_id: int,
+             past_diffs: List[OrderBookMessage],
+             timestamp: Optional[float] = None):
+        """
+        Stores the levels of `order_book`, up to date as of `update_id`, and the diffs already applied to it.
+        """
+        bids, asks = order_book.snapshot_arrays()
+        messages = [(SNAPSHOT, update_id, update_id, time.time() if timestamp is None else timestamp,
+                     np.column_stack((bids["price"], bids["amount"])), np.column_stack((asks["price"], asks["amount"])))]
+        for diff in past_diffs:
+            messages.append((DIFF, diff.first_update_id, diff.update_id, diff.timestamp or 0) + _levels(diff))
+
+        records = np.empty(sum(1 + len(message[4]) + len(message[5]) for message in messages), dtype=STORE_DTYPE)
+        position = 0
+        for kind, first_update_id, message_update_id, message_timestamp, bids_array, asks_array in messages:
+            records[position] = (kind, first_update_id, message_update_id, message_timestamp, 0)
+            position += 1
+            for side, levels in ((BID, bids_array), (ASK, asks_array)):
+                side_records = records[position:position + len(levels)]
+                side_records["kind"] = side
+                side_records["first_update_id"] = message_update_id
+                side_records["update_id"] = message_update_id
+                side_records["price"] = levels[:, 0]
+                side_records["amount"] = levels[:, 1]
+                position += len(levels)
+
+        os.makedirs(self._path, exist_ok=True)
+        file_path = self._file_path(trading_pair)
+        with open(f"{file_path}.tmp", "wb") as file:
+            np.save(file, records)
+        os.replace(f"{file_path}.tmp", file_path)
+
+    def load(self, trading_pair: str, max_age: Optional[float] = None) -> Optional[StoredOrderBook]:
+        """
+        The stored state of the order book of `trading_pair`, or None if there is none, or if it was saved more than
+        `max_age` seconds ago.
+        """
+        file_path = self._file_path(trading_pair)
+        if not os.path.exists(file_path):
+            return None
+        records = np.load(file_path, mmap_mode="r")
+        if len(records) == 0 or records["kind"][0] != SNAPSHOT:
+            return None
+        timestamp = float(records["price"][0])
+        if max_age is not None and time.time() - timestamp > max_age:
+            return None
+
+        records = records.view(np.ndarray)
+        kinds, update_ids = records["kind"], records["update_id"]
+        levels = np.column_stack((records["price"], records["amount"]))
+        headers = np.flatnonzero(kinds <= DIFF).tolist() + [len(records)]
+        bid_counts = np.cumsum(kinds == BID).tolist()
+        messages = []
+        for start, end in zip(headers[:-1], headers[1:]):
+            asks_start = start + 1 + bid_counts[end - 1] - bid_counts[start]
+            content = {"trading_pair": trading_pair, "update_id": int(update_ids[start])}
+            if kinds[start] == SNAPSHOT:
+                message_type, message_timestamp = OrderBookMessageType.SNAPSHOT, timestamp
+            else:
+                message_type, message_timestamp = OrderBookMessageType.DIFF, float(levels[start, 0])
+                content["first_update_id"] = int(records["first_update_id"][start])
+            messages.append(CompactOrderBookMessage.from_arrays(
+                message_type,
+                content,
+                bids_array=levels[start + 1:asks_start],
+                asks_array=levels[asks_start:end],
+                timestamp=message_timestamp,
+            ))
+        return StoredOrderBook(snapshot=messages[0], diffs=messages[1:], timestamp=timestamp)
+
+    def remove(self, trading_pair: str):
+        file_path = self._file_path(trading_pair)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _file_path(self, trading_pair: str) -> str:
+        return os.path.join(self._path, f"{trading_pair.replace(os.sep, '_')}.npy")
+
+
+def _levels(message: OrderBookMessage):
+    if isinstance(message, CompactOrderBookMessage):
+        return message.bids_array, message.asks_array
+    return (np.array([(row.price, row.amount) for row in message.bids], dtype=np.float64).reshape(-1, 2),
+            np.array([(row.price, row.amount) for row in message.asks], dtype=np.float64).reshape(-1, 2))
@@ -3,13 +3,16 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_store import OrderBookStore
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -21,8 +24,67 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class ShardedMessageQueue:
+    """
+    Output queue handed to the data source listeners in sharded mode. Puts every message straight into the queue of
+    the shard of its trading pair, so each shard consumer reads the messages of its trading pairs in order without a
+    router task in between.
+    """
+
+    def __init__(self, shard_queues: List[asyncio.Queue], shard_indices: Dict[str, int]):
+        self._shard_queues = shard_queues
+        self._shard_indices = shard_indices
+
+    def shard_queue(self, trading_pair: str) -> asyncio.Queue:
+        shard_index = self._shard_indices.get(trading_pair)
+        if shard_index is None:
+            shard_index = hash(trading_pair) % len(self._shard_queues)
+        return self._shard_queues[shard_index]
+
+    def put_nowait(self, message: OrderBookMessage):
+        self.shard_queue(message.trading_pair).put_nowait(message)
+
+    async def put(self, message: OrderBookMessage):
+        self.put_nowait(message)
+
+
+class CoalescedOrderBookDiff:
+    """
+    The net effect of consecutive diffs of one order book: the last row of every price on each side, applied to the
+    order book as a single diff.
+    """
+
+    def __init__(self):
+        self.bids: Dict[float, OrderBookRow] = {}
+        self.asks: Dict[float, OrderBookRow] = {}
+        self.update_id: int = 0
+        self.diff_count: int = 0
+
+    def add(self, message: OrderBookMessage):
+        self.bids.update((row.price, row) for row in message.bids)
+        self.asks.update((row.price, row) for row in message.asks)
+        self.update_id = message.update_id
+        self.diff_count += 1
+
+    def apply_to(self, order_book: OrderBook):
+        order_book.apply_diffs(list(self.bids.values()), list(self.asks.values()), self.update_id)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshots fetched at the same time while initializing the order books; the requests themselves are paced by the
+    # throttler of the data source. Connectors whose snapshot requests are not throttled use 1 and an interval.
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    SNAPSHOT_REQUEST_INTERVAL: float = 0.0
+    RESYNC_RETRY_INTERVAL: float = 1.0
+    # Seconds before the initial order book of a trading pair is requested again after a failure, doubled after each
+    # failure up to the max.
+    INIT_RETRY_INTERVAL: float = 1.0
+    INIT_MAX_RETRY_INTERVAL: float = 30.0
+    # Seconds between two saves of the order books to the order book store, and the age past which a stored order book
+    # is not used any more to initialize the order book.
+    ORDER_BOOK_STORE_INTERVAL: float = 10.0
+    ORDER_BOOK_STORE_MAX_AGE: float = 60.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +93,34 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_snapshot_requests: Optional[int] = None,
+                 order_book_shards: Optional[int] = None,
+                 coalesce_diffs: bool = False,
+                 order_book_store: Optional[OrderBookStore] = None,
+                 max_depth: int = 0):
+        """
+        :param order_book_shards: if set, the diffs and snapshots are applied by that many consumer tasks, each one
+            reading the messages of its share of the trading pairs straight from the data source, instead of a router
+            forwarding them to a queue and a task per trading pair. Subclasses overriding _track_single_book or the
+            routers keep the per trading pair mode.
+        :param coalesce_diffs: if True, the diffs received for an order book are merged, and applied only when the
+            order books are read or flushed, see flush_coalesced_diffs()
+        :param order_book_store: if set, the order books are saved to it periodically and when the tracker stops, and
+            initialized from it instead of from a snapshot when the tracker starts again, see _stored_order_book()
+        :param max_depth: if positive, the number of levels the order books keep on each side, see OrderBook.max_depth
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._max_concurrent_snapshot_requests: int = (
+            max_concurrent_snapshot_requests or self.MAX_CONCURRENT_SNAPSHOT_REQUESTS
+        )
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +130,21 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._last_update_ids: Dict[str, int] = {}
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._resync_counts: Dict[str, int] = defaultdict(int)
+        self._resync_buffers: Dict[str, List[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._order_book_shards: Optional[int] = order_book_shards
+        self._shard_message_queues: List[asyncio.Queue] = []
+        self._order_book_shard_tasks: List[asyncio.Task] = []
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._coalesced_diffs: Dict[str, CoalescedOrderBookDiff] = {}
+        self._order_book_store: Optional[OrderBookStore] = order_book_store
+        self._stored_update_ids: Dict[str, int] = {}
+        self._max_depth: int = max_depth
+        # trading pairs whose order book was initialized from the store and is not confirmed current yet
+        self._warm_started_order_books: Set[str] = set()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +155,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._order_book_store_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -62,19 +163,71 @@ class OrderBookTracker:
 
     @property
     def order_books(self) -> Dict[str, OrderBook]:
+        if len(self._coalesced_diffs) > 0:
+            self.flush_coalesced_diffs()
         return self._order_books
 
+    @property
+    def coalesce_diffs(self) -> bool:
+        return self._coalesce_diffs
+
+    @coalesce_diffs.setter
+    def coalesce_diffs(self, value: bool):
+        self._coalesce_diffs = value
+        if not value:
+            self.flush_coalesced_diffs()
+
+    @property
+    def order_book_store(self) -> Optional[OrderBookStore]:
+        return self._order_book_store
+
+    @order_book_store.setter
+    def order_book_store(self, value: Optional[OrderBookStore]):
+        """to be set before the tracker starts"""
+        self._order_book_store = value
+
     @property
     def ready(self) -> bool:
-        return self._order_books_initialized.is_set()
+        return self._order_books_initialized.is_set() and len(self._warm_started_order_books) == 0
+
+    @property
+    def sequence_gap_counts(self) -> Dict[str, int]:
+        """Number of times diffs were found missing, per trading pair"""
+        return dict(self._sequence_gap_counts)
+
+    @property
+    def resync_counts(self) -> Dict[str, int]:
+        """Number of times an order book was restored from a requested snapshot, per trading pair"""
+        return dict(self._resync_counts)
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        True once the order book of `trading_pair` is initialized and tracked, possibly before the others. An order book
+        initialized from the order book store is ready once a diff continues it, or once it is resynchronized.
+        """
+        return self._order_book_ready_events[trading_pair].is_set()
 
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
             trading_pair: order_book.snapshot
-            for trading_pair, order_book in self._order_books.items()
+            for trading_pair, order_book in self.order_books.items()
+        }
+
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        return {
+            trading_pair: order_book.snapshot_arrays(depth=depth)
+            for trading_pair, order_book in self.order_books.items()
         }
 
+    def flush_coalesced_diffs(self):
+        """
+        Applies the diffs coalesced since the last flush to their order books. Runs whenever the order books are read
+        through the tracker, and at every tick of the exchange connectors, before the strategies read the order books.
+        """
+        for trading_pair in list(self._coalesced_diffs):
+            self._flush_coalesced_diff(trading_pair)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,27 +236,35 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        if self._order_book_shards:
+            diff_output = snapshot_output = self._start_order_book_shards()
+        else:
+            diff_output, snapshot_output = self._order_book_diff_stream, self._order_book_snapshot_stream
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(self._ev_loop, snapshot_output)
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        if self._order_book_store is not None:
+            self._order_book_store_task = safe_ensure_future(
+                self._order_book_store_loop()
+            )
 
     def stop(self):
         if self._init_order_books_task is not None:
@@ -133,14 +294,34 @@ class OrderBookTracker:
             self._update_last_trade_prices_task = None
         if self._order_book_stream_listener_task is not None:
             self._order_book_stream_listener_task.cancel()
+        if self._order_book_store_task is not None:
+            self._order_book_store_task.cancel()
+            self._order_book_store_task = None
+        self.save_order_books()
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._order_book_shard_tasks:
+            task.cancel()
+        self._order_book_shard_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._coalesced_diffs.clear()
         self._order_books_initialized.clear()
+        self._warm_started_order_books.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
+        for trading_pair in self._trading_pairs:
+            await self._order_book_ready_events[trading_pair].wait()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -174,17 +355,129 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books, fetching up to `max_concurrent_snapshot_requests` snapshots at a time. Each order book
+        is tracked, and reported by is_order_book_ready(), as soon as its snapshot arrives. Order books found in the
+        order book store are initialized from it, without a snapshot request, and tracked right away, but only reported
+        ready once the diffs are known to continue them. A failing trading pair is retried on its own, with a backoff,
+        without holding back the others.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        semaphore = asyncio.Semaphore(self._max_concurrent_snapshot_requests)
+        completed = 0
+
+        async def request_initial_order_book(trading_pair: str) -> OrderBook:
+            retry_interval = self.INIT_RETRY_INTERVAL
+            while True:
+                try:
+                    async with semaphore:
+                        order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                        if self.SNAPSHOT_REQUEST_INTERVAL > 0:
+                            await self._sleep(delay=self.SNAPSHOT_REQUEST_INTERVAL)
+                    return order_book
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing the order book for {trading_pair}. "
+                        f"Retrying after {retry_interval} seconds.",
+                        exc_info=True,
+                        app_warning_msg=f"Could not initialize the order book for {trading_pair}. Retrying.",
+                    )
+                # outside of the semaphore, the snapshots of the other trading pairs go on meanwhile
+                await self._sleep(delay=retry_interval)
+                retry_interval = min(retry_interval * 2, self.INIT_MAX_RETRY_INTERVAL)
+
+        async def init_order_book(trading_pair: str):
+            nonlocal completed
+            order_book = self._stored_order_book(trading_pair)
+            if order_book is not None:
+                self._warm_started_order_books.add(trading_pair)
+            else:
+                order_book = await request_initial_order_book(trading_pair)
+            if self._max_depth > 0:
+                order_book.max_depth = self._max_depth
+            if self._order_book_shards:
+                self._last_update_ids[trading_pair] = order_book.snapshot_uid
+                self._order_books[trading_pair] = order_book
+                self._apply_saved_messages(trading_pair)
+            else:
+                self._order_books[trading_pair] = order_book
+                self._tracking_message_queues[trading_pair] = asyncio.Queue()
+                self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            if trading_pair not in self._warm_started_order_books:
+                self._order_book_ready_events[trading_pair].set()
+            completed += 1
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+                               f"{completed}/{len(self._trading_pairs)} completed.")
+
+        results = await asyncio.gather(*(init_order_book(trading_pair) for trading_pair in self._trading_pairs),
+                                       return_exceptions=True)
+        for trading_pair, result in zip(self._trading_pairs, results):
+            if isinstance(result, Exception):
+                self.logger().error(f"Could not track the order book for {trading_pair}.", exc_info=result)
         self._order_books_initialized.set()
 
+    def _stored_order_book(self, trading_pair: str) -> Optional[OrderBook]:
+        """
+        The order book of `trading_pair` as saved to the order book store less than ORDER_BOOK_STORE_MAX_AGE seconds
+        ago, with its past diffs window, if any. Only for data sources whose diffs are sequenced: the first diff received
+        either continues the stored order book, or is a sequence gap and the order book is resynchronized from a
+        snapshot, like at any other gap.
+        """
+        if self._order_book_store is None or not self._data_source.SEQUENCED_ORDER_BOOK_DIFFS:
+            return None
+        try:
+            stored = self._order_book_store.load(trading_pair, max_age=self.ORDER_BOOK_STORE_MAX_AGE)
+        except Exception:
+            self.logger().warning(f"Could not load the stored order book for {trading_pair}.", exc_info=True)
+            return None
+        if stored is None:
+            return None
+        order_book: OrderBook = self._data_source.order_book_create_function()
+        order_book.apply_snapshot_message(stored.snapshot)
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        past_diffs_window.clear()
+        past_diffs_window.extend(stored.diffs)
+        self._stored_update_ids[trading_pair] = stored.snapshot.update_id
+        self.logger().info(f"Restored the order book for {trading_pair} as of update {stored.snapshot.update_id} "
+                           f"from the order book store.")
+        return order_book
+
+    def save_order_books(self):
+        """
+        Saves the order books updated since they were last saved to the order book store, except the ones being
+        resynchronized.
+        """
+        if self._order_book_store is None:
+            return
+        for trading_pair, order_book in self.order_books.items():
+            update_id = self._last_update_ids.get(trading_pair)
+            if (update_id is None
+                    or trading_pair in self._resync_buffers
+                    or self._stored_update_ids.get(trading_pair) == update_id):
+                continue
+            try:
+                self._order_book_store.save(trading_pair, order_book, update_id,
+                                            list(self._past_diffs_windows[trading_pair]))
+                self._stored_update_ids[trading_pair] = update_id
+            except Exception:
+                self.logger().warning(f"Could not save the order book for {trading_pair}.", exc_info=True)
+
+    async def _order_book_store_loop(self):
+        await self._order_books_initialized.wait()
+        while True:
+            await self._sleep(delay=self.ORDER_BOOK_STORE_INTERVAL)
+            self.save_order_books()
+
+    def _start_order_book_shards(self) -> ShardedMessageQueue:
+        shards = min(self._order_book_shards, max(len(self._trading_pairs), 1))
+        self._shard_message_queues = [asyncio.Queue() for _ in range(shards)]
+        self._order_book_shard_tasks = [
+            safe_ensure_future(self._order_book_shard_consumer(message_queue))
+            for message_queue in self._shard_message_queues
+        ]
+        shard_indices = {trading_pair: i % shards for i, trading_pair in enumerate(self._trading_pairs)}
+        return ShardedMessageQueue(shard_queues=self._shard_message_queues, shard_indices=shard_indices)
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -254,12 +547,11 @@ class OrderBookTracker:
                 await asyncio.sleep(5.0)
 
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window = self._past_diffs_windows[trading_pair]
-
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        self._last_update_ids[trading_pair] = order_book.snapshot_uid
 
         while True:
             try:
@@ -271,9 +563,7 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                if self._apply_order_book_message(trading_pair, message):
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -282,9 +572,6 @@ class OrderBookTracker:
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +582,178 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _order_book_shard_consumer(self, message_queue: asyncio.Queue):
+        """
+        Applies the diff and snapshot messages of the trading pairs of one shard, in the order the data source emitted
+        them, straight to their order books.
+        """
+        last_message_timestamp: float = time.time()
+        messages_accepted: int = 0
+        messages_rejected: int = 0
+
+        while True:
+            try:
+                message: OrderBookMessage = await message_queue.get()
+                trading_pair: str = message.trading_pair
+
+                if trading_pair not in self._order_books:
+                    # Save diff messages received before snapshots are ready, the initial snapshot supersedes others
+                    if message.type is OrderBookMessageType.DIFF:
+                        self._saved_message_queues[trading_pair].append(message)
+                    continue
+                if self._is_outdated_diff(trading_pair, message):
+                    messages_rejected += 1
+                    continue
+                if self._apply_order_book_message(trading_pair, message):
+                    messages_accepted += 1
+
+                # Log some statistics.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    messages_accepted = 0
+                    messages_rejected = 0
+                last_message_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error applying order book messages.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error applying order book messages. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _apply_saved_messages(self, trading_pair: str):
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        while len(saved_messages) > 0:
+            message = saved_messages.popleft()
+            if not self._is_outdated_diff(trading_pair, message):
+                self._apply_order_book_message(trading_pair, message)
+
+    def _is_outdated_diff(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        return message.type is OrderBookMessageType.DIFF and self._order_books[trading_pair].snapshot_uid > message.update_id
+
+    def _apply_order_book_message(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        """
+        Applies a diff or snapshot message to the order book of `trading_pair`. While the order book is resynchronized
+        after a sequence gap, or after a depth-limited order book ran short of levels, the diffs are buffered instead.
+
+        :return: True if the message was a diff applied to the order book
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        if trading_pair in self._resync_buffers:
+            # snapshots received in the meantime are superseded by the requested one
+            if message.type is OrderBookMessageType.DIFF:
+                self._resync_buffers[trading_pair].append(message)
+            return False
+
+        if message.type is OrderBookMessageType.DIFF:
+            if self._is_sequence_gap(trading_pair, message):
+                self._sequence_gap_counts[trading_pair] += 1
+                self.logger().warning(f"Order book diffs missing for {trading_pair} between update "
+                                      f"{self._last_update_ids[trading_pair]} and {message.first_update_id}. "
+                                      f"Requesting a new snapshot.")
+                self._flush_coalesced_diff(trading_pair)
+                self._start_resync(trading_pair, [message])
+                return False
+            if message.update_id > self._last_update_ids[trading_pair]:
+                self._set_order_book_current(trading_pair)
+            self._past_diffs_windows[trading_pair].append(message)
+            self._last_update_ids[trading_pair] = max(self._last_update_ids[trading_pair], message.update_id)
+            if self._coalesce_diffs:
+                coalesced_diff = self._coalesced_diffs.get(trading_pair)
+                if coalesced_diff is None:
+                    coalesced_diff = self._coalesced_diffs[trading_pair] = CoalescedOrderBookDiff()
+                coalesced_diff.add(message)
+            else:
+                order_book.apply_diff_message(message)
+                self._resync_if_short_of_depth(trading_pair)
+            return True
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            self._flush_coalesced_diff(trading_pair)
+            past_diffs: List[OrderBookMessage] = list(self._past_diffs_windows[trading_pair])
+            order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+            self._last_update_ids[trading_pair] = max(self._last_update_ids[trading_pair], message.update_id)
+            self._set_order_book_current(trading_pair)
+        return False
+
+    def _set_order_book_current(self, trading_pair: str):
+        """reports an order book initialized from the order book store as ready, once it is known to be current"""
+        if trading_pair in self._warm_started_order_books:
+            self._warm_started_order_books.discard(trading_pair)
+            self._order_book_ready_events[trading_pair].set()
+
+    def _flush_coalesced_diff(self, trading_pair: str):
+        coalesced_diff = self._coalesced_diffs.pop(trading_pair, None)
+        if coalesced_diff is not None:
+            coalesced_diff.apply_to(self._order_books[trading_pair])
+            self._resync_if_short_of_depth(trading_pair)
+
+    def _resync_if_short_of_depth(self, trading_pair: str):
+        order_book: OrderBook = self._order_books[trading_pair]
+        if order_book.needs_resync and trading_pair not in self._resync_buffers:
+            self.logger().info(f"The order book for {trading_pair} holds fewer levels than its max depth of "
+                               f"{order_book.max_depth}. Requesting a new snapshot.")
+            self._start_resync(trading_pair, list(self._past_diffs_windows[trading_pair]))
+
+    def _is_sequence_gap(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        """
+        True if the diffs between the last update applied to the order book and `message` are missing. Only checked for
+        data sources whose diffs are sequenced, see OrderBookTrackerDataSource.SEQUENCED_ORDER_BOOK_DIFFS.
+        """
+        return (self._data_source.SEQUENCED_ORDER_BOOK_DIFFS
+                and message.first_update_id > self._last_update_ids[trading_pair] + 1)
+
+    @staticmethod
+    def _is_sequence_contiguous(update_id: int, diffs: List[OrderBookMessage]) -> bool:
+        for diff in diffs:
+            if diff.first_update_id > update_id + 1:
+                return False
+            update_id = max(update_id, diff.update_id)
+        return True
+
+    def _start_resync(self, trading_pair: str, diffs: List[OrderBookMessage]):
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        self._resync_buffers[trading_pair] = diffs + list(saved_messages)
+        saved_messages.clear()
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Restores the order book of `trading_pair` from a new snapshot. The diffs received while it is requested are
+        buffered, then replayed on top of the snapshot. For sequenced diffs, the snapshot is requested again until it is
+        recent enough for the buffered diffs to continue it.
+        """
+        buffered_diffs: List[OrderBookMessage] = self._resync_buffers[trading_pair]
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+                diffs = sorted((diff for diff in buffered_diffs if diff.update_id > snapshot.update_id),
+                               key=lambda diff: diff.update_id)
+                if (not self._data_source.SEQUENCED_ORDER_BOOK_DIFFS
+                        or self._is_sequence_contiguous(snapshot.update_id, diffs)):
+                    break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching the order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not resynchronize the order book for {trading_pair}. Retrying.",
+                )
+            await self._sleep(delay=self.RESYNC_RETRY_INTERVAL)
+
+        self._order_books[trading_pair].restore_from_snapshot_and_diffs(snapshot, diffs)
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        past_diffs_window.clear()
+        past_diffs_window.extend(diffs)
+        self._last_update_ids[trading_pair] = max([snapshot.update_id] + [diff.update_id for diff in diffs])
+        del self._resync_buffers[trading_pair]
+        del self._resync_tasks[trading_pair]
+        self._resync_counts[trading_pair] += 1
+        self._set_order_book_current(trading_pair)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -13,6 +13,9 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # True if the diffs carry a `first_update_id` continuing the `update_id` of the previous diff (or of the snapshot),
+    # so the order book tracker can detect missing diffs and resynchronize the order book with a new snapshot
+    SEQUENCED_ORDER_BOOK_DIFFS = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -64,7 +67,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
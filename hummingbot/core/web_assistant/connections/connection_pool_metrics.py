@@ -0,0 +1,75 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import DefaultDict, Dict
+
+import aiohttp
+
+
+@dataclass
+class HostPoolMetrics:
+    """The use of the connections to one host."""
+
+    in_flight: int = 0  # requests sent and not answered yet
+    waiting: int = 0  # requests waiting for a free connection of the pool
+    connections_created: int = 0
+    connections_reused: int = 0
+    handshake_time: float = 0.0  # seconds spent opening the connections, DNS, TCP and TLS, in total
+    max_handshake_time: float = 0.0
+
+    @property
+    def mean_handshake_time(self) -> float:
+        return self.handshake_time / self.connections_created if self.connections_created > 0 else 0.0
+
+
+class ConnectionPoolMetrics:
+    """Collects `HostPoolMetrics` per host from the trace events of an `aiohttp.ClientSession`."""
+
+    def __init__(self):
+        self._hosts: DefaultDict[str, HostPoolMetrics] = defaultdict(HostPoolMetrics)
+
+    @property
+    def hosts(self) -> Dict[str, HostPoolMetrics]:
+        return dict(self._hosts)
+
+    def host(self, host: str) -> HostPoolMetrics:
+        return self._hosts[host]
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_done)
+        trace_config.on_request_exception.append(self._on_request_done)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        context.host = params.url.host
+        self._hosts[context.host].in_flight += 1
+
+    async def _on_request_done(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._hosts[context.host].in_flight -= 1
+
+    async def _on_connection_queued_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._hosts[context.host].waiting += 1
+
+    async def _on_connection_queued_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._hosts[context.host].waiting -= 1
+
+    async def _on_connection_create_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        context.connection_create_start = time.perf_counter()
+
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        metrics = self._hosts[context.host]
+        handshake_time = time.perf_counter() - context.connection_create_start
+        metrics.connections_created += 1
+        metrics.handshake_time += handshake_time
+        metrics.max_handshake_time = max(metrics.max_handshake_time, handshake_time)
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._hosts[context.host].connections_reused += 1
@@ -2,6 +2,8 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool_metrics import ConnectionPoolMetrics
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,13 +18,28 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The REST connections share a pool sized by `pool_config`, whose use is reported per host by `pool_metrics`. The
+    WebSocket connections are long-lived and get a session of their own, out of the pool, so that they never hold the
+    connections the REST requests wait for.
     """
 
-    def __init__(self):
+    def __init__(self, pool_config: Optional[ConnectionPoolConfig] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._ws_shared_client: Optional[aiohttp.ClientSession] = None
+        self._pool_config: ConnectionPoolConfig = pool_config or ConnectionPoolConfig()
+        self._pool_metrics: ConnectionPoolMetrics = ConnectionPoolMetrics()
+
+    @property
+    def pool_config(self) -> ConnectionPoolConfig:
+        return self._pool_config
+
+    @property
+    def pool_metrics(self) -> ConnectionPoolMetrics:
+        return self._pool_metrics
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
@@ -30,10 +47,29 @@ class ConnectionsFactory:
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
-        shared_client = self._ws_independent_session or await self._get_shared_client()
+        shared_client = self._ws_independent_session or await self._get_ws_shared_client()
         connection = WSConnection(aiohttp_client_session=shared_client)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_config.limit,
+                limit_per_host=self._pool_config.limit_per_host,
+                keepalive_timeout=self._pool_config.keepalive_timeout,
+                use_dns_cache=self._pool_config.dns_cache_ttl != 0,
+                ttl_dns_cache=self._pool_config.dns_cache_ttl,
+            )
+            self._shared_client = aiohttp.ClientSession(connector=connector,
+                                                        trace_configs=[self._pool_metrics.trace_config()])
         return self._shared_client
+
+    async def _get_ws_shared_client(self) -> aiohttp.ClientSession:
+        if self._ws_shared_client is None:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                use_dns_cache=self._pool_config.dns_cache_ttl != 0,
+                ttl_dns_cache=self._pool_config.dns_cache_ttl,
+            )
+            self._ws_shared_client = aiohttp.ClientSession(connector=connector)
+        return self._ws_shared_client
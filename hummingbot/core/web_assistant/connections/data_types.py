@@ -10,6 +10,21 @@ if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
+@dataclass
+class ConnectionPoolConfig:
+    """The pool of HTTP connections of the REST clients; the WebSocket clients only share its DNS cache TTL.
+
+    `limit` caps the connections open at once, `limit_per_host` the ones to each exchange host (0 for no cap); requests
+    beyond them wait for a free connection. Idle connections are kept alive for `keepalive_timeout` seconds to save the
+    TCP and TLS handshakes of the next requests, and resolved host names are cached for `dns_cache_ttl` seconds.
+    """
+
+    limit: int = 256
+    limit_per_host: int = 64
+    keepalive_timeout: float = 60.0
+    dns_cache_ttl: Optional[int] = 300
+
+
 class RESTMethod(Enum):
     GET = "GET"
     POST = "POST"
@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -43,6 +44,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -54,6 +56,7 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            priority=priority,
         )
         response_json = await response.json()
         return response_json
@@ -69,7 +72,12 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
     ) -> RESTResponse:
+        """
+        :param priority: the priority of the request for the throttler, by default the priority of the rate limit of
+            `throttler_limit_id`
+        """
 
         headers = headers or {}
 
@@ -90,7 +98,7 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -1,5 +1,9 @@
 import abc
+import time
+from dataclasses import dataclass
+from typing import List, Mapping, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.connections.data_types import RESTResponse
 
 
@@ -13,3 +17,72 @@ class RESTPostProcessorBase(abc.ABC):
     @abc.abstractmethod
     async def post_process(self, response: RESTResponse) -> RESTResponse:
         ...
+
+
+@dataclass
+class RateLimitHeaders:
+    """The response headers in which an exchange reports the usage of one of the rate limits of the throttler.
+
+    The usage is either `used_header`, the weight used, or `remaining_header`, the weight left of the limit in
+    `limit_header`, or else of the throttler limit. The server resets it at the timestamp in milliseconds in
+    `reset_header`, or at the end of the current window if it counts the usage in `fixed_window` seconds long windows
+    from the epoch; the usage counts for the time interval of the limit otherwise.
+    """
+
+    limit_id: str
+    used_header: Optional[str] = None
+    remaining_header: Optional[str] = None
+    limit_header: Optional[str] = None
+    reset_header: Optional[str] = None
+    fixed_window: Optional[float] = None
+
+
+class RateLimitHeadersPostProcessor(RESTPostProcessorBase):
+    """Feeds the rate limit usage reported in the response headers back into the throttler.
+
+    The tasks then wait for the capacity the server actually has left, including the one used by other clients of the
+    account, instead of running into 429 responses. A 429 or 418 response with a `Retry-After` header uses up the
+    limits until then.
+    """
+
+    def __init__(self, throttler: AsyncThrottlerBase, rate_limit_headers: List[RateLimitHeaders]):
+        self._throttler = throttler
+        self._rate_limit_headers = rate_limit_headers
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers or {}
+        now = time.time()
+        retry_after = _header_value(headers, "Retry-After") if response.status in (418, 429) else None
+        for rate_limit_headers in self._rate_limit_headers:
+            limit = _header_value(headers, rate_limit_headers.limit_header)
+            if retry_after is not None:
+                await self._throttler.async_update_usage(limit_id=rate_limit_headers.limit_id,
+                                                         remaining=0,
+                                                         limit=None if limit is None else int(limit),
+                                                         expires_in=retry_after)
+                continue
+            used = _header_value(headers, rate_limit_headers.used_header)
+            remaining = _header_value(headers, rate_limit_headers.remaining_header)
+            if used is None and remaining is None and limit is None:
+                continue
+            reset_timestamp = _header_value(headers, rate_limit_headers.reset_header)
+            if reset_timestamp is not None:
+                expires_in = reset_timestamp / 1e3 - now
+            elif rate_limit_headers.fixed_window is not None:
+                expires_in = rate_limit_headers.fixed_window - now % rate_limit_headers.fixed_window
+            else:
+                expires_in = None
+            await self._throttler.async_update_usage(limit_id=rate_limit_headers.limit_id,
+                                                     used=None if used is None else int(used),
+                                                     remaining=None if remaining is None else int(remaining),
+                                                     limit=None if limit is None else int(limit),
+                                                     expires_in=expires_in)
+        return response
+
+
+def _header_value(headers: Mapping[str, str], header: Optional[str]) -> Optional[float]:
+    value = headers.get(header) if header is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -2,7 +2,9 @@ from typing import List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool_metrics import ConnectionPoolMetrics
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,8 +31,9 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        connection_pool_config: Optional[ConnectionPoolConfig] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(pool_config=connection_pool_config)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +49,10 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_metrics(self) -> ConnectionPoolMetrics:
+        return self._connections_factory.pool_metrics
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -1,5 +1,6 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
@@ -165,6 +166,20 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.snapshot
 
+    def get_order_book_snapshot_arrays(self, connector_name: str, trading_pair: str,
+                                       depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask
+        read-only NumPy structured arrays with price, amount and update_id fields. Cheaper than the DataFrames of
+        get_order_book_snapshot when polling many books.
+        :param connector_name: str
+        :param trading_pair: str
+        :param depth: maximum number of levels per side, all of them if None
+        :return: Tuple of bid and ask arrays, best level first.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.snapshot_arrays(depth=depth)
+
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float, is_buy: bool) -> OrderBookQueryResult:
         """
         Gets the price for a specified quote volume on the order book.
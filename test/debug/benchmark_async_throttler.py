@@ -0,0 +1,96 @@
+"""
+Overhead of AsyncThrottler and AsyncSlidingWindowThrottler, with many limit ids sharing a linked pool limit
+
+Usage:
+
+```
+$ python -m test.debug.benchmark_async_throttler --limit-ids 24 --requests 500 --tasks 1 20
+
+```
+
+Every limit id is linked to one pool limit, like the endpoints of an exchange sharing a request weight limit. Two runs
+per throttler:
+
+* `within limits`: `--tasks` tasks run `--requests` tasks in total, round robin over the limit ids, with limits high
+  enough that none waits, after `--backlog` tasks already run within the time window. Reports the tasks per second,
+  i.e. the cost of the capacity checks themselves;
+* `saturated`: `--burst` tasks started at once on a pool limit of `--burst` / 4 per 0.5 s. Reports how late the last
+  one ran after the earliest time the limit allowed, and the CPU time spent meanwhile.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Type
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+POOL_ID = "POOL"
+
+
+def _rate_limits(limit_ids: List[str], pool_limit: int, time_interval: float) -> List[RateLimit]:
+    return [RateLimit(limit_id=POOL_ID, limit=pool_limit, time_interval=time_interval)] + [
+        RateLimit(limit_id=limit_id, limit=pool_limit, time_interval=time_interval,
+                  linked_limits=[LinkedLimitWeightPair(POOL_ID)])
+        for limit_id in limit_ids
+    ]
+
+
+async def within_limits(throttler_class: Type[AsyncThrottlerBase], limit_ids: List[str], requests: int, tasks: int,
+                        backlog: int):
+    throttler = throttler_class(rate_limits=_rate_limits(limit_ids, pool_limit=10 ** 9, time_interval=60))
+    for i in range(backlog):
+        async with throttler.execute_task(limit_id=limit_ids[i % len(limit_ids)]):
+            pass
+
+    async def run(task_index: int):
+        for i in range(task_index, requests, tasks):
+            async with throttler.execute_task(limit_id=limit_ids[i % len(limit_ids)]):
+                pass
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run(task_index) for task_index in range(tasks)))
+    elapsed = time.perf_counter() - started
+    print(f"{throttler_class.__name__:>27} within limits, tasks={tasks:<3}: {requests / elapsed:10.0f} tasks/s")
+
+
+async def saturated(throttler_class: Type[AsyncThrottlerBase], limit_ids: List[str], burst: int):
+    pool_limit, time_interval = burst // 4, 0.5
+    throttler = throttler_class(rate_limits=_rate_limits(limit_ids, pool_limit, time_interval), safety_margin_pct=0)
+    # the "rate limit almost reached" warnings notify the client application, which is not running here
+    AsyncRequestContextBase._last_max_cap_warning_ts = throttler._last_max_cap_warning_ts = float("inf")
+
+    async def run(i: int):
+        async with throttler.execute_task(limit_id=limit_ids[i % len(limit_ids)]):
+            pass
+
+    started, cpu_started = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(run(i) for i in range(burst)))
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+    earliest = (burst - 1) // pool_limit * time_interval
+    print(f"{throttler_class.__name__:>27} saturated, {burst} tasks: last one {(elapsed - earliest) * 1e3:6.1f} ms "
+          f"late, {cpu:5.2f} s CPU")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit-ids", type=int, default=24)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--backlog", type=int, default=500, help="tasks already in the time window")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1, 20])
+    parser.add_argument("--burst", type=int, default=200)
+    args = parser.parse_args()
+
+    limit_ids = [f"/endpoint_{i}" for i in range(args.limit_ids)]
+    for throttler_class in (AsyncThrottler, AsyncSlidingWindowThrottler):
+        for tasks in args.tasks:
+            asyncio.run(within_limits(throttler_class, limit_ids, args.requests, tasks, args.backlog))
+        asyncio.run(saturated(throttler_class, limit_ids, args.burst))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Diff throughput of OrderBookTracker, routing through a queue and a task per trading pair or through sharded consumers
+
+Usage:
+
+```
+$ python -m test.debug.benchmark_order_book_tracker --pairs 300 --diffs 200 --shards 1 4
+
+```
+
+A producer task plays the data source: it puts the diffs of every trading pair, round robin, into the output queue
+the tracker hands to `listen_for_order_book_diffs`, yielding to the event loop every `--burst` diffs the way a
+websocket reader does between frames. Each run reports the diffs applied per second until the last one is applied:
+
+* `per-pair`: `_order_book_diff_router` forwarding every diff to the queue of `_track_single_book` of its pair;
+* `shards=N`: N `_order_book_shard_consumer` tasks applying the diffs of their pairs as they read them.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class _SnapshotDataSource:
+    SEQUENCED_ORDER_BOOK_DIFFS = True
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(bids=[], asks=[], update_id=0)
+        return order_book
+
+
+def _diffs(trading_pairs: List[str], diffs_per_pair: int, seed: int) -> List[OrderBookMessage]:
+    rng = random.Random(seed)
+    messages = []
+    for update_id in range(1, diffs_per_pair + 1):
+        for trading_pair in trading_pairs:
+            price = 100 + rng.randint(-20, 20) * 0.01
+            side, other_side = ("bids", "asks") if price < 100 else ("asks", "bids")
+            messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair,
+                "first_update_id": update_id,
+                "update_id": update_id,
+                side: [[price, rng.choice((0.0, 1.0, 2.5))]],
+                other_side: [],
+            }, timestamp=update_id))
+    return messages
+
+
+async def bench(trading_pairs: List[str], messages: List[OrderBookMessage], shards: int, burst: int):
+    tracker = OrderBookTracker(data_source=_SnapshotDataSource(), trading_pairs=trading_pairs,
+                               order_book_shards=shards or None)
+    if shards:
+        output = tracker._start_order_book_shards()
+    else:
+        output = tracker._order_book_diff_stream
+        tracker._order_book_diff_router_task = asyncio.ensure_future(tracker._order_book_diff_router())
+    await tracker._init_order_books()
+    last_update_id = messages[-1].update_id
+
+    started = time.perf_counter()
+    for i, message in enumerate(messages):
+        output.put_nowait(message)
+        if i % burst == burst - 1:
+            await asyncio.sleep(0)
+    while any(order_book.last_diff_uid < last_update_id for order_book in tracker.order_books.values()):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    name = f"shards={shards}" if shards else "per-pair"
+    print(f"{name:>10}: {len(messages) / elapsed:10.0f} diffs/s   {elapsed:6.2f} s")
+    tracker.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=300)
+    parser.add_argument("--diffs", type=int, default=200, help="diffs per trading pair")
+    parser.add_argument("--burst", type=int, default=20, help="diffs put into the queue between two yields")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    trading_pairs = [f"COIN{i}-USDT" for i in range(args.pairs)]
+    messages = _diffs(trading_pairs, args.diffs, args.seed)
+    for shards in [0] + args.shards:
+        asyncio.run(bench(trading_pairs, messages, shards, args.burst))
+
+
+if __name__ == "__main__":
+    main()
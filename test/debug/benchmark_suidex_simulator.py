@@ -0,0 +1,149 @@
+"""
+Throughput and latency of the Suidex order path, against the in-process Deep Book
+
+Usage:
+
+```
+$ python -m test.debug.benchmark_suidex_simulator --orders 5000 --concurrency 50
+
+```
+
+Three measurements, from the matching engine up to the full asynchronous stack:
+
+* `engine`: `DeepbookSimulator.place_limit_order` / `cancel_order` called in a loop;
+* `async`: the same calls through `AsyncDeepbookConnector` (thread pool hand-off per call);
+* `batched`: placements and cancels of resting orders issued by `--concurrency` concurrent tasks through
+  `SuidexOrderBatcher`, with `DeepbookEventStream` following the pool events as the data source does.
+
+Makers rest orders on a ladder around the mid price and, in the first two runs, a taker crosses the spread every
+tenth order, so the book holds a realistic number of levels and the matching loop is exercised.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from hummingbot.connector.exchange.suidex.libsui import deepbook
+from hummingbot.connector.exchange.suidex.libsui.async_deepbook import AsyncDeepbookConnector
+from hummingbot.connector.exchange.suidex.libsui.event_stream import DeepbookEventStream
+from hummingbot.connector.exchange.suidex.libsui.simulator import DeepbookSimulator
+from hummingbot.connector.exchange.suidex.suidex_order_batcher import SuidexOrderBatcher
+
+MID_PRICE = 1_000_000_000
+LEVELS = 50
+QUANTITY = 1_000_000
+DEPOSIT = 10**18
+
+
+def _simulator(rng: random.Random, takers: bool = True):
+    simulator = DeepbookSimulator()
+    tick_size = simulator.pool().pool.tick_size
+    maker = simulator.create_account()
+    for account_cap in (simulator.account_cap, maker):
+        simulator.deposit_base(DEPOSIT, account_cap=account_cap)
+        simulator.deposit_quote(DEPOSIT, account_cap=account_cap)
+
+    def order(i: int):
+        """a resting order on the ladder, or every tenth order a taker crossing the spread"""
+        if takers and i % 10 == 9:
+            return dict(price=MID_PRICE + LEVELS * tick_size, quantity=QUANTITY, restriction=deepbook.IMMEDIATE_OR_CANCEL)
+        is_bid = rng.random() < 0.5
+        distance = rng.randint(1, LEVELS) * tick_size
+        return dict(
+            price=MID_PRICE - distance if is_bid else MID_PRICE + distance,
+            quantity=QUANTITY if is_bid else -QUANTITY,
+            restriction=deepbook.NO_RESTRICTION,
+        )
+
+    return simulator, maker, order
+
+
+def _report(name: str, started: float, latencies: List[float]):
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if len(latencies) >= 100 else latencies[-1]
+    print(
+        f"{name:>8}: {len(latencies) / elapsed:10.0f} calls/s   "
+        f"p50 {statistics.median(latencies) * 1e6:8.1f} us   p99 {p99 * 1e6:8.1f} us"
+    )
+
+
+def bench_engine(orders: int, seed: int):
+    simulator, maker, order = _simulator(random.Random(seed))
+    latencies, resting = [], []
+    started = time.perf_counter()
+    for i in range(orders):
+        begin = time.perf_counter()
+        if resting and i % 4 == 3:
+            simulator.cancel_order(resting.pop(0), account_cap=maker)
+        else:
+            _, _, pool_order_id, _ = simulator.place_limit_order(account_cap=maker, **order(i))
+            if pool_order_id is not None:
+                resting.append(pool_order_id)
+        latencies.append(time.perf_counter() - begin)
+    _report("engine", started, latencies)
+
+
+async def bench_async(orders: int, seed: int):
+    simulator, maker, order = _simulator(random.Random(seed))
+    chain_executor = AsyncDeepbookConnector(connector=simulator)
+    latencies = []
+    started = time.perf_counter()
+    for i in range(orders):
+        begin = time.perf_counter()
+        await chain_executor.place_limit_order(account_cap=maker, **order(i))
+        latencies.append(time.perf_counter() - begin)
+    _report("async", started, latencies)
+    chain_executor.close()
+
+
+async def bench_batched(orders: int, concurrency: int, seed: int):
+    # every order comes from the one account of the batcher: a taker would cancel its own makers (self-matching)
+    # and make the later cancels of those abort, so this run only rests orders, bids below and asks above the mid
+    simulator, _, order = _simulator(random.Random(seed), takers=False)
+    chain_executor = AsyncDeepbookConnector(connector=simulator)
+    batcher = SuidexOrderBatcher(chain_executor=chain_executor)
+    stream = DeepbookEventStream(chain_executor=chain_executor, poll_interval=0.001)
+    stream_events = []
+    listening = asyncio.create_task(stream.listen(events_handler=stream_events.append))
+    latencies = []
+    client_order_ids = iter(range(1, orders + 1))
+
+    async def trader(count: int):
+        for _ in range(count):
+            i = next(client_order_ids)
+            begin = time.perf_counter()
+            success, pool_order_id, _ = await batcher.place_order(client_order_id=i, **order(i))
+            if success and pool_order_id is not None and i % 4 == 3:
+                await batcher.cancel_order(order_id=int(pool_order_id))
+            latencies.append(time.perf_counter() - begin)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(trader(orders // concurrency) for _ in range(concurrency)))
+    _report("batched", started, latencies)
+
+    emitted = len(simulator.query_events(None, limit=10**9)[0])
+    while len(stream_events) + 4 < emitted:  # the deposits precede the cursor the stream starts from
+        await asyncio.sleep(0.01)
+    listening.cancel()
+    print(f"{'events':>8}: {len(stream_events)} delivered by the event stream")
+    chain_executor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    bench_engine(args.orders, args.seed)
+    asyncio.run(bench_async(args.orders, args.seed))
+    asyncio.run(bench_batched(args.orders, args.concurrency, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -91,6 +91,10 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ global_token_name               | USDT                 |\n"
                            "    | ∟ global_token_symbol             | $                    |\n"
                            "    | rate_limits_share_pct             | 100                  |\n"
+                           "    | rate_limits_shared                | False                |\n"
+                           "    | order_book_max_depth              | 0                    |\n"
+                           "    | order_book_coalesce_diffs         | False                |\n"
+                           "    | order_book_warm_restart           | False                |\n"
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
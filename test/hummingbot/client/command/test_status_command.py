@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.web_assistant.connections.connection_pool_metrics import ConnectionPoolMetrics
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +76,25 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_strategy_status_reports_the_connection_pools(self):
+        pool_metrics = ConnectionPoolMetrics()
+        host_metrics = pool_metrics.host("api.binance.com")
+        host_metrics.in_flight = 3
+        host_metrics.waiting = 1
+        host_metrics.connections_created = 2
+        host_metrics.connections_reused = 40
+        host_metrics.handshake_time = 0.1
+        host_metrics.max_handshake_time = 0.06
+        market = MagicMock(spec=ExchangePyBase)
+        market.display_name = "binance"
+        market.connection_pool_metrics = pool_metrics
+        self.app.markets = {"binance": market, "binance_paper_trade": MagicMock()}
+        self.app.strategy = MagicMock()
+        self.app.strategy.format_status.return_value = "Strategy status"
+
+        status = self.async_run_with_timeout(self.app.strategy_status())
+
+        self.assertIn("Strategy status\n\n  Connection pools:\n", status)
+        self.assertEqual(["binance", "api.binance.com", "3", "1", "2", "40", "50.0", "60.0"],
+                         status.split("\n")[-1].split())
@@ -1,6 +1,8 @@
 import asyncio
 import json
+import os
 import re
+import time
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, patch
@@ -8,6 +10,7 @@ from unittest.mock import AsyncMock, patch
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 
+from hummingbot import data_path
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
@@ -15,6 +18,9 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.api_throttler.async_shared_throttler import AsyncSharedThrottler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RequestPriority, TaskLog
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
@@ -1227,6 +1233,68 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
         self.assertEqual(result[0].min_notional_size, Decimal("10"))
 
+    def test_cancel_goes_ahead_of_a_queued_poll_when_the_request_weight_is_busy(self):
+        throttler = self.exchange._create_throttler(ClientConfigAdapter(ClientConfigMap()))
+        request_weight = next(limit for limit in CONSTANTS.RATE_LIMITS if limit.limit_id == CONSTANTS.REQUEST_WEIGHT)
+        # the polls can use 80% of the weight, the cancels all of it
+        throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=request_weight, weight=4790))
+        started = []
+
+        async def request(limit_id: str, priority: Optional[RequestPriority] = None):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                started.append(limit_id)
+
+        async def poll_then_cancel():
+            poll = asyncio.ensure_future(request(CONSTANTS.ACCOUNTS_PATH_URL))
+            await asyncio.sleep(0.05)
+            await request(CONSTANTS.ORDER_PATH_URL, priority=RequestPriority.CANCEL)
+            self.assertFalse(poll.done())
+            poll.cancel()
+
+        self.async_run_with_timeout(poll_then_cancel())
+
+        self.assertEqual([CONSTANTS.ORDER_PATH_URL], started)
+
+    def test_shared_rate_limits_setting_creates_a_throttler_on_the_shared_budget(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rate_limits_shared = True
+
+        throttler = self.exchange._create_throttler(client_config_map)
+        throttler.budget.close()
+
+        self.assertIsInstance(throttler, AsyncSharedThrottler)
+        self.assertTrue(throttler.budget.path.endswith(f"{self.exchange.name}.budget"))
+        self.assertIsInstance(self.exchange._throttler, AsyncThrottler)
+
+    def test_order_book_diffs_coalescing_setting_configures_the_tracker(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_coalesce_diffs = True
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertTrue(exchange.order_book_tracker.coalesce_diffs)
+        self.assertFalse(self.exchange.order_book_tracker.coalesce_diffs)
+
+    def test_order_book_warm_restart_setting_gives_the_tracker_a_store(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_warm_restart = True
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertEqual(os.path.join(data_path(), "order_books", exchange.name),
+                         exchange.order_book_tracker.order_book_store.path)
+        self.assertIsNone(self.exchange.order_book_tracker.order_book_store)
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
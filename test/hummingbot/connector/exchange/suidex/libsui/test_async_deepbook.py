@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from hummingbot.connector.exchange.suidex.libsui.async_deepbook import AsyncDeepbookConnector
+
+
+class BlockingDeepbookConnector:
+    """stands in for DeepbookConnector: every call blocks the calling thread like a pysui SyncTransaction"""
+
+    account_cap = "0xcap"
+    pool_object_id = "0xpool"
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calling_threads = []
+
+    def _block(self):
+        self.calling_threads.append(threading.get_ident())
+        time.sleep(self.delay)
+
+    def place_limit_order(self, price, quantity, is_bid=None, client_order_id=None, **kwargs):
+        self._block()
+        return True, client_order_id, "42", None
+
+    def cancel_order(self, order_id, account_cap=None):
+        self._block()
+        return True, {"order_id": order_id}
+
+    def account_balance(self, **kwargs):
+        self._block()
+        return 1, 2, 3, 4
+
+    def get_level2_book_status(self, side, price_low=0, price_high=10**12):
+        self._block()
+        return [100, 200], [5, 6]
+
+
+class AsyncDeepbookConnectorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.sync_connector = BlockingDeepbookConnector()
+        self.connector = AsyncDeepbookConnector(connector=self.sync_connector, max_workers=4)
+
+    def tearDown(self) -> None:
+        self.connector.close()
+        super().tearDown()
+
+    def test_calls_are_forwarded(self):
+        async def run():
+            placed = await self.connector.place_limit_order(price=10, quantity=20, is_bid=True, client_order_id=7)
+            canceled = await self.connector.cancel_order(order_id=42)
+            balance = await self.connector.account_balance()
+            book = await self.connector.get_level2_book_status("bid", price_low=100, price_high=200)
+            return placed, canceled, balance, book
+
+        placed, canceled, balance, book = asyncio.run(run())
+
+        self.assertEqual((True, 7, "42", None), placed)
+        self.assertEqual((True, {"order_id": 42}), canceled)
+        self.assertEqual((1, 2, 3, 4), balance)
+        self.assertEqual(([100, 200], [5, 6]), book)
+        self.assertEqual("0xcap", self.connector.account_cap)
+        self.assertEqual("0xpool", self.connector.pool_object_id)
+
+    def test_chain_calls_do_not_block_the_event_loop(self):
+        loop_thread = []
+        ticks = []
+
+        async def ticker():
+            loop_thread.append(threading.get_ident())
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker_task = asyncio.ensure_future(ticker())
+            await asyncio.gather(*[self.connector.cancel_order(order_id=i) for i in range(4)])
+            ticker_task.cancel()
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        self.assertNotIn(loop_thread[0], self.sync_connector.calling_threads)
+        # the four blocking calls ran concurrently and the loop kept ticking while they were in flight
+        self.assertLess(elapsed, 4 * self.sync_connector.delay)
+        self.assertGreater(len(ticks), 5)
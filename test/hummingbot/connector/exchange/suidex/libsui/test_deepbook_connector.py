@@ -5,3 +5,135 @@ from hummingbot.connector.exchange.suidex import libsui
 
 def test_place_limit_order():
     return 1
+
+
+def test_canceled_order_ids_from_cancel_events():
+    from hummingbot.connector.exchange.suidex.libsui import deepbook
+
+    tx_result_json = {
+        "events": [
+            {"type": "0xdee9::clob_v2::OrderCanceled<0x2::sui::SUI, 0xabc::realusdc::REALUSDC>",
+             "parsedJson": {"order_id": "7"}},
+            {"type": "0xdee9::clob_v2::AllOrdersCanceled<0x2::sui::SUI, 0xabc::realusdc::REALUSDC>",
+             "parsedJson": {"orders_canceled": [{"order_id": "8"}, {"order_id": "9"}]}},
+            {"type": "0xdee9::clob_v2::OrderPlaced<0x2::sui::SUI, 0xabc::realusdc::REALUSDC>",
+             "parsedJson": {"order_id": "10"}},
+        ]
+    }
+
+    assert deepbook._canceled_order_ids(tx_result_json) == {"7", "8", "9"}
+    assert deepbook._canceled_order_ids(None) == set()
+
+
+def test_default_expire_timestamp_is_epoch_milliseconds_whatever_the_timezone():
+    import os
+    import time
+
+    from hummingbot.connector.exchange.suidex.libsui import deepbook
+
+    previous_tz = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    try:
+        now_ms = int(time.time() * 1000)
+        expire_timestamp = deepbook._default_expire_timestamp(ttl_ms=60_000)
+    finally:
+        if previous_tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = previous_tz
+        time.tzset()
+
+    assert now_ms + 60_000 <= expire_timestamp < now_ms + 61_000
+
+
+def _order_bcs(order_id, client_order_id, price, original_quantity, quantity, is_bid, owner, expire_timestamp):
+    return list(
+        b"".join(value.to_bytes(8, "little") for value in (order_id, client_order_id, price, original_quantity, quantity))
+        + bytes([is_bid]) + bytes.fromhex(owner[2:]) + expire_timestamp.to_bytes(8, "little") + bytes([0])
+    )
+
+
+def test_decode_order():
+    owner = "0x" + "ab" * 32
+
+    order = libsui.decode_order(_order_bcs(7, 42, 1_500_000, 2_000, 1_000, True, owner, 1_700_000_000_000))
+
+    assert order == {
+        "order_id": 7, "client_order_id": 42, "price": 1_500_000, "original_quantity": 2_000, "quantity": 1_000,
+        "is_bid": True, "owner": owner, "expire_timestamp": 1_700_000_000_000, "self_matching_prevention": 0,
+    }
+
+
+def _connector_inspecting(inspection):
+    from unittest.mock import MagicMock, patch
+
+    from hummingbot.connector.exchange.suidex.libsui import deepbook
+    from test.hummingbot.connector.exchange.suidex.libsui.test_object_cache import (
+        ACCOUNT_CAP,
+        POOL_OBJECT_ID,
+        FakeSuiClient,
+    )
+
+    connector = deepbook.DeepbookConnector(
+        client=FakeSuiClient(), cfg=MagicMock(), net="localnet", package_id="0xdee9", pool_object_id=POOL_OBJECT_ID,
+        account_cap=ACCOUNT_CAP, gas_coin_pool_size=1,
+    )
+    connector.pools = MagicMock(pool_by_id=MagicMock(return_value=None))
+    txn = MagicMock()
+    txn.inspect_all.return_value = inspection
+    return connector, patch.object(deepbook, "SyncTransaction", return_value=txn), txn
+
+
+def test_get_order_status_reads_the_order_without_executing_a_transaction():
+    from unittest.mock import patch
+
+    from pysui.sui.sui_txresults.complex_tx import TxInspectionResult
+
+    from hummingbot.connector.exchange.suidex.libsui import deepbook
+
+    owner = "0x" + "cd" * 32
+    raw = _order_bcs(2**63 + 5, 42, 1_500_000, 2_000, 500, False, owner, 1_700_000_000_000)
+    inspection = TxInspectionResult(effects=None, events=[], results=[{"returnValues": [[raw, "0xdee9::clob_v2::Order"]]}])
+    connector, sync_transaction, txn = _connector_inspecting(inspection)
+
+    with sync_transaction, patch.object(deepbook.libsui, "execute_and_handle_result") as execute:
+        order = connector.get_order_status(2**63 + 5)
+
+    execute.assert_not_called()
+    assert txn.move_call.call_args.kwargs["target"] == "0xdee9::clob_v2::get_order_status"
+    assert order == deepbook.DeepbookOrder(
+        order_id=2**63 + 5, client_order_id=42, price=1_500_000, original_quantity=2_000, quantity=500, is_bid=False,
+        owner=owner, expire_timestamp=1_700_000_000_000, self_matching_prevention=0,
+    )
+
+
+def test_get_order_status_of_an_order_no_longer_open_is_none():
+    from pysui.sui.sui_txresults.complex_tx import TxInspectionResult
+
+    error = "MoveAbort(MoveLocation { module: ModuleId { name: Identifier(\"clob_v2\") } }, 3) in command 0"
+    connector, sync_transaction, _ = _connector_inspecting(
+        TxInspectionResult(effects=None, events=[], results=None, error=error)
+    )
+
+    with sync_transaction:
+        assert connector.get_order_status(5) is None
+
+
+def test_account_balance_takes_the_coin_types_of_the_pool():
+    from unittest.mock import MagicMock, patch
+
+    from test.hummingbot.connector.exchange.suidex.libsui.test_object_cache import POOL_OBJECT_ID
+
+    connector, sync_transaction, txn = _connector_inspecting(None)
+    connector.pool_object_id = "0xsui_pool"
+    weth_types = ["0xdee9::weth::WETH", "0xdee9::realusdc::REALUSDC"]
+    connector.pools.pool_by_id.return_value = MagicMock(type_arguments=weth_types)
+    txn.move_call.return_value = [MagicMock(value=(value, "u64")) for value in (1, 2, 3, 4)]
+
+    with sync_transaction, patch.object(connector, "_execute", return_value=(True, {}, None)):
+        balance = connector.account_balance(pool_object_id=POOL_OBJECT_ID)
+
+    assert balance == (1, 2, 3, 4)
+    connector.pools.pool_by_id.assert_called_with(POOL_OBJECT_ID)
+    assert txn.move_call.call_args.kwargs["type_arguments"] == weth_types
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Dict, List
+
+from hummingbot.connector.exchange.suidex.libsui.event_stream import DeepbookEventStream
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+
+class FakeEventsExecutor:
+    def __init__(self):
+        self.events: List[Dict] = []
+        self.queries = 0
+
+    def emit(self, timestamp_ms: int):
+        self.events.append({"id": {"txDigest": f"tx{len(self.events)}", "eventSeq": "0"},
+                            "timestampMs": str(timestamp_ms)})
+
+    async def latest_event_cursor(self):
+        return self.events[-1]["id"] if self.events else None
+
+    async def query_events(self, cursor=None):
+        self.queries += 1
+        start = 0 if cursor is None else next(i for i, e in enumerate(self.events) if e["id"] == cursor) + 1
+        page = self.events[start:start + 2]
+        return page, page[-1]["id"] if page else None, start + 2 < len(self.events)
+
+
+class DeepbookEventStreamTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.executor = FakeEventsExecutor()
+        self.stream = DeepbookEventStream(chain_executor=self.executor, poll_interval=0.01)
+        self.delivered = []
+
+    async def _listen_until(self, queries: int):
+        task = asyncio.ensure_future(self.stream.listen(self.delivered.append))
+        for _ in range(100):
+            if self.executor.queries >= queries:
+                break
+            await asyncio.sleep(0.01)
+        return task
+
+    async def test_events_before_the_stream_starts_are_not_delivered(self):
+        self.executor.emit(1_000)
+        self.executor.emit(2_000)
+
+        task = await self._listen_until(queries=1)
+        self.executor.emit(3_000)
+        await self._listen_until_delivered(task, 1)
+
+        self.assertEqual(["3000"], [e["timestampMs"] for e in self.delivered])
+        self.assertEqual(3.0, self.stream.last_event_timestamp)
+
+    async def test_first_events_of_an_empty_history_are_all_delivered(self):
+        task = await self._listen_until(queries=2)
+        self.assertIsNone(self.stream.cursor)
+
+        self.executor.emit(1_000)
+        self.executor.emit(2_000)
+        self.executor.emit(3_000)
+        await self._listen_until_delivered(task, 3)
+
+        self.assertEqual(["1000", "2000", "3000"], [e["timestampMs"] for e in self.delivered])
+        self.assertEqual(self.executor.events[-1]["id"], self.stream.cursor)
+
+    async def _listen_until_delivered(self, task: asyncio.Task, events: int):
+        for _ in range(100):
+            if len(self.delivered) >= events:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.03)
+        task.cancel()
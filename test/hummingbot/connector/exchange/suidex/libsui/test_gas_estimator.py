@@ -0,0 +1,107 @@
+import unittest
+from types import SimpleNamespace
+
+from pysui import SuiRpcResult
+
+from hummingbot.connector.exchange.suidex.libsui import DEFAULT_GAS_BUDGET
+from hummingbot.connector.exchange.suidex.libsui.gas_estimator import MIN_BUDGET_GAS_UNITS, GasEstimator
+
+
+class FakeGasPriceClient:
+    """serves the reference gas price, counting the reads"""
+
+    def __init__(self, gas_price=750):
+        self.gas_price = gas_price
+        self.price_reads = 0
+
+    def execute(self, builder):
+        self.price_reads += 1
+        return SuiRpcResult(True, "", str(self.gas_price))
+
+
+class FakeTransaction:
+    """inspects as a transaction using `gas_used` MIST, counting the inspections"""
+
+    def __init__(self, gas_used, succeeded=True):
+        self.gas_used = gas_used
+        self.succeeded = succeeded
+        self.gas_price = None
+        self.inspections = 0
+
+    def inspect_all(self):
+        self.inspections += 1
+        return SimpleNamespace(
+            effects=SimpleNamespace(
+                status=SimpleNamespace(succeeded=self.succeeded),
+                gas_used=SimpleNamespace(total=self.gas_used),
+            )
+        )
+
+
+def _effects(computation_cost, storage_cost=0, error=None):
+    status = {"status": "success"} if error is None else {"status": "failure", "error": error}
+    return {
+        "effects": {
+            "status": status,
+            "gasUsed": {
+                "computationCost": str(computation_cost),
+                "storageCost": str(storage_cost),
+                "storageRebate": "0",
+                "nonRefundableStorageFee": "0",
+            },
+        }
+    }
+
+
+class GasEstimatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = FakeGasPriceClient()
+        self.estimator = GasEstimator(self.client, safety_margin=0.5, price_refresh_interval=60)
+        self.now = 100.0
+        self.estimator._time = lambda: self.now
+
+    def test_each_shape_is_inspected_once(self):
+        txn = FakeTransaction(gas_used=4_000_000)
+
+        budgets = [self.estimator.budget(("place_limit_order",), txn) for _ in range(3)]
+        self.estimator.budget(("execute_batch", 1, 2), FakeTransaction(gas_used=8_000_000))
+
+        self.assertEqual([6_000_000] * 3, budgets)
+        self.assertEqual(1, txn.inspections)
+        self.assertEqual(750, txn.gas_price)
+        self.assertEqual(12_000_000, self.estimator.budget(("execute_batch", 1, 2), txn))
+        self.assertEqual(1, self.client.price_reads)
+
+    def test_a_new_reference_gas_price_drops_the_budgets(self):
+        self.estimator.budget(("cancel_order",), FakeTransaction(gas_used=2_000_000))
+        self.client.gas_price = 1_000
+
+        self.now += 30
+        self.assertEqual(3_000_000, self.estimator.budget(("cancel_order",), FakeTransaction(gas_used=0)))
+        self.now += 31
+        txn = FakeTransaction(gas_used=2_600_000)
+        self.assertEqual(3_900_000, self.estimator.budget(("cancel_order",), txn))
+        self.assertEqual((1, 1_000), (txn.inspections, txn.gas_price))
+        self.assertEqual(2, self.client.price_reads)
+
+    def test_budgets_follow_the_executed_transactions(self):
+        shape = ("cancel_all_orders",)
+        self.estimator.budget(shape, FakeTransaction(gas_used=2_000_000))
+
+        self.estimator.observe(shape, _effects(computation_cost=1_000_000))
+        self.assertEqual(3_000_000, self.estimator.budget(shape, FakeTransaction(gas_used=0)))
+        self.estimator.observe(shape, _effects(computation_cost=3_000_000, storage_cost=1_000_000))
+        self.assertEqual(6_000_000, self.estimator.budget(shape, FakeTransaction(gas_used=0)))
+
+        self.estimator.observe(shape, _effects(computation_cost=6_000_000, error="InsufficientGas"))
+        txn = FakeTransaction(gas_used=5_000_000)
+        self.assertEqual(7_500_000, self.estimator.budget(shape, txn))
+        self.assertEqual(1, txn.inspections)
+
+    def test_failed_inspections_fall_back_to_the_default_budget(self):
+        txn = FakeTransaction(gas_used=1_000_000, succeeded=False)
+
+        self.assertEqual(DEFAULT_GAS_BUDGET, self.estimator.budget(("place_limit_order",), txn))
+        self.assertEqual(DEFAULT_GAS_BUDGET, self.estimator.budget(("place_limit_order",), txn))
+        self.assertEqual(2, txn.inspections)
+        self.assertEqual(MIN_BUDGET_GAS_UNITS * 750, self.estimator.budget(("noop",), FakeTransaction(gas_used=10)))
@@ -0,0 +1,42 @@
+import unittest
+
+from hummingbot.connector.exchange.suidex.libsui.level2_book import Level2Book
+
+
+class Level2BookTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.book = Level2Book()
+        self.book.apply_snapshot(bids=([100, 99, 90], [5, 6, 7]), asks=([101, 110], [3, 4]), update_id=1000)
+
+    def test_changes_are_ignored_until_the_first_snapshot(self):
+        book = Level2Book()
+
+        self.assertTrue(book.needs_snapshot)
+        self.assertIsNone(book.apply_change(is_bid=True, price=100, quantity_change=1, update_id=1))
+        self.assertEqual(0, book.gaps)
+
+    def test_changes_update_levels_after_the_snapshot(self):
+        self.assertIsNone(self.book.apply_change(is_bid=True, price=100, quantity_change=1, update_id=1000))
+        self.assertEqual(6, self.book.apply_change(is_bid=True, price=100, quantity_change=1, update_id=1001))
+        self.assertEqual(0, self.book.apply_change(is_bid=False, price=101, quantity_change=-3, update_id=1002))
+        self.assertEqual(2, self.book.apply_change(is_bid=False, price=105, quantity_change=2, update_id=1003))
+
+        self.assertEqual([(100, 6), (99, 6), (90, 7)], self.book.levels(is_bid=True))
+        self.assertEqual([(105, 2), (110, 4)], self.book.levels(is_bid=False))
+        self.assertEqual(1003, self.book.update_id)
+
+    def test_removing_more_than_a_level_holds_is_a_gap(self):
+        self.assertIsNone(self.book.apply_change(is_bid=True, price=99, quantity_change=-7, update_id=1001))
+
+        self.assertTrue(self.book.needs_snapshot)
+        self.assertEqual(1, self.book.gaps)
+
+    def test_window_refresh_replaces_only_the_levels_inside_the_window(self):
+        self.assertEqual((98, 103), self.book.touch_window(width=0.02))
+
+        changes = self.book.apply_window(True, 98, 103, window=([100], [8]))
+
+        self.assertEqual(sorted([(99, 0), (100, 8)]), sorted(changes))
+        self.assertEqual([(100, 8), (90, 7)], self.book.levels(is_bid=True))
+        self.assertEqual(1000, self.book.update_id)
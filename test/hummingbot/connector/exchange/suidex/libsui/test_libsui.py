@@ -56,3 +56,67 @@ class LibSuiTestCases(DexTestCase):
 
     def test_more_tests_here(self):
         return "change me"
+
+
+OWNER = "0x" + "ab" * 32
+
+
+class FakeOwnedObjectsClient:
+    """serves owned objects one page at a time, filtered by struct type like a full node"""
+
+    def __init__(self, objects, page_size=2):
+        from unittest.mock import MagicMock
+
+        self.config = MagicMock(active_address=OWNER)
+        self.objects = objects
+        self.page_size = page_size
+        self.queries = []
+
+    def execute(self, builder):
+        from pysui import SuiRpcResult
+        from pysui.sui.sui_txresults.single_tx import ObjectReadPage
+
+        struct_type = builder.query.map["filter"]["StructType"]
+        cursor = None if builder.cursor is None or builder.cursor.value is None else builder.cursor.value
+        self.queries.append((struct_type, cursor))
+        matching = [o for o in self.objects if o["type"].split("<")[0] == struct_type]
+        start = 0 if cursor is None else [o["objectId"] for o in matching].index(cursor) + 1
+        data = matching[start:start + self.page_size]
+        page = ObjectReadPage.from_dict({
+            "data": [{"data": o} for o in data],
+            "hasNextPage": start + self.page_size < len(matching),
+            "nextCursor": data[-1]["objectId"] if data else None,
+        })
+        return SuiRpcResult(True, "", page)
+
+
+class FindObjectsTestCases(unittest.TestCase):
+    ACCOUNT_CAP_TYPE = "0xdee9::clob_v2::AccountCap"
+
+    def setUp(self) -> None:
+        from hummingbot.connector.exchange.suidex import libsui
+
+        self.libsui = libsui
+        self.libsui._objects_cache.clear()
+        owner = {"AddressOwner": OWNER}
+        self.client = FakeOwnedObjectsClient(
+            [{"objectId": f"0xcoin{i}", "version": "1", "digest": "d", "type": "0x2::coin::Coin<0x2::sui::SUI>",
+              "owner": owner} for i in range(100)]
+            + [{"objectId": f"0xcap{i}", "version": str(version), "digest": "d", "type": self.ACCOUNT_CAP_TYPE,
+                "owner": owner} for i, version in enumerate((12, 3, 7))]
+        )
+
+    def test_objects_are_filtered_by_the_node_and_paged(self):
+        objects = self.libsui.find_objects(self.client, self.ACCOUNT_CAP_TYPE)
+
+        self.assertEqual(["0xcap1", "0xcap2", "0xcap0"], [o["objectId"] for o in objects])
+        self.assertEqual([(self.ACCOUNT_CAP_TYPE, None), (self.ACCOUNT_CAP_TYPE, "0xcap1")], self.client.queries)
+
+    def test_results_are_cached_per_owner_and_type(self):
+        self.libsui.find_objects(self.client, self.ACCOUNT_CAP_TYPE)
+        self.libsui.find_objects(self.client, self.ACCOUNT_CAP_TYPE)
+        self.assertEqual(2, len(self.client.queries))
+
+        self.libsui.invalidate_objects(OWNER, self.ACCOUNT_CAP_TYPE)
+        self.libsui.find_objects(self.client, self.ACCOUNT_CAP_TYPE)
+        self.assertEqual(4, len(self.client.queries))
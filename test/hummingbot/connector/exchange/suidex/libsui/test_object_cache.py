@@ -0,0 +1,153 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pysui import SuiRpcResult
+from pysui.sui.sui_txresults.single_tx import ObjectRead, SuiCoinObjects
+
+from hummingbot.connector.exchange.suidex.libsui import deepbook
+from hummingbot.connector.exchange.suidex.libsui.object_cache import GasCoinPool, ObjectRefCache
+
+ACCOUNT_CAP = "0xcap"
+POOL_OBJECT_ID = "0xpool"
+
+
+class FakeSuiClient:
+    """serves object reads and gas coins from memory, counting the lookups"""
+
+    def __init__(self, coin_balances=(10**9, 10**9)):
+        self.object_lookups = []
+        self.coins = {f"0xcoin{i}": balance for i, balance in enumerate(coin_balances)}
+        self.config = MagicMock(active_address="0xme")
+        self._objects = {
+            POOL_OBJECT_ID: {"version": "4", "digest": "pool", "owner": {"Shared": {"initial_shared_version": 2}}},
+            deepbook.CLOCK_OBJECT_ID: {"version": "9", "digest": "clock", "owner": {"Shared": {"initial_shared_version": 1}}},
+            ACCOUNT_CAP: {"version": "7", "digest": "cap7", "owner": {"AddressOwner": "0xme"}},
+        }
+
+    def get_object(self, identifier):
+        object_id = identifier.value
+        self.object_lookups.append(object_id)
+        return SuiRpcResult(True, "", ObjectRead.from_dict(dict(objectId=object_id, **self._objects[object_id])))
+
+    def get_gas(self, address=None):
+        coins = [
+            {"coinType": "0x2::sui::SUI", "coinObjectId": coin_id, "version": "1", "digest": "d", "balance": str(balance),
+             "previousTransaction": "t"}
+            for coin_id, balance in self.coins.items()
+        ]
+        return SuiRpcResult(True, "", SuiCoinObjects.from_dict({"data": coins, "nextCursor": None, "hasNextPage": False}))
+
+
+def _effects(mutated=(), deleted=()):
+    return {
+        "effects": {
+            "status": {"status": "success"},
+            "mutated": [
+                {"owner": {"AddressOwner": "0xme"}, "reference": {"objectId": object_id, "version": version, "digest": digest}}
+                for object_id, version, digest in mutated
+            ],
+            "deleted": [{"objectId": object_id, "version": 0, "digest": "gone"} for object_id in deleted],
+        }
+    }
+
+
+class ObjectRefCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = FakeSuiClient()
+        self.cache = ObjectRefCache(self.client)
+
+    def test_objects_are_looked_up_once(self):
+        for _ in range(3):
+            self.cache.get(POOL_OBJECT_ID)
+            self.cache.get(ACCOUNT_CAP)
+
+        self.assertEqual([POOL_OBJECT_ID, ACCOUNT_CAP], self.client.object_lookups)
+
+    def test_owned_objects_follow_transaction_effects(self):
+        self.cache.get(POOL_OBJECT_ID)
+        self.cache.get(ACCOUNT_CAP)
+
+        self.cache.update_from_effects(_effects(mutated=[(ACCOUNT_CAP, 8, "cap8"), (POOL_OBJECT_ID, 12, "pool12")]))
+
+        account_cap = self.cache.get(ACCOUNT_CAP)
+        self.assertEqual(("8", "cap8"), (account_cap.version, account_cap.digest))
+        # a shared object is referenced by its initial shared version, whatever its current one
+        self.assertEqual("4", self.cache.get(POOL_OBJECT_ID).version)
+        self.assertEqual(2, len(self.client.object_lookups))
+
+    def test_deleted_and_invalidated_objects_are_looked_up_again(self):
+        self.cache.get(POOL_OBJECT_ID)
+        self.cache.get(ACCOUNT_CAP)
+
+        self.cache.update_from_effects(_effects(deleted=[ACCOUNT_CAP]))
+        self.cache.get(ACCOUNT_CAP)
+        self.cache.invalidate_owned()
+        self.cache.get(ACCOUNT_CAP)
+        self.cache.get(POOL_OBJECT_ID)
+
+        self.assertEqual([POOL_OBJECT_ID, ACCOUNT_CAP, ACCOUNT_CAP, ACCOUNT_CAP], self.client.object_lookups)
+
+    def test_lease_serializes_transactions_on_an_owned_object(self):
+        holders = []
+
+        def transaction():
+            with self.cache.lease(ACCOUNT_CAP):
+                holders.append(threading.get_ident())
+                time.sleep(0.05)
+                holders.append(threading.get_ident())
+
+        threads = [threading.Thread(target=transaction) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # every transaction releases the object before the next one takes it
+        self.assertTrue(all(holders[i] == holders[i + 1] for i in range(0, len(holders), 2)))
+
+
+class GasCoinPoolTests(unittest.TestCase):
+    def test_each_transaction_holds_its_own_coin(self):
+        pool = GasCoinPool(FakeSuiClient(), size=2, coin_balance=10**8)
+
+        with pool.coin() as first, pool.coin() as second:
+            self.assertNotEqual(first, second)
+            with self.assertRaises(TimeoutError):
+                pool.acquire(timeout=0.01)
+        with pool.coin() as third:
+            self.assertIn(third, (first, second))
+
+    def test_missing_coins_are_split_off_the_gas_coin(self):
+        client = FakeSuiClient(coin_balances=(10**10, 10**3))
+        pool = GasCoinPool(client, size=3, coin_balance=10**8)
+
+        def split(count):
+            for i in range(count):
+                client.coins[f"0xsplit{i}"] = 10**8
+
+        with patch.object(pool, "_split_gas_coins", side_effect=split) as split_gas_coins:
+            pool.ensure()
+
+        split_gas_coins.assert_called_once_with(2)
+        self.assertEqual({"0xcoin0", "0xsplit0", "0xsplit1"}, set(pool.coin_ids))
+
+
+class DeepbookConnectorExecuteTests(unittest.TestCase):
+    def test_execute_pays_with_a_pooled_coin_and_applies_the_effects(self):
+        client = FakeSuiClient()
+        connector = deepbook.DeepbookConnector(
+            client=client, cfg=MagicMock(), net="localnet", package_id="0xdee9", pool_object_id=POOL_OBJECT_ID,
+            account_cap=ACCOUNT_CAP, gas_coin_pool_size=2,
+        )
+        connector._object(ACCOUNT_CAP)
+        tx_result_json = _effects(mutated=[(ACCOUNT_CAP, 8, "cap8")])
+
+        with patch.object(deepbook.libsui, "execute_and_handle_result", return_value=(True, tx_result_json, None)) as \
+                execute:
+            connector._execute(MagicMock())
+
+        self.assertIn(execute.call_args.kwargs["use_gas_object"], client.coins)
+        self.assertEqual("8", connector._object(ACCOUNT_CAP).version)
+        self.assertEqual(1, client.object_lookups.count(ACCOUNT_CAP))
@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pysui import SuiRpcResult
+from pysui.sui.sui_types.collections import EventID
+
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import PoolRegistry, normalize_type
+
+PACKAGE_ID = "0xdee9"
+REALUSDC = f"{PACKAGE_ID}::realusdc::REALUSDC"
+WETH = f"{PACKAGE_ID}::weth::WETH"
+
+
+def pool_created_event(pool_id, base_type, quote_type, tick_size=1_000_000, lot_size=100_000):
+    # Move `TypeName`s carry full-length addresses without the 0x prefix
+    def type_name(type_):
+        address, rest = type_.split("::", 1)
+        return {"name": f"{address[2:].rjust(64, '0')}::{rest}"}
+
+    return {
+        "id": {"txDigest": f"tx-{pool_id}", "eventSeq": "0"},
+        "parsedJson": {
+            "pool_id": pool_id,
+            "base_asset": type_name(base_type),
+            "quote_asset": type_name(quote_type),
+            "taker_fee_rate": "2500000",
+            "maker_rebate_rate": "1500000",
+            "tick_size": str(tick_size),
+            "lot_size": str(lot_size),
+        },
+    }
+
+
+class FakeEventsClient:
+    """serves `PoolCreated` events one page at a time, counting the queries"""
+
+    def __init__(self, events, page_size=2):
+        self.events = events
+        self.page_size = page_size
+        self.queries = []
+
+    def execute(self, builder):
+        cursor = next((param.map for param in builder.params if isinstance(param, EventID)), None)
+        self.queries.append(cursor)
+        ids = [event["id"] for event in self.events]
+        start = 0 if cursor is None else ids.index(cursor) + 1
+        data = self.events[start:start + self.page_size]
+        page = MagicMock()
+        page.to_dict.return_value = {
+            "data": data,
+            "nextCursor": data[-1]["id"] if data else None,
+            "hasNextPage": start + self.page_size < len(self.events),
+        }
+        return SuiRpcResult(True, "", page)
+
+
+class PoolRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = FakeEventsClient([
+            pool_created_event("0xp1", "0x2::sui::SUI", REALUSDC),
+            pool_created_event("0xp2", WETH, REALUSDC),
+            pool_created_event("0xp3", "0x2::sui::SUI", REALUSDC, tick_size=10),
+        ])
+        self.registry = PoolRegistry(self.client, PACKAGE_ID)
+        self.now = 100.0
+        self.registry._time = lambda: self.now
+
+    def test_normalize_type(self):
+        sui_address = "2".rjust(64, "0")
+        self.assertEqual("0x2::sui::SUI", normalize_type(f"0x{sui_address}::sui::SUI"))
+        self.assertEqual("0x2::sui::SUI", normalize_type(f"{sui_address}::sui::SUI"))
+
+    def test_pools_are_indexed_once_and_served_from_memory(self):
+        pools = self.registry.pools()
+        self.registry.pools()
+        self.registry.pool_for("0x2::sui::SUI", REALUSDC)
+
+        self.assertEqual(["0xp1", "0xp2", "0xp3"], [pool.pool_id for pool in pools])
+        self.assertEqual(2, len(self.client.queries))  # two pages, then nothing
+        sui_pool = self.registry.pool_for("0x0002::sui::SUI", REALUSDC)
+        self.assertEqual("0xp1", sui_pool.pool_id)
+        self.assertEqual(["0x2::sui::SUI", REALUSDC], sui_pool.type_arguments)
+        self.assertEqual((1_000_000, 100_000, 2_500_000, 1_500_000),
+                         (sui_pool.tick_size, sui_pool.lot_size, sui_pool.taker_fee_rate, sui_pool.maker_rebate_rate))
+        self.assertEqual(10, self.registry.pool_by_id("0xp3").tick_size)
+
+    def test_new_pools_are_read_from_the_last_cursor(self):
+        self.registry.pools()
+        self.client.events.append(pool_created_event("0xp4", WETH, "0x2::sui::SUI"))
+
+        # a miss right after a refresh does not go back to the chain
+        self.assertIsNone(self.registry.pool_for(WETH, "0x2::sui::SUI"))
+        self.now += 10
+        self.assertEqual("0xp4", self.registry.pool_for(WETH, "0x2::sui::SUI").pool_id)
+        self.assertEqual({"txDigest": "tx-0xp3", "eventSeq": "0"}, self.client.queries[-1])
@@ -0,0 +1,133 @@
+import unittest
+
+from hummingbot.connector.exchange.suidex.libsui import deepbook
+from hummingbot.connector.exchange.suidex.libsui.simulator import MIN_ASK_ORDER_ID, DeepbookSimulator
+
+NOW_MS = 1_700_000_000_000
+TICK = 100_000
+ONE_SUI = 10**9
+PRICE_1 = 1_000_000  # 1 REALUSDC (6 decimals) per SUI (9 decimals), scaled by 10^9
+PRICE_1_1 = 1_100_000
+ONE_USDC = 10**6
+
+
+class DeepbookSimulatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now_ms = NOW_MS
+        self.simulator = DeepbookSimulator(clock=lambda: self.now_ms)
+        self.taker = self.simulator.account_cap
+        self.maker = self.simulator.create_account()
+        self.other_maker = self.simulator.create_account()
+        for account_cap in (self.taker, self.maker, self.other_maker):
+            self.simulator.deposit_base(10 * ONE_SUI, account_cap=account_cap)
+            self.simulator.deposit_quote(100 * ONE_USDC, account_cap=account_cap)
+
+    def _ask(self, price, quantity, account_cap, **kwargs):
+        kwargs.setdefault("restriction", deepbook.NO_RESTRICTION)
+        return self.simulator.place_limit_order(price, -quantity, account_cap=account_cap, **kwargs)
+
+    def test_orders_are_matched_in_price_time_priority(self):
+        _, _, first, _ = self._ask(PRICE_1_1, ONE_SUI, self.maker, client_order_id=1)
+        _, _, second, _ = self._ask(PRICE_1_1, ONE_SUI, self.other_maker, client_order_id=2)
+        _, _, best, _ = self._ask(PRICE_1, ONE_SUI, self.other_maker, client_order_id=3)
+        self.assertEqual([str(MIN_ASK_ORDER_ID + i) for i in range(3)], [first, second, best])
+
+        success, _, pool_order_id, tx_result_json = self.simulator.place_limit_order(
+            PRICE_1_1, 5 * ONE_SUI // 2, client_order_id=4, restriction=deepbook.IMMEDIATE_OR_CANCEL
+        )
+
+        self.assertTrue(success)
+        self.assertIsNone(pool_order_id)
+        fills = deepbook._events_of_type(tx_result_json, "OrderFilled")
+        self.assertEqual([best, first, second], [fill["order_id"] for fill in fills])
+        self.assertEqual(
+            [str(ONE_SUI), str(ONE_SUI), str(ONE_SUI // 2)], [fill["base_asset_quantity_filled"] for fill in fills]
+        )
+        self.assertEqual(([PRICE_1_1], [ONE_SUI // 2]), self.simulator.get_level2_book_status("ask"))
+
+    def test_taker_pays_the_fee_and_the_maker_earns_the_rebate(self):
+        self._ask(PRICE_1, ONE_SUI, self.maker)
+
+        self.simulator.place_limit_order(PRICE_1, ONE_SUI // 3 - ONE_SUI // 3 % 1000)
+
+        filled = ONE_SUI // 3 - ONE_SUI // 3 % 1000
+        quote = filled * PRICE_1 // 10**9  # 333_333
+        commission = quote * 2_500_000 // 10**9 + 1  # rounded up
+        rebate = quote * 1_500_000 // 10**9
+        self.assertEqual(
+            (10 * ONE_SUI + filled, 0, 100 * ONE_USDC - quote - commission, 0), self.simulator.account_balance()
+        )
+        self.assertEqual(
+            (9 * ONE_SUI, ONE_SUI - filled, 100 * ONE_USDC + quote + rebate, 0),
+            self.simulator.account_balance(account_cap=self.maker),
+        )
+        self.assertEqual(commission - rebate, self.simulator.pool().quote_asset_trading_fees)
+
+    def test_tick_lot_and_restriction_violations_abort_with_the_chain_codes(self):
+        cases = [
+            (dict(price=PRICE_1 + 1, quantity=ONE_SUI), deepbook.EInvalidPrice),
+            (dict(price=PRICE_1, quantity=TICK - 1000), deepbook.EInvalidQuantity),
+            (dict(price=PRICE_1, quantity=ONE_SUI + 1), deepbook.EInvalidQuantity),
+            (dict(price=PRICE_1, quantity=ONE_SUI, expire_timestamp=NOW_MS), deepbook.EInvalidExpireTimestamp),
+            (dict(price=PRICE_1, quantity=ONE_SUI, restriction=deepbook.FILL_OR_KILL),
+             deepbook.EOrderCannotBeFullyFilled),
+        ]
+        for kwargs, code in cases:
+            success, _, _, tx_result_json = self.simulator.place_limit_order(**kwargs)
+            self.assertFalse(success)
+            self.assertEqual(code, deepbook.move_abort_code(tx_result_json), kwargs)
+
+        self._ask(PRICE_1, ONE_SUI, self.maker)
+        success, _, _, tx_result_json = self.simulator.place_limit_order(
+            PRICE_1, ONE_SUI, restriction=deepbook.POST_OR_ABORT
+        )
+        self.assertEqual(deepbook.EOrderCannotBeFullyPassive, deepbook.move_abort_code(tx_result_json))
+        self.assertEqual(([PRICE_1], [ONE_SUI]), self.simulator.get_level2_book_status("ask"))
+
+    def test_expired_makers_are_canceled_instead_of_matched(self):
+        _, _, expiring, _ = self._ask(PRICE_1, ONE_SUI, self.maker, expire_timestamp=NOW_MS + 1_000)
+        self._ask(PRICE_1_1, ONE_SUI, self.other_maker)
+        self.now_ms += 1_000
+
+        self.assertEqual(([PRICE_1_1], [ONE_SUI]), self.simulator.get_level2_book_status("ask"))
+        _, _, _, tx_result_json = self.simulator.place_limit_order(PRICE_1_1, ONE_SUI)
+
+        self.assertEqual({expiring}, deepbook._canceled_order_ids(tx_result_json))
+        self.assertEqual(1, len(deepbook._events_of_type(tx_result_json, "OrderFilled")))
+        self.assertEqual((10 * ONE_SUI, 0), self.simulator.account_balance(account_cap=self.maker)[:2])
+
+    def test_a_batch_is_atomic(self):
+        _, _, resting, _ = self._ask(PRICE_1_1, ONE_SUI, self.taker, client_order_id=1)
+        balances = self.simulator.account_balance()
+
+        success, placed, canceled, tx_result_json = self.simulator.execute_batch(
+            place_orders=[
+                dict(price=PRICE_1, quantity=-ONE_SUI, client_order_id=2, restriction=deepbook.NO_RESTRICTION),
+                dict(price=PRICE_1 + 1, quantity=-ONE_SUI, client_order_id=3),
+            ],
+            cancel_order_ids=[resting],
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(({}, set(), []), (placed, canceled, tx_result_json["events"]))
+        self.assertIn("in command 2", tx_result_json["effects"]["status"]["error"])
+        self.assertEqual(balances, self.simulator.account_balance())
+        self.assertEqual(([PRICE_1_1], [ONE_SUI]), self.simulator.get_level2_book_status("ask"))
+        self.assertIsNotNone(self.simulator.get_order_status(resting))
+
+        success, placed, canceled, _ = self.simulator.execute_batch(
+            place_orders=[dict(price=PRICE_1, quantity=-ONE_SUI, client_order_id=2)], cancel_order_ids=[resting]
+        )
+        self.assertTrue(success)
+        self.assertEqual({resting}, canceled)
+
+    def test_events_are_paged_in_order(self):
+        cursor = self.simulator.latest_event_cursor()
+        self._ask(PRICE_1, ONE_SUI, self.maker)
+        self.simulator.cancel_all_orders(account_cap=self.maker)
+
+        events, next_cursor, has_next_page = self.simulator.query_events(cursor, limit=1)
+        self.assertEqual((["OrderPlaced"], True), ([deepbook.event_name(e) for e in events], has_next_page))
+        events, _, has_next_page = self.simulator.query_events(next_cursor)
+        self.assertEqual((["AllOrdersCanceled"], False), ([deepbook.event_name(e) for e in events], has_next_page))
+        self.assertEqual(str(ONE_SUI), events[0]["parsedJson"]["orders_canceled"][0]["base_asset_quantity_canceled"])
@@ -0,0 +1,166 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.connector.exchange.suidex.libsui.deepbook import DeepbookOrder
+from hummingbot.connector.exchange.suidex.libsui.pool_registry import DeepbookPool
+
+PACKAGE_ID = "0xdee9"
+POOL_OBJECT_ID = "0xpool"
+ACCOUNT_CAP = "0xcap"
+OTHER_ACCOUNT_CAP = "0xother"
+
+_TYPE_ARGUMENTS = f"<0x2::sui::SUI, {PACKAGE_ID}::realusdc::REALUSDC>"
+
+SUI_REALUSDC_POOL = DeepbookPool(
+    pool_id=POOL_OBJECT_ID,
+    base_type="0x2::sui::SUI",
+    quote_type=f"{PACKAGE_ID}::realusdc::REALUSDC",
+    tick_size=1_000,
+    lot_size=100_000_000,
+    taker_fee_rate=2_500_000,
+    maker_rebate_rate=1_500_000,
+)
+COIN_DECIMALS = {"0x2::sui::SUI": 9, f"{PACKAGE_ID}::realusdc::REALUSDC": 6}
+
+
+class ReplayDeepbookConnector:
+    """
+    Stands in for DeepbookConnector in tests: replays a recorded sequence of `clob_v2` pool events through
+    `query_events` (one page at a time, as a full node would) and serves a fixed level 2 snapshot and the orders of
+    `open_orders` as resting in the pool.
+    """
+
+    def __init__(
+        self,
+        events: Optional[List[Dict[str, Any]]] = None,
+        bids: Optional[List[Tuple[int, int]]] = None,
+        asks: Optional[List[Tuple[int, int]]] = None,
+        page_size: int = 2,
+    ):
+        self.account_cap = ACCOUNT_CAP
+        self.pool_object_id = POOL_OBJECT_ID
+        self.package_id = PACKAGE_ID
+        self.events = []
+        self.bids = bids or []
+        self.asks = asks or []
+        self.page_size = page_size
+        self.level2_requests = []
+        self.pools = [SUI_REALUSDC_POOL]
+        self.open_orders: Dict[int, DeepbookOrder] = {}
+        for event in events or []:
+            self.record(event)
+
+    def record(self, event: Dict[str, Any]):
+        """appends an event built by one of the `*_event` helpers, assigning its id"""
+        event = dict(event)
+        event["id"] = {"txDigest": f"tx{len(self.events)}", "eventSeq": "0"}
+        self.events.append(event)
+
+    def latest_event_cursor(self):
+        # replay from the first recorded event
+        return None
+
+    def query_events(self, cursor=None, limit=None):
+        start = 0 if cursor is None else self._index_of(cursor) + 1
+        page = self.events[start:start + self.page_size]
+        next_cursor = page[-1]["id"] if page else None
+        return page, next_cursor, start + self.page_size < len(self.events)
+
+    def get_level2_book_status(self, side, price_low=0, price_high=10**12):
+        self.level2_requests.append((side, price_low, price_high))
+        levels = [(p, d) for p, d in (self.bids if side == "bid" else self.asks) if price_low <= p <= price_high]
+        return [p for p, _ in levels], [d for _, d in levels]
+
+    def get_order_status(self, pool_order_id, account_cap=None, pool_object_id=None):
+        return self.open_orders.get(int(pool_order_id))
+
+    def list_pools(self, refresh=False):
+        return list(self.pools)
+
+    def coin_decimals(self, coin_type):
+        return COIN_DECIMALS[coin_type]
+
+    def _index_of(self, cursor):
+        return next(i for i, event in enumerate(self.events) if event["id"] == cursor)
+
+
+def _event(name: str, timestamp_ms: int, **parsed_json) -> Dict[str, Any]:
+    return {
+        "type": f"{PACKAGE_ID}::clob_v2::{name}{_TYPE_ARGUMENTS}",
+        "parsedJson": dict(pool_id=POOL_OBJECT_ID, **parsed_json),
+        "timestampMs": str(timestamp_ms),
+    }
+
+
+def order_placed_event(timestamp_ms, order_id, client_order_id, is_bid, price, quantity, owner=OTHER_ACCOUNT_CAP):
+    return _event(
+        "OrderPlaced",
+        timestamp_ms,
+        order_id=str(order_id),
+        client_order_id=str(client_order_id),
+        is_bid=is_bid,
+        owner=owner,
+        original_quantity=str(quantity),
+        base_asset_quantity_placed=str(quantity),
+        price=str(price),
+        expire_timestamp="0",
+    )
+
+
+def order_canceled_event(timestamp_ms, order_id, client_order_id, is_bid, price, quantity, owner=OTHER_ACCOUNT_CAP):
+    return _event(
+        "OrderCanceled",
+        timestamp_ms,
+        order_id=str(order_id),
+        client_order_id=str(client_order_id),
+        is_bid=is_bid,
+        owner=owner,
+        original_quantity=str(quantity),
+        base_asset_quantity_canceled=str(quantity),
+        price=str(price),
+    )
+
+
+def order_filled_event(
+    timestamp_ms,
+    order_id,
+    maker_client_order_id,
+    taker_client_order_id,
+    is_bid,
+    price,
+    quantity,
+    remaining,
+    maker_address=OTHER_ACCOUNT_CAP,
+    taker_address=OTHER_ACCOUNT_CAP,
+    taker_commission=0,
+    maker_rebates=0,
+):
+    return _event(
+        "OrderFilled",
+        timestamp_ms,
+        order_id=str(order_id),
+        taker_client_order_id=str(taker_client_order_id),
+        maker_client_order_id=str(maker_client_order_id),
+        is_bid=is_bid,
+        taker_address=taker_address,
+        maker_address=maker_address,
+        original_quantity=str(quantity + remaining),
+        base_asset_quantity_filled=str(quantity),
+        base_asset_quantity_remaining=str(remaining),
+        price=str(price),
+        taker_commission=str(taker_commission),
+        maker_rebates=str(maker_rebates),
+    )
+
+
+def resting_order(order_id, client_order_id, is_bid, price, original_quantity, quantity, owner=ACCOUNT_CAP):
+    return DeepbookOrder(
+        order_id=order_id,
+        client_order_id=client_order_id,
+        price=price,
+        original_quantity=original_quantity,
+        quantity=quantity,
+        is_bid=is_bid,
+        owner=owner,
+        expire_timestamp=0,
+        self_matching_prevention=0,
+    )
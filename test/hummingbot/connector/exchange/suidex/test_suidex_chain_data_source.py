@@ -0,0 +1,295 @@
+import asyncio
+from decimal import Decimal
+from test.hummingbot.connector.exchange.suidex.replay_deepbook_connector import (
+    ACCOUNT_CAP,
+    PACKAGE_ID,
+    SUI_REALUSDC_POOL,
+    ReplayDeepbookConnector,
+    order_canceled_event,
+    order_filled_event,
+    order_placed_event,
+    resting_order,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.exchange.suidex import chain_data_source, suidex_utils
+from hummingbot.connector.exchange.suidex.chain_data_source import SuidexDataSource
+from hummingbot.connector.exchange.suidex.libsui import deepbook
+from hummingbot.connector.exchange.suidex.libsui.simulator import DeepbookSimulator
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+
+PRICE_1 = suidex_utils.to_chain_price(Decimal("1"))
+PRICE_1_1 = suidex_utils.to_chain_price(Decimal("1.1"))
+ONE_SUI = suidex_utils.to_chain_quantity(Decimal("1"))
+SNAPSHOT_TIMESTAMP = 1000.0
+ASK_ORDER_ID = (1 << 63) + 1
+
+
+class SuidexChainDataSourceTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.replay = ReplayDeepbookConnector(bids=[(PRICE_1, 5 * ONE_SUI)], asks=[(PRICE_1_1, 3 * ONE_SUI)])
+        connector = MagicMock()
+        connector.trade_fee_schema.return_value = TradeFeeSchema()
+        with patch.object(chain_data_source, "CLASSES", [lambda: self.replay]):
+            self.data_source = SuidexDataSource(connector=connector)
+        self.data_source._time = MagicMock(return_value=SNAPSHOT_TIMESTAMP)
+        self.data_source._event_stream._poll_interval = 0.01
+
+        self.diffs_logger = EventLogger()
+        self.trades_logger = EventLogger()
+        self.order_updates_logger = EventLogger()
+        self.trade_updates_logger = EventLogger()
+        self.data_source.add_listener(OrderBookEvent.OrderBookDataSourceUpdateEvent, self.diffs_logger)
+        self.data_source.add_listener(OrderBookEvent.TradeEvent, self.trades_logger)
+        self.data_source.add_listener(MarketEvent.OrderUpdate, self.order_updates_logger)
+        self.data_source.add_listener(MarketEvent.TradeUpdate, self.trade_updates_logger)
+
+    async def asyncTearDown(self) -> None:
+        await self.data_source.stop()
+        self.data_source._chain_executor.close()
+        await super().asyncTearDown()
+
+    async def _replay(self, expected_diffs: int):
+        await self.data_source.start(market_symbols=["SUI-REALUSDC"])
+        for _ in range(100):
+            if len(self.diffs_logger.event_log) >= expected_diffs:
+                break
+            await asyncio.sleep(0.01)
+
+    async def test_snapshot_then_events_are_applied_as_absolute_level_diffs(self):
+        snapshot = await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        self.assertEqual(int(SNAPSHOT_TIMESTAMP * 1e3), snapshot.update_id)
+
+        self.replay.record(order_placed_event(999_000, 1, 1, True, PRICE_1, ONE_SUI))  # already in the snapshot
+        self.replay.record(order_placed_event(1_000_250, 2, 2, True, PRICE_1, ONE_SUI))
+        self.replay.record(order_canceled_event(1_000_500, 3, 3, False, PRICE_1_1, 3 * ONE_SUI))
+        await self._replay(expected_diffs=2)
+
+        diffs = self.diffs_logger.event_log
+        self.assertEqual(2, len(diffs))
+        self.assertEqual(OrderBookMessageType.DIFF, diffs[0].type)
+        self.assertEqual(1_000_250, diffs[0].update_id)
+        self.assertEqual([(1.0, 6.0)], [(row.price, row.amount) for row in diffs[0].bids])
+        self.assertEqual([(1.1, 0.0)], [(row.price, row.amount) for row in diffs[1].asks])
+
+    async def test_own_order_events_become_order_and_trade_updates(self):
+        await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        chain_client_order_id = self.data_source._register_client_order_id(client_order_id="OID1")
+
+        self.replay.record(
+            order_placed_event(1_000_100, ASK_ORDER_ID, chain_client_order_id, False, PRICE_1_1, 2 * ONE_SUI,
+                               owner=ACCOUNT_CAP)
+        )
+        self.replay.record(
+            order_filled_event(1_000_200, ASK_ORDER_ID, chain_client_order_id, 77, False, PRICE_1_1, ONE_SUI, ONE_SUI,
+                               maker_address=ACCOUNT_CAP, maker_rebates=1_500)
+        )
+        self.replay.record(
+            order_canceled_event(1_000_300, ASK_ORDER_ID, chain_client_order_id, False, PRICE_1_1, ONE_SUI,
+                                 owner=ACCOUNT_CAP)
+        )
+        await self._replay(expected_diffs=3)
+
+        self.assertEqual(
+            [5.0, 4.0, 3.0],
+            [diff.asks[0].amount for diff in self.diffs_logger.event_log],
+        )
+        order_updates = self.order_updates_logger.event_log
+        self.assertEqual(
+            [OrderState.OPEN, OrderState.PARTIALLY_FILLED, OrderState.CANCELED],
+            [update.new_state for update in order_updates],
+        )
+        self.assertTrue(all(update.client_order_id == "OID1" for update in order_updates))
+        self.assertEqual(str(ASK_ORDER_ID), order_updates[0].exchange_order_id)
+
+        trade_update = self.trade_updates_logger.event_log[0]
+        self.assertEqual("OID1", trade_update.client_order_id)
+        self.assertEqual(Decimal("1"), trade_update.fill_base_amount)
+        self.assertEqual(Decimal("1.1"), trade_update.fill_price)
+        self.assertFalse(trade_update.is_taker)
+        self.assertEqual(Decimal("-0.0015"), trade_update.fee.flat_fees[0].amount)
+
+        public_trade = self.trades_logger.event_log[0]
+        self.assertEqual(float(TradeType.BUY.value), public_trade.content["trade_type"])
+        self.assertEqual(Decimal("1"), public_trade.content["amount"])
+
+    async def test_snapshots_after_the_first_only_read_around_the_touch(self):
+        await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        self.replay.bids = [(PRICE_1, 2 * ONE_SUI)]
+
+        snapshot = await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+
+        full_reads, window_reads = self.replay.level2_requests[:2], self.replay.level2_requests[2:]
+        self.assertEqual([("bid", 0, 10**12), ("ask", 0, 10**12)], full_reads)
+        self.assertTrue(all(price_low > PRICE_1 * 0.9 and price_high < PRICE_1_1 * 1.1
+                            for _, price_low, price_high in window_reads))
+        self.assertEqual([(1.0, 2.0)], [(row.price, row.amount) for row in snapshot.bids])
+        self.assertEqual([(1.1, 3.0)], [(row.price, row.amount) for row in snapshot.asks])
+
+    async def test_gap_in_events_triggers_a_full_resync(self):
+        await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        self.replay.asks = [(PRICE_1_1, ONE_SUI)]
+        # cancels more than the level holds: some event was missed
+        self.replay.record(order_canceled_event(1_000_100, 3, 3, False, PRICE_1_1, 4 * ONE_SUI))
+        await self._replay(expected_diffs=1)
+
+        resync = self.diffs_logger.event_log[0]
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, resync.type)
+        self.assertEqual([(1.1, 1.0)], [(row.price, row.amount) for row in resync.asks])
+        self.assertEqual(4, len(self.replay.level2_requests))
+        self.assertEqual(("ask", 0, 10**12), self.replay.level2_requests[-1])
+
+    async def test_symbols_and_trading_rules_come_from_the_configured_pool(self):
+        weth_pool = replace(SUI_REALUSDC_POOL, pool_id="0xweth", base_type=f"{PACKAGE_ID}::weth::WETH")
+        duplicate_pool = replace(SUI_REALUSDC_POOL, pool_id="0xpool0", tick_size=10)
+        self.replay.pools[:0] = [duplicate_pool]
+        self.replay.pools.append(weth_pool)
+        self.data_source._connector.trading_pair_associated_to_exchange_symbol = AsyncMock(
+            side_effect=lambda symbol: symbol
+        )
+
+        with patch(
+            "test.hummingbot.connector.exchange.suidex.replay_deepbook_connector.COIN_DECIMALS",
+            {"0x2::sui::SUI": 9, f"{PACKAGE_ID}::realusdc::REALUSDC": 6, f"{PACKAGE_ID}::weth::WETH": 8},
+        ):
+            symbols_map = await self.data_source.symbols_map()
+            trading_rules = await self.data_source.all_trading_rules()
+
+        # the orders, the book and the balances only reach the configured pool, so no other pool is listed
+        self.assertEqual({"SUI-REALUSDC": "SUI-REALUSDC"}, dict(symbols_map))
+        self.assertEqual(1, len(trading_rules))
+        sui_rule = trading_rules[0]
+        self.assertEqual("SUI-REALUSDC", sui_rule.trading_pair)
+        self.assertEqual(Decimal("0.001"), sui_rule.min_price_increment)
+        self.assertEqual(Decimal("0.1"), sui_rule.min_base_amount_increment)
+
+    async def test_orders_and_book_reads_of_another_market_are_rejected(self):
+        self.replay.pools.append(replace(SUI_REALUSDC_POOL, pool_id="0xweth", base_type=f"{PACKAGE_ID}::weth::WETH"))
+
+        with self.assertRaises(ValueError):
+            await self.data_source.place_order(
+                market_symbol="WETH-REALUSDC",
+                client_order_id="OID1",
+                price=Decimal("1"),
+                amount=Decimal("1"),
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+            )
+        with self.assertRaises(ValueError):
+            await self.data_source.order_book_snapshot(market_symbol="WETH-REALUSDC", trading_pair="WETH-REALUSDC")
+        self.assertEqual([], self.replay.level2_requests)
+
+    def _in_flight_order(self, client_order_id: str, exchange_order_id: int) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=str(exchange_order_id),
+            trading_pair="SUI-REALUSDC",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            amount=Decimal("2"),
+            price=Decimal("1.1"),
+            creation_timestamp=SNAPSHOT_TIMESTAMP,
+        )
+
+    async def test_order_update_of_a_resting_order_is_read_from_the_pool(self):
+        chain_client_order_id = self.data_source._register_client_order_id(client_order_id="OID1")
+        self.replay.open_orders[ASK_ORDER_ID] = resting_order(
+            ASK_ORDER_ID, chain_client_order_id, False, PRICE_1_1, 2 * ONE_SUI, ONE_SUI
+        )
+
+        order_update = await self.data_source.order_update(
+            order=self._in_flight_order("OID1", ASK_ORDER_ID), market_symbol="SUI-REALUSDC"
+        )
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, order_update.new_state)
+        self.assertEqual("OID1", order_update.client_order_id)
+        self.assertEqual(str(ASK_ORDER_ID), order_update.exchange_order_id)
+
+    async def test_order_update_and_fills_of_a_closed_order_come_from_its_events(self):
+        await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        chain_client_order_id = self.data_source._register_client_order_id(client_order_id="OID1")
+        self.replay.record(
+            order_placed_event(1_000_100, ASK_ORDER_ID, chain_client_order_id, False, PRICE_1_1, 2 * ONE_SUI,
+                               owner=ACCOUNT_CAP)
+        )
+        self.replay.record(
+            order_filled_event(1_000_200, ASK_ORDER_ID, chain_client_order_id, 77, False, PRICE_1_1, ONE_SUI, ONE_SUI,
+                               maker_address=ACCOUNT_CAP)
+        )
+        self.replay.record(
+            order_canceled_event(1_000_300, ASK_ORDER_ID, chain_client_order_id, False, PRICE_1_1, ONE_SUI,
+                                 owner=ACCOUNT_CAP)
+        )
+        await self._replay(expected_diffs=3)
+        order = self._in_flight_order("OID1", ASK_ORDER_ID)
+
+        order_update = await self.data_source.order_update(order=order, market_symbol="SUI-REALUSDC")
+        fills = await self.data_source.get_all_fills(from_timestamp=1000.0, to_timestamp=1001.0, orders=[order])
+
+        self.assertEqual(OrderState.CANCELED, order_update.new_state)
+        self.assertEqual([("OID1", Decimal("1"), Decimal("1.1"))],
+                         [(fill.client_order_id, fill.fill_base_amount, fill.fill_price) for fill in fills])
+        self.assertEqual([], await self.data_source.get_all_fills(
+            from_timestamp=1000.25, to_timestamp=1001.0, orders=[order]))
+        self.assertEqual(1.1, await self.data_source.last_price(market_symbol="SUI-REALUSDC"))
+
+        # the fills of an order no longer polled are dropped
+        self.assertEqual([], await self.data_source.get_all_fills(from_timestamp=1000.0, to_timestamp=1001.0, orders=[]))
+        self.assertEqual([], await self.data_source.get_all_fills(
+            from_timestamp=1000.0, to_timestamp=1001.0, orders=[order]))
+
+    async def test_order_update_of_an_order_out_of_the_pool_without_its_events_raises(self):
+        with self.assertRaises(IOError):
+            await self.data_source.order_update(
+                order=self._in_flight_order("OID1", ASK_ORDER_ID), market_symbol="SUI-REALUSDC"
+            )
+
+    async def test_last_price_before_any_trade_is_the_mid_price(self):
+        self.assertAlmostEqual(1.05, await self.data_source.last_price(market_symbol="SUI-REALUSDC"))
+
+
+class SuidexChainDataSourceSimulatorTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        connector = MagicMock()
+        connector.trade_fee_schema.return_value = TradeFeeSchema()
+        self.data_source = SuidexDataSource(connector=connector, connector_cls=DeepbookSimulator)
+        self.data_source._time = MagicMock(return_value=SNAPSHOT_TIMESTAMP)
+        self.data_source._event_stream._poll_interval = 0.01
+        self.simulator = self.data_source._chain_executor.connector
+        self.diffs_logger = EventLogger()
+        self.trades_logger = EventLogger()
+        self.data_source.add_listener(OrderBookEvent.OrderBookDataSourceUpdateEvent, self.diffs_logger)
+        self.data_source.add_listener(OrderBookEvent.TradeEvent, self.trades_logger)
+
+    async def asyncTearDown(self) -> None:
+        await self.data_source.stop()
+        self.data_source._chain_executor.close()
+        await super().asyncTearDown()
+
+    async def test_orders_matched_by_the_simulator_reach_the_order_book_and_the_trades(self):
+        maker = self.simulator.create_account()
+        self.simulator.deposit_base(5 * ONE_SUI, account_cap=maker)
+        self.simulator.deposit_quote(10**9)
+        self.simulator.place_limit_order(PRICE_1_1, -2 * ONE_SUI, restriction=deepbook.NO_RESTRICTION, account_cap=maker)
+        await self.data_source.order_book_snapshot(market_symbol="SUI-REALUSDC", trading_pair="SUI-REALUSDC")
+        await self.data_source.start(market_symbols=["SUI-REALUSDC"])
+        while self.data_source._event_stream.cursor is None:
+            await asyncio.sleep(0.01)
+
+        await self.data_source._chain_executor.place_limit_order(PRICE_1_1, ONE_SUI)
+        for _ in range(100):
+            if len(self.diffs_logger.event_log) >= 1:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual([1.0], [diff.asks[0].amount for diff in self.diffs_logger.event_log])
+        self.assertEqual(Decimal("1"), self.trades_logger.event_log[0].content["amount"])
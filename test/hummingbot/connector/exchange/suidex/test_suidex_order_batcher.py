@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from typing import Any, Dict, List
+
+from hummingbot.connector.exchange.suidex.suidex_order_batcher import SuidexOrderBatcher
+
+
+class FakeBatchingChainExecutor:
+    """records every programmable transaction block it is asked to execute"""
+
+    def __init__(self, failing_client_order_ids=(), failing_cancel_ids=()):
+        self.batches: List[Dict[str, Any]] = []
+        self._failing_client_order_ids = set(failing_client_order_ids)
+        self._failing_cancel_ids = set(failing_cancel_ids)
+        self._next_order_id = 1000
+
+    async def execute_batch(self, place_orders, cancel_order_ids):
+        self.batches.append({"place_orders": list(place_orders), "cancel_order_ids": list(cancel_order_ids)})
+        if any(o["client_order_id"] in self._failing_client_order_ids for o in place_orders) or any(
+            i in self._failing_cancel_ids for i in cancel_order_ids
+        ):
+            return False, {}, set(), {"effects": {"status": {"status": "failure"}}}
+        placed = {}
+        for order in place_orders:
+            self._next_order_id += 1
+            placed[str(order["client_order_id"])] = str(self._next_order_id)
+        canceled = {str(order_id) for order_id in cancel_order_ids}
+        return True, placed, canceled, {"effects": {"status": {"status": "success"}}}
+
+
+class SuidexOrderBatcherTests(unittest.TestCase):
+    def test_requests_within_the_window_share_one_transaction(self):
+        chain_executor = FakeBatchingChainExecutor()
+        batcher = SuidexOrderBatcher(chain_executor=chain_executor, batch_window=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                *[batcher.place_order(price=100 + i, quantity=1000, is_bid=True, client_order_id=i) for i in range(10)],
+                *[batcher.cancel_order(order_id=order_id) for order_id in (1, 2)],
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(1, len(chain_executor.batches))
+        self.assertEqual(10, len(chain_executor.batches[0]["place_orders"]))
+        self.assertEqual([1, 2], chain_executor.batches[0]["cancel_order_ids"])
+        pool_order_ids = [result[1] for result in results[:10]]
+        self.assertTrue(all(result[0] for result in results))
+        self.assertEqual(10, len(set(pool_order_ids)))
+
+    def test_batch_is_flushed_when_full(self):
+        chain_executor = FakeBatchingChainExecutor()
+        batcher = SuidexOrderBatcher(chain_executor=chain_executor, batch_window=10, max_batch_size=2)
+
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(*[batcher.cancel_order(order_id=order_id) for order_id in (1, 2, 3, 4)]),
+                timeout=1,
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual([[1, 2], [3, 4]], [batch["cancel_order_ids"] for batch in chain_executor.batches])
+        self.assertTrue(all(success for success, _ in results))
+
+    def test_failed_batch_is_resubmitted_per_request(self):
+        chain_executor = FakeBatchingChainExecutor(failing_client_order_ids={2})
+        batcher = SuidexOrderBatcher(chain_executor=chain_executor, batch_window=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                *[batcher.place_order(price=100, quantity=1000, is_bid=False, client_order_id=i) for i in (1, 2, 3)]
+            )
+
+        results = asyncio.run(run())
+
+        # the combined batch, then one transaction per request
+        self.assertEqual(4, len(chain_executor.batches))
+        self.assertEqual([True, False, True], [success for success, _, _ in results])
+        self.assertIsNone(results[1][1])
@@ -0,0 +1,164 @@
+import asyncio
+from typing import List
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+TEST_OTHER_PATH_URL = "/other"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class AsyncSlidingWindowThrottlerUnitTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_OTHER_PATH_URL, limit=1000, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID, limit=1000, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID, limit=1000, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    async def _run(self, limit_id: str, started: List, priority: RequestPriority = None):
+        async with self.throttler.execute_task(limit_id=limit_id, priority=priority):
+            started.append(limit_id if priority is None else priority)
+
+    async def test_tasks_of_unknown_limits_are_not_throttled(self):
+        context = self.throttler.execute_task(limit_id="unknown")
+
+        self.assertTrue(context.within_capacity())
+        for _ in range(100):
+            await asyncio.wait_for(context.acquire(), timeout=1)
+
+    async def test_weighted_tasks_use_the_capacity_of_their_linked_limits(self):
+        started = []
+        await self._run(TEST_WEIGHTED_TASK_1_ID, started)
+        await self._run(TEST_WEIGHTED_TASK_2_ID, started)
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+        self.assertEqual(1, self.throttler._windows[TEST_WEIGHTED_TASK_1_ID].used)
+
+        waiting_task = asyncio.ensure_future(self._run(TEST_WEIGHTED_TASK_1_ID, started))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiting_task.done())
+        waiting_task.cancel()
+
+    async def test_waiting_task_runs_when_the_oldest_task_leaves_the_window(self):
+        loop = asyncio.get_running_loop()
+        started = []
+        start_time = loop.time()
+        await self._run(TEST_PATH_URL, started)
+        await self._run(TEST_PATH_URL, started)
+
+        await asyncio.wait_for(self._run(TEST_PATH_URL, started), timeout=1)
+
+        self.assertEqual(3, len(started))
+        self.assertGreaterEqual(loop.time() - start_time, 0.19)
+        self.assertLess(loop.time() - start_time, 0.3)
+
+    async def test_waiting_tasks_run_in_order_without_holding_back_other_limits(self):
+        started = []
+        for _ in range(2):
+            await self._run(TEST_POOL_ID, started)
+        tasks = [asyncio.ensure_future(self._run(limit_id, started))
+                 for limit_id in (TEST_PATH_URL, TEST_POOL_ID, TEST_OTHER_PATH_URL)]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([TEST_POOL_ID, TEST_POOL_ID, TEST_OTHER_PATH_URL], started)
+
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        self.assertEqual([TEST_POOL_ID, TEST_POOL_ID, TEST_OTHER_PATH_URL, TEST_PATH_URL, TEST_POOL_ID], started)
+
+    async def test_cancelled_waiting_task_does_not_hold_back_the_next_ones(self):
+        started = []
+        for _ in range(2):
+            await self._run(TEST_POOL_ID, started)
+        cancelled_task = asyncio.ensure_future(self._run(TEST_PATH_URL, started))
+        next_task = asyncio.ensure_future(self._run(TEST_POOL_ID, started))
+        await asyncio.sleep(0.01)
+
+        cancelled_task.cancel()
+        await asyncio.wait_for(next_task, timeout=1)
+
+        self.assertEqual([TEST_POOL_ID] * 3, started)
+        self.assertEqual(0, sum(len(waiters) for waiters in self.throttler._waiters))
+
+    async def test_new_rate_limits_keep_the_tasks_in_their_window(self):
+        started = []
+        await self._run(TEST_POOL_ID, started)
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)])
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    async def test_waiting_tasks_run_by_priority(self):
+        started = []
+        for _ in range(2):
+            await self._run(TEST_POOL_ID, started)
+        started.clear()
+        tasks = [asyncio.ensure_future(self._run(TEST_PATH_URL, started, priority))
+                 for priority in (RequestPriority.PUBLIC_DATA, RequestPriority.PRIVATE_STATUS, RequestPriority.CANCEL,
+                                  RequestPriority.CREATE)]
+
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        self.assertEqual([RequestPriority.CANCEL, RequestPriority.CREATE,
+                          RequestPriority.PRIVATE_STATUS, RequestPriority.PUBLIC_DATA], started)
+
+    async def test_reserved_capacity_is_left_to_more_urgent_tasks(self):
+        self.throttler = AsyncSlidingWindowThrottler(
+            rate_limits=self.rate_limits + [RateLimit(limit_id="/cancel", limit=1000, time_interval=5.0,
+                                                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID)],
+                                                      priority=RequestPriority.CANCEL)],
+            safety_margin_pct=0,
+            priority_reserves={RequestPriority.CANCEL: 0.2, RequestPriority.CREATE: 0.1},
+        )
+        started = []
+        for _ in range(7):
+            await self._run(TEST_WEIGHTED_TASK_2_ID, started)
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        await self._run(TEST_WEIGHTED_TASK_2_ID, started, RequestPriority.CREATE)
+        self.assertFalse(
+            self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.CREATE).within_capacity()
+        )
+        for _ in range(2):
+            await asyncio.wait_for(self._run("/cancel", started), timeout=1)
+
+        self.assertEqual(10, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+
+    async def test_usage_reported_by_the_server_holds_back_tasks_until_it_expires(self):
+        started = []
+        await self._run(TEST_WEIGHTED_TASK_2_ID, started)
+
+        self.throttler.update_usage(TEST_WEIGHTED_POOL_ID, used=10, expires_in=0.1)
+
+        self.assertEqual(10, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        await asyncio.wait_for(self._run(TEST_WEIGHTED_TASK_2_ID, started), timeout=1)
+        self.assertEqual(2, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+
+    async def test_limit_reported_by_the_server_lets_waiting_tasks_run(self):
+        started = []
+        for _ in range(2):
+            await self._run(TEST_POOL_ID, started)
+        waiting_task = asyncio.ensure_future(self._run(TEST_POOL_ID, started))
+        await asyncio.sleep(0.01)
+
+        self.throttler.update_usage(TEST_POOL_ID, remaining=1, limit=3)
+        await asyncio.sleep(0)
+
+        self.assertTrue(waiting_task.done())
+        self.assertEqual(3, self.throttler._windows[TEST_POOL_ID].rate_limit.limit)
@@ -11,7 +11,7 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -189,6 +189,29 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.assertTrue(context.within_capacity())
 
+    def test_within_capacity_leaves_the_reserved_capacity_to_more_urgent_priorities(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits,
+                                   priority_reserves={RequestPriority.CANCEL: 0.2, RequestPriority.CREATE: 0.1})
+        task_2, task_2_related_limits = throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
+        # Simulate 7 Weighted Task 2 in task logs, resulting in a used capacity of 7/10
+        for _ in range(7):
+            for linked_limit, weight in task_2_related_limits:
+                throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+
+        # Public data tasks leave 3 to creates and cancels, creates leave 2 to cancels
+        self.assertFalse(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertTrue(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                               priority=RequestPriority.CREATE).within_capacity())
+        self.assertTrue(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                               priority=RequestPriority.CANCEL).within_capacity())
+
+        for linked_limit, weight in task_2_related_limits:
+            throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+        self.assertFalse(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                priority=RequestPriority.CREATE).within_capacity())
+        self.assertTrue(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                               priority=RequestPriority.CANCEL).within_capacity())
+
     def test_within_capacity_returns_true(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
@@ -0,0 +1,206 @@
+import asyncio
+import fcntl
+import multiprocessing
+import tempfile
+import time
+import unittest
+
+from hummingbot.core.api_throttler.async_shared_throttler import AsyncSharedThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.shared_rate_limit_budget import WAITING_TIMEOUT, SharedRateLimitBudget
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+
+
+def _run_shared_throttler(path: str, duration: float, timestamps):
+    throttler = AsyncSharedThrottler(
+        rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=20, time_interval=0.3),
+                     RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=0.3,
+                               linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)])],
+        budget=SharedRateLimitBudget("processes", path=path),
+        retry_interval=0.01,
+        safety_margin_pct=0,
+    )
+    throttler._last_max_cap_warning_ts = float("inf")
+
+    async def run():
+        end = time.time() + duration
+        while time.time() < end:
+            async with throttler.execute_task(limit_id=TEST_PATH_URL):
+                timestamps.put(time.time())
+
+    asyncio.run(run())
+    throttler.budget.close()
+
+
+class SharedRateLimitBudgetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.budget = SharedRateLimitBudget("test", path=self.directory.name, buckets=11)
+        self.other_budget = SharedRateLimitBudget("test", path=self.directory.name, buckets=11)
+
+    def tearDown(self) -> None:
+        self.budget.close()
+        self.other_budget.close()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_clients_draw_from_one_budget(self):
+        for _ in range(6):
+            self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)[0])
+        for _ in range(4):
+            self.assertTrue(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.5)[0])
+
+        acquired, wait = self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.5)
+
+        self.assertFalse(acquired)
+        self.assertAlmostEqual(0.6, wait)
+        self.assertEqual(10, self.budget.usage(TEST_POOL_ID, now=100.5))
+        self.assertEqual(4, self.budget.usage(TEST_POOL_ID, now=101.15))
+        self.assertTrue(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=101.15)[0])
+
+    def test_task_draws_from_all_its_limits_or_none(self):
+        self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 9)], now=100.0)[0])
+
+        self.assertFalse(self.budget.try_acquire([(TEST_PATH_URL, 10, 1.0, 1), (TEST_POOL_ID, 10, 1.0, 2)],
+                                                 now=100.0)[0])
+        self.assertFalse(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 2)], now=100.0, consume=False)[0])
+        self.assertEqual(0, self.budget.usage(TEST_PATH_URL, now=100.0))
+
+    def test_clients_keep_to_their_fair_share_while_others_wait(self):
+        for _ in range(10):
+            self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)[0])
+        self.assertFalse(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)[0])
+
+        # half the window later the budget is still full, then each client gets its share of what frees up
+        self.assertFalse(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.5)[0])
+        self.assertFalse(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.5)[0])
+        for _ in range(5):
+            self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=101.15)[0])
+        self.assertFalse(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=101.15)[0])
+        for _ in range(5):
+            self.assertTrue(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=101.15)[0])
+
+        # without waiting clients, a client uses all the capacity left
+        now = 102.3 + WAITING_TIMEOUT
+        for _ in range(10):
+            self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=now)[0])
+
+    def test_closed_client_leaves_its_slot(self):
+        self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)
+        self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)
+        self.other_budget.close()
+
+        self.other_budget = SharedRateLimitBudget("test", path=self.directory.name, buckets=11)
+        self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)
+
+        self.assertEqual(1, self.other_budget._client)
+        self.assertEqual(3, self.other_budget.usage(TEST_POOL_ID, now=100.0))
+
+    def test_budget_with_another_layout_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SharedRateLimitBudget("test", path=self.directory.name, buckets=21)
+
+    def test_processes_share_the_limits(self):
+        context = multiprocessing.get_context("fork")
+        timestamps = context.Queue()
+        processes = [context.Process(target=_run_shared_throttler, args=(self.directory.name, 0.9, timestamps))
+                     for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=10)
+            self.assertEqual(0, process.exitcode)
+
+        started = sorted(timestamps.get(timeout=1) for _ in range(timestamps.qsize()))
+        self.assertGreater(len(started), 40)
+        # the tasks log their start a little after the budget lets them run
+        for i in range(len(started) - 20):
+            self.assertGreater(started[i + 20] - started[i], 0.29)
+
+    def test_usage_added_for_no_client_expires_with_its_bucket(self):
+        self.budget.add_usage(TEST_POOL_ID, span=1.0, weight=8, timestamp=99.5, now=100.0)
+
+        self.assertFalse(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 3)], now=100.0)[0])
+        self.assertTrue(self.other_budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 3)], now=100.65)[0])
+
+    def test_usage_added_out_of_the_window_is_dropped(self):
+        self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 1)], now=100.0)[0])
+
+        # the bucket of 98.9 is the current one again, for 100.0
+        self.budget.add_usage(TEST_POOL_ID, span=1.0, weight=8, timestamp=98.9, now=100.0)
+        self.budget.add_usage(TEST_POOL_ID, span=1.0, weight=8, timestamp=90.0, now=100.0)
+
+        self.assertEqual(1, self.budget.usage(TEST_POOL_ID, now=100.0))
+
+    def test_usage_added_ahead_of_now_is_counted_now(self):
+        self.budget.add_usage(TEST_POOL_ID, span=1.0, weight=8, timestamp=105.0, now=100.0)
+
+        self.assertEqual(8, self.budget.usage(TEST_POOL_ID, now=100.0))
+        self.assertEqual(0, self.budget.usage(TEST_POOL_ID, now=101.15))
+
+    def test_waiting_for_the_lock_does_not_block_the_event_loop(self):
+        async def run():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            # another process holding the lock: flock() locks are per open file
+            with open(self.budget.path, "rb") as other_file:
+                fcntl.flock(other_file.fileno(), fcntl.LOCK_EX)
+                ticker = asyncio.ensure_future(tick())
+                acquiring = asyncio.ensure_future(self.budget.async_try_acquire([(TEST_POOL_ID, 10, 1.0, 1)]))
+                await asyncio.sleep(0.05)
+                self.assertFalse(acquiring.done())
+                self.assertGreater(ticks, 10)
+                fcntl.flock(other_file.fileno(), fcntl.LOCK_UN)
+            acquired = await asyncio.wait_for(acquiring, timeout=1)
+            ticker.cancel()
+            return acquired
+
+        self.assertTrue(asyncio.run(run())[0])
+        self.assertEqual(1, self.budget.usage(TEST_POOL_ID))
+
+    def test_aligned_usage_counts_only_the_missing_weight(self):
+        self.assertTrue(self.budget.try_acquire([(TEST_POOL_ID, 10, 1.0, 3)], now=100.0)[0])
+
+        asyncio.run(self.other_budget.async_align_usage(TEST_POOL_ID, span=1.0, used=8, expires_in=0.5, now=100.0))
+        asyncio.run(self.other_budget.async_align_usage(TEST_POOL_ID, span=1.0, used=2, expires_in=0.5, now=100.0))
+
+        self.assertEqual(8, self.budget.usage(TEST_POOL_ID, now=100.0))
+        # the missing weight expires with the reported usage, the weight drawn by the client with its own bucket
+        self.assertEqual(3, self.budget.usage(TEST_POOL_ID, now=100.65))
+
+    def test_updating_the_usage_does_not_block_the_event_loop(self):
+        throttler = AsyncSharedThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0)],
+                                         budget=self.budget,
+                                         safety_margin_pct=0)
+
+        async def run():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            with open(self.budget.path, "rb") as other_file:
+                fcntl.flock(other_file.fileno(), fcntl.LOCK_EX)
+                ticker = asyncio.ensure_future(tick())
+                updating = asyncio.ensure_future(throttler.async_update_usage(TEST_POOL_ID, used=7))
+                await asyncio.sleep(0.05)
+                self.assertFalse(updating.done())
+                self.assertGreater(ticks, 10)
+                fcntl.flock(other_file.fileno(), fcntl.LOCK_UN)
+            await asyncio.wait_for(updating, timeout=1)
+            ticker.cancel()
+
+        asyncio.run(run())
+        self.assertEqual(7, self.other_budget.usage(TEST_POOL_ID))
@@ -0,0 +1,132 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class ArrayOrderBookUnitTest(unittest.TestCase):
+    def assert_same_result(self, expected, actual, query):
+        for field in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value, actual_value = getattr(expected, field), getattr(actual, field)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value), f"{query} {field}: {actual_value}")
+            else:
+                self.assertAlmostEqual(expected_value, actual_value, places=9, msg=f"{query} {field}")
+
+    def assert_same_book(self, expected: OrderBook, actual: ArrayOrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for expected_array, actual_array in zip(expected.snapshot_arrays(depth=5), actual.snapshot_arrays(depth=5)):
+            self.assertEqual(expected_array.tolist(), actual_array.tolist())
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+
+    def test_queries_match_the_order_book(self):
+        rng = random.Random(42)
+        expected, actual = OrderBook(), ArrayOrderBook()
+        bids = [OrderBookRow(100 - i * 0.5, rng.uniform(0.1, 5), 1) for i in range(60)]
+        asks = [OrderBookRow(101 + i * 0.5, rng.uniform(0.1, 5), 1) for i in range(60)]
+        rng.shuffle(bids)
+        for book in (expected, actual):
+            book.apply_snapshot(bids, asks, 1)
+
+        for update_id in range(2, 200):
+            bids = [OrderBookRow(rng.randint(140, 200) * 0.5, rng.choice([0, rng.uniform(0.1, 5)]), update_id)
+                    for _ in range(rng.randint(0, 4))]
+            asks = [OrderBookRow(rng.randint(202, 262) * 0.5, rng.choice([0, rng.uniform(0.1, 5)]), update_id)
+                    for _ in range(rng.randint(0, 4))]
+            for book in (expected, actual):
+                book.apply_diffs(bids, asks, update_id)
+            self.assert_same_book(expected, actual)
+
+            is_buy = rng.random() < 0.5
+            volume = rng.uniform(0, 150)
+            price = rng.uniform(60, 140)
+            for query, argument in (
+                ("get_price_for_volume", volume),
+                ("get_vwap_for_volume", volume),
+                ("get_price_for_quote_volume", volume * 100),
+                ("get_quote_volume_for_base_amount", volume),
+                ("get_volume_for_price", price),
+                ("get_quote_volume_for_price", price),
+            ):
+                self.assert_same_result(
+                    getattr(expected, query)(is_buy, argument), getattr(actual, query)(is_buy, argument), query
+                )
+
+    def test_diffs_update_and_delete_levels(self):
+        book = ArrayOrderBook()
+        book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(10, 2, 1)], [OrderBookRow(11, 3, 1)], 1)
+
+        book.apply_diffs([OrderBookRow(10, 0, 2), OrderBookRow(9.5, 4, 2)], [OrderBookRow(11, 5, 2)], 2)
+
+        self.assertEqual([(9.5, 4, 2), (9, 1, 1)], list(book.bid_entries()))
+        self.assertEqual([(11, 5, 2)], list(book.ask_entries()))
+        self.assertEqual((9.5, 11), (book.get_price(False), book.get_price(True)))
+        self.assertEqual(2, book.last_diff_uid)
+        self.assertEqual(4 * 9.5 + 1 * 9, book.get_quote_volume_for_price(False, 9).result_volume)
+        self.assertEqual(5, book.get_price_for_volume(False, 5).result_volume)
+        self.assertEqual(9, book.get_price_for_volume(False, 5).result_price)
+
+    def test_max_depth_matches_the_order_book(self):
+        rng = random.Random(3)
+        full, expected, actual = OrderBook(), OrderBook(max_depth=8), ArrayOrderBook(max_depth=8)
+        bids = [OrderBookRow(100 - i * 0.5, rng.uniform(0.1, 5), 1) for i in range(20)]
+        asks = [OrderBookRow(101 + i * 0.5, rng.uniform(0.1, 5), 1) for i in range(20)]
+        for book in (full, expected, actual):
+            book.apply_snapshot(bids, asks, 1)
+        self.assertEqual(8, len(list(actual.bid_entries())))
+
+        for update_id in range(2, 300):
+            bids = [OrderBookRow(rng.randint(170, 200) * 0.5, rng.choice([0, rng.uniform(0.1, 5)]), update_id)
+                    for _ in range(rng.randint(0, 3))]
+            asks = [OrderBookRow(rng.randint(202, 232) * 0.5, rng.choice([0, rng.uniform(0.1, 5)]), update_id)
+                    for _ in range(rng.randint(0, 3))]
+            for book in (full, expected, actual):
+                book.apply_diffs(bids, asks, update_id)
+            self.assertEqual(expected.needs_resync, actual.needs_resync)
+            if actual.needs_resync:
+                for book in (expected, actual):
+                    book.apply_snapshot(list(full.bid_entries()), list(full.ask_entries()), update_id)
+            self.assert_same_book(expected, actual)
+            self.assert_same_result(expected.get_vwap_for_volume(True, 10), actual.get_vwap_for_volume(True, 10),
+                                    "get_vwap_for_volume")
+
+    def test_snapshot_keeps_the_first_entry_of_a_price(self):
+        book = ArrayOrderBook()
+        book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(9, 2, 2)], [], 3)
+
+        self.assertEqual([(9, 1, 1)], list(book.bid_entries()))
+        self.assertEqual(3, book.snapshot_uid)
+        with self.assertRaises(EnvironmentError):
+            book.get_price(True)
+
+    def test_truncate_overlap_entries_dex(self):
+        order_book = ArrayOrderBook(dex=True)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [50, 0.01, 4]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bids, asks = order_book.snapshot
+        self.assertEqual(bids.iloc[0].tolist(), [3., 1., 3.])
+        self.assertEqual(asks.iloc[0].tolist(), [4., 1., 1.])
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 5]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual(bids.iloc[0].tolist(), [3.5, 1., 5.])
+        self.assertEqual(asks.iloc[0].tolist(), [4., 1., 1.])
+
+    def test_truncate_overlap_entries_cex(self):
+        order_book = ArrayOrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        order_book.apply_numpy_diffs(np.array([[50, 0.01, 6]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+        self.assertEqual(bids.iloc[0].tolist(), [50., 0.01, 6.])
+        self.assertEqual(0, len(asks))
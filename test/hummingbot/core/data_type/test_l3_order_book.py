@@ -0,0 +1,102 @@
+import random
+import unittest
+from collections import defaultdict
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.l3_order_book import L3OrderBook, QueuePosition
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class L3OrderBookUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.order_book = L3OrderBook()
+        self.order_book.apply_l3_snapshot(
+            bids=[("b1", 10, 1), ("b2", 10, 2), ("b3", 9, 4), ("b4", 10, 0.5)],
+            asks=[("a1", 11, 1)],
+            update_id=1,
+        )
+
+    def test_snapshot_aggregates_the_orders_into_price_levels(self):
+        self.assertEqual([OrderBookRow(10, 3.5, 1), OrderBookRow(9, 4, 1)], list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11, 1, 1)], list(self.order_book.ask_entries()))
+        self.assertEqual((3, 1, 0), tuple(self.order_book.order_count(True, price) for price in (10, 9, 8)))
+        self.assertEqual(QueuePosition(amount_ahead=3, orders_ahead=2), self.order_book.queue_position("b4"))
+        self.assertEqual(QueuePosition(amount_ahead=0, orders_ahead=0), self.order_book.queue_position("a1"))
+        self.assertIsNone(self.order_book.queue_position("unknown"))
+
+    def test_partial_fill_keeps_the_place_in_the_queue_and_a_larger_amount_loses_it(self):
+        self.order_book.apply_order_update("b1", is_bid=True, price=10, amount=0.25, update_id=2)
+        self.assertEqual(QueuePosition(0.25, 1), self.order_book.queue_position("b2"))
+        self.assertEqual(OrderBookRow(10, 2.75, 2), next(self.order_book.bid_entries()))
+
+        self.order_book.apply_order_update("b1", is_bid=True, price=10, amount=1, update_id=3)
+        self.assertEqual(QueuePosition(2.5, 2), self.order_book.queue_position("b1"))
+        self.assertEqual(QueuePosition(0, 0), self.order_book.queue_position("b2"))
+        self.assertEqual(OrderBookRow(10, 3.5, 3), next(self.order_book.bid_entries()))
+
+    def test_orders_move_between_levels_and_empty_levels_are_removed(self):
+        self.order_book.apply_order_updates([
+            ("b3", True, 10, 4),
+            ("b5", True, 9.5, 1),
+            ("a1", False, 11, 0),
+        ], update_id=2)
+
+        self.assertEqual([OrderBookRow(10, 7.5, 2), OrderBookRow(9.5, 1, 2)], list(self.order_book.bid_entries()))
+        self.assertEqual([], list(self.order_book.ask_entries()))
+        self.assertEqual(QueuePosition(3.5, 3), self.order_book.queue_position("b3"))
+        self.assertFalse(self.order_book.has_order("a1"))
+
+        self.order_book.remove_order("b5", update_id=3)
+        self.assertEqual([OrderBookRow(10, 7.5, 2)], list(self.order_book.bid_entries()))
+        self.assertEqual(3, self.order_book.last_diff_uid)
+
+    def test_queue_position_of_in_flight_order(self):
+        order = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("10"),
+        )
+        self.assertIsNone(self.order_book.in_flight_order_queue_position(order))
+
+        order.update_exchange_order_id("b2")
+        self.assertEqual(QueuePosition(1, 1), self.order_book.in_flight_order_queue_position(order))
+
+    def test_level_snapshot_drops_the_orders(self):
+        self.order_book.apply_snapshot([OrderBookRow(10, 1, 2)], [], 2)
+
+        self.assertEqual([OrderBookRow(10, 1, 2)], list(self.order_book.bid_entries()))
+        self.assertIsNone(self.order_book.queue_position("b1"))
+        self.assertEqual(0, self.order_book.order_count(True, 10))
+
+    def test_incremental_levels_match_the_orders(self):
+        rng = random.Random(5)
+        self.order_book.apply_l3_snapshot(bids=[], asks=[], update_id=1)
+        orders = {}
+        for update_id in range(2, 2000):
+            order_id = f"o{rng.randint(0, 200)}"
+            is_bid = orders[order_id][0] if order_id in orders else rng.random() < 0.5
+            price = rng.randint(80, 99) if is_bid else rng.randint(101, 120)
+            amount = rng.choice([0, rng.randint(1, 40) * 0.25])
+            self.order_book.apply_order_update(order_id, is_bid, price, amount, update_id)
+            if amount > 0:
+                orders[order_id] = (is_bid, price, amount)
+            else:
+                orders.pop(order_id, None)
+
+        levels = defaultdict(float)
+        for is_bid, price, amount in orders.values():
+            levels[(is_bid, price)] += amount
+        self.assertEqual(
+            sorted(((True, price), amount) for (is_bid, price), amount in levels.items() if is_bid),
+            sorted(((True, row.price), row.amount) for row in self.order_book.bid_entries()),
+        )
+        self.assertEqual(
+            sorted(((False, price), amount) for (is_bid, price), amount in levels.items() if not is_bid),
+            sorted(((False, row.price), row.amount) for row in self.order_book.ask_entries()),
+        )
@@ -1,8 +1,15 @@
 #!/usr/bin/env python
 
 import logging
+import random
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book import SNAPSHOT_DTYPE, OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
@@ -50,6 +57,109 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_snapshot_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(1, 1, 1), OrderBookRow(3, 3, 3), OrderBookRow(2, 2, 2)],
+            [OrderBookRow(5, 5, 5), OrderBookRow(4, 4, 4)],
+            6,
+        )
+
+        bids, asks = order_book.snapshot_arrays(depth=2)
+
+        self.assertEqual(SNAPSHOT_DTYPE, bids.dtype)
+        self.assertEqual([(3, 3, 3), (2, 2, 2)], bids.tolist())
+        self.assertEqual([(4, 4, 4), (5, 5, 5)], asks.tolist())
+        self.assertFalse(bids.flags.writeable)
+        self.assertEqual(3, len(order_book.snapshot_arrays()[0]))
+        self.assertEqual(0, len(OrderBook().snapshot_arrays(depth=5)[1]))
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(list(OrderBookRow._fields), list(bids_df.columns))
+        self.assertEqual([[3., 3., 3.], [2., 2., 2.], [1., 1., 1.]], bids_df.values.tolist())
+        self.assertTrue(all(dtype == np.float64 for dtype in asks_df.dtypes))
+
+    def test_restore_from_compact_messages_matches_the_row_path(self):
+        snapshot = {"trading_pair": "COINALPHA-HBOT", "update_id": 1, "bids": [("3", "1"), ("2", "1")],
+                    "asks": [("4", "1")]}
+        diffs = [
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [("3", "0")], "asks": [("3.5", "2")]},
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 3, "bids": [("3.6", "1")], "asks": []},
+        ]
+        books = []
+        for message_class in (OrderBookMessage, CompactOrderBookMessage):
+            order_book = OrderBook()
+            order_book.restore_from_snapshot_and_diffs(
+                message_class(OrderBookMessageType.SNAPSHOT, snapshot),
+                [message_class(OrderBookMessageType.DIFF, diff) for diff in diffs],
+            )
+            books.append(order_book)
+
+        self.assertEqual(list(books[0].bid_entries()), list(books[1].bid_entries()))
+        self.assertEqual(list(books[0].ask_entries()), list(books[1].ask_entries()))
+        self.assertEqual([OrderBookRow(3.6, 1, 3), OrderBookRow(2, 1, 1)], list(books[1].bid_entries()))
+        self.assertEqual((1, 3), (books[1].snapshot_uid, books[1].last_diff_uid))
+
+    def test_max_depth_drops_the_levels_beyond_it(self):
+        order_book = OrderBook(max_depth=3)
+        order_book.apply_snapshot([OrderBookRow(price, 1, 1) for price in (1, 2, 3, 4, 5)],
+                                  [OrderBookRow(price, 1, 1) for price in (6, 7, 8, 9)], 1)
+        self.assertEqual([5, 4, 3], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([6, 7, 8], [row.price for row in order_book.ask_entries()])
+
+        # 1.5 is beyond the dropped level at 2, where the levels of the exchange are unknown
+        order_book.apply_diffs([OrderBookRow(2.5, 1, 2), OrderBookRow(1.5, 1, 2)],
+                               [OrderBookRow(6, 0, 2), OrderBookRow(8.5, 1, 2)], 2)
+        self.assertEqual([5, 4, 3], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([7, 8, 8.5], [row.price for row in order_book.ask_entries()])
+        self.assertFalse(order_book.needs_resync)
+
+        order_book.apply_diffs([OrderBookRow(4, 0, 3)], [], 3)
+        self.assertEqual([5, 3], [row.price for row in order_book.bid_entries()])
+        self.assertTrue(order_book.needs_resync)
+
+        order_book.apply_snapshot([OrderBookRow(price, 1, 4) for price in (2, 3, 5)], [], 4)
+        self.assertFalse(order_book.needs_resync)
+        self.assertEqual(3, order_book.max_depth)
+
+    def test_max_depth_set_later_drops_the_levels_beyond_it(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(price, 1, 1) for price in (1, 2, 3, 4, 5)],
+                                  [OrderBookRow(price, 1, 1) for price in (6, 7, 8, 9)], 1)
+
+        order_book.max_depth = 2
+
+        self.assertEqual([5, 4], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([6, 7], [row.price for row in order_book.ask_entries()])
+        order_book.apply_diffs([OrderBookRow(3.5, 1, 2)], [], 2)
+        self.assertEqual([5, 4], [row.price for row in order_book.bid_entries()])
+
+    def test_depth_limited_order_book_is_the_top_of_the_full_order_book(self):
+        rng = random.Random(7)
+        full, limited = OrderBook(), OrderBook(max_depth=10)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(30)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(30)]
+        for order_book in (full, limited):
+            order_book.apply_snapshot(bids, asks, 1)
+
+        resyncs = 0
+        for update_id in range(2, 500):
+            bids = [OrderBookRow(rng.randint(70, 100), rng.choice([0, 1, 2]), update_id) for _ in range(3)]
+            asks = [OrderBookRow(rng.randint(101, 131), rng.choice([0, 1, 2]), update_id) for _ in range(3)]
+            for order_book in (full, limited):
+                order_book.apply_diffs(bids, asks, update_id)
+
+            for full_rows, limited_rows in ((list(full.bid_entries()), list(limited.bid_entries())),
+                                            (list(full.ask_entries()), list(limited.ask_entries()))):
+                if limited.needs_resync:
+                    self.assertEqual(full_rows[:len(limited_rows)], limited_rows)
+                else:
+                    self.assertEqual(full_rows[:10], limited_rows)
+            if limited.needs_resync:
+                resyncs += 1
+                limited.apply_snapshot(list(full.bid_entries()), list(full.ask_entries()), update_id)
+        self.assertGreater(resyncs, 0)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,7 +1,10 @@
 import time
 import unittest
+from decimal import Decimal
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +251,34 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_compact_message_parses_the_levels_once(self):
+        msg = CompactOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 2,
+                "bids": [(Decimal("9.5"), Decimal("1")), ("9", "2", "extra")],
+                "asks": [],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.bids_array, msg.bids_array)
+        self.assertEqual([[9.5, 1], [9, 2]], msg.bids_array.tolist())
+        self.assertEqual((0, 2), msg.asks_array.shape)
+        self.assertFalse(msg.bids_array.flags.writeable)
+        self.assertEqual([OrderBookRow(9.5, 1, 2), OrderBookRow(9, 2, 2)], msg.bids)
+        self.assertEqual(msg, OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 2}))
+
+    def test_compact_message_from_arrays(self):
+        msg = CompactOrderBookMessage.from_arrays(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 1},
+            bids_array=np.array([[1.0, 2.0]]),
+            asks_array=np.empty((0, 2)),
+        )
+
+        self.assertEqual("COINALPHA-HBOT", msg.trading_pair)
+        self.assertIs(msg.content["bids"], msg.bids_array)
+        self.assertEqual([OrderBookRow(1.0, 2.0, 1)], msg.bids)
+        self.assertEqual([], msg.asks)
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    CompactOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_store import OrderBookStore
+
+
+class OrderBookStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = OrderBookStore(os.path.join(self.directory.name, "order_books"))
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COIN-HBOT", "update_id": 10, "bids": [[9.5, 2.0], [9.0, 1.0]], "asks": [[11.0, 3.0]]
+        }, timestamp=1))
+        self.diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COIN-HBOT", "first_update_id": 11, "update_id": 12, "bids": [["9.5", "2"]], "asks": []
+            }, timestamp=2),
+            CompactOrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COIN-HBOT", "update_id": 13, "bids": [], "asks": [[11.0, 0.0], [12.0, 1.5]]
+            }, timestamp=3),
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_stored_order_book_is_loaded_with_its_past_diffs(self):
+        self.store.save("COIN-HBOT", self.order_book, update_id=13, past_diffs=self.diffs)
+
+        stored = self.store.load("COIN-HBOT")
+
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, stored.snapshot.type)
+        self.assertEqual(13, stored.snapshot.update_id)
+        np.testing.assert_array_equal([[9.5, 2.0], [9.0, 1.0]], stored.snapshot.bids_array)
+        np.testing.assert_array_equal([[11.0, 3.0]], stored.snapshot.asks_array)
+        self.assertEqual([(11, 12, 2), (13, 13, 3)],
+                         [(diff.first_update_id, diff.update_id, diff.timestamp) for diff in stored.diffs])
+        np.testing.assert_array_equal([[9.5, 2.0]], stored.diffs[0].bids_array)
+        np.testing.assert_array_equal([[11.0, 0.0], [12.0, 1.5]], stored.diffs[1].asks_array)
+        self.assertEqual((0, 2), stored.diffs[0].asks_array.shape)
+
+        restored = OrderBook()
+        restored.apply_snapshot_message(stored.snapshot)
+        self.assertEqual(list(self.order_book.bid_entries())[0].price, list(restored.bid_entries())[0].price)
+        self.assertEqual(13, restored.snapshot_uid)
+
+    def test_save_replaces_the_stored_order_book(self):
+        self.store.save("COIN-HBOT", self.order_book, update_id=10, past_diffs=self.diffs)
+        self.store.save("COIN-HBOT", self.order_book, update_id=20, past_diffs=[])
+
+        stored = self.store.load("COIN-HBOT")
+
+        self.assertEqual(20, stored.snapshot.update_id)
+        self.assertEqual([], stored.diffs)
+        self.assertEqual(["COIN-HBOT.npy"], os.listdir(self.store.path))
+
+    def test_missing_or_outdated_order_book_is_not_loaded(self):
+        self.assertIsNone(self.store.load("COIN-HBOT"))
+
+        self.store.save("COIN-HBOT", self.order_book, update_id=10, past_diffs=[], timestamp=1000)
+        self.assertIsNone(self.store.load("COIN-HBOT", max_age=60))
+        self.assertEqual(1000, self.store.load("COIN-HBOT").timestamp)
+
+        self.store.remove("COIN-HBOT")
+        self.assertIsNone(self.store.load("COIN-HBOT"))
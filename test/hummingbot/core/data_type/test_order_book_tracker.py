@@ -0,0 +1,478 @@
+import asyncio
+import tempfile
+from typing import Dict, List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_store import OrderBookStore
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+
+class ControlledSnapshotDataSource:
+    """hands out an order book for a trading pair once its snapshot is released, counting the concurrent requests"""
+
+    def __init__(self):
+        self.released: Dict[str, asyncio.Event] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def release(self, trading_pair: str):
+        self.released.setdefault(trading_pair, asyncio.Event()).set()
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.released.setdefault(trading_pair, asyncio.Event()).wait()
+        finally:
+            self.in_flight -= 1
+        return OrderBook()
+
+
+class FailingSnapshotDataSource:
+    """fails the first order book requests of the trading pairs listed in `failures`"""
+
+    def __init__(self, failures: Dict[str, int]):
+        self.failures = failures
+        self.requests: Dict[str, int] = {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requests[trading_pair] = self.requests.get(trading_pair, 0) + 1
+        if self.requests[trading_pair] <= self.failures.get(trading_pair, 0):
+            raise IOError(f"No snapshot for {trading_pair}")
+        return OrderBook()
+
+
+class SequencedSnapshotDataSource:
+    """hands out the queued snapshot messages, the last one repeatedly"""
+    SEQUENCED_ORDER_BOOK_DIFFS = True
+
+    def __init__(self, snapshots: List[OrderBookMessage]):
+        self.snapshots = snapshots
+        self.requests = 0
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requests += 1
+        return self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+
+
+class StoredSnapshotDataSource(SequencedSnapshotDataSource):
+    """also hands out the queued snapshots as new order books"""
+    order_book_create_function = OrderBook
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(await self._order_book_snapshot(trading_pair))
+        return order_book
+
+
+def snapshot_message(update_id: int, bids: List, asks: List) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": "COIN-HBOT", "update_id": update_id, "bids": bids, "asks": asks
+    }, timestamp=update_id)
+
+
+def diff_message(first_update_id: int, update_id: int, bids: List = (), asks: List = ()) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "COIN-HBOT", "first_update_id": first_update_id, "update_id": update_id,
+        "bids": list(bids), "asks": list(asks)
+    }, timestamp=update_id)
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COIN{i}-HBOT" for i in range(5)]
+        self.data_source = ControlledSnapshotDataSource()
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, max_concurrent_snapshot_requests=2
+        )
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    async def test_order_books_are_initialized_concurrently_and_ready_one_by_one(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(2, self.data_source.in_flight)
+        self.data_source.release("COIN1-HBOT")
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("COIN1-HBOT"), timeout=1)
+
+        self.assertTrue(self.tracker.is_order_book_ready("COIN1-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COIN0-HBOT"))
+        self.assertIn("COIN1-HBOT", self.tracker.order_books)
+        self.assertFalse(self.tracker.ready)
+
+        for trading_pair in self.trading_pairs:
+            self.data_source.release(trading_pair)
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(2, self.data_source.max_in_flight)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker._tracking_tasks))
+
+    async def test_stop_resets_the_readiness_of_each_order_book(self):
+        for trading_pair in self.trading_pairs:
+            self.data_source.release(trading_pair)
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+        self.assertTrue(self.tracker.is_order_book_ready("COIN0-HBOT"))
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.is_order_book_ready("COIN0-HBOT"))
+        self.assertFalse(self.tracker.ready)
+
+    async def test_failing_order_book_is_retried_without_holding_back_the_others(self):
+        self.data_source = FailingSnapshotDataSource(failures={"COIN0-HBOT": 2})
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker.INIT_RETRY_INTERVAL = 0.01
+        retry_intervals = []
+        sleep = self.tracker._sleep
+
+        async def record_sleep(delay: float):
+            retry_intervals.append(delay)
+            await sleep(delay=delay)
+
+        self.tracker._sleep = record_sleep
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("COIN4-HBOT"), timeout=1)
+
+        self.assertFalse(self.tracker.is_order_book_ready("COIN0-HBOT"))
+        self.assertTrue(all(self.tracker.is_order_book_ready(f"COIN{i}-HBOT") for i in range(1, 5)))
+
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(3, self.data_source.requests["COIN0-HBOT"])
+        self.assertEqual([0.01, 0.02], retry_intervals)
+
+    async def test_order_books_are_capped_to_the_max_depth(self):
+        self.data_source = StoredSnapshotDataSource(snapshots=[
+            snapshot_message(10, bids=[[9.0, 1.0], [8.0, 1.0], [7.0, 1.0]], asks=[[11.0, 1.0], [12.0, 1.0], [13.0, 1.0]])
+        ])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COIN-HBOT"], max_depth=2)
+
+        await self.tracker._init_order_books()
+
+        order_book = self.tracker.order_books["COIN-HBOT"]
+        self.assertEqual(2, order_book.max_depth)
+        self.assertEqual([9.0, 8.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11.0, 12.0], [row.price for row in order_book.ask_entries()])
+
+
+class OrderBookTrackerSequenceGapTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = SequencedSnapshotDataSource(snapshots=[])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COIN-HBOT"])
+        self.tracker.RESYNC_RETRY_INTERVAL = 0
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot_message(snapshot_message(10, bids=[[9.0, 1.0]], asks=[[11.0, 1.0]]))
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tracker._order_books["COIN-HBOT"] = self.order_book
+        self.queue = self.tracker._tracking_message_queues["COIN-HBOT"] = asyncio.Queue()
+        self.tracking_task = asyncio.create_task(self.tracker._track_single_book("COIN-HBOT"))
+
+    async def asyncTearDown(self) -> None:
+        self.tracking_task.cancel()
+        self.tracker.stop()
+        await super().asyncTearDown()
+
+    async def _process(self, *messages: OrderBookMessage):
+        for message in messages:
+            self.queue.put_nowait(message)
+        while not self.queue.empty() or self.tracker._resync_tasks:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.001)
+
+    def _book(self):
+        return ([(row.price, row.amount) for row in self.order_book.bid_entries()],
+                [(row.price, row.amount) for row in self.order_book.ask_entries()])
+
+    async def test_contiguous_diffs_are_applied_without_resync(self):
+        await self._process(diff_message(9, 12, bids=[[9.5, 2.0]]), diff_message(13, 13, asks=[[11.0, 0.0]]))
+
+        self.assertEqual(([(9.5, 2.0), (9.0, 1.0)], []), self._book())
+        self.assertEqual(0, self.data_source.requests)
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+
+    async def test_gap_restores_the_order_book_from_a_snapshot_and_replays_the_buffered_diffs(self):
+        self.data_source.snapshots = [snapshot_message(15, bids=[[8.0, 3.0]], asks=[[12.0, 1.0]])]
+
+        await self._process(
+            diff_message(11, 11, bids=[[9.5, 2.0]]),
+            diff_message(14, 14, bids=[[9.0, 5.0]]),  # 12 and 13 are missing
+            diff_message(15, 16, bids=[[8.5, 1.0]]),
+            diff_message(17, 17, asks=[[12.0, 0.0], [11.5, 4.0]]),
+        )
+
+        self.assertEqual(1, self.data_source.requests)
+        self.assertEqual(([(8.5, 1.0), (8.0, 3.0)], [(11.5, 4.0)]), self._book())
+        self.assertEqual({"COIN-HBOT": 1}, self.tracker.sequence_gap_counts)
+        self.assertEqual({"COIN-HBOT": 1}, self.tracker.resync_counts)
+        self.assertEqual(17, self.tracker._last_update_ids["COIN-HBOT"])
+
+        await self._process(diff_message(18, 18, bids=[[8.5, 0.0]]))
+        self.assertEqual(([(8.0, 3.0)], [(11.5, 4.0)]), self._book())
+        self.assertEqual(1, self.data_source.requests)
+
+    async def test_snapshot_older_than_the_buffered_diffs_is_requested_again(self):
+        self.data_source.snapshots = [
+            snapshot_message(12, bids=[[9.0, 1.0]], asks=[]),
+            snapshot_message(20, bids=[[7.0, 1.0]], asks=[]),
+        ]
+
+        await self._process(diff_message(15, 21, bids=[[7.5, 1.0]]))
+
+        self.assertEqual(2, self.data_source.requests)
+        self.assertEqual(([(7.5, 1.0), (7.0, 1.0)], []), self._book())
+        self.assertEqual({"COIN-HBOT": 1}, self.tracker.resync_counts)
+
+    async def test_depth_limited_order_book_short_of_levels_is_restored_from_a_snapshot(self):
+        self.order_book = self.tracker._order_books["COIN-HBOT"] = OrderBook(max_depth=1)
+        self.order_book.apply_snapshot_message(snapshot_message(10, bids=[[9.0, 1.0], [8.0, 1.0]], asks=[]))
+        self.data_source.snapshots = [snapshot_message(11, bids=[[8.0, 1.0], [7.0, 1.0]], asks=[])]
+
+        await self._process(diff_message(11, 11, bids=[[9.0, 0.0]]), diff_message(12, 12, bids=[[7.5, 2.0]]))
+
+        self.assertEqual(1, self.data_source.requests)
+        self.assertEqual(([(8.0, 1.0)], []), self._book())
+        self.assertFalse(self.order_book.needs_resync)
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+        self.assertEqual({"COIN-HBOT": 1}, self.tracker.resync_counts)
+
+    async def test_update_ids_of_unsequenced_data_sources_are_not_checked(self):
+        self.data_source.SEQUENCED_ORDER_BOOK_DIFFS = False
+
+        await self._process(diff_message(100, 100, bids=[[9.5, 2.0]]))
+
+        self.assertEqual(0, self.data_source.requests)
+        self.assertEqual(([(9.5, 2.0), (9.0, 1.0)], [(11.0, 1.0)]), self._book())
+
+
+class ShardedOrderBookTrackerSequenceGapTests(OrderBookTrackerSequenceGapTests):
+    async def asyncSetUp(self) -> None:
+        await IsolatedAsyncioWrapperTestCase.asyncSetUp(self)
+        self.tracker._order_book_shards = 1
+        self.tracker._order_books["COIN-HBOT"] = self.order_book
+        self.tracker._last_update_ids["COIN-HBOT"] = self.order_book.snapshot_uid
+        self.queue = self.tracker._start_order_book_shards()
+        self.tracking_task = self.tracker._order_book_shard_tasks[0]
+
+    async def _process(self, *messages: OrderBookMessage):
+        for message in messages:
+            await self.queue.put(message)
+        while not self.tracker._shard_message_queues[0].empty() or self.tracker._resync_tasks:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.001)
+
+
+class OrderBookTrackerShardingTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COIN{i}-HBOT" for i in range(5)]
+        self.data_source = ControlledSnapshotDataSource()
+        self.data_source.SEQUENCED_ORDER_BOOK_DIFFS = False
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                        order_book_shards=2)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    @staticmethod
+    def _diff(trading_pair: str, update_id: int, bids: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": []
+        }, timestamp=update_id)
+
+    async def test_messages_are_applied_in_order_by_one_consumer_per_shard(self):
+        router = self.tracker._start_order_book_shards()
+        router.put_nowait(self._diff("COIN0-HBOT", 1, bids=[[1.0, 1.0]]))  # saved until the order book is ready
+        for trading_pair in self.trading_pairs:
+            self.data_source.release(trading_pair)
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+
+        for update_id in range(2, 12):
+            for trading_pair in self.trading_pairs:
+                await router.put(self._diff(trading_pair, update_id, bids=[[1.0, update_id]]))
+        while any(not queue.empty() for queue in self.tracker._shard_message_queues):
+            await asyncio.sleep(0.001)
+
+        self.assertEqual(2, len(self.tracker._order_book_shard_tasks))
+        self.assertEqual({}, self.tracker._tracking_tasks)
+        self.assertIs(router.shard_queue("COIN0-HBOT"), router.shard_queue("COIN2-HBOT"))
+        self.assertIsNot(router.shard_queue("COIN0-HBOT"), router.shard_queue("COIN1-HBOT"))
+        for trading_pair, order_book in self.tracker.order_books.items():
+            self.assertEqual([(1.0, 11.0, 11)], [(row.price, row.amount, row.update_id)
+                                                 for row in order_book.bid_entries()])
+
+
+class OrderBookTrackerCoalescingTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = SequencedSnapshotDataSource(snapshots=[])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COIN-HBOT"], coalesce_diffs=True)
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot_message(snapshot_message(10, bids=[[9.0, 1.0]], asks=[[11.0, 1.0]]))
+        self.tracker._order_books["COIN-HBOT"] = self.order_book
+        self.tracker._last_update_ids["COIN-HBOT"] = 10
+
+    def _book(self, order_book: OrderBook):
+        return ([(row.price, row.amount, row.update_id) for row in order_book.bid_entries()],
+                [(row.price, row.amount, row.update_id) for row in order_book.ask_entries()])
+
+    def test_diffs_are_applied_as_one_net_diff_when_the_order_books_are_read(self):
+        diffs = [
+            diff_message(11, 11, bids=[[9.5, 2.0], [9.0, 0.0]]),
+            diff_message(12, 12, bids=[[9.5, 3.0]], asks=[[10.5, 1.0]]),
+            diff_message(13, 13, asks=[[10.5, 0.0], [12.0, 4.0]]),
+        ]
+        expected = OrderBook()
+        expected.restore_from_snapshot_and_diffs(snapshot_message(10, bids=[[9.0, 1.0]], asks=[[11.0, 1.0]]), diffs)
+
+        for diff in diffs:
+            self.assertTrue(self.tracker._apply_order_book_message("COIN-HBOT", diff))
+
+        self.assertEqual(([(9.0, 1.0, 10)], [(11.0, 1.0, 10)]), self._book(self.order_book))
+        self.assertEqual(3, self.tracker._coalesced_diffs["COIN-HBOT"].diff_count)
+        self.assertEqual(self._book(expected), self._book(self.tracker.order_books["COIN-HBOT"]))
+        self.assertEqual(13, self.order_book.last_diff_uid)
+        self.assertEqual({}, self.tracker._coalesced_diffs)
+
+    def test_coalesced_diffs_are_applied_before_a_snapshot(self):
+        self.tracker._apply_order_book_message("COIN-HBOT", diff_message(11, 11, bids=[[9.5, 2.0]]))
+        self.tracker._apply_order_book_message("COIN-HBOT", diff_message(12, 12, asks=[[10.5, 1.0]]))
+        # the snapshot predates the second diff, which is replayed from the past diffs
+        self.tracker._apply_order_book_message(
+            "COIN-HBOT", snapshot_message(11, bids=[[9.5, 2.0], [8.0, 1.0]], asks=[[11.0, 1.0]])
+        )
+
+        self.assertEqual({}, self.tracker._coalesced_diffs)
+        self.assertEqual(([(9.5, 2.0, 11), (8.0, 1.0, 11)], [(10.5, 1.0, 12), (11.0, 1.0, 11)]),
+                         self._book(self.order_book))
+
+    def test_disabling_coalescing_flushes_the_coalesced_diffs(self):
+        self.tracker._apply_order_book_message("COIN-HBOT", diff_message(11, 11, bids=[[9.5, 2.0]]))
+
+        self.tracker.coalesce_diffs = False
+        self.assertEqual([(9.5, 2.0, 11), (9.0, 1.0, 10)], self._book(self.order_book)[0])
+
+        self.tracker._apply_order_book_message("COIN-HBOT", diff_message(12, 12, bids=[[9.5, 0.0]]))
+        self.assertEqual([(9.0, 1.0, 10)], self._book(self.order_book)[0])
+
+
+class OrderBookTrackerStoreTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = OrderBookStore(self.directory.name)
+        self.data_source = StoredSnapshotDataSource(snapshots=[snapshot_message(20, bids=[[8.0, 1.0]], asks=[])])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COIN-HBOT"],
+                                        order_book_store=self.store)
+        self.tracker.RESYNC_RETRY_INTERVAL = 0
+
+        previous_tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COIN-HBOT"],
+                                            order_book_store=self.store)
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(snapshot_message(10, bids=[[9.0, 1.0]], asks=[[11.0, 1.0]]))
+        previous_tracker._order_books["COIN-HBOT"] = order_book
+        previous_tracker._last_update_ids["COIN-HBOT"] = 10
+        previous_tracker._apply_order_book_message("COIN-HBOT", diff_message(11, 12, bids=[[9.5, 2.0]]))
+        previous_tracker.save_order_books()
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def _book(self):
+        order_book = self.tracker.order_books["COIN-HBOT"]
+        return ([(row.price, row.amount) for row in order_book.bid_entries()],
+                [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    async def _process(self, *messages: OrderBookMessage):
+        queue = self.tracker._tracking_message_queues["COIN-HBOT"]
+        for message in messages:
+            queue.put_nowait(message)
+        while not queue.empty() or self.tracker._resync_tasks:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.001)
+
+    async def test_stored_order_book_continued_by_the_diffs_is_used_without_snapshot(self):
+        await self.tracker._init_order_books()
+
+        self.assertEqual(0, self.data_source.requests)
+        self.assertEqual(([(9.5, 2.0), (9.0, 1.0)], [(11.0, 1.0)]), self._book())
+        self.assertEqual([12], [diff.update_id for diff in self.tracker._past_diffs_windows["COIN-HBOT"]])
+
+        self.assertFalse(self.tracker.is_order_book_ready("COIN-HBOT"))
+
+        await self._process(diff_message(12, 13, asks=[[10.5, 1.0]]))
+
+        self.assertEqual(0, self.data_source.requests)
+        self.assertEqual(([(9.5, 2.0), (9.0, 1.0)], [(10.5, 1.0), (11.0, 1.0)]), self._book())
+        self.assertTrue(self.tracker.is_order_book_ready("COIN-HBOT"))
+        self.assertTrue(self.tracker.ready)
+
+    async def test_stored_order_book_followed_by_a_gap_is_resynchronized(self):
+        await self.tracker._init_order_books()
+
+        await self._process(diff_message(15, 21, asks=[[10.5, 1.0]]))
+
+        self.assertEqual(1, self.data_source.requests)
+        self.assertEqual(([(8.0, 1.0)], [(10.5, 1.0)]), self._book())
+        self.assertEqual({"COIN-HBOT": 1}, self.tracker.sequence_gap_counts)
+
+    async def test_stored_order_book_stays_not_ready_across_a_gap_until_resynchronized(self):
+        snapshot_released = asyncio.Event()
+        request_snapshot = self.data_source._order_book_snapshot
+
+        async def released_snapshot(trading_pair: str) -> OrderBookMessage:
+            await snapshot_released.wait()
+            return await request_snapshot(trading_pair)
+
+        self.data_source._order_book_snapshot = released_snapshot
+        await self.tracker._init_order_books()
+        self.assertFalse(self.tracker.is_order_book_ready("COIN-HBOT"))
+        self.assertFalse(self.tracker.ready)
+
+        self.tracker._tracking_message_queues["COIN-HBOT"].put_nowait(diff_message(15, 21, asks=[[10.5, 1.0]]))
+        await asyncio.sleep(0.01)
+
+        self.assertIn("COIN-HBOT", self.tracker._resync_tasks)
+        self.assertFalse(self.tracker.is_order_book_ready("COIN-HBOT"))
+
+        snapshot_released.set()
+        await self._process()
+
+        self.assertEqual(([(8.0, 1.0)], [(10.5, 1.0)]), self._book())
+        self.assertTrue(self.tracker.is_order_book_ready("COIN-HBOT"))
+        self.assertTrue(self.tracker.ready)
+
+    async def test_outdated_stored_order_book_is_not_used(self):
+        self.tracker.ORDER_BOOK_STORE_MAX_AGE = -1
+
+        await self.tracker._init_order_books()
+
+        self.assertEqual(1, self.data_source.requests)
+        self.assertEqual(([(8.0, 1.0)], []), self._book())
+
+    async def test_order_books_are_saved_again_when_the_tracker_stops(self):
+        await self.tracker._init_order_books()
+        self.tracker.save_order_books()
+        self.assertEqual(12, self.store.load("COIN-HBOT").snapshot.update_id)
+
+        await self._process(diff_message(13, 13, bids=[[9.0, 0.0]]))
+        self.tracker.stop()
+
+        stored = self.store.load("COIN-HBOT")
+        self.assertEqual(13, stored.snapshot.update_id)
+        self.assertEqual([[9.5, 2.0]], stored.snapshot.bids_array.tolist())
+        self.assertEqual([12, 13], [diff.update_id for diff in stored.diffs])
@@ -2,13 +2,18 @@ import asyncio
 import unittest
 from typing import Awaitable
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 from hummingbot.core.web_assistant.connections.connections_factory import (
     ConnectionsFactory
 )
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig, RESTMethod, RESTRequest
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
 )
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 
 
 class ConnectionsFactoryTest(unittest.TestCase):
@@ -34,3 +39,75 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+
+class ConnectionsFactoryPoolTest(IsolatedAsyncioWrapperTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.requests_in_handler = 0
+        self.max_requests_in_handler = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            self.requests_in_handler += 1
+            self.max_requests_in_handler = max(self.max_requests_in_handler, self.requests_in_handler)
+            await asyncio.sleep(0.05)
+            self.requests_in_handler -= 1
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/status", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+        await super().asyncTearDown()
+
+    async def test_shared_client_uses_the_pool_config(self):
+        factory = ConnectionsFactory(pool_config=ConnectionPoolConfig(limit=10, limit_per_host=2, keepalive_timeout=5,
+                                                                      dns_cache_ttl=60))
+
+        client = await factory._get_shared_client()
+
+        self.assertEqual(10, client.connector.limit)
+        self.assertEqual(2, client.connector.limit_per_host)
+        self.assertTrue(client.connector.use_dns_cache)
+        await client.close()
+
+    async def test_ws_connections_are_out_of_the_pool(self):
+        factory = ConnectionsFactory(pool_config=ConnectionPoolConfig(limit=10, limit_per_host=2))
+
+        ws_client = await factory._get_ws_shared_client()
+        rest_client = await factory._get_shared_client()
+
+        self.assertIsNot(rest_client, ws_client)
+        self.assertEqual(0, ws_client.connector.limit)
+        self.assertEqual(0, ws_client.connector.limit_per_host)
+        self.assertTrue(ws_client.connector.use_dns_cache)
+        await ws_client.close()
+        await rest_client.close()
+
+    async def test_requests_beyond_the_host_limit_wait_and_reuse_connections(self):
+        factory = ConnectionsFactory(pool_config=ConnectionPoolConfig(limit_per_host=2))
+        connection = await factory.get_rest_connection()
+        url = str(self.server.make_url("/status"))
+        waiting = []
+
+        async def call():
+            response = await connection.call(RESTRequest(method=RESTMethod.GET, url=url))
+            waiting.append(factory.pool_metrics.host(self.server.host).waiting)
+            return await response.json()
+
+        responses = await asyncio.gather(*(call() for _ in range(6)))
+
+        metrics = factory.pool_metrics.host(self.server.host)
+        self.assertEqual([{"ok": True}] * 6, responses)
+        self.assertEqual(2, self.max_requests_in_handler)
+        self.assertGreater(max(waiting), 0)
+        self.assertEqual(2, metrics.connections_created)
+        self.assertEqual(4, metrics.connections_reused)
+        self.assertEqual(0, metrics.in_flight)
+        self.assertEqual(0, metrics.waiting)
+        self.assertGreater(metrics.mean_handshake_time, 0)
+        self.assertGreaterEqual(metrics.max_handshake_time, metrics.mean_handshake_time)
+        await (await factory._get_shared_client()).close()
@@ -0,0 +1,89 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.web_assistant.connections.data_types import RESTResponse
+from hummingbot.core.web_assistant.rest_post_processors import RateLimitHeaders, RateLimitHeadersPostProcessor
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+TEST_PATH_URL = "/hummingbot"
+
+
+class RateLimitHeadersPostProcessorTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncThrottler(
+            rate_limits=[RateLimit(limit_id=REQUEST_WEIGHT, limit=100, time_interval=60),
+                         RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=60,
+                                   linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 10)])],
+            safety_margin_pct=0,
+        )
+        self.weight_rate_limit = self.throttler._id_to_limit_map[REQUEST_WEIGHT]
+
+    def _response(self, headers, status: int = 200) -> RESTResponse:
+        response = MagicMock(spec=RESTResponse)
+        response.status = status
+        response.headers = headers
+        return response
+
+    async def test_used_weight_above_the_local_count_is_added_until_the_window_resets(self):
+        post_processor = RateLimitHeadersPostProcessor(
+            throttler=self.throttler,
+            rate_limit_headers=[RateLimitHeaders(limit_id=REQUEST_WEIGHT, used_header="X-USED", fixed_window=60)],
+        )
+        async with self.throttler.execute_task(limit_id=TEST_PATH_URL):
+            pass
+
+        now = time.time()
+        with patch("time.time", return_value=now):
+            await post_processor.post_process(self._response({"X-USED": "95"}))
+
+        self.assertEqual(95, self.throttler._used_capacity(self.weight_rate_limit, now))
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+        # the server resets the weight used at the next minute
+        next_minute = (now // 60 + 1) * 60
+        self.assertEqual(95, self.throttler._used_capacity(self.weight_rate_limit, next_minute - 0.001))
+        self.assertEqual(10, self.throttler._used_capacity(self.weight_rate_limit, next_minute + 0.001))
+
+    async def test_used_weight_below_the_local_count_is_ignored(self):
+        post_processor = RateLimitHeadersPostProcessor(
+            throttler=self.throttler,
+            rate_limit_headers=[RateLimitHeaders(limit_id=REQUEST_WEIGHT, used_header="X-USED")],
+        )
+        async with self.throttler.execute_task(limit_id=TEST_PATH_URL):
+            pass
+
+        await post_processor.post_process(self._response({"X-USED": "3"}))
+        await post_processor.post_process(self._response({}))
+
+        self.assertEqual(1, len(self.throttler._task_logs) - 1)
+        self.assertEqual(10, self.throttler._used_capacity(self.weight_rate_limit, time.time()))
+
+    async def test_remaining_weight_and_limit_replace_the_configured_limit(self):
+        post_processor = RateLimitHeadersPostProcessor(
+            throttler=self.throttler,
+            rate_limit_headers=[RateLimitHeaders(limit_id=REQUEST_WEIGHT, remaining_header="X-REMAINING",
+                                                 limit_header="X-LIMIT", reset_header="X-RESET")],
+        )
+
+        reset_timestamp = int((time.time() + 10) * 1e3)
+        await post_processor.post_process(
+            self._response({"X-REMAINING": "150", "X-LIMIT": "200", "X-RESET": str(reset_timestamp)})
+        )
+
+        self.assertEqual(200, self.weight_rate_limit.limit)
+        self.assertEqual(50, self.throttler._used_capacity(self.weight_rate_limit, time.time()))
+        self.assertEqual(0, self.throttler._used_capacity(self.weight_rate_limit, time.time() + 11))
+
+    async def test_too_many_requests_response_uses_up_the_limit_until_retry_after(self):
+        post_processor = RateLimitHeadersPostProcessor(
+            throttler=self.throttler,
+            rate_limit_headers=[RateLimitHeaders(limit_id=REQUEST_WEIGHT, used_header="X-USED")],
+        )
+
+        await post_processor.post_process(self._response({"Retry-After": "5", "X-USED": "20"}, status=429))
+
+        self.assertEqual(100, self.throttler._used_capacity(self.weight_rate_limit, time.time()))
+        self.assertEqual(0, self.throttler._used_capacity(self.weight_rate_limit, time.time() + 6))
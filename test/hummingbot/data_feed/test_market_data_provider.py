@@ -4,7 +4,9 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
@@ -66,6 +68,14 @@ class TestMarketDataProvider(unittest.TestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_snapshot_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1)], [OrderBookRow(101, 3, 1)], 1)
+        self.mock_connector.get_order_book.return_value = order_book
+        bids, asks = self.provider.get_order_book_snapshot_arrays("mock_connector", "BTC-USDT", depth=1)
+        self.assertEqual([99], bids["price"].tolist())
+        self.assertEqual([3], asks["amount"].tolist())
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))